@@ -0,0 +1,219 @@
+"""
+### PyLCONF.compiler
+
+#### Overview
+
+This module is used by the PyLCONF compile scripts: `pylconf-compile` and `pylconf-decompile`
+
+```bash
+pylconf-compile path-to-first.lconf path-to-second.lconf
+pylconf-compile --schema path-to.lconfsd path-to-first.lconf
+pylconf-compile -o out.lconfc path-to-first.lconf
+pylconf-decompile path-to-first.lconfc
+pylconf-decompile -o out.lconf path-to-first.lconfc
+```
+
+`pylconf-compile` parses each LCONF-File (validating all its LCONF-Sections) and writes it in the compiled binary
+LCONF format (see `lconf_binary`) next to it with the extension `.lconfc`. With `--schema` each LCONF-Section with a
+LCONF-Schema-Section of the same name is parsed with `lconf_schema.parse_section_typed`: its LCONF-Values are stored
+typed, numeric STRUCTURE_LISTs and table columns as native blocks.
+
+`pylconf-decompile` writes the LCONF text of `.lconfc` files: to stdout or with `-o` to a file. Each LCONF-Section is
+emitted with its LCONF-Indentation-Per-Level number.
+
+Exit code: 0 if all files were done else 1.
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from os.path import splitext
+from sys import (
+    exit as sys_exit,
+    stderr as sys_stderr,
+    stdout as sys_stdout,
+)
+
+from PyLCONF.lconf_binary import (
+    dumps as binary_dumps,
+    FILE_EXTENSION,
+    load as binary_load,
+)
+from PyLCONF.lconf_emitter import dump
+from PyLCONF.lconf_loader import load
+from PyLCONF.lconf_schema import compile_schema
+from PyLCONF.lconf_section import extract_sections
+from PyLCONF.utilities import Err
+
+
+def parse_compile_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Compile `LCONF files` into the binary `.lconfc` format',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    pylconf-compile path-to-first.lconf path-to-second.lconf
+    pylconf-compile --schema path-to.lconfsd path-to-first.lconf
+    pylconf-compile -o out.lconfc path-to-first.lconf
+    '''
+    )
+
+    main_parser.add_argument(
+       'in_files',
+       nargs='*',
+       default=[],
+       help='List of files to be compiled',
+    )
+    main_parser.add_argument(
+       '-s', '--schema',
+       default=None,
+       help='LCONF-Schema-File: LCONF-Sections with a LCONF-Schema-Section of the same name are stored typed',
+    )
+    main_parser.add_argument(
+       '-o', '--output',
+       default=None,
+       help='Output file: only for one input file (default: the input file with the extension .lconfc)',
+    )
+
+    args = main_parser.parse_args()
+    if not args.in_files:
+        main_parser.print_help()
+        sys_exit()
+    if args.output is not None and len(args.in_files) != 1:
+        main_parser.error('--output needs exact one input file')
+
+    return args
+
+
+def parse_decompile_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Decompile binary `.lconfc` files into `LCONF files`',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    pylconf-decompile path-to-first.lconfc
+    pylconf-decompile -o out.lconf path-to-first.lconfc
+    '''
+    )
+
+    main_parser.add_argument(
+       'in_files',
+       nargs='*',
+       default=[],
+       help='List of files to be decompiled',
+    )
+    main_parser.add_argument(
+       '-o', '--output',
+       default=None,
+       help='Output file (default: stdout)',
+    )
+
+    args = main_parser.parse_args()
+    if not args.in_files:
+        main_parser.print_help()
+        sys_exit()
+
+    return args
+
+
+def load_schemas(path_to_lconfsd_file):
+    """
+    #### compiler.load_schemas
+
+    Compiles all LCONF-Schema-Sections of a LCONF-Schema-File.
+
+    `load_schemas(path_to_lconfsd_file)`
+
+    **Returns:** (dict) LCONF-Schema-Section-Name: LconfSchema else raises an error
+    """
+    with open(path_to_lconfsd_file, 'rb') as file_obj:
+        buffer = file_obj.read()
+    return {
+        section_span[2]: compile_schema(section_span, buffer)
+        for section_span in extract_sections(buffer, as_spans=True)
+    }
+
+
+def compile_file(path_to_lconf_file, path_to_lconfc_file, lconf_schema_obj=None):
+    """
+    #### compiler.compile_file
+
+    Parses a LCONF-File and writes it in the compiled binary LCONF format.
+
+    `compile_file(path_to_lconf_file, path_to_lconfc_file, lconf_schema_obj=None)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File
+    * `path_to_lconfc_file`: (str) path of the `.lconfc` file
+    * `lconf_schema_obj`: (LconfSchema or mapping of LCONF-Section-Name: LconfSchema) optional: see
+        `lconf_loader.load`
+
+    **Returns:** (int) the number of LCONF-Sections else raises an error
+    """
+    section_objs = load(path_to_lconf_file, lconf_schema_obj, use_numpy=False)
+    data = binary_dumps(section_objs)
+    with open(path_to_lconfc_file, 'wb') as file_obj:
+        file_obj.write(data)
+    return len(section_objs)
+
+
+def decompile_file(path_to_lconfc_file, fileobj):
+    """
+    #### compiler.decompile_file
+
+    Writes the LCONF text of a compiled binary LCONF file to a file object opened in text mode.
+
+    `decompile_file(path_to_lconfc_file, fileobj)`
+
+    **Returns:** (int) the number of LCONF-Sections else raises an error
+    """
+    section_objs = binary_load(path_to_lconfc_file, use_numpy=False)
+    for idx, section_obj in enumerate(section_objs):
+        if idx:
+            fileobj.write('\n')
+        dump(section_obj, fileobj, section_obj.section_indentation_number)
+    return len(section_objs)
+
+
+def _error_text(err):
+    """ Returns the message of one raised error in one line.
+    """
+    return err.message if isinstance(err, Err) else str(err)
+
+
+def compile_main():
+    args = parse_compile_commandline()
+    try:
+        lconf_schema_obj = load_schemas(args.schema) if args.schema is not None else None
+    except (OSError, Err) as err:
+        sys_stderr.write('pylconf-compile: {}: {}\n'.format(args.schema, _error_text(err)))
+        return 1
+
+    is_done = True
+    for path_to_lconf_file in args.in_files:
+        path_to_lconfc_file = args.output or splitext(path_to_lconf_file)[0] + FILE_EXTENSION
+        try:
+            section_count = compile_file(path_to_lconf_file, path_to_lconfc_file, lconf_schema_obj)
+        except (OSError, Err) as err:
+            sys_stderr.write('pylconf-compile: {}: {}\n'.format(path_to_lconf_file, _error_text(err)))
+            is_done = False
+            continue
+        sys_stdout.write('{} -> {}: {} LCONF-Sections\n'.format(path_to_lconf_file, path_to_lconfc_file,
+                                                                 section_count))
+    return 0 if is_done else 1
+
+
+def decompile_main():
+    args = parse_decompile_commandline()
+    fileobj = sys_stdout if args.output is None else open(args.output, 'w', encoding='utf-8')
+    is_done = True
+    try:
+        for idx, path_to_lconfc_file in enumerate(args.in_files):
+            if idx:
+                fileobj.write('\n')
+            try:
+                decompile_file(path_to_lconfc_file, fileobj)
+            except (OSError, Err) as err:
+                sys_stderr.write('pylconf-decompile: {}: {}\n'.format(path_to_lconfc_file, _error_text(err)))
+                is_done = False
+    finally:
+        if fileobj is not sys_stdout:
+            fileobj.close()
+    return 0 if is_done else 1
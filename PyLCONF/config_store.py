@@ -0,0 +1,442 @@
+"""
+### PyLCONF.config_store
+
+#### Overview
+
+`ConfigStore`: The parsed LCONF-Sections of LCONF-Files: reloaded when the files change.
+`ConfigSnapshot`: One immutable version of the parsed LCONF-Sections of a `ConfigStore`.
+
+#### Reloading
+
+A reload reads each changed LCONF-File and finds its LCONF-Sections with `extract_sections(buffer, as_spans=True)`.
+Each LCONF-Section is keyed by a BLAKE2b hash of its bytes: the parsed object of an unchanged LCONF-Section is taken
+from the current snapshot, only new or changed LCONF-Sections are parsed (and so validated) with
+`lconf_loader.parse_section_span`. If all succeed a new `ConfigSnapshot` replaces the current one with one attribute
+assignment: readers take no lock and see either the old or the new snapshot, never a part of a reload. If one fails
+the current snapshot is kept: the error is raised by `reload` or passed to the error callbacks by the watcher thread.
+
+#### Watching
+
+`start` runs a daemon thread which watches the directories of the LCONF-Files with inotify (Linux: through `ctypes`,
+no dependency): editors which write a temporary file and rename it are seen too. The events of one write are collected
+for SETTLE_SECONDS before the changed files are reloaded. Without inotify (or with `use_inotify=False`) the thread
+polls `st_mtime_ns`, `st_size` and `st_ino` of each file every `poll_interval` seconds: with inotify the files are
+polled at the same interval too.
+
+NOTE: the parsed LCONF-Sections of unchanged LCONF-Sections are shared between snapshots: readers must not change them.
+"""
+from ctypes import (
+    CDLL,
+    get_errno,
+)
+from hashlib import blake2b
+from os import (
+    close as os_close,
+    fsencode,
+    pipe,
+    read as os_read,
+    stat as os_stat,
+    write as os_write,
+)
+from os.path import (
+    abspath as path_abspath,
+    basename as path_basename,
+    dirname as path_dirname,
+)
+from select import select
+from struct import Struct
+from threading import (
+    Event,
+    Lock,
+    Thread,
+)
+from types import MappingProxyType
+
+from PyLCONF.lconf_loader import parse_section_span
+from PyLCONF.lconf_section import extract_sections
+
+
+DEFAULT_POLL_INTERVAL = 1.0
+# Seconds without a new inotify event before the changed files are reloaded
+SETTLE_SECONDS = 0.05
+SECTION_KEY_SIZE = 16
+
+# inotify: see `linux/inotify.h`
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# `struct inotify_event` without its name: `wd`, `mask`, `cookie`, `len`
+INOTIFY_EVENT = Struct('iIII')
+INOTIFY_READ_SIZE = 65536
+
+
+class ConfigSnapshot(object):
+    """ One immutable version of the parsed LCONF-Sections of a `ConfigStore`.
+
+    Supports the read-only mapping protocol with the LCONF-Section-Names as keys: `snapshot[section_name]`,
+    `section_name in snapshot`, `len(snapshot)`, `iter(snapshot)`, `get`, `keys`, `values`, `items`. A
+    LCONF-Section-Name used more than once maps to its first LCONF-Section (files in the order of `ConfigStore.paths`).
+
+    * `version`: (int) 1 for the first load: increased by one with each reload which changed a LCONF-File
+    * `files`: (mapping) absolute path: tuple of the parsed LCONF-Sections (LconfSection) of the file in file order
+    """
+    __slots__ = ('version', 'files', '_sections', '_section_keys')
+
+    def __init__(self, version, files, section_keys):
+        sections = {}
+        for section_objs in files.values():
+            for section_obj in section_objs:
+                sections.setdefault(section_obj.name, section_obj)
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, 'files', MappingProxyType(files))
+        object.__setattr__(self, '_sections', sections)
+        # absolute path: tuple of the keys of its LCONF-Sections: see `ConfigStore._load_file`
+        object.__setattr__(self, '_section_keys', section_keys)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ConfigSnapshot is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('ConfigSnapshot is immutable')
+
+    def __getitem__(self, section_name):
+        return self._sections[section_name]
+
+    def get(self, section_name, default=None):
+        return self._sections.get(section_name, default)
+
+    def __contains__(self, section_name):
+        return section_name in self._sections
+
+    def __len__(self):
+        return len(self._sections)
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def keys(self):
+        return list(self._sections)
+
+    def values(self):
+        return list(self._sections.values())
+
+    def items(self):
+        return list(self._sections.items())
+
+    def __repr__(self):
+        return '<{} version {}: {} LCONF-Sections in {} files>'.format(self.__class__.__name__, self.version,
+                                                                      len(self._sections), len(self.files))
+
+
+class ConfigStore(object):
+    """ The parsed LCONF-Sections of LCONF-Files: reloaded when the files change.
+
+    `ConfigStore(paths, lconf_schema_obj=None, use_numpy=True, poll_interval=DEFAULT_POLL_INTERVAL, use_inotify=True)`
+
+    * `paths`: (str or iterable of str) the LCONF-Files: all are loaded at creation, an error is raised
+    * `lconf_schema_obj`, `use_numpy`: see `lconf_loader.load`
+    * `poll_interval`: (float) seconds between two checks of the watcher thread without inotify events
+    * `use_inotify`: (bool) False: the watcher thread only polls
+
+    Readers use `snapshot` (or `version`): one attribute read, no lock. A reader which reads more than one value should
+    keep one snapshot for all of them.
+
+    `reload` or the watcher thread (`start`, `stop` or `with ConfigStore(..) as store:`) replace the snapshot: see the
+    module documentation. After each replacement the change callbacks are called in the thread which reloaded.
+
+    * `paths`: (tuple) the absolute paths of the LCONF-Files
+    """
+    __slots__ = ('paths', 'lconf_schema_obj', 'use_numpy', 'poll_interval', 'use_inotify', '_snapshot',
+                 '_file_signatures', '_reload_lock', '_change_callbacks', '_error_callbacks', '_thread',
+                 '_stop_event', '_inotify')
+
+    def __init__(self, paths, lconf_schema_obj=None, use_numpy=True, poll_interval=DEFAULT_POLL_INTERVAL,
+                 use_inotify=True):
+        if isinstance(paths, str):
+            paths = (paths,)
+        self.paths = tuple(path_abspath(path) for path in paths)
+        self.lconf_schema_obj = lconf_schema_obj
+        self.use_numpy = use_numpy
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        # absolute path: (st_mtime_ns, st_size, st_ino) of the last read: only used while holding `_reload_lock`
+        self._file_signatures = {}
+        self._reload_lock = Lock()
+        # Replaced, not changed: iterated without a lock
+        self._change_callbacks = ()
+        self._error_callbacks = ()
+        self._thread = None
+        self._stop_event = None
+        self._inotify = None
+
+        files = {}
+        section_keys = {}
+        for path in self.paths:
+            # Taken before the file is read: a change while reading is found by the next poll
+            self._file_signatures[path] = _file_signature(path)
+            with open(path, 'rb') as file_obj:
+                files[path], section_keys[path], _ = self._load_file(file_obj.read(), (), ())
+        self._snapshot = ConfigSnapshot(1, files, section_keys)
+
+    @property
+    def snapshot(self):
+        """ (ConfigSnapshot) the current snapshot.
+        """
+        return self._snapshot
+
+    @property
+    def version(self):
+        """ (int) the version of the current snapshot.
+        """
+        return self._snapshot.version
+
+    def add_change_callback(self, callback):
+        """ Adds a callable called after each replacement of the snapshot.
+
+        `callback(old_snapshot, new_snapshot, changed_names)`: `changed_names` is a frozenset of the
+        LCONF-Section-Names which were added, changed or removed.
+        """
+        self._change_callbacks += (callback,)
+
+    def add_error_callback(self, callback):
+        """ Adds a callable called with each error of a reload of the watcher thread: `callback(err)`.
+
+        The error is an `Err` for a not valid LCONF-Section, an `OSError` for a missing or not readable file or the
+        error of a change callback.
+        """
+        self._error_callbacks += (callback,)
+
+    def reload(self, paths=None):
+        """ Reloads the changed LCONF-Files and replaces the snapshot if any LCONF-Section changed.
+
+        * `paths`: (iterable of str) optional: read these LCONF-Files (of `paths`) even if their `os.stat` did not
+            change. The LCONF-Files whose `st_mtime_ns`, `st_size` or `st_ino` changed are always read.
+
+        The new `os.stat` of the read LCONF-Files is only stored if the reload succeeds: after an error (e.g. a not
+        valid or missing file) the next reload reads all of them again, none of their changes is lost.
+
+        **Returns:** (ConfigSnapshot) the new snapshot or None if no LCONF-Section changed else raises an error
+        """
+        if paths is not None:
+            paths = {path_abspath(path) for path in paths}
+        with self._reload_lock:
+            old_snapshot = self._snapshot
+            new_files = {}
+            new_section_keys = {}
+            changed_names = set()
+            new_file_signatures = {}
+            for path in self.paths:
+                signature = _file_signature(path)
+                if (paths is None or path not in paths) and signature == self._file_signatures.get(path):
+                    continue
+                new_file_signatures[path] = signature
+                with open(path, 'rb') as file_obj:
+                    buffer = file_obj.read()
+                loaded = self._load_file(buffer, old_snapshot.files[path], old_snapshot._section_keys[path])
+                if loaded is not None:
+                    new_files[path], new_section_keys[path], file_changed_names = loaded
+                    changed_names |= file_changed_names
+            if not new_files:
+                self._file_signatures.update(new_file_signatures)
+                return None
+
+            files = {path: new_files.get(path, old_snapshot.files[path]) for path in self.paths}
+            section_keys = {path: new_section_keys.get(path, old_snapshot._section_keys[path]) for path in self.paths}
+            new_snapshot = ConfigSnapshot(old_snapshot.version + 1, files, section_keys)
+            self._snapshot = new_snapshot
+            self._file_signatures.update(new_file_signatures)
+
+        changed_names = frozenset(changed_names)
+        for callback in self._change_callbacks:
+            callback(old_snapshot, new_snapshot, changed_names)
+        return new_snapshot
+
+    def _load_file(self, buffer, old_section_objs, old_section_keys):
+        """ Parses the new or changed LCONF-Sections of one LCONF-File.
+
+        **Returns:** (tuple) `(section_objs, section_keys, changed_names)` or None if the LCONF-Sections are the same
+        """
+        reusable = dict(zip(old_section_keys, old_section_objs))
+        section_objs = []
+        section_keys = []
+        changed_names = set()
+        with memoryview(buffer) as buffer_view:
+            for section_span in extract_sections(buffer, as_spans=True):
+                section_key = blake2b(buffer_view[section_span[0]:section_span[1]],
+                                      digest_size=SECTION_KEY_SIZE).digest()
+                section_obj = reusable.get(section_key)
+                if section_obj is None:
+                    section_obj = parse_section_span(section_span, buffer, self.lconf_schema_obj, self.use_numpy)
+                    changed_names.add(section_obj.name)
+                section_objs.append(section_obj)
+                section_keys.append(section_key)
+        section_keys = tuple(section_keys)
+        if section_keys == tuple(old_section_keys):
+            return None
+        # Removed LCONF-Sections
+        new_keys = set(section_keys)
+        changed_names.update(section_obj.name for section_key, section_obj in reusable.items()
+                             if section_key not in new_keys)
+        return tuple(section_objs), section_keys, changed_names
+
+    def start(self):
+        """ Starts the watcher thread: nothing if it runs.
+        """
+        if self._thread is not None:
+            return
+        self._inotify = None
+        if self.use_inotify:
+            try:
+                self._inotify = _Inotify(self.paths)
+            except OSError:
+                pass
+        self._stop_event = Event()
+        self._thread = Thread(target=self._watch, args=(self._stop_event, self._inotify),
+                              name='ConfigStore watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """ Stops the watcher thread and waits up to `timeout` seconds (None: no limit) for it to end.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        if self._inotify is not None:
+            self._inotify.wake()
+        self._thread.join(timeout)
+        if self._inotify is not None and not self._thread.is_alive():
+            self._inotify.close()
+        self._thread = None
+        self._inotify = None
+
+    @property
+    def is_watching(self):
+        """ (bool) True while the watcher thread runs: `uses_inotify` tells how it watches.
+        """
+        return self._thread is not None
+
+    @property
+    def uses_inotify(self):
+        return self._inotify is not None
+
+    def _watch(self, stop_event, inotify):
+        """ The loop of the watcher thread.
+        """
+        while not stop_event.is_set():
+            paths = None
+            if inotify is None:
+                if stop_event.wait(self.poll_interval):
+                    break
+            else:
+                changed_paths = inotify.wait(self.poll_interval)
+                if changed_paths:
+                    while True:
+                        more_paths = inotify.wait(SETTLE_SECONDS)
+                        if not more_paths:
+                            break
+                        changed_paths |= more_paths
+                    paths = changed_paths
+                if stop_event.is_set():
+                    break
+            try:
+                self.reload(paths)
+            except Exception as err:
+                for callback in self._error_callbacks:
+                    callback(err)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def __repr__(self):
+        return '<{}: {} files, version {}{}>'.format(self.__class__.__name__, len(self.paths), self._snapshot.version,
+                                                    ', watching' if self._thread is not None else '')
+
+
+def _file_signature(path):
+    """ Returns `(st_mtime_ns, st_size, st_ino)` of a file: None if it does not exist.
+    """
+    try:
+        stat_result = os_stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+
+class _Inotify(object):
+    """ The inotify events of the directories of the LCONF-Files: raises an OSError if inotify is not available.
+    """
+    __slots__ = ('_fd', '_wake_read', '_wake_write', '_paths_by_name', '_all_paths')
+
+    def __init__(self, paths):
+        try:
+            libc = CDLL(None, use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            raise OSError('inotify is not available')
+        self._fd = inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(get_errno(), 'inotify_init1 failed')
+        self._all_paths = frozenset(paths)
+        # (watch descriptor, file name): absolute path
+        self._paths_by_name = {}
+        watch_descriptors = {}
+        for path in paths:
+            directory = path_dirname(path)
+            if directory not in watch_descriptors:
+                watch_descriptor = inotify_add_watch(self._fd, fsencode(directory), WATCH_MASK)
+                if watch_descriptor < 0:
+                    errno = get_errno()
+                    os_close(self._fd)
+                    raise OSError(errno, 'inotify_add_watch failed: {}'.format(directory))
+                watch_descriptors[directory] = watch_descriptor
+            self._paths_by_name[(watch_descriptors[directory], fsencode(path_basename(path)))] = path
+        self._wake_read, self._wake_write = pipe()
+
+    def wait(self, timeout):
+        """ Waits up to `timeout` seconds for events.
+
+        **Returns:** (set) the absolute paths of the LCONF-Files with events: all after a queue overflow, empty on a
+            timeout or after `wake`
+        """
+        if self._fd not in select([self._fd, self._wake_read], [], [], timeout)[0]:
+            return set()
+        try:
+            data = os_read(self._fd, INOTIFY_READ_SIZE)
+        except BlockingIOError:
+            return set()
+        paths = set()
+        paths_by_name = self._paths_by_name
+        event_size = INOTIFY_EVENT.size
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, name_length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += event_size
+            if mask & IN_Q_OVERFLOW:
+                return set(self._all_paths)
+            path = paths_by_name.get((watch_descriptor, data[offset:offset + name_length].rstrip(b'\x00')))
+            if path is not None:
+                paths.add(path)
+            offset += name_length
+        return paths
+
+    def wake(self):
+        """ Ends a running `wait` (and all later ones) at once.
+        """
+        os_write(self._wake_write, b'\x00')
+
+    def close(self):
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            os_close(fd)
@@ -0,0 +1,597 @@
+# cython: language_level=3
+"""
+### PyLCONF._speedups
+
+#### Overview
+
+Compiled versions of the LCONF-Section line functions: selected by `PyLCONF.lconf_section` at import, the pure-Python
+code is used if this extension is not built.
+
+`section_splitlines`: Compiled `lconf_section.section_splitlines`.
+`prepare_section_lines`: Compiled `lconf_section.prepare_section_lines`.
+`check_section_text`: The state machine of `line_engine.iter_section_lines` (without yielding the lines): returns only
+    if a whole LCONF-Section is valid.
+`scan_lines`: Compiled `line_table.scan_lines`: fills the `LineTable` arrays in one scan over the characters.
+
+The compiled functions only decide if the input is valid: all errors are raised by the pure-Python functions
+(`lconf_section.py_section_splitlines`, `lconf_section.py_prepare_section_lines`, `line_engine.iter_section_lines`)
+which are called again for a not valid input. The messages, codes, line numbers and columns of the errors are the same
+with and without this extension.
+
+`check_section_text` runs on the undecoded UTF-8 `bytes` of a LCONF-Section: the lines are not split into objects,
+each character is read from the buffer. Indexes the Python code would not reach (or could only reach by raising an
+error) make it return False: the pure-Python code decides these lines.
+"""
+from cpython cimport array
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+from libc.stdlib cimport (
+    free,
+    malloc,
+    realloc,
+)
+from libc.limits cimport INT_MAX
+
+import array
+
+
+cdef extern from "Python.h":
+    ctypedef unsigned char Py_UCS1
+    ctypedef unsigned short Py_UCS2
+    int PyUnicode_1BYTE_KIND
+    int PyUnicode_2BYTE_KIND
+    int PyUnicode_KIND(object o)
+    void* PyUnicode_DATA(object o)
+    Py_UCS4 PyUnicode_READ(int kind, void* data, Py_ssize_t index)
+    char* PyBytes_AS_STRING(object o)
+
+
+# Structural tokens: all ASCII
+cdef enum:
+    C_SPACE = 32                # ' '
+    C_NUMBER_SIGN = 35          # '#' LCONF_COMMENT_LINE_IDENTIFIER
+    C_ASTERISK = 42             # '*' STRUCTURE_BLOCKS_IDENTIFIER
+    C_MINUS = 45                # '-' STRUCTURE_LIST_IDENTIFIER
+    C_PERIOD = 46               # '.' STRUCTURE_SINGLE_BLOCK_IDENTIFIER
+    C_COLON = 58                # ':' LCONF_KEY_VALUE_SEPARATOR: two of them
+    C_VERTICAL_LINE = 124       # '|' STRUCTURE_TABLE_IDENTIFIER and STRUCTURE_TABLE_VALUE_SEPARATOR
+    C_LF = 10
+    C_CR = 13
+
+# Stack situations: the same numbers as `line_engine.IS_*`
+cdef enum:
+    IS_ROOT = 0
+    IS_SINGLE_BLOCK = 1
+    IS_GENERAL_LIST = 2
+    IS_TABLE = 3
+    IS_REPEATED_BLOCK = 4
+    IS_NAMED_BLOCKS = 5
+    IS_UNNAMED_BLOCKS = 6
+
+# Result of one line
+cdef enum:
+    LINE_OK = 0
+    LINE_WRONG = 1
+
+# Nesting levels allocated at first: doubled if needed
+cdef enum:
+    INITIAL_STACK_SIZE = 64
+
+# Lines allocated at first by `scan_lines`: doubled if needed
+cdef enum:
+    INITIAL_LINES_SIZE = 256
+
+SECTION_END_TOKEN_BYTES = b'___END'
+
+
+# The pure-Python functions of `lconf_section`: imported at the first use, `lconf_section` imports this module
+cdef object _lconf_section = None
+
+
+cdef object _get_lconf_section():
+    global _lconf_section
+    if _lconf_section is None:
+        from PyLCONF import lconf_section
+        _lconf_section = lconf_section
+    return _lconf_section
+
+
+# The `LineTable` arrays: the same typecodes as `line_table.STARTS_TYPECODE`, `LENGTHS_TYPECODE`, `INDENTS_TYPECODE`
+cdef array.array STARTS_TEMPLATE = array.array('q')
+cdef array.array INTS_TEMPLATE = array.array('i')
+
+
+# The characters of one line: UTF-8 `bytes` or the 1, 2 or 4 byte kind of a `str`
+ctypedef fused char_t:
+    Py_UCS1
+    Py_UCS2
+    Py_UCS4
+
+
+cdef struct LineState:
+    # The open structures: one item per nesting level
+    int* stack_situations
+    Py_ssize_t stack_size
+    Py_ssize_t len_stack
+    int stack_situation
+    Py_ssize_t prev_indent
+    Py_ssize_t check_indent
+    Py_ssize_t table_rows_expected_pipes
+    Py_ssize_t section_indentation_number
+
+
+cdef inline bint _is_space(Py_UCS4 char_, bint is_str):
+    """ The characters removed by `str.lstrip()` / `bytes.lstrip()`.
+    """
+    if is_str:
+        return Py_UNICODE_ISSPACE(char_)
+    return char_ == C_SPACE or (9 <= char_ <= 13)
+
+
+cdef inline bint _is_identifier(Py_UCS4 char_):
+    return char_ == C_MINUS or char_ == C_VERTICAL_LINE or char_ == C_PERIOD or char_ == C_ASTERISK
+
+
+cdef int _check_line(LineState* state, const char_t* data, Py_ssize_t length, bint is_str) except -1:
+    """ Checks one not empty LCONF-Section line: `data[:length]`.
+
+    Returns LINE_OK or LINE_WRONG: the same checks in the same order as `line_engine.iter_section_lines`.
+    """
+    cdef Py_ssize_t cur_indent = 0
+    cdef Py_ssize_t cur_level
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t key_value_separator_idx = -1
+    cdef Py_ssize_t row_pipes
+    cdef Py_UCS4 first_char
+    cdef Py_UCS4 last_char = data[length - 1]
+
+    # Check Trailing Space
+    if last_char == C_SPACE:
+        return LINE_WRONG
+    while cur_indent < length and _is_space(data[cur_indent], is_str):
+        cur_indent += 1
+    # A line of only whitespace
+    if cur_indent == length:
+        return LINE_WRONG
+    first_char = data[cur_indent]
+    # Skip LCONF-Section-Comment-Line
+    if first_char == C_NUMBER_SIGN:
+        return LINE_OK
+
+    if cur_indent != state.check_indent:
+        if cur_indent != state.prev_indent:
+            if cur_indent > state.prev_indent + state.section_indentation_number:
+                return LINE_WRONG
+            elif cur_indent % state.section_indentation_number != 0:
+                return LINE_WRONG
+            state.prev_indent = cur_indent
+        state.check_indent = cur_indent
+        cur_level = cur_indent // state.section_indentation_number
+        if cur_level < state.len_stack - 1:
+            state.len_stack = cur_level + 1
+        elif cur_level >= state.len_stack:
+            return LINE_WRONG
+        state.stack_situation = state.stack_situations[cur_level]
+    else:
+        cur_level = state.len_stack - 1
+
+    # The first LCONF_KEY_VALUE_SEPARATOR `::`
+    for idx in range(length - 1):
+        if data[idx] == C_COLON and data[idx + 1] == C_COLON:
+            key_value_separator_idx = idx
+            break
+
+    # ====  ==== ==== Root or STRUCTURE_SINGLE_BLOCK: check any new situation ====  ==== ====   #
+    if state.stack_situation <= IS_SINGLE_BLOCK:
+        if not _is_identifier(first_char):
+            # `STRUCTURE_PAIR`: exactly one space before and after: or one space before and line end (empty value)
+            if key_value_separator_idx < cur_indent + 2:
+                return LINE_WRONG
+            if _char_at(data, length, key_value_separator_idx - 1) != C_SPACE or \
+                    _char_at(data, length, key_value_separator_idx - 2) == C_SPACE:
+                return LINE_WRONG
+            if length != key_value_separator_idx + 2 and (
+                    _char_at(data, length, key_value_separator_idx + 2) != C_SPACE or
+                    _char_at(data, length, key_value_separator_idx + 3) == C_SPACE):
+                return LINE_WRONG
+            return LINE_OK
+
+        # Identifier lines: `- `, `| `, `. `, `* ` followed by the LCONF-Key-Name
+        if length < cur_indent + 3 or data[cur_indent + 1] != C_SPACE or \
+                data[cur_indent + 2] == C_SPACE:
+            return LINE_WRONG
+        if key_value_separator_idx != -1:
+            # Compact_STRUCTURE_LIST
+            if first_char != C_MINUS:
+                return LINE_WRONG
+            if (_char_at(data, length, key_value_separator_idx - 1) != C_SPACE or
+                _char_at(data, length, key_value_separator_idx - 2) == C_SPACE or
+                length < key_value_separator_idx + 4 or
+                data[key_value_separator_idx + 2] != C_SPACE or
+                data[key_value_separator_idx + 3] == C_SPACE
+                ):
+                return LINE_WRONG
+            return LINE_OK
+        if first_char == C_VERTICAL_LINE:
+            if last_char == C_VERTICAL_LINE:
+                return LINE_WRONG
+            state.table_rows_expected_pipes = -1
+            _push(state, IS_TABLE)
+        elif first_char == C_MINUS:
+            _push(state, IS_GENERAL_LIST)
+        elif first_char == C_PERIOD:
+            _push(state, IS_SINGLE_BLOCK)
+        else:
+            _push(state, IS_REPEATED_BLOCK)
+        state.check_indent = -1
+
+    # ====  ==== ==== continue stack_situation ====  ==== ====   #
+    # STRUCTURE_LIST (General-List): only LCONF-Values
+    elif state.stack_situation == IS_GENERAL_LIST:
+        if _is_identifier(first_char) or key_value_separator_idx != -1:
+            return LINE_WRONG
+
+    # STRUCTURE_TABLE: rows start and end with a STRUCTURE_TABLE_VALUE_SEPARATOR: all the same number of them
+    elif state.stack_situation == IS_TABLE:
+        if first_char != C_VERTICAL_LINE or last_char != C_VERTICAL_LINE or key_value_separator_idx != -1:
+            return LINE_WRONG
+        row_pipes = 0
+        for idx in range(cur_indent, length):
+            if data[idx] == C_VERTICAL_LINE:
+                row_pipes += 1
+        if state.table_rows_expected_pipes == -1:
+            if row_pipes < 2:
+                return LINE_WRONG
+            state.table_rows_expected_pipes = row_pipes
+        elif row_pipes != state.table_rows_expected_pipes:
+            return LINE_WRONG
+
+    # STRUCTURE_NAMED_BLOCKS / STRUCTURE_UNNAMED_BLOCKS: only STRUCTURE_SINGLE_BLOCK_IDENTIFIER lines
+    else:
+        if key_value_separator_idx != -1 or first_char != C_PERIOD:
+            return LINE_WRONG
+        # The first item decides: NAMED or UNNAMED
+        if state.stack_situation == IS_REPEATED_BLOCK:
+            if length == cur_indent + 1:
+                state.stack_situation = IS_UNNAMED_BLOCKS
+            else:
+                state.stack_situation = IS_NAMED_BLOCKS
+            state.stack_situations[cur_level] = state.stack_situation
+        if state.stack_situation == IS_NAMED_BLOCKS:
+            if length <= cur_indent + 2 or data[cur_indent + 1] != C_SPACE or \
+                    data[cur_indent + 2] == C_SPACE:
+                return LINE_WRONG
+        elif length > cur_indent + 1:
+            return LINE_WRONG
+        _push(state, IS_SINGLE_BLOCK)
+        state.check_indent = -1
+    return LINE_OK
+
+
+cdef inline long _char_at(const char_t* data, Py_ssize_t length, Py_ssize_t idx):
+    """ The character at `idx` of a line or -1 for an index out of it (also negative ones: Python would wrap them).
+    """
+    if idx < 0 or idx >= length:
+        return -1
+    return data[idx]
+
+
+cdef int _push(LineState* state, int stack_situation) except -1:
+    cdef int* new_stack
+    if state.len_stack == state.stack_size:
+        new_stack = <int*>realloc(state.stack_situations, 2 * state.stack_size * sizeof(int))
+        if new_stack is NULL:
+            raise MemoryError()
+        state.stack_situations = new_stack
+        state.stack_size *= 2
+    state.stack_situations[state.len_stack] = stack_situation
+    state.len_stack += 1
+    return 0
+
+
+cdef bint _check_section_bytes(bytes section_text, Py_ssize_t section_indentation_number, Py_ssize_t body_start,
+                               Py_ssize_t body_end) except -1:
+    """ Checks the lines of `section_text[body_start:body_end]`: split like `bytes.splitlines`.
+    """
+    cdef const Py_UCS1* data = <const Py_UCS1*>PyBytes_AS_STRING(section_text)
+    cdef Py_ssize_t line_start = body_start
+    cdef Py_ssize_t idx = body_start
+    cdef unsigned char char_
+    cdef LineState state
+    cdef bint is_valid = True
+
+    _init_state(&state, section_indentation_number)
+    try:
+        while idx < body_end:
+            char_ = data[idx]
+            if char_ != C_LF and char_ != C_CR:
+                idx += 1
+                continue
+            if idx > line_start and _check_line(&state, data + line_start, idx - line_start, False) != LINE_OK:
+                is_valid = False
+                break
+            if char_ == C_CR and idx + 1 < body_end and data[idx + 1] == C_LF:
+                idx += 1
+            idx += 1
+            line_start = idx
+        else:
+            if body_end > line_start and _check_line(&state, data + line_start, body_end - line_start,
+                                                     False) != LINE_OK:
+                is_valid = False
+    finally:
+        free(state.stack_situations)
+    return is_valid
+
+
+cdef bint _check_section_str_lines(list section_lines, Py_ssize_t section_indentation_number) except -1:
+    """ Checks the `str` lines between the first and the last line.
+    """
+    cdef Py_ssize_t line_idx
+    cdef str orig_line
+    cdef int kind
+    cdef int line_result
+    cdef LineState state
+    cdef bint is_valid = True
+
+    _init_state(&state, section_indentation_number)
+    try:
+        for line_idx in range(1, len(section_lines) - 1):
+            orig_line = section_lines[line_idx]
+            if not orig_line:
+                continue
+            kind = PyUnicode_KIND(orig_line)
+            if kind == PyUnicode_1BYTE_KIND:
+                line_result = _check_line(&state, <const Py_UCS1*>PyUnicode_DATA(orig_line), len(orig_line), True)
+            elif kind == PyUnicode_2BYTE_KIND:
+                line_result = _check_line(&state, <const Py_UCS2*>PyUnicode_DATA(orig_line), len(orig_line), True)
+            else:
+                line_result = _check_line(&state, <const Py_UCS4*>PyUnicode_DATA(orig_line), len(orig_line), True)
+            if line_result != LINE_OK:
+                is_valid = False
+                break
+    finally:
+        free(state.stack_situations)
+    return is_valid
+
+
+cdef int _init_state(LineState* state, Py_ssize_t section_indentation_number) except -1:
+    state.stack_situations = <int*>malloc(INITIAL_STACK_SIZE * sizeof(int))
+    if state.stack_situations is NULL:
+        raise MemoryError()
+    state.stack_size = INITIAL_STACK_SIZE
+    state.stack_situations[0] = IS_ROOT
+    state.len_stack = 1
+    state.stack_situation = IS_ROOT
+    state.prev_indent = 0
+    state.check_indent = -1
+    state.table_rows_expected_pipes = -1
+    state.section_indentation_number = section_indentation_number
+    return 0
+
+
+cdef inline bint _is_line_break(Py_UCS4 char_, bint is_str):
+    """ The line boundaries of `str.splitlines()` / `bytes.splitlines()`.
+    """
+    if char_ == C_LF or char_ == C_CR:
+        return True
+    if not is_str:
+        return False
+    return char_ == 0x0B or char_ == 0x0C or 0x1C <= char_ <= 0x1E or char_ == 0x85 or char_ == 0x2028 or \
+        char_ == 0x2029
+
+
+cdef int _scan_lines(const char_t* data, Py_ssize_t length, bint is_str, array.array starts, array.array lengths,
+                     array.array indents) except -1:
+    """ Fills the arrays with the lines of `data[:length]`: resized to the number of lines.
+    """
+    cdef Py_ssize_t idx = 0
+    cdef Py_ssize_t line_start
+    cdef Py_ssize_t line_indent
+    cdef Py_ssize_t line_count = 0
+    cdef Py_ssize_t capacity = len(starts)
+
+    while idx < length:
+        line_start = idx
+        while idx < length and not _is_line_break(data[idx], is_str) and _is_space(data[idx], is_str):
+            idx += 1
+        line_indent = idx - line_start
+        while idx < length and not _is_line_break(data[idx], is_str):
+            idx += 1
+        if idx - line_start > INT_MAX:
+            raise OverflowError('line too long for the LineTable')
+        if line_count == capacity:
+            capacity *= 2
+            array.resize(starts, capacity)
+            array.resize(lengths, capacity)
+            array.resize(indents, capacity)
+        starts.data.as_longlongs[line_count] = line_start
+        lengths.data.as_ints[line_count] = <int>(idx - line_start)
+        indents.data.as_ints[line_count] = <int>line_indent
+        line_count += 1
+        if idx < length:
+            if data[idx] == C_CR and idx + 1 < length and data[idx + 1] == C_LF:
+                idx += 1
+            idx += 1
+    array.resize(starts, line_count)
+    array.resize(lengths, line_count)
+    array.resize(indents, line_count)
+    return 0
+
+
+# =================================================================================================================== #
+
+def scan_lines(text):
+    """
+    #### _speedups.scan_lines
+
+    Compiled `line_table.scan_lines`: the same result.
+
+    `scan_lines(text)`
+    """
+    cdef array.array starts
+    cdef array.array lengths
+    cdef array.array indents
+    cdef int kind
+
+    if type(text) is not str and type(text) is not bytes:
+        from PyLCONF.line_table import py_scan_lines
+        return py_scan_lines(text)
+    starts = array.clone(STARTS_TEMPLATE, INITIAL_LINES_SIZE, False)
+    lengths = array.clone(INTS_TEMPLATE, INITIAL_LINES_SIZE, False)
+    indents = array.clone(INTS_TEMPLATE, INITIAL_LINES_SIZE, False)
+    if type(text) is bytes:
+        _scan_lines(<const Py_UCS1*>PyBytes_AS_STRING(text), len(text), False, starts, lengths, indents)
+    else:
+        kind = PyUnicode_KIND(text)
+        if kind == PyUnicode_1BYTE_KIND:
+            _scan_lines(<const Py_UCS1*>PyUnicode_DATA(text), len(text), True, starts, lengths, indents)
+        elif kind == PyUnicode_2BYTE_KIND:
+            _scan_lines(<const Py_UCS2*>PyUnicode_DATA(text), len(text), True, starts, lengths, indents)
+        else:
+            _scan_lines(<const Py_UCS4*>PyUnicode_DATA(text), len(text), True, starts, lengths, indents)
+    return starts, lengths, indents
+
+
+def check_section_text(section_text):
+    """
+    #### _speedups.check_section_text
+
+    Returns True if one LCONF-Section is valid like `lconf_section.validate_one_section_fast` (without errors).
+
+    `check_section_text(section_text)`
+
+    **Parameters:**
+
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+
+    **Returns:** (bool) True if valid: False if not valid or not decided: never raises for a wrong LCONF-Section
+    """
+    cdef Py_ssize_t first_line_end
+    cdef Py_ssize_t body_start
+    cdef Py_ssize_t body_end
+    cdef Py_ssize_t last_line_start
+    cdef Py_ssize_t text_length
+    cdef const unsigned char* data
+    cdef unsigned char char_
+
+    if type(section_text) is str:
+        section_lines = section_text.splitlines()
+        try:
+            section_indentation_number = _get_lconf_section().section_first_line(section_lines[0])[0]
+        except Exception:
+            return False
+        if section_lines[-1] != '___END':
+            return False
+        return _check_section_str_lines(section_lines, section_indentation_number)
+
+    if type(section_text) is not bytes:
+        return False
+    data = <const unsigned char*>PyBytes_AS_STRING(section_text)
+    text_length = len(section_text)
+    # `splitlines` does not return a last empty line: the LCONF-Section-End-Line is the last not empty one
+    body_end = text_length
+    if body_end and data[body_end - 1] == C_LF:
+        body_end -= 1
+    if body_end and data[body_end - 1] == C_CR:
+        body_end -= 1
+    if body_end < text_length and body_end and data[body_end - 1] in (C_LF, C_CR):
+        # More than one newline at the end: an empty last line
+        return False
+    last_line_start = body_end
+    while last_line_start and data[last_line_start - 1] != C_LF and data[last_line_start - 1] != C_CR:
+        last_line_start -= 1
+    if last_line_start == 0 or section_text[last_line_start:body_end] != SECTION_END_TOKEN_BYTES:
+        return False
+
+    first_line_end = 0
+    while data[first_line_end] != C_LF and data[first_line_end] != C_CR:
+        first_line_end += 1
+    try:
+        section_indentation_number = _get_lconf_section().section_first_line(
+            section_text[:first_line_end].decode('utf-8'))[0]
+    except Exception:
+        return False
+    body_start = first_line_end + 1
+    if data[first_line_end] == C_CR and data[body_start] == C_LF:
+        body_start += 1
+    return _check_section_bytes(section_text, section_indentation_number, body_start, last_line_start)
+
+
+def section_splitlines(section_text):
+    """
+    #### _speedups.section_splitlines
+
+    Compiled `lconf_section.section_splitlines`: the same result and errors.
+
+    `section_splitlines(section_text)`
+    """
+    cdef list section_lines = section_text.splitlines()
+    if not section_lines:
+        return _get_lconf_section().py_section_splitlines(section_text)
+    if type(section_text) is str:
+        first_line = section_lines[0]
+        is_end_line = section_lines[-1] == '___END'
+    else:
+        first_line = section_lines[0].decode('utf-8')
+        is_end_line = section_lines[-1] == SECTION_END_TOKEN_BYTES
+    section_indentation_number, section_format, section_name = _get_lconf_section().section_first_line(first_line)
+    if not is_end_line:
+        return _get_lconf_section().py_section_splitlines(section_text)
+    return section_lines, section_indentation_number, section_format, section_name
+
+
+def prepare_section_lines(section_lines, Py_ssize_t section_indentation_number, section_format, section_name,
+                          Py_ssize_t first_line_number=1):
+    """
+    #### _speedups.prepare_section_lines
+
+    Compiled `lconf_section.prepare_section_lines`: the same result and errors.
+
+    `prepare_section_lines(section_lines, section_indentation_number, section_format, section_name,
+                          first_line_number=1)`
+    """
+    cdef list prepared_lines = []
+    cdef Py_ssize_t prev_indent = 0
+    cdef Py_ssize_t line_indent
+    cdef Py_ssize_t length
+    cdef Py_ssize_t line_idx
+    cdef int kind
+    cdef void* data
+    cdef type line_type = type(section_lines[0])
+    cdef bint is_str = line_type is str
+
+    if not is_str and line_type is not bytes:
+        return _get_lconf_section().py_prepare_section_lines(
+            section_lines, section_indentation_number, section_format, section_name, first_line_number)
+    for line_idx in range(1, len(section_lines)):
+        orig_line = section_lines[line_idx]
+        # Skip complete Blank-Line (zero characters)
+        if not orig_line:
+            continue
+        if type(orig_line) is not line_type:
+            return _get_lconf_section().py_prepare_section_lines(
+                section_lines, section_indentation_number, section_format, section_name, first_line_number)
+        if is_str:
+            kind = PyUnicode_KIND(orig_line)
+            data = PyUnicode_DATA(orig_line)
+        else:
+            kind = PyUnicode_1BYTE_KIND
+            data = PyBytes_AS_STRING(orig_line)
+        length = len(orig_line)
+        line_indent = 0
+        while line_indent < length and _is_space(PyUnicode_READ(kind, data, line_indent), is_str):
+            line_indent += 1
+        # Trailing space or a line of only whitespace: raised by the pure-Python code
+        if PyUnicode_READ(kind, data, length - 1) == C_SPACE or line_indent == length:
+            return _get_lconf_section().py_prepare_section_lines(
+                section_lines, section_indentation_number, section_format, section_name, first_line_number)
+        # Skip LCONF-Section-Comment-Line
+        if PyUnicode_READ(kind, data, line_indent) == C_NUMBER_SIGN:
+            continue
+        # Indentation increase jump or not a multiple of section_indentation_number
+        if line_indent > prev_indent + section_indentation_number or (
+                line_indent != prev_indent and line_indent % section_indentation_number != 0):
+            return _get_lconf_section().py_prepare_section_lines(
+                section_lines, section_indentation_number, section_format, section_name, first_line_number)
+        prepared_lines.append((line_indent, orig_line, first_line_number + line_idx))
+        prev_indent = line_indent
+    return prepared_lines
@@ -0,0 +1,116 @@
+"""
+### PyLCONF.indexer
+
+#### Overview
+
+This module is used by the PyLCONF section index script: `pylconf-index`
+
+```bash
+pylconf-index path-to-first.lconf path-to-dir
+pylconf-index --force --extension .lconf --extension .lconfsd path-to-dir
+```
+
+`pylconf-index` builds the index files (see `section_index`) of the given LCONF-Files and of the LCONF-Files in the
+given directory trees: only missing or stale ones, with `--force` all of them.
+
+Exit code: 0 if all files were done else 1.
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from os import walk as os_walk
+from os.path import (
+    isdir as path_isdir,
+    join as path_join,
+)
+from sys import (
+    exit as sys_exit,
+    stderr as sys_stderr,
+    stdout as sys_stdout,
+)
+
+from PyLCONF.section_index import (
+    build_index,
+    open_index,
+)
+from PyLCONF.utilities import Err
+
+
+DEFAULT_EXTENSIONS = ('.lconf',)
+
+
+def parse_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Build the section index files (`.idx`) of `LCONF files` and directory trees',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    pylconf-index path-to-first.lconf path-to-dir
+    pylconf-index --force --extension .lconf --extension .lconfsd path-to-dir
+    '''
+    )
+
+    main_parser.add_argument(
+       'in_paths',
+       nargs='*',
+       default=[],
+       help='LCONF-Files and directories: directories are searched recursively for files with the extensions',
+    )
+    main_parser.add_argument(
+       '-e', '--extension',
+       action='append',
+       default=None,
+       help='Extension of the LCONF-Files in directories: may be repeated (default: {})'.format(
+           ' '.join(DEFAULT_EXTENSIONS)),
+    )
+    main_parser.add_argument(
+       '-f', '--force',
+       action='store_true',
+       help='Rebuild all index files: else only missing or stale ones',
+    )
+
+    args = main_parser.parse_args()
+    if not args.in_paths:
+        main_parser.print_help()
+        sys_exit()
+    if args.extension is None:
+        args.extension = DEFAULT_EXTENSIONS
+
+    return args
+
+
+def iter_lconf_files(in_paths, extensions=DEFAULT_EXTENSIONS):
+    """
+    #### indexer.iter_lconf_files
+
+    Yields the given files and the files with one of the `extensions` in the given directories (recursively, sorted).
+
+    `iter_lconf_files(in_paths, extensions=DEFAULT_EXTENSIONS)`
+    """
+    extensions = tuple(extensions)
+    for in_path in in_paths:
+        if not path_isdir(in_path):
+            yield in_path
+            continue
+        for dir_path, dir_names, file_names in os_walk(in_path):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith(extensions):
+                    yield path_join(dir_path, file_name)
+
+
+def main():
+    args = parse_commandline()
+    is_done = True
+    for path_to_lconf_file in iter_lconf_files(args.in_paths, args.extension):
+        try:
+            if args.force:
+                section_index = build_index(path_to_lconf_file)
+            else:
+                section_index = open_index(path_to_lconf_file, must_write=True)
+        except (OSError, Err) as err:
+            sys_stderr.write('pylconf-index: {}: {}\n'.format(path_to_lconf_file,
+                                                              err.message if isinstance(err, Err) else err))
+            is_done = False
+            continue
+        sys_stdout.write('{} -> {}: {} LCONF-Sections\n'.format(path_to_lconf_file, section_index.path_to_index_file,
+                                                                section_index.section_count))
+    return 0 if is_done else 1
@@ -0,0 +1,249 @@
+"""
+### PyLCONF.lazy_section
+
+#### Overview
+
+`LazySection`: One LCONF-Section which parses its top-level items only when they are accessed.
+"""
+from re import (
+    compile as re_compile,
+    MULTILINE as RE_MULTILINE,
+)
+
+from PyLCONF.constants import (
+    LCONF_SECTION_END as SECTION_END_TOKEN,
+    STRUCTURE_LIST_IDENTIFIER,
+    STRUCTURE_TABLE_IDENTIFIER,
+    STRUCTURE_SINGLE_BLOCK_IDENTIFIER,
+    STRUCTURE_BLOCKS_IDENTIFIER,
+    LCONF_KEY_VALUE_SEPARATOR,
+)
+from PyLCONF.lconf_section import (
+    parse_section_lines,
+    section_bytes_from_span,
+    section_first_line,
+)
+from PyLCONF.line_table import LineTable
+from PyLCONF.structure_classes import StructureSingleBlock
+from PyLCONF.utilities import (
+    ERR_SECTION_END_LINE,
+    Err,
+)
+
+
+# Lines which start a top-level item: not indented and not a LCONF_BLANK_LINE or LCONF-Section-Comment-Line.
+#   The LCONF-Section-Start-Line and the LCONF-Section-End-Line match too.
+TOP_LEVEL_LINE_RE = re_compile(r'^[^ #\r\n]', RE_MULTILINE)
+TOP_LEVEL_LINE_BYTES_RE = re_compile(br'^[^ #\r\n]', RE_MULTILINE)
+
+IDENTIFIERS = (
+    STRUCTURE_LIST_IDENTIFIER,
+    STRUCTURE_TABLE_IDENTIFIER,
+    STRUCTURE_SINGLE_BLOCK_IDENTIFIER,
+    STRUCTURE_BLOCKS_IDENTIFIER,
+)
+BYTES_IDENTIFIERS = tuple(ord(identifier_) for identifier_ in IDENTIFIERS)
+
+# Marks a not yet parsed top-level item
+NOT_PARSED = object()
+
+
+class LazySection(object):
+    """ One LCONF-Section which parses its top-level items only when they are accessed.
+
+    `LazySection(section_text, buffer=None)`
+
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+    * `buffer`: (bytes, bytearray, mmap or memoryview) optional: if given `section_text` must be a section span
+        `(start, end, section_name, section_format)` into it: see `extract_sections(source, as_spans=True)`.
+
+    At creation only the LCONF-Section-Start-Line, the LCONF-Section-End-Line and the lines before the first top-level
+    item are validated: the start of each top-level item (not indented line) is found with one regular expression
+    search and its LCONF-Key-Name is read from that line.
+
+    Supports the read-only mapping protocol like `StructureSingleBlock`. An item is parsed and validated like in
+    `lconf_section.parse_section` on its first access: the result is cached. A full traversal (`values`, `items`,
+    `to_python`) or `validate` parses and so validates all items: the source text is then released.
+
+    NOTE: a lookup of a missing LCONF-Key-Name raises a KeyError without validating the LCONF-Section.
+
+    * `name`: (str) the LCONF-Section-Name
+    * `section_format`: (str) the LCONF-Section format: `LCONF`, `STRICT` or `FLEXIBLE`
+    * `section_indentation_number`: (int) the LCONF-Indentation-Per-Level number
+    """
+    __slots__ = ('name', 'section_format', 'section_indentation_number', '_text', '_first_line', '_item_starts',
+                 '_item_line_numbers', '_keys', '_values', '_index', '_not_parsed_count')
+
+    def __init__(self, section_text, buffer=None):
+        if buffer is not None:
+            section_text = section_bytes_from_span(buffer, section_text)
+        if isinstance(section_text, str):
+            top_level_line_re = TOP_LEVEL_LINE_RE
+            identifiers = IDENTIFIERS
+            newline = '\n'
+            carriage_return = '\r'
+            key_value_separator = LCONF_KEY_VALUE_SEPARATOR
+            to_str = str.__str__
+        else:
+            top_level_line_re = TOP_LEVEL_LINE_BYTES_RE
+            identifiers = BYTES_IDENTIFIERS
+            newline = b'\n'
+            carriage_return = b'\r'
+            key_value_separator = LCONF_KEY_VALUE_SEPARATOR.encode('utf-8')
+            to_str = bytes.decode
+
+        first_line_end_idx = section_text.find(newline)
+        if first_line_end_idx == -1:
+            first_line_end_idx = len(section_text)
+        first_line = section_text[:first_line_end_idx].rstrip(carriage_return)
+        self.section_indentation_number, self.section_format, self.name = section_first_line(
+            first_line if isinstance(first_line, str) else first_line.decode('utf-8'))
+
+        # One offset per top-level item: the last one is the start of the LCONF-Section-End-Line
+        item_starts = [match.start() for match in top_level_line_re.finditer(section_text, first_line_end_idx)]
+        end_lines = section_text[item_starts[-1]:].splitlines() if item_starts else []
+        if len(end_lines) != 1 or to_str(end_lines[0]) != SECTION_END_TOKEN:
+            last_line = section_text.splitlines()[-1]
+            raise Err('LazySection', [
+                'LCONF-Section-Name: {}'.format(self.name),
+                '  LCONF_SECTION_END LINE ERROR: EXPECTED: <{}>'.format(SECTION_END_TOKEN),
+                '      <{!s}>'.format(last_line if isinstance(last_line, str) else last_line.decode('utf-8', 'replace'))
+            ], ERR_SECTION_END_LINE)
+
+        self._text = section_text
+        self._first_line = first_line
+        self._item_starts = item_starts
+        # The line number of the line before each top-level item: errors report the line numbers of the LCONF-Section
+        item_line_numbers = []
+        line_number = 1
+        prev_item_start = 0
+        for item_start in item_starts:
+            line_number += section_text.count(newline, prev_item_start, item_start)
+            item_line_numbers.append(line_number - 1)
+            prev_item_start = item_start
+        self._item_line_numbers = item_line_numbers
+
+        # Lines before the first top-level item: may only be LCONF_BLANK_LINEs or LCONF-Section-Comment-Lines
+        if item_starts[0] > first_line_end_idx:
+            self._parse_lines(section_text[first_line_end_idx + 1:item_starts[0]], 1)
+
+        keys = []
+        for item_start in item_starts[:-1]:
+            line_end_idx = section_text.find(newline, item_start)
+            first_item_line = section_text[item_start:line_end_idx].rstrip(carriage_return)
+            key_value_separator_idx = first_item_line.find(key_value_separator)
+            if first_item_line[0] in identifiers:
+                # Compact_STRUCTURE_LIST or an Identifier line
+                if key_value_separator_idx != -1 and first_item_line[0] == identifiers[0]:
+                    keys.append(to_str(first_item_line[2:key_value_separator_idx - 1]))
+                else:
+                    keys.append(to_str(first_item_line[2:]))
+            # LCONF-Key-Value-Pair: a wrong line is reported when the item is parsed
+            elif key_value_separator_idx > 0:
+                keys.append(to_str(first_item_line[:key_value_separator_idx - 1]))
+            else:
+                keys.append(to_str(first_item_line))
+        self._keys = keys
+        self._values = [NOT_PARSED] * len(keys)
+        self._index = None
+        self._not_parsed_count = len(keys)
+
+    @property
+    def section_name(self):
+        return self.name
+
+    @property
+    def is_validated(self):
+        """ True if all items are parsed: the whole LCONF-Section is validated.
+        """
+        return self._not_parsed_count == 0
+
+    def _parse_lines(self, item_text, first_line_number):
+        """ Parses the lines of one top-level item (or the lines before the first one) into a root block.
+
+        `first_line_number`: (int) the line number of the line before `item_text` in the LCONF-Section
+        """
+        # `parse_section_lines` skips the first and the last line: these are only placeholders. `item_text` ends with
+        #   the line break before the next top-level item
+        first_line = self._first_line
+        newline = '\n' if isinstance(first_line, str) else b'\n'
+        return parse_section_lines(StructureSingleBlock(None), LineTable(first_line + newline + item_text + first_line),
+                                   self.section_indentation_number, self.section_format, self.name, 'LazySection',
+                                   first_line_number=first_line_number)
+
+    def _value(self, idx):
+        value = self._values[idx]
+        if value is NOT_PARSED:
+            item_starts = self._item_starts
+            value = self._parse_lines(self._text[item_starts[idx]:item_starts[idx + 1]],
+                                      self._item_line_numbers[idx]).values()[0]
+            self._values[idx] = value
+            self._not_parsed_count -= 1
+            if self._not_parsed_count == 0:
+                self._text = None
+                self._item_starts = None
+                self._item_line_numbers = None
+        return value
+
+    def _key_idx(self, key):
+        if self._index is None:
+            self._index = index = {}
+            for idx, key_ in enumerate(self._keys):
+                index.setdefault(key_, idx)
+        return self._index[key]
+
+    def validate(self):
+        """ Parses all not yet parsed items: raises an error for the first wrong line.
+
+        **Returns:** (bool) True if success
+        """
+        for idx in range(len(self._keys)):
+            self._value(idx)
+        return True
+
+    def __getitem__(self, key):
+        return self._value(self._key_idx(key))
+
+    def get(self, key, default=None):
+        try:
+            idx = self._key_idx(key)
+        except KeyError:
+            return default
+        return self._value(idx)
+
+    def __contains__(self, key):
+        try:
+            self._key_idx(key)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def keys(self):
+        return list(self._keys)
+
+    def values(self):
+        self.validate()
+        return list(self._values)
+
+    def items(self):
+        self.validate()
+        return list(zip(self._keys, self._values))
+
+    def to_python(self):
+        """ Returns the LCONF-Section as a plain dict: parses and validates all items.
+        """
+        self.validate()
+        return {
+            key: value if isinstance(value, str) else value.to_python()
+            for key, value in zip(self._keys, self._values)
+        }
+
+    def __repr__(self):
+        return '<{} {!r} ({}): {} items, {} parsed>'.format(self.__class__.__name__, self.name, self.section_format,
+                                                           len(self._keys), len(self._keys) - self._not_parsed_count)
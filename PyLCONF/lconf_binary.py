@@ -0,0 +1,610 @@
+"""
+### PyLCONF.lconf_binary
+
+#### Overview
+
+`dumps`: Returns parsed LCONF-Sections in the compiled binary LCONF format (`.lconfc`).
+`dump`: Writes parsed LCONF-Sections in the compiled binary LCONF format to a binary file object.
+`loads`: Returns the LCONF-Sections of compiled binary LCONF bytes.
+`load`: Returns the LCONF-Sections of a compiled binary LCONF file.
+
+A `.lconfc` file holds the result objects of `lconf_section.parse_section` or `lconf_schema.parse_section_typed`:
+`loads` rebuilds the same objects without parsing or validating any LCONF text. `lconf_emitter.dump` writes them back
+as LCONF text: text -> `.lconfc` -> text is lossless for all LCONF-Key-Names, LCONF-Values (with their Python types)
+and structures in their order. Comments and the compact or not compact form of a STRUCTURE_LIST are not part of a
+parsed LCONF-Section and are not kept.
+
+#### Layout
+
+All numbers are little-endian: `u8`, `u32` (unsigned), `i64` and `f64` (IEEE 754 double).
+
+* header: `MAGIC` (6 bytes), `u8` FORMAT_VERSION, `u8` flags (0)
+* string table: `u32` count, each string `u32` UTF-8 length + UTF-8 bytes: all LCONF-Key-Names, LCONF-Section formats,
+    STRUCTURE_NAMED_BLOCKS names and LCONF-Value-Type names: each distinct string is stored once
+* string values: `u32` count, `u32` UTF-8 length + all `TAG_STRING` values in document order joined by a newline:
+    LCONF-Values can not contain a newline
+* `u32` number of LCONF-Sections, each: the LCONF-Section-Name (`u32` length + UTF-8 bytes), `u32` string table index
+    of the format, `u32` LCONF-Indentation-Per-Level number and the root block
+* block: `u32` number of items, `u32` string table index of each LCONF-Key-Name, a value sequence of the values
+* value sequence of N values: `u8` tag of each value and the data of the values which are not `TAG_STRING` in their
+    order
+
+The tags of LCONF-Values match the `TYPE_*` LCONF-Value-Types (see `TAG_TYPES`):
+
+* `TAG_STRING`: the next of the string values: also the empty LCONF-Value
+* `TAG_BOOLEAN`: `u8` 0 or 1
+* `TAG_INTEGER`: `i64`
+* `TAG_FLOAT`: `f64`
+* `TAG_LIST` (StructureList): `u32` count, a value sequence
+* `TAG_ARRAY` (StructureArray): `u8` item tag (`TAG_INTEGER`, `TAG_FLOAT` or `TAG_BOOLEAN`), `u32` count and the
+    values as one native block of `i64`, `f64` or `u8`
+* `TAG_TABLE` (StructureTable): `u32` row count, `u32` cell count of each row, one value sequence of all cells
+* `TAG_COLUMN_TABLE` (StructureColumnTable): `u32` column count, `u32` row count, each column: `u32` string table index
+    of its LCONF-Key-Name and of its LCONF-Value-Type, `u8` encoding: an item tag for one native block like
+    `TAG_ARRAY` else `TAG_LIST` and a value sequence of its cells
+* `TAG_SINGLE_BLOCK`: a block
+* `TAG_NAMED_BLOCKS`, `TAG_UNNAMED_BLOCKS`: `u32` count, for STRUCTURE_NAMED_BLOCKS the `u32` string table index of
+    each block name, the blocks
+
+All string values are decoded with one `decode` and `split`: a value sequence of only strings takes the next N of
+them without per value tag checks.
+"""
+from array import array
+from gc import (
+    disable as gc_disable,
+    enable as gc_enable,
+    isenabled as gc_isenabled,
+)
+from collections.abc import Mapping
+from numbers import (
+    Integral,
+    Real,
+)
+from struct import (
+    error as StructError,
+    Struct,
+)
+from itertools import islice
+from sys import byteorder
+
+from PyLCONF.constants import (
+    TYPE_BOOLEAN,
+    TYPE_FLOAT,
+    TYPE_INTEGER,
+    TYPE_STRING,
+)
+from PyLCONF.lconf_classes import LconfSection
+from PyLCONF.lconf_schema import (
+    build_column_table,
+    NUMPY_DTYPES,
+    numpy,
+)
+from PyLCONF.structure_classes import (
+    StructureArray,
+    StructureBlocks,
+    StructureColumnTable,
+    StructureList,
+    StructureSingleBlock,
+    StructureTable,
+)
+from PyLCONF.utilities import Err
+
+
+MAGIC = b'LCONFC'
+FORMAT_VERSION = 1
+FILE_EXTENSION = '.lconfc'
+
+# Tags of LCONF-Values
+TAG_STRING = 1
+TAG_BOOLEAN = 2
+TAG_INTEGER = 3
+TAG_FLOAT = 4
+# Tags of structures
+TAG_LIST = 16
+TAG_ARRAY = 17
+TAG_TABLE = 18
+TAG_COLUMN_TABLE = 19
+TAG_SINGLE_BLOCK = 20
+TAG_NAMED_BLOCKS = 21
+TAG_UNNAMED_BLOCKS = 22
+
+# LCONF-Value-Type of each LCONF-Value tag
+TAG_TYPES = {
+    TAG_STRING: TYPE_STRING,
+    TAG_BOOLEAN: TYPE_BOOLEAN,
+    TAG_INTEGER: TYPE_INTEGER,
+    TAG_FLOAT: TYPE_FLOAT,
+}
+# `array.array` typecode of each native block item tag
+ARRAY_TAG_TYPECODES = {
+    TAG_INTEGER: 'q',
+    TAG_FLOAT: 'd',
+    TAG_BOOLEAN: 'b',
+}
+TYPECODE_ARRAY_TAGS = {typecode: tag for tag, typecode in ARRAY_TAG_TYPECODES.items()}
+DTYPE_KIND_ARRAY_TAGS = {
+    'i': TAG_INTEGER,
+    'f': TAG_FLOAT,
+    'b': TAG_BOOLEAN,
+}
+# Little-endian NumPy dtype of each native block item tag
+ARRAY_TAG_DTYPES = {
+    TAG_INTEGER: '<i8',
+    TAG_FLOAT: '<f8',
+    TAG_BOOLEAN: 'u1',
+}
+
+HEADER = Struct('<6sBB')
+U32 = Struct('<I')
+U32_U32 = Struct('<II')
+I64 = Struct('<q')
+F64 = Struct('<d')
+# `array.array` typecode of 4 byte unsigned integers
+U32_TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
+
+IS_BIG_ENDIAN = byteorder == 'big'
+NEWLINE = '\n'
+
+
+def _native_bytes(values, tag):
+    """ Returns the native block of an `array.array` or NumPy array: little-endian.
+    """
+    if isinstance(values, array):
+        if IS_BIG_ENDIAN and values.itemsize > 1:
+            values = array(values.typecode, values)
+            values.byteswap()
+        return values.tobytes()
+    return numpy.ascontiguousarray(values, dtype=ARRAY_TAG_DTYPES[tag]).tobytes()
+
+
+class _Encoder(object):
+    """ Helper for `dumps`: encodes the LCONF-Sections into `body` and collects the string table.
+    """
+    __slots__ = ('body', 'strings', 'string_values', '_string_idxs')
+
+    def __init__(self):
+        self.body = bytearray()
+        self.strings = []
+        self.string_values = []
+        self._string_idxs = {}
+
+    def string_idx(self, string):
+        idx = self._string_idxs.get(string)
+        if idx is None:
+            idx = self._string_idxs[string] = len(self.strings)
+            self.strings.append(string)
+        return idx
+
+    def add_string(self, string):
+        encoded = string.encode('utf-8')
+        self.body += U32.pack(len(encoded))
+        self.body += encoded
+
+    def add_block(self, block_obj):
+        keys = list(block_obj.keys())
+        self.body += U32.pack(len(keys))
+        self.body += _u32_bytes([self.string_idx(key) for key in keys])
+        self.add_values(keys, list(block_obj.values()))
+
+    def add_values(self, keys, values):
+        """ Adds one value sequence: `keys` are the LCONF-Key-Names of the `values` (for error messages).
+        """
+        tags = [_value_tag(key, value) for key, value in zip(keys, values)]
+        self.body += bytes(tags)
+        if tags.count(TAG_STRING) == len(tags):
+            self.string_values.extend(values)
+            return
+        for key, tag, value in zip(keys, tags, values):
+            if tag == TAG_STRING:
+                self.string_values.append(value)
+            else:
+                self.add_data(key, tag, value)
+
+    def add_data(self, key, tag, value):
+        body = self.body
+        if tag == TAG_BOOLEAN:
+            body.append(bool(value))
+        elif tag == TAG_INTEGER:
+            try:
+                body += I64.pack(int(value))
+            except StructError:
+                raise Err('dumps', ['LCONF-Key-Name: <{}>: integer out of the 64 bit range: <{}>'.format(key, value)])
+        elif tag == TAG_FLOAT:
+            body += F64.pack(float(value))
+        elif tag == TAG_ARRAY:
+            if isinstance(value, StructureArray):
+                self.add_array(value.values, TAG_BOOLEAN if value.is_boolean else _array_tag(value.values))
+            else:
+                self.add_array(value, _array_tag(value))
+        elif tag == TAG_COLUMN_TABLE:
+            self.add_column_table(value)
+        elif tag == TAG_TABLE:
+            rows = value.rows if isinstance(value, StructureTable) else value
+            body += U32.pack(len(rows))
+            body += _u32_bytes([len(row) for row in rows])
+            cells = [cell for row in rows for cell in row]
+            self.add_values([key] * len(cells), cells)
+        elif tag == TAG_SINGLE_BLOCK:
+            self.add_block(value)
+        elif tag == TAG_LIST:
+            body += U32.pack(len(value))
+            self.add_values([key] * len(value), list(value))
+        else:
+            body += U32.pack(len(value))
+            if tag == TAG_NAMED_BLOCKS:
+                body += _u32_bytes([self.string_idx(block_obj.name) for block_obj in value])
+            for block_obj in value:
+                self.add_block(block_obj)
+
+    def add_array(self, values, item_tag):
+        self.body += bytes((item_tag,))
+        self.body += U32.pack(len(values))
+        self.body += _native_bytes(values, item_tag)
+
+    def add_column_table(self, table_obj):
+        body = self.body
+        body += U32_U32.pack(len(table_obj.columns), len(table_obj))
+        for column_name, column_type, column in zip(table_obj.column_names, table_obj.column_types,
+                                                    table_obj.columns):
+            body += U32_U32.pack(self.string_idx(column_name), self.string_idx(column_type or ''))
+            item_tag = None
+            if isinstance(column, array) or (hasattr(column, 'dtype') and column.dtype.kind != 'O'):
+                item_tag = _array_tag(column)
+            if item_tag is None:
+                body.append(TAG_LIST)
+                self.add_values([column_name] * len(column), list(column))
+            else:
+                body.append(item_tag)
+                body += _native_bytes(column, item_tag)
+
+
+def _value_tag(key, value):
+    """ Returns the tag of one value of a value sequence.
+    """
+    value_class = value.__class__
+    if value_class is str:
+        return TAG_STRING
+    elif value_class is bool:
+        return TAG_BOOLEAN
+    elif value_class is int:
+        return TAG_INTEGER
+    elif value_class is float:
+        return TAG_FLOAT
+    elif isinstance(value, StructureArray):
+        return TAG_ARRAY
+    elif isinstance(value, StructureColumnTable):
+        return TAG_COLUMN_TABLE
+    elif isinstance(value, StructureTable):
+        return TAG_TABLE
+    elif isinstance(value, StructureBlocks):
+        return TAG_NAMED_BLOCKS if value.is_named else TAG_UNNAMED_BLOCKS
+    elif isinstance(value, Mapping) or hasattr(value, 'items'):
+        return TAG_SINGLE_BLOCK
+    elif isinstance(value, array) or hasattr(value, 'dtype'):
+        if _array_tag(value) is None:
+            raise Err('dumps', ['LCONF-Key-Name: <{}>: not supported array item type: <{}>'.format(
+                key, value.typecode if isinstance(value, array) else value.dtype)])
+        return TAG_ARRAY
+    elif isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], tuple):
+            return TAG_TABLE
+        elif value and isinstance(value[0], Mapping):
+            return TAG_UNNAMED_BLOCKS
+        return TAG_LIST
+    elif isinstance(value, Integral):
+        return TAG_INTEGER
+    elif isinstance(value, Real):
+        return TAG_FLOAT
+    raise Err('dumps', ['LCONF-Key-Name: <{}>: not supported value: <{!r}>'.format(key, value)])
+
+
+def _array_tag(values):
+    """ Returns the native block item tag of an `array.array` or NumPy array: None if not supported.
+    """
+    if isinstance(values, array):
+        return TYPECODE_ARRAY_TAGS.get(values.typecode)
+    return DTYPE_KIND_ARRAY_TAGS.get(values.dtype.kind)
+
+
+def _u32_bytes(numbers):
+    values = array(U32_TYPECODE, numbers)
+    if IS_BIG_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _iter_section_objs(obj):
+    """ Yields each LCONF-Section object of a `dumps` object.
+    """
+    if hasattr(obj, 'section_format'):
+        yield obj
+    else:
+        for section_obj in obj:
+            yield section_obj
+
+
+def dumps(obj):
+    """
+    #### lconf_binary.dumps
+
+    Returns parsed LCONF-Sections in the compiled binary LCONF format: see the module documentation.
+
+    `dumps(obj)`
+
+    **Parameters:**
+
+    * `obj`: one LCONF-Section object (`LconfSection`, `LazySection`) or an iterable of them
+
+    **Returns:** (bytes) the `.lconfc` content else raises an error
+    """
+    encoder = _Encoder()
+    section_count = 0
+    for section_obj in _iter_section_objs(obj):
+        encoder.add_string(section_obj.name)
+        encoder.body += U32_U32.pack(encoder.string_idx(section_obj.section_format),
+                                     section_obj.section_indentation_number)
+        encoder.add_block(section_obj)
+        section_count += 1
+
+    parts = [HEADER.pack(MAGIC, FORMAT_VERSION, 0), U32.pack(len(encoder.strings))]
+    for string in encoder.strings:
+        encoded = string.encode('utf-8')
+        parts.append(U32.pack(len(encoded)))
+        parts.append(encoded)
+    string_values = encoder.string_values
+    joined = NEWLINE.join(string_values).encode('utf-8')
+    if joined.count(b'\n') != max(len(string_values) - 1, 0):
+        raise Err('dumps', ['A LCONF-Value can not contain a newline: <{!r}>'.format(
+            next(value for value in string_values if NEWLINE in value))])
+    parts.append(U32_U32.pack(len(string_values), len(joined)))
+    parts.append(joined)
+    parts.append(U32.pack(section_count))
+    parts.append(encoder.body)
+    return b''.join(parts)
+
+
+def dump(obj, fileobj):
+    """
+    #### lconf_binary.dump
+
+    Writes parsed LCONF-Sections in the compiled binary LCONF format to a file object opened in binary mode: see
+    `dumps`.
+
+    `dump(obj, fileobj)`
+    """
+    fileobj.write(dumps(obj))
+
+
+class _Decoder(object):
+    """ Helper for `loads`: decodes from `data` starting at `pos`.
+    """
+    __slots__ = ('data', 'pos', 'strings', 'string_values', 'use_numpy')
+
+    def __init__(self, data, use_numpy):
+        self.data = data
+        self.pos = 0
+        self.strings = None
+        # Iterator of the string values
+        self.string_values = None
+        self.use_numpy = use_numpy
+
+    def read_u32(self):
+        self.pos += 4
+        return U32.unpack_from(self.data, self.pos - 4)[0]
+
+    def read_string(self):
+        size = U32.unpack_from(self.data, self.pos)[0]
+        start = self.pos + 4
+        self.pos = start + size
+        if self.pos > len(self.data):
+            raise IndexError('truncated string')
+        return self.data[start:self.pos].decode('utf-8')
+
+    def read_u32s(self, count):
+        values = array(U32_TYPECODE)
+        end = self.pos + count * 4
+        values.frombytes(self.data[self.pos:end])
+        if IS_BIG_ENDIAN:
+            values.byteswap()
+        self.pos = end
+        return values
+
+    def read_block(self, block_obj):
+        self.pos += 4
+        count = U32.unpack_from(self.data, self.pos - 4)[0]
+        keys = list(map(self.strings.__getitem__, self.read_u32s(count)))
+        block_obj.extend_items(keys, self.read_values(count, keys))
+        return block_obj
+
+    def read_values(self, count, keys):
+        """ Returns the values of one value sequence: `keys` is the LCONF-Key-Name of all values or a list of one
+        LCONF-Key-Name per value.
+        """
+        data = self.data
+        tags = data[self.pos:self.pos + count]
+        self.pos += count
+        if len(tags) != count:
+            raise IndexError('truncated value sequence')
+        if tags.count(TAG_STRING) == count:
+            values = list(islice(self.string_values, count))
+            if len(values) != count:
+                raise IndexError('missing string values')
+            return values
+
+        next_string = self.string_values.__next__
+        read_value = self.read_value
+        if keys.__class__ is str:
+            return [next_string() if tag == TAG_STRING else read_value(tag, keys) for tag in tags]
+        return [next_string() if tag == TAG_STRING else read_value(tag, key) for key, tag in zip(keys, tags)]
+
+    def read_value(self, tag, key):
+        """ Returns one value which is not `TAG_STRING`.
+        """
+        data = self.data
+        if tag == TAG_INTEGER:
+            self.pos += 8
+            return I64.unpack_from(data, self.pos - 8)[0]
+        elif tag == TAG_FLOAT:
+            self.pos += 8
+            return F64.unpack_from(data, self.pos - 8)[0]
+        elif tag == TAG_BOOLEAN:
+            self.pos += 1
+            return data[self.pos - 1] == 1
+        elif tag == TAG_SINGLE_BLOCK:
+            return self.read_block(StructureSingleBlock(key))
+        elif tag == TAG_LIST:
+            return StructureList(key, self.read_values(self.read_u32(), key))
+        elif tag == TAG_ARRAY:
+            self.pos += 1
+            item_tag = data[self.pos - 1]
+            values = self.read_native(item_tag, self.read_u32())
+            if self.use_numpy:
+                values = numpy.frombuffer(values, dtype=NUMPY_DTYPES[values.typecode])
+            return StructureArray(key, values, item_tag == TAG_BOOLEAN)
+        elif tag == TAG_TABLE:
+            return self.read_table(key)
+        elif tag == TAG_COLUMN_TABLE:
+            return self.read_column_table(key)
+        elif tag == TAG_NAMED_BLOCKS or tag == TAG_UNNAMED_BLOCKS:
+            count = self.read_u32()
+            blocks_obj = StructureBlocks(key)
+            if tag == TAG_NAMED_BLOCKS:
+                strings = self.strings
+                blocks_obj.is_named = True
+                blocks_obj.extend([self.read_block(StructureSingleBlock(strings[name_idx]))
+                                   for name_idx in self.read_u32s(count)])
+            else:
+                blocks_obj.extend([self.read_block(StructureSingleBlock(None)) for _ in range(count)])
+            return blocks_obj
+        raise Err('loads', ['Not valid compiled binary LCONF: unknown tag <{}> near byte <{}>'.format(tag, self.pos)])
+
+    def read_native(self, item_tag, count):
+        """ Returns `count` values of one native block as `array.array`.
+        """
+        typecode = ARRAY_TAG_TYPECODES.get(item_tag)
+        if typecode is None:
+            raise Err('loads', ['Not valid compiled binary LCONF: unknown array item tag <{}>'.format(item_tag)])
+        values = array(typecode)
+        end = self.pos + count * values.itemsize
+        values.frombytes(self.data[self.pos:end])
+        if len(values) != count:
+            raise IndexError('truncated native block')
+        if IS_BIG_ENDIAN and values.itemsize > 1:
+            values.byteswap()
+        self.pos = end
+        return values
+
+    def read_table(self, key):
+        row_count = self.read_u32()
+        cell_counts = self.read_u32s(row_count)
+        cells = self.read_values(sum(cell_counts), key)
+        table_obj = StructureTable(key)
+        if not row_count:
+            return table_obj
+        width = cell_counts[0]
+        if cell_counts.count(width) == row_count:
+            if width:
+                table_obj.rows = list(zip(*[iter(cells)] * width))
+            else:
+                table_obj.rows = [()] * row_count
+            return table_obj
+        rows = table_obj.rows
+        start = 0
+        for cell_count in cell_counts:
+            rows.append(tuple(cells[start:start + cell_count]))
+            start += cell_count
+        return table_obj
+
+    def read_column_table(self, key):
+        column_count, row_count = U32_U32.unpack_from(self.data, self.pos)
+        self.pos += 8
+        strings = self.strings
+        column_names = []
+        column_types = []
+        columns = []
+        for _ in range(column_count):
+            name_idx, type_idx = U32_U32.unpack_from(self.data, self.pos)
+            self.pos += 9
+            column_names.append(strings[name_idx])
+            column_types.append(strings[type_idx] or None)
+            encoding = self.data[self.pos - 1]
+            if encoding == TAG_LIST:
+                columns.append(self.read_values(row_count, strings[name_idx]))
+            else:
+                columns.append(self.read_native(encoding, row_count))
+        return build_column_table(key, tuple(column_names), tuple(column_types), columns, self.use_numpy)
+
+
+def loads(data, use_numpy=True):
+    """
+    #### lconf_binary.loads
+
+    Returns the LCONF-Sections of compiled binary LCONF bytes: see the module documentation.
+
+    `loads(data, use_numpy=True)`
+
+    **Parameters:**
+
+    * `data`: (bytes, bytearray, mmap or memoryview) the `.lconfc` content
+    * `use_numpy`: (bool) if True and NumPy is installed StructureArray values are NumPy arrays and each
+        StructureColumnTable is backed by one NumPy structured array: like `lconf_schema.parse_section_typed`
+
+    **Returns:** (list) the LCONF-Sections (LconfSection) in their order else raises an error
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    if len(data) < HEADER.size:
+        raise Err('loads', ['Not valid compiled binary LCONF: truncated'])
+    magic, format_version, _flags = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise Err('loads', ['Not valid compiled binary LCONF: wrong magic: <{!r}>'.format(magic)])
+    if format_version != FORMAT_VERSION:
+        raise Err('loads', ['Not supported compiled binary LCONF format version: <{}> expected: <{}>'.format(
+            format_version, FORMAT_VERSION)])
+
+    decoder = _Decoder(data, use_numpy and numpy is not None)
+    decoder.pos = HEADER.size
+    # The decoded objects have no reference cycles: the cyclic garbage collector would only scan them again and again
+    #   while they are created
+    is_gc_enabled = gc_isenabled()
+    gc_disable()
+    try:
+        decoder.strings = [decoder.read_string() for _ in range(decoder.read_u32())]
+        string_count = decoder.read_u32()
+        string_values = decoder.read_string().split(NEWLINE)
+        if not string_count:
+            string_values = []
+        if len(string_values) != string_count:
+            raise ValueError('wrong number of string values')
+        decoder.string_values = iter(string_values)
+        section_objs = []
+        for _ in range(decoder.read_u32()):
+            section_name = decoder.read_string()
+            format_idx, section_indentation_number = U32_U32.unpack_from(data, decoder.pos)
+            decoder.pos += 8
+            section_objs.append(decoder.read_block(LconfSection(section_name, decoder.strings[format_idx],
+                                                                section_indentation_number)))
+    except (StructError, IndexError, ValueError, StopIteration) as err:
+        raise Err('loads', ['Not valid compiled binary LCONF: truncated or corrupt near byte <{}>: {}'.format(
+            decoder.pos, err)])
+    finally:
+        if is_gc_enabled:
+            gc_enable()
+    if decoder.pos != len(data):
+        raise Err('loads', ['Not valid compiled binary LCONF: <{}> bytes after the last LCONF-Section'.format(
+            len(data) - decoder.pos)])
+    return section_objs
+
+
+def load(path_to_lconfc_file, use_numpy=True):
+    """
+    #### lconf_binary.load
+
+    Returns the LCONF-Sections of a compiled binary LCONF file: see `loads`.
+
+    `load(path_to_lconfc_file, use_numpy=True)`
+
+    **Returns:** (list) the LCONF-Sections (LconfSection) in their order else raises an error
+    """
+    with open(path_to_lconfc_file, 'rb') as file_obj:
+        return loads(file_obj.read(), use_numpy)
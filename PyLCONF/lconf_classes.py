@@ -0,0 +1,31 @@
+"""
+### PyLCONF.lconf_classes
+
+#### Overview
+
+`LconfSection`: The parsed LCONF-Section: the root STRUCTURE_SINGLE_BLOCK plus the LCONF-Section-Start-Line data.
+"""
+from PyLCONF.structure_classes import StructureSingleBlock
+
+
+class LconfSection(StructureSingleBlock):
+    """ The parsed LCONF-Section: the root STRUCTURE_SINGLE_BLOCK plus the LCONF-Section-Start-Line data.
+
+    * `name`: (str) the LCONF-Section-Name
+    * `section_format`: (str) the LCONF-Section format: `LCONF`, `STRICT` or `FLEXIBLE`
+    * `section_indentation_number`: (int) the LCONF-Indentation-Per-Level number
+    """
+    __slots__ = ('section_format', 'section_indentation_number')
+
+    def __init__(self, name, section_format, section_indentation_number):
+        StructureSingleBlock.__init__(self, name)
+        self.section_format = section_format
+        self.section_indentation_number = section_indentation_number
+
+    @property
+    def section_name(self):
+        return self.name
+
+    def __repr__(self):
+        return '<{} {!r} ({}): {} items>'.format(self.__class__.__name__, self.name, self.section_format,
+                                                 len(self._items) // 2)
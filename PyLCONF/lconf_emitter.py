@@ -0,0 +1,479 @@
+"""
+### PyLCONF.lconf_emitter
+
+#### Overview
+
+`dump`: Writes LCONF-Sections to a file object: line by line through a buffer.
+`dumps`: Returns LCONF-Sections as one string.
+
+Supported objects: the result objects of `lconf_section.parse_section`, `lconf_schema.parse_section_typed` and
+`lazy_section.LazySection` and plain Python objects:
+
+* `str`, `int`, `float`, `bool`: LCONF-Key-Value-Pair
+* mapping: STRUCTURE_SINGLE_BLOCK
+* list, tuple, `array.array`, NumPy array: STRUCTURE_LIST: Compact_STRUCTURE_LIST if no item is a `str` or if an
+    item can not be a STRUCTURE_LIST item line (e.g. `-3.25`)
+* list of tuples: STRUCTURE_TABLE
+* list of mappings: STRUCTURE_UNNAMED_BLOCKS
+
+#### Comments
+
+Parsed LCONF-Sections do not keep LCONF-Section-Comment-Lines: there are no manual comments to emit.
+
+* `EMIT_NO_COMMENTS`, `EMIT_ONLY_MANUAL_COMMENTS`: no comment lines are emitted
+* `EMIT_ALL_COMMENTS`: with a LCONF-Schema one auto-generated comment line is emitted before each item it defines
+
+#### Not Representable
+
+Raises an `Err` for LCONF-Key-Names and LCONF-Values which LCONF can not represent:
+
+* line breaks (`str.splitlines` boundaries) in any LCONF-Key-Name, LCONF-Value or LCONF-Section-Name
+* a leading or a trailing space: STRUCTURE_TABLE cells may have both
+* LCONF_KEY_VALUE_SEPARATOR `::` in LCONF-Key-Names, STRUCTURE_LIST items and STRUCTURE_TABLE cells: the
+    LCONF-Value of a LCONF-Key-Value-Pair may contain it (but a LCONF-Schema validation rejects it)
+* LCONF-Key-Names which are empty or start with whitespace, an identifier (`- | . *`) or
+    LCONF_COMMENT_LINE_IDENTIFIER `#`
+* STRUCTURE_LIST items like that which can not be in a Compact_STRUCTURE_LIST either: e.g. with a
+    STRUCTURE_LIST_VALUE_SEPARATOR `,`
+* STRUCTURE_TABLE cells with a STRUCTURE_TABLE_VALUE_SEPARATOR `|` and STRUCTURE_TABLE rows without cells or with
+    another number of cells than the first row
+"""
+from array import array
+from collections.abc import Mapping
+from io import StringIO
+from numbers import Number
+from re import (
+    compile as re_compile,
+    escape as re_escape,
+)
+
+from PyLCONF.constants import (
+    LCONF_SECTION_START as SECTION_START_TOKEN,
+    LCONF_SECTION_END as SECTION_END_TOKEN,
+    LCONF_FORMAT_LCONF,
+    LCONF_TRUE,
+    LCONF_FALSE,
+    LCONF_KEY_VALUE_SEPARATOR,
+    LCONF_COMMENT_LINE_IDENTIFIER,
+    STRUCTURE_LIST_IDENTIFIER,
+    STRUCTURE_LIST_VALUE_SEPARATOR,
+    STRUCTURE_TABLE_IDENTIFIER,
+    STRUCTURE_TABLE_VALUE_SEPARATOR,
+    STRUCTURE_SINGLE_BLOCK_IDENTIFIER,
+    STRUCTURE_BLOCKS_IDENTIFIER,
+    EMIT_NO_COMMENTS,
+    EMIT_ONLY_MANUAL_COMMENTS,
+    EMIT_ALL_COMMENTS,
+    TYPE_BOOLEAN,
+)
+from PyLCONF.line_table import STR_LINE_BREAKS
+from PyLCONF.lconf_schema import (
+    REQUIREMENT_FLAGS,
+    SCHEMA_KIND_NAMES,
+)
+from PyLCONF.structure_classes import (
+    StructureArray,
+    StructureBlocks,
+    StructureColumnTable,
+    StructureTable,
+)
+from PyLCONF.utilities import Err
+
+
+# Line parts collected before one write to the file object
+EMIT_BUFFER_PARTS = 16384
+
+EMIT_COMMENT_OPTIONS = (EMIT_NO_COMMENTS, EMIT_ONLY_MANUAL_COMMENTS, EMIT_ALL_COMMENTS)
+
+KEY_VALUE_SEPARATOR = ' {} '.format(LCONF_KEY_VALUE_SEPARATOR)
+EMPTY_KEY_VALUE_SEPARATOR = ' {}'.format(LCONF_KEY_VALUE_SEPARATOR)
+LIST_IDENTIFIER = STRUCTURE_LIST_IDENTIFIER + ' '
+TABLE_IDENTIFIER = STRUCTURE_TABLE_IDENTIFIER + ' '
+SINGLE_BLOCK_IDENTIFIER = STRUCTURE_SINGLE_BLOCK_IDENTIFIER + ' '
+BLOCKS_IDENTIFIER = STRUCTURE_BLOCKS_IDENTIFIER + ' '
+COMMENT_IDENTIFIER = LCONF_COMMENT_LINE_IDENTIFIER + ' '
+NEWLINE = '\n'
+
+# LCONF-Key-Names and LCONF-Values which can not be emitted: see the module documentation
+#   LINE_START_RE: text at the start of a line after the indentation: LCONF-Key-Names of LCONF-Key-Value-Pairs and
+#   STRUCTURE_LIST items
+LINE_START_IDENTIFIERS = re_escape(STRUCTURE_LIST_IDENTIFIER + STRUCTURE_TABLE_IDENTIFIER +
+                                   STRUCTURE_SINGLE_BLOCK_IDENTIFIER + STRUCTURE_BLOCKS_IDENTIFIER +
+                                   LCONF_COMMENT_LINE_IDENTIFIER)
+LINE_START_RE = re_compile(r'^(?:$|[\s{}])|{}| $|[{}]'.format(LINE_START_IDENTIFIERS, LCONF_KEY_VALUE_SEPARATOR,
+                                                             STR_LINE_BREAKS))
+#   NAME_RE: LCONF-Key-Names after an identifier and STRUCTURE_NAMED_BLOCKS item names
+NAME_RE = re_compile('^(?: |$)|{}| $|[{}]'.format(LCONF_KEY_VALUE_SEPARATOR, STR_LINE_BREAKS))
+#   VALUE_RE: LCONF-Values of LCONF-Key-Value-Pairs and LCONF-Section-Names
+VALUE_RE = re_compile('^ | $|[{}]'.format(STR_LINE_BREAKS))
+#   COMPACT_ITEM_RE: Compact_STRUCTURE_LIST items
+COMPACT_ITEM_RE = re_compile('{}|{}|[{}]'.format(re_escape(STRUCTURE_LIST_VALUE_SEPARATOR), LCONF_KEY_VALUE_SEPARATOR,
+                                                 STR_LINE_BREAKS))
+#   TABLE_ROW_RE: the joined cells of a STRUCTURE_TABLE row: the STRUCTURE_TABLE_VALUE_SEPARATORs are counted
+TABLE_ROW_RE = re_compile('{}|[{}]'.format(LCONF_KEY_VALUE_SEPARATOR, STR_LINE_BREAKS))
+
+# Many texts are checked together: each followed by LINES_SEPARATOR, a line break which is not part of `\r\n`
+LINES_SEPARATOR = '\x1c'
+ASCII_LINE_BREAKS = tuple(line_break for line_break in STR_LINE_BREAKS
+                          if line_break.isascii() and line_break != LINES_SEPARATOR)
+#   LIST_LINES_RE: STRUCTURE_LIST items: the joined text starts with a LINES_SEPARATOR too
+LIST_LINES_RE = re_compile(r'{0}[\s{1}]|{2}| {0}'.format(LINES_SEPARATOR, LINE_START_IDENTIFIERS,
+                                                        LCONF_KEY_VALUE_SEPARATOR))
+
+REQUIREMENT_NAMES = {flags: requirement_name for requirement_name, flags in REQUIREMENT_FLAGS.items()}
+
+
+def _value_str(value):
+    """ Returns the LCONF-Value of one Python value.
+    """
+    if value.__class__ is str:
+        return value
+    elif value is True:
+        return LCONF_TRUE
+    elif value is False:
+        return LCONF_FALSE
+    return str(value)
+
+
+def _chunk_strs(values, idx, is_boolean):
+    """ Returns the LCONF-Values of `values[idx:idx + EMIT_BUFFER_PARTS]`: Python objects are only created per chunk.
+    """
+    chunk = values[idx:idx + EMIT_BUFFER_PARTS]
+    if hasattr(chunk, 'tolist'):
+        chunk = chunk.tolist()
+    if is_boolean:
+        return [LCONF_TRUE if value else LCONF_FALSE for value in chunk]
+    return map(_value_str, chunk)
+
+
+def _joined_lines(texts):
+    """ Returns `texts` each followed by a LINES_SEPARATOR or None if one of them contains a line break.
+    """
+    joined = LINES_SEPARATOR.join(texts) + LINES_SEPARATOR
+    if joined.isascii():
+        # Much faster than `splitlines`: no line objects
+        if joined.count(LINES_SEPARATOR) != len(texts) or any(
+                line_break in joined for line_break in ASCII_LINE_BREAKS):
+            return None
+    elif len(joined.splitlines()) != len(texts):
+        return None
+    return joined
+
+
+def _check_text(text, invalid_re, what, key=None):
+    """ Raises an `Err` if LCONF can not represent `text`: see the module documentation.
+
+    `key`: the LCONF-Key-Name `text` belongs to: only used for the error
+    """
+    if invalid_re.search(text) is not None:
+        _raise_not_representable(what if key is None else '{} of <{}>'.format(what, key), text)
+
+
+def _raise_not_representable(what, text):
+    raise Err('dump', [
+        '{} can not be represented in LCONF: <{!r}>'.format(what, text),
+        '    See: `lconf_emitter` Not Representable',
+    ])
+
+
+def _check_pair_values(values, block_obj):
+    """ Helper for `_Emitter._emit_block`: raises an `Err` if LCONF can not represent one of the LCONF-Values `values`
+    (not empty) of LCONF-Key-Value-Pairs of `block_obj`. All `values` are checked together.
+    """
+    if not values:
+        return
+    joined = _joined_lines(values)
+    if joined is None or joined[0] == ' ' or ' ' + LINES_SEPARATOR in joined or LINES_SEPARATOR + ' ' in joined:
+        for key, value in block_obj.items():
+            if value.__class__ is str:
+                _check_text(value, VALUE_RE, 'LCONF-Value', key)
+
+
+def _check_table_rows(key, row_texts, cells_count):
+    """ Helper for `_Emitter._emit_table`: raises an `Err` if LCONF can not represent one of the STRUCTURE_TABLE rows:
+    `row_texts` are their joined cells, each row has `cells_count` cells. All rows are checked together.
+    """
+    if not row_texts:
+        return
+    joined = _joined_lines(row_texts)
+    if joined is None or LCONF_KEY_VALUE_SEPARATOR in joined or \
+            joined.count(STRUCTURE_TABLE_VALUE_SEPARATOR) != (cells_count - 1) * len(row_texts):
+        for row_text in row_texts:
+            if TABLE_ROW_RE.search(row_text) is not None or \
+                    row_text.count(STRUCTURE_TABLE_VALUE_SEPARATOR) != cells_count - 1:
+                _raise_not_representable('STRUCTURE_TABLE row of <{}>'.format(key), row_text)
+
+
+def _is_compact_list(key, values):
+    """ Helper for `_Emitter._emit_block`: returns True if the STRUCTURE_LIST `values` (a list with `str` items) must
+    be a Compact_STRUCTURE_LIST: one of its items can not be a STRUCTURE_LIST item line. Raises an `Err` if it can
+    not be emitted.
+    """
+    item_strs = values
+    try:
+        joined = _joined_lines(item_strs)
+    except TypeError:
+        item_strs = list(map(_value_str, values))
+        joined = _joined_lines(item_strs)
+    if joined is not None and LIST_LINES_RE.search(LINES_SEPARATOR + joined) is None:
+        return False
+    wrong_item = next(item_str for item_str in item_strs if LINE_START_RE.search(item_str) is not None)
+    if item_strs[0].startswith(' ') or item_strs[-1].endswith(' ') or item_strs == [''] or \
+            any(COMPACT_ITEM_RE.search(item_str) is not None for item_str in item_strs):
+        _raise_not_representable('STRUCTURE_LIST item of <{}>'.format(key), wrong_item)
+    return True
+
+
+class _Emitter(object):
+    """ Helper for `dump`: collects line parts and writes them to `write` in chunks of about EMIT_BUFFER_PARTS parts.
+    """
+    __slots__ = ('_write', '_parts', '_indentation', '_prefixes', '_all_comments', '_checked_keys', '_checked_names')
+
+    def __init__(self, write, indentation, comments):
+        if comments not in EMIT_COMMENT_OPTIONS:
+            raise Err('dump', [
+                'Unknown comments option: <{}>. Expected one of: <{}>'.format(
+                    comments, '>, <'.join(EMIT_COMMENT_OPTIONS)),
+            ])
+        if not isinstance(indentation, int) or not 2 <= indentation <= 8:
+            raise Err('dump', [
+                'Wrong LCONF-Indentation-Per-Level Number:',
+                '    MUST be one of <2,3,4,5,6,7,8>. Got: <{}>'.format(indentation),
+            ])
+        self._write = write
+        self._parts = []
+        self._indentation = indentation
+        # Indentation prefix per level: extended on demand
+        self._prefixes = ['']
+        self._all_comments = comments == EMIT_ALL_COMMENTS
+        # LCONF-Key-Names already checked with LINE_START_RE and NAME_RE: the same LCONF-Key-Names repeat in
+        # STRUCTURE_BLOCKS
+        self._checked_keys = set()
+        self._checked_names = set()
+
+    def _prefix(self, level):
+        prefixes = self._prefixes
+        while len(prefixes) <= level:
+            prefixes.append(' ' * (self._indentation * len(prefixes)))
+        return prefixes[level]
+
+    def blank_line(self):
+        self._parts.append(NEWLINE)
+
+    def flush(self):
+        if self._parts:
+            self._write(''.join(self._parts))
+            self._parts = []
+
+    def emit_section(self, name, section_format, block_obj, schema_block):
+        if not name:
+            _raise_not_representable('LCONF-Section-Name', name)
+        _check_text(name, VALUE_RE, 'LCONF-Section-Name')
+        self._parts.extend((SECTION_START_TOKEN, KEY_VALUE_SEPARATOR, str(self._indentation), KEY_VALUE_SEPARATOR,
+                            section_format, KEY_VALUE_SEPARATOR, name, NEWLINE))
+        self._emit_block(block_obj, 0, schema_block)
+        self._parts.extend((SECTION_END_TOKEN, NEWLINE))
+
+    def _emit_block(self, block_obj, level, schema_block):
+        parts = self._parts
+        prefix = self._prefix(level)
+        schema_items = schema_block.items if schema_block is not None else None
+        checked_keys = self._checked_keys
+        checked_names = self._checked_names
+        # LCONF-Values of LCONF-Key-Value-Pairs not yet checked: checked together before they are written
+        values = []
+        for key, value in block_obj.items():
+            if len(parts) >= EMIT_BUFFER_PARTS:
+                _check_pair_values(values, block_obj)
+                values = []
+                self.flush()
+                parts = self._parts
+            schema_item = None
+            if schema_items is not None:
+                schema_item = schema_items.get(key)
+                if schema_item is not None and self._all_comments:
+                    parts.extend((prefix, COMMENT_IDENTIFIER, 'Key-Name: `', key, '` | Type: <',
+                                  schema_item.value_type or SCHEMA_KIND_NAMES[schema_item.schema_kind], '> | <',
+                                  REQUIREMENT_NAMES[schema_item.requirement], '>', NEWLINE))
+
+            if value.__class__ is not str and isinstance(value, Number):
+                value = _value_str(value)
+            if value.__class__ is str:
+                if key not in checked_keys:
+                    _check_text(key, LINE_START_RE, 'LCONF-Key-Name')
+                    checked_keys.add(key)
+                if value:
+                    values.append(value)
+                    parts.extend((prefix, key, KEY_VALUE_SEPARATOR, value, NEWLINE))
+                else:
+                    parts.extend((prefix, key, EMPTY_KEY_VALUE_SEPARATOR, NEWLINE))
+                continue
+
+            if key not in checked_names:
+                _check_text(key, NAME_RE, 'LCONF-Key-Name')
+                checked_names.add(key)
+            # The structures may flush
+            _check_pair_values(values, block_obj)
+            values = []
+            child_schema = schema_item.child if schema_item is not None else None
+            if isinstance(value, Mapping) or hasattr(value, 'items'):
+                parts.extend((prefix, SINGLE_BLOCK_IDENTIFIER, key, NEWLINE))
+                self._emit_block(value, level + 1, child_schema)
+            elif isinstance(value, StructureBlocks):
+                self._emit_blocks(key, value, level, value.is_named, child_schema)
+            elif isinstance(value, (StructureTable, StructureColumnTable)):
+                self._emit_table(key, value, level)
+            elif isinstance(value, StructureArray):
+                self._emit_list(key, value.values, level, True, value.is_boolean)
+            elif hasattr(value, 'dtype') or isinstance(value, array):
+                self._emit_list(key, value, level, True, False)
+            elif value and isinstance(value[0], tuple):
+                self._emit_table(key, value, level)
+            elif value and isinstance(value[0], Mapping):
+                self._emit_blocks(key, value, level, False, child_schema)
+            else:
+                self._emit_list(key, value, level, not any(item.__class__ is str for item in value) or
+                                _is_compact_list(key, value), False)
+            parts = self._parts
+        _check_pair_values(values, block_obj)
+        if len(parts) >= EMIT_BUFFER_PARTS:
+            self.flush()
+
+    def _emit_list(self, key, values, level, is_compact, is_boolean):
+        """ `is_compact`: Compact_STRUCTURE_LIST for numbers and LCONF-Booleans.
+        """
+        prefix = self._prefix(level)
+        if not len(values) or not is_compact:
+            self._parts.extend((prefix, LIST_IDENTIFIER, key, NEWLINE))
+            item_prefix = self._prefix(level + 1)
+            item_separator = NEWLINE + item_prefix
+            for idx in range(0, len(values), EMIT_BUFFER_PARTS):
+                self._parts.extend((item_prefix, item_separator.join(_chunk_strs(values, idx, is_boolean)), NEWLINE))
+                # One part holds EMIT_BUFFER_PARTS LCONF-Values
+                self.flush()
+        else:
+            self._parts.extend((prefix, LIST_IDENTIFIER, key, KEY_VALUE_SEPARATOR))
+            for idx in range(0, len(values), EMIT_BUFFER_PARTS):
+                if idx:
+                    self._parts.append(STRUCTURE_LIST_VALUE_SEPARATOR)
+                self._parts.append(STRUCTURE_LIST_VALUE_SEPARATOR.join(_chunk_strs(values, idx, is_boolean)))
+                self.flush()
+            self._parts.append(NEWLINE)
+
+    def _emit_table(self, key, rows, level):
+        if key.endswith(STRUCTURE_TABLE_IDENTIFIER):
+            _raise_not_representable('LCONF-Key-Name', key)
+        parts = self._parts
+        parts.extend((self._prefix(level), TABLE_IDENTIFIER, key, NEWLINE))
+        row_start = self._prefix(level + 1) + STRUCTURE_TABLE_VALUE_SEPARATOR
+        row_end = STRUCTURE_TABLE_VALUE_SEPARATOR + NEWLINE
+        is_boolean_columns = None
+        if isinstance(rows, StructureColumnTable):
+            is_boolean_columns = [column_type == TYPE_BOOLEAN for column_type in rows.column_types]
+        join = STRUCTURE_TABLE_VALUE_SEPARATOR.join
+        # All rows must have the cells number of the first row
+        cells_count = -1
+        # Rows not yet checked: checked together before they are written
+        row_texts = []
+        for row in rows:
+            if is_boolean_columns is not None:
+                row = [bool(cell) if is_boolean and cell != '' else cell
+                       for cell, is_boolean in zip(row, is_boolean_columns)]
+            if len(row) != cells_count:
+                if cells_count != -1 or not row:
+                    _raise_not_representable(
+                        'STRUCTURE_TABLE row of <{}> (all rows need the same number of cells: at least one)'.format(
+                            key), row)
+                cells_count = len(row)
+            try:
+                row_text = join(row)
+            except TypeError:
+                row_text = join(map(_value_str, row))
+            row_texts.append(row_text)
+            parts.extend((row_start, row_text, row_end))
+            if len(parts) >= EMIT_BUFFER_PARTS:
+                _check_table_rows(key, row_texts, cells_count)
+                row_texts = []
+                self.flush()
+                parts = self._parts
+        _check_table_rows(key, row_texts, cells_count)
+
+    def _emit_blocks(self, key, blocks, level, is_named, schema_block):
+        self._parts.extend((self._prefix(level), BLOCKS_IDENTIFIER, key, NEWLINE))
+        block_prefix = self._prefix(level + 1)
+        for block_obj in blocks:
+            if is_named:
+                _check_text(block_obj.name, NAME_RE, 'STRUCTURE_NAMED_BLOCKS item name')
+                self._parts.extend((block_prefix, SINGLE_BLOCK_IDENTIFIER, block_obj.name, NEWLINE))
+            else:
+                self._parts.extend((block_prefix, STRUCTURE_SINGLE_BLOCK_IDENTIFIER, NEWLINE))
+            self._emit_block(block_obj, level + 2, schema_block)
+
+
+def _iter_sections(obj):
+    """ Yields `(name, section_format, block_obj)` for each LCONF-Section of a `dump` object.
+    """
+    if hasattr(obj, 'section_format'):
+        yield obj.name, obj.section_format, obj
+    elif isinstance(obj, Mapping):
+        for name, block_obj in obj.items():
+            if hasattr(block_obj, 'section_format'):
+                yield name, block_obj.section_format, block_obj
+            else:
+                yield name, LCONF_FORMAT_LCONF, block_obj
+    else:
+        for section_obj in obj:
+            yield section_obj.name, section_obj.section_format, section_obj
+
+
+def dump(obj, fileobj, indentation=4, comments=EMIT_NO_COMMENTS, lconf_schema_obj=None):
+    """
+    #### lconf_emitter.dump
+
+    Writes LCONF-Sections to a file object: the document is never built as one string.
+
+    `dump(obj, fileobj, indentation=4, comments=EMIT_NO_COMMENTS, lconf_schema_obj=None)`
+
+    **Parameters:**
+
+    * `obj`: one LCONF-Section object (`LconfSection`, `LazySection`), an iterable of them or a mapping of
+        LCONF-Section-Name: mapping (emitted with the format `LCONF`)
+    * `fileobj`: file object opened in text mode
+    * `indentation`: (int) the LCONF-Indentation-Per-Level number
+    * `comments`: (str) one of `EMIT_NO_COMMENTS`, `EMIT_ONLY_MANUAL_COMMENTS`, `EMIT_ALL_COMMENTS`: see the module
+        documentation
+    * `lconf_schema_obj`: (LconfSchema or mapping of LCONF-Section-Name: LconfSchema) optional: used for the
+        auto-generated comments
+
+    **Returns:** None else raises an error
+
+    Line parts are collected in chunks of about EMIT_BUFFER_PARTS parts: each chunk is one `fileobj.write` call. The
+    indentation prefix of each level is computed once.
+    """
+    emitter = _Emitter(fileobj.write, indentation, comments)
+    is_first = True
+    for name, section_format, block_obj in _iter_sections(obj):
+        if not is_first:
+            emitter.blank_line()
+        is_first = False
+        if isinstance(lconf_schema_obj, Mapping):
+            schema_obj = lconf_schema_obj.get(name)
+        else:
+            schema_obj = lconf_schema_obj
+        emitter.emit_section(name, section_format, block_obj, schema_obj.root if schema_obj is not None else None)
+    emitter.flush()
+
+
+def dumps(obj, indentation=4, comments=EMIT_NO_COMMENTS, lconf_schema_obj=None):
+    """
+    #### lconf_emitter.dumps
+
+    Returns LCONF-Sections as one string: see `dump`.
+
+    `dumps(obj, indentation=4, comments=EMIT_NO_COMMENTS, lconf_schema_obj=None)`
+
+    **Returns:** (str) the LCONF-Sections
+    """
+    fileobj = StringIO()
+    dump(obj, fileobj, indentation, comments, lconf_schema_obj)
+    return fileobj.getvalue()
@@ -0,0 +1,233 @@
+"""
+### PyLCONF.lconf_loader
+
+#### Overview
+
+`load`: Parses all LCONF-Sections of a LCONF-File: optional with an on-disk cache of the parsed result.
+`load_section`: Parses one LCONF-Section of a LCONF-File by its name: reads only that LCONF-Section using the sidecar
+    index file of `section_index`.
+`parse_section_span`: Parses one LCONF-Section span with its LCONF-Schema: used by `load`, `load_section` and
+    `config_store.ConfigStore`.
+
+#### Cache
+
+With `cache_dir` the parsed (and with a LCONF-Schema validated and converted) LCONF-Sections are stored in one cache
+file per LCONF-File: `<cache_dir>/<hash of the absolute path>.lconf-cache`. It starts with a fingerprint of:
+
+* the content of the LCONF-File (BLAKE2b)
+* the LCONF-Schema(s): `LconfSchema.digest`
+* the PyLCONF version, the pickle protocol and if NumPy arrays and record classes are used
+
+followed by the result pickled with the highest protocol. A later `load` with the same fingerprint only reads and
+hashes the LCONF-File and unpickles the result: `extract_sections` and the validation are skipped. On any mismatch or
+a not readable cache file the LCONF-File is parsed again and the cache file is replaced. Cache files are written to a
+temporary file in `cache_dir` and moved into place with `os.replace`: concurrent readers never see a partial file.
+
+NOTE: the cache files are unpickled: `cache_dir` must not be writable by untrusted users.
+"""
+from collections.abc import Mapping
+from hashlib import blake2b
+from os import (
+    makedirs,
+    replace as os_replace,
+    unlink,
+)
+from os.path import (
+    abspath as path_abspath,
+    join as path_join,
+)
+from pickle import (
+    dumps as pickle_dumps,
+    loads as pickle_loads,
+    HIGHEST_PROTOCOL,
+)
+from tempfile import mkstemp
+
+from PyLCONF import __version__
+from PyLCONF.lconf_schema import (
+    numpy,
+    parse_section_typed,
+)
+from PyLCONF.lconf_section import (
+    extract_sections,
+    parse_section,
+)
+from PyLCONF.section_index import (
+    SECTION_DIGEST_SIZE,
+    build_index,
+    open_index,
+)
+from PyLCONF.utilities import Err
+
+
+CACHE_FILE_EXTENSION = '.lconf-cache'
+CACHE_MAGIC = b'LCONFPK1'
+FINGERPRINT_SIZE = 32
+
+
+def load(path_to_lconf_file, lconf_schema_obj=None, cache_dir=None, use_numpy=True, use_records=False):
+    """
+    #### lconf_loader.load
+
+    Parses all LCONF-Sections of a LCONF-File.
+
+    `load(path_to_lconf_file, lconf_schema_obj=None, cache_dir=None, use_numpy=True, use_records=False)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File containing one or more LCONF-Sections
+    * `lconf_schema_obj`: (LconfSchema or mapping of LCONF-Section-Name: LconfSchema) optional: each LCONF-Section
+        with a LCONF-Schema is parsed with `lconf_schema.parse_section_typed` else with `lconf_section.parse_section`
+    * `cache_dir`: (str) optional: directory of the cache files: created if it does not exist. See the module
+        documentation.
+    * `use_numpy`, `use_records`: (bool) see `lconf_schema.parse_section_typed`
+
+    **Returns:** (list) the parsed LCONF-Sections (LconfSection) in file order else raises an error
+    """
+    with open(path_to_lconf_file, 'rb') as file_obj:
+        buffer = file_obj.read()
+    use_numpy = use_numpy and numpy is not None
+    if cache_dir is None:
+        return _parse_sections(buffer, lconf_schema_obj, use_numpy, use_records)
+
+    fingerprint = _fingerprint(buffer, lconf_schema_obj, use_numpy, use_records)
+    cache_path = path_join(cache_dir, blake2b(path_abspath(path_to_lconf_file).encode('utf-8'),
+                                              digest_size=16).hexdigest() + CACHE_FILE_EXTENSION)
+    section_objs = _read_cache_file(cache_path, fingerprint)
+    if section_objs is None:
+        section_objs = _parse_sections(buffer, lconf_schema_obj, use_numpy, use_records)
+        _write_cache_file(cache_dir, cache_path, fingerprint, section_objs)
+    return section_objs
+
+
+def load_section(path_to_lconf_file, section_name, lconf_schema_obj=None, use_numpy=True, use_records=False):
+    """
+    #### lconf_loader.load_section
+
+    Parses one LCONF-Section of a LCONF-File by its name: reads only that LCONF-Section.
+
+    `load_section(path_to_lconf_file, section_name, lconf_schema_obj=None, use_numpy=True, use_records=False)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File containing one or more LCONF-Sections
+    * `section_name`: (str) the LCONF-Section-Name: the first LCONF-Section with this name is parsed
+    * `lconf_schema_obj`: (LconfSchema or mapping of LCONF-Section-Name: LconfSchema) optional: see `load`
+    * `use_numpy`, `use_records`: (bool) see `lconf_schema.parse_section_typed`
+
+    **Returns:** (LconfSection) else raises an error: a KeyError if the LCONF-File has no LCONF-Section with the name
+
+        The byte offsets of the LCONF-Section are looked up in the index file (`<path_to_lconf_file>.idx`): it is built
+        on the first call and rebuilt if the LCONF-File changed (see `section_index.open_index`). The LCONF-Section is
+        read with `seek` and one `read` of its size: the time does not depend on the size of the LCONF-File. If the
+        hash of the read bytes is not the one in the index the index file is rebuilt once.
+    """
+    section_index = open_index(path_to_lconf_file)
+    for is_rebuilt in (False, True):
+        index_entry = section_index.find(section_name)
+        if index_entry is None:
+            raise KeyError(section_name)
+        start, end, _, section_format, section_digest = index_entry
+        with open(path_to_lconf_file, 'rb') as file_obj:
+            file_obj.seek(start)
+            buffer = file_obj.read(end - start)
+        if blake2b(buffer, digest_size=SECTION_DIGEST_SIZE).digest() == section_digest:
+            break
+        if is_rebuilt:
+            raise Err('load_section', [
+                'LCONF-Section-Name: {}'.format(section_name),
+                '  INDEX ERROR: the LCONF-File changed while it was read: <{}>'.format(path_to_lconf_file),
+            ])
+        section_index = build_index(path_to_lconf_file, must_write=False)
+    return parse_section_span((0, len(buffer), section_name, section_format), buffer, lconf_schema_obj, use_numpy,
+                              use_records)
+
+
+def parse_section_span(section_span, buffer, lconf_schema_obj=None, use_numpy=True, use_records=False):
+    """
+    #### lconf_loader.parse_section_span
+
+    Parses one LCONF-Section span with its LCONF-Schema.
+
+    `parse_section_span(section_span, buffer, lconf_schema_obj=None, use_numpy=True, use_records=False)`
+
+    **Parameters:**
+
+    * `section_span`: (tuple) `(start, end, section_name, section_format)`: see
+        `extract_sections(source, as_spans=True)`
+    * `buffer`: (bytes, bytearray, mmap or memoryview) the LCONF-File
+    * `lconf_schema_obj`: (LconfSchema or mapping of LCONF-Section-Name: LconfSchema) optional: see `load`
+    * `use_numpy`, `use_records`: (bool) see `lconf_schema.parse_section_typed`
+
+    **Returns:** (LconfSection) else raises an error
+    """
+    if isinstance(lconf_schema_obj, Mapping):
+        lconf_schema_obj = lconf_schema_obj.get(section_span[2])
+    if lconf_schema_obj is None:
+        return parse_section(section_span, buffer)
+    return parse_section_typed(section_span, lconf_schema_obj, buffer, use_numpy, use_records)
+
+
+def _parse_sections(buffer, lconf_schema_obj, use_numpy, use_records):
+    if lconf_schema_obj is None:
+        return [parse_section(section_span, buffer) for section_span in extract_sections(buffer, as_spans=True)]
+    return [parse_section_span(section_span, buffer, lconf_schema_obj, use_numpy, use_records)
+            for section_span in extract_sections(buffer, as_spans=True)]
+
+
+def _fingerprint(buffer, lconf_schema_obj, use_numpy, use_records):
+    hash_obj = blake2b(digest_size=FINGERPRINT_SIZE)
+    hash_obj.update('{}\x00{}\x00{:d}\x00{:d}\x00'.format(__version__, HIGHEST_PROTOCOL, use_numpy,
+                                                          use_records).encode('utf-8'))
+    if isinstance(lconf_schema_obj, Mapping):
+        for section_name in sorted(lconf_schema_obj):
+            hash_obj.update(section_name.encode('utf-8'))
+            hash_obj.update(b'\x00')
+            hash_obj.update(lconf_schema_obj[section_name].digest)
+    elif lconf_schema_obj is not None:
+        hash_obj.update(lconf_schema_obj.digest)
+    hash_obj.update(b'\x00')
+    hash_obj.update(buffer)
+    return hash_obj.digest()
+
+
+def _read_cache_file(cache_path, fingerprint):
+    """ Helper for `load`: returns the cached LCONF-Sections or None if the cache file is missing, not valid or has
+    another fingerprint.
+    """
+    try:
+        with open(cache_path, 'rb') as file_obj:
+            cache_bytes = file_obj.read()
+    except OSError:
+        return None
+    header_size = len(CACHE_MAGIC) + FINGERPRINT_SIZE
+    if cache_bytes[:len(CACHE_MAGIC)] != CACHE_MAGIC or cache_bytes[len(CACHE_MAGIC):header_size] != fingerprint:
+        return None
+    try:
+        with memoryview(cache_bytes) as cache_view:
+            section_objs = pickle_loads(cache_view[header_size:])
+    except Exception:
+        return None
+    return section_objs if isinstance(section_objs, list) else None
+
+
+def _write_cache_file(cache_dir, cache_path, fingerprint, section_objs):
+    """ Helper for `load`: writes the cache file atomically: errors are ignored, the next `load` parses again.
+    """
+    try:
+        makedirs(cache_dir, exist_ok=True)
+        file_descriptor, tmp_path = mkstemp(suffix='.tmp', dir=cache_dir)
+    except OSError:
+        return
+    try:
+        with open(file_descriptor, 'wb') as file_obj:
+            file_obj.write(CACHE_MAGIC)
+            file_obj.write(fingerprint)
+            file_obj.write(pickle_dumps(section_objs, HIGHEST_PROTOCOL))
+        os_replace(tmp_path, cache_path)
+    except Exception:
+        # E.g. an OSError or a `pickle.PicklingError`
+        try:
+            unlink(tmp_path)
+        except OSError:
+            pass
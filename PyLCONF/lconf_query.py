@@ -0,0 +1,316 @@
+"""
+### PyLCONF.lconf_query
+
+#### Overview
+
+`query`: Returns one LCONF-Value or structure by its key path: parses only the target item.
+`split_key_path`: Splits a key path into its parts.
+
+A key path is the LCONF-Section-Name followed by one part per nesting level, joined by KEY_PATH_SEPARATOR:
+e.g. `Ranking of 1998 home runs/players/2`. A part is:
+
+* in the root or a STRUCTURE_SINGLE_BLOCK: a LCONF-Key-Name
+* in a STRUCTURE_LIST or a STRUCTURE_TABLE: the index of an item / row (`0` is the first)
+* in STRUCTURE_NAMED_BLOCKS: the name of a block: in STRUCTURE_UNNAMED_BLOCKS: the index of a block
+* in a STRUCTURE_TABLE row: the index of a column
+
+#### Skipping
+
+The LCONF-Section is found with one regular expression search for its LCONF-Section-Start-Line. From there only the
+first lines of the items on the key path are read: the next item of a structure is found with one regular expression
+search for the next line indented the same or less (LCONF_BLANK_LINEs and LCONF-Section-Comment-Lines never match). The
+lines of skipped items are not split, decoded or validated: the time depends on the number of items before the target
+on each level, not on the size of the LCONF-File.
+
+Only the lines of the target item are validated (like in `lconf_section.parse_section`): a LCONF-Section which is not
+valid elsewhere may still return a result. Use `lconf_section.validate_one_section_fast` to validate it.
+"""
+from re import (
+    compile as re_compile,
+    escape as re_escape,
+    MULTILINE as RE_MULTILINE,
+)
+
+from PyLCONF.constants import (
+    LCONF_SECTION_START as SECTION_START_TOKEN,
+    LCONF_SECTION_END as SECTION_END_TOKEN,
+    LCONF_KEY_VALUE_SEPARATOR,
+)
+from PyLCONF.lconf_section import (
+    SECTION_END_TOKEN_BYTES,
+    SECTION_END_TOKEN_BYTES_RE,
+    parse_section,
+    parse_section_lines,
+    section_first_line,
+)
+from PyLCONF.line_engine import (
+    BYTES_LINE_KINDS_BY_FIRST_CHAR,
+    LINE_BLOCKS,
+    LINE_COMPACT_LIST,
+    LINE_KINDS_BY_FIRST_CHAR,
+    LINE_LIST,
+    LINE_LIST_VALUE,
+    LINE_NAMED_BLOCK,
+    LINE_PAIR,
+    LINE_SINGLE_BLOCK,
+    LINE_TABLE,
+    LINE_TABLE_ROW,
+)
+from PyLCONF.line_table import LineTable
+from PyLCONF.structure_classes import (
+    StructureBlocks,
+    StructureSingleBlock,
+)
+from PyLCONF.utilities import (
+    ERR_SECTION_END_LINE,
+    Err,
+)
+
+
+KEY_PATH_SEPARATOR = '/'
+
+# A LCONF-Section-Start-Line: the escaped LCONF-Section-Name and `\r?$` are appended. `query` searches it after a line
+#   break: a pattern which starts with a literal is searched much faster than one which starts with `^` (MULTILINE)
+SECTION_START_LINE_PATTERN = r'({} :: [2-8] :: (?:LCONF|STRICT|FLEXIBLE) :: '.format(SECTION_START_TOKEN)
+
+# The next line indented at most `max_indent` spaces which is not a LCONF_BLANK_LINE or a LCONF-Section-Comment-Line:
+#   group 1: the indentation: group 2: the line without the indentation and the line break
+NEXT_LINE_PATTERN = r'\n( {{0,{}}})([^ #\r\n][^\r\n]*)'
+
+# Items without item lines: the last part of a key path which `query` walks
+LEAF_LINE_KINDS = (LINE_PAIR, LINE_COMPACT_LIST, LINE_LIST_VALUE, LINE_TABLE_ROW)
+# Line kind of the items of a structure which are found by index (or name)
+ITEM_LINE_KINDS = {
+    LINE_LIST: LINE_LIST_VALUE,
+    LINE_TABLE: LINE_TABLE_ROW,
+    LINE_BLOCKS: LINE_NAMED_BLOCK,
+}
+
+# Compiled NEXT_LINE_PATTERNs by (is `str`, max_indent)
+_next_line_res = {}
+
+
+def split_key_path(key_path):
+    """
+    #### lconf_query.split_key_path
+
+    Splits a key path into its parts.
+
+    `split_key_path(key_path)`
+
+    **Parameters:**
+
+    * `key_path`: (str) the LCONF-Section-Name and the parts joined by KEY_PATH_SEPARATOR: or (tuple, list) the parts
+        (an `int` part is an index). Use a sequence if a LCONF-Section-Name or LCONF-Key-Name contains a
+        KEY_PATH_SEPARATOR.
+
+    **Returns:** (list) the parts as `str`: the first one is the LCONF-Section-Name
+    """
+    if isinstance(key_path, str):
+        return key_path.split(KEY_PATH_SEPARATOR)
+    return [str(part) for part in key_path]
+
+
+def query(source, key_path):
+    """
+    #### lconf_query.query
+
+    Returns one LCONF-Value or structure by its key path: parses only the target item.
+
+    `query(source, key_path)`
+
+    **Parameters:**
+
+    * `source`: (raw str) which contains one or more LCONF-Sections: or (bytes, bytearray, mmap or memoryview) UTF-8
+        encoded
+    * `key_path`: (str or sequence) the LCONF-Section-Name followed by the parts: see the module Overview and
+        `split_key_path`
+
+    **Returns:** the target parsed like by `lconf_section.parse_section`: (str) a LCONF-Value: (tuple) a
+        STRUCTURE_TABLE row: (StructureSingleBlock, StructureList, StructureTable or StructureBlocks) a structure:
+        (LconfSection) the whole LCONF-Section if the key path has no other parts
+
+        Raises a KeyError if the LCONF-Section (the first one with the name) or a name part is not found: an IndexError
+        for an index out of range: else an error for a wrong line of the target item.
+    """
+    key_parts = split_key_path(key_path)
+    section_name = key_parts[0]
+    section_start_pattern = SECTION_START_LINE_PATTERN + re_escape(section_name) + r')\r?$'
+    if isinstance(source, str):
+        is_str = True
+        line_kinds_by_first_char = LINE_KINDS_BY_FIRST_CHAR
+        key_value_separator = LCONF_KEY_VALUE_SEPARATOR
+        end_token = SECTION_END_TOKEN
+        newline = '\n'
+        read = source.__getitem__
+    else:
+        is_str = False
+        section_start_pattern = section_start_pattern.encode('utf-8')
+        line_kinds_by_first_char = BYTES_LINE_KINDS_BY_FIRST_CHAR
+        key_value_separator = LCONF_KEY_VALUE_SEPARATOR.encode('utf-8')
+        end_token = SECTION_END_TOKEN_BYTES
+        newline = b'\n'
+        key_parts[1:] = [part.encode('utf-8') for part in key_parts[1:]]
+
+        def read(slice_):
+            return bytes(source[slice_])
+
+    # The first line of the source or a line after a line break
+    match = re_compile(section_start_pattern, RE_MULTILINE).match(source)
+    if match is None:
+        match = re_compile(newline + section_start_pattern, RE_MULTILINE).search(source)
+        if match is None:
+            raise KeyError(section_name)
+    section_start = match.start(1)
+    first_line = read(slice(section_start, match.end(1)))
+    section_indentation_number, section_format, section_name = section_first_line(
+        first_line if is_str else first_line.decode('utf-8'))
+    if len(key_parts) == 1:
+        if is_str:
+            end_idx = source.find(end_token, match.end())
+        else:
+            match_end = SECTION_END_TOKEN_BYTES_RE.search(source, match.end())
+            end_idx = -1 if match_end is None else match_end.start()
+        if end_idx == -1:
+            _raise_section_end_err(section_name, match.end())
+        return parse_section(read(slice(section_start, end_idx + len(end_token))))
+
+    # The current item: the root is a STRUCTURE_SINGLE_BLOCK one level above the not indented lines
+    line_kind = LINE_SINGLE_BLOCK
+    item_indent = -section_indentation_number
+    item_start = section_start
+    item_end = match.end()
+    # The structure of the current item if it was found by index: (line_kind, content_start, line_end) of its first line
+    parent_line = None
+    part_idx = 1
+    while part_idx < len(key_parts) and line_kind not in LEAF_LINE_KINDS:
+        part = key_parts[part_idx]
+        child_indent = item_indent + section_indentation_number
+        next_line_re = _next_line_re(is_str, child_indent)
+        match = next_line_re.search(source, item_end)
+        # Items by LCONF-Key-Name
+        if line_kind == LINE_SINGLE_BLOCK:
+            while True:
+                if match is None:
+                    _raise_section_end_err(section_name, item_end)
+                if len(match.group(1)) != child_indent or (child_indent == 0 and match.group(2) == end_token):
+                    raise KeyError(_decoded(part))
+                line = read(slice(match.start(2), match.end(2)))
+                child_kind = line_kinds_by_first_char.get(line[0], LINE_PAIR)
+                key_value_separator_idx = line.find(key_value_separator)
+                if child_kind == LINE_PAIR:
+                    key = line[:key_value_separator_idx - 1] if key_value_separator_idx > 0 else line
+                elif child_kind == LINE_LIST and key_value_separator_idx != -1:
+                    child_kind = LINE_COMPACT_LIST
+                    key = line[2:key_value_separator_idx - 1]
+                else:
+                    key = line[2:]
+                if key == part:
+                    break
+                match = next_line_re.search(source, match.end())
+            parent_line = None
+        # Items by index: STRUCTURE_LIST items, STRUCTURE_TABLE rows and STRUCTURE_UNNAMED_BLOCKS:
+        #   STRUCTURE_NAMED_BLOCKS by name
+        else:
+            item_idx = int(part) if part.isdigit() else -1
+            if item_idx == -1 and line_kind != LINE_BLOCKS:
+                raise KeyError(_decoded(part))
+            is_named = False
+            count = 0
+            while True:
+                if match is None:
+                    _raise_section_end_err(section_name, item_end)
+                if len(match.group(1)) != child_indent:
+                    if is_named or item_idx == -1:
+                        raise KeyError(_decoded(part))
+                    raise IndexError('{}: index out of range: <{}>'.format(_decoded(key_parts[part_idx - 1]),
+                                                                           _decoded(part)))
+                if line_kind == LINE_BLOCKS and match.end(2) - match.start(2) > 1:
+                    is_named = True
+                    if read(slice(match.start(2) + 2, match.end(2))) == part:
+                        break
+                elif count == item_idx:
+                    break
+                count += 1
+                match = next_line_re.search(source, match.end())
+            parent_line = (line_kind, item_start + item_indent, item_end)
+            child_kind = ITEM_LINE_KINDS[line_kind]
+            if child_kind == LINE_NAMED_BLOCK:
+                child_kind = LINE_SINGLE_BLOCK
+        line_kind = child_kind
+        item_indent = child_indent
+        item_start = match.start(1)
+        item_end = match.end(2)
+        part_idx += 1
+
+    result = _parse_item(source, read, newline, first_line, section_indentation_number, section_format, section_name,
+                         parent_line, item_start, item_end, item_indent)
+    # The rest of the key path in the parsed item: e.g. the column of a STRUCTURE_TABLE row
+    for part in key_parts[part_idx:]:
+        result = _parsed_part(result, _decoded(part))
+    return result
+
+
+def _next_line_re(is_str, max_indent):
+    """ Helper for `query`: returns the compiled NEXT_LINE_PATTERN.
+    """
+    next_line_re = _next_line_res.get((is_str, max_indent))
+    if next_line_re is None:
+        pattern = NEXT_LINE_PATTERN.format(max_indent)
+        next_line_re = _next_line_res[(is_str, max_indent)] = re_compile(pattern if is_str else pattern.encode('ascii'))
+    return next_line_re
+
+
+def _parse_item(source, read, newline, first_line, section_indentation_number, section_format, section_name,
+                parent_line, item_start, item_end, item_indent):
+    """ Helper for `query`: parses the lines of one item into a root block and returns it. An item found by index is
+    parsed below the first line of its structure and returned as its only item.
+    """
+    is_str = isinstance(first_line, str)
+    # The item ends before the next line indented the same or less
+    match = _next_line_re(is_str, item_indent).search(source, item_end)
+    if match is None:
+        _raise_section_end_err(section_name, item_end)
+    item_text = read(slice(item_start, match.start() + 1))
+    # Dedent the item to the root: or one level below the not indented first line of its structure
+    dedent = item_indent
+    if parent_line is not None:
+        dedent -= section_indentation_number
+        item_text = read(slice(parent_line[1], parent_line[2])) + newline + item_text
+    if dedent:
+        pattern = '^ {{0,{}}}'.format(dedent)
+        item_text = re_compile(pattern if is_str else pattern.encode('ascii'), RE_MULTILINE).sub(newline[:0],
+                                                                                                   item_text)
+
+    # `parse_section_lines` skips the first and the last line: these are only placeholders
+    result = parse_section_lines(StructureSingleBlock(None), LineTable(first_line + newline + item_text + first_line),
+                                 section_indentation_number, section_format, section_name, 'query').values()[0]
+    if parent_line is None:
+        return result
+    if parent_line[0] == LINE_TABLE:
+        return result.rows[0]
+    return result[0]
+
+
+def _parsed_part(parsed_obj, part):
+    """ Helper for `query`: returns the item of an already parsed structure by one key path part.
+    """
+    if isinstance(parsed_obj, StructureSingleBlock):
+        return parsed_obj[part]
+    if isinstance(parsed_obj, StructureBlocks) and parsed_obj.is_named:
+        return parsed_obj.get_block(part)
+    if isinstance(parsed_obj, str) or not part.isdigit():
+        raise KeyError(part)
+    return parsed_obj[int(part)]
+
+
+def _raise_section_end_err(section_name, start_idx):
+    raise Err('query', [
+        'LCONF-Section-Name: {}'.format(section_name),
+        '  LCONF_SECTION_END LINE ERROR: EXPECTED: <{}>'.format(SECTION_END_TOKEN),
+        '      not found after offset: <{}>'.format(start_idx),
+    ], ERR_SECTION_END_LINE)
+
+
+def _decoded(part):
+    return part if isinstance(part, str) else part.decode('utf-8')
@@ -3,33 +3,878 @@
 
 #### Overview
 
-`validate_one_section_schema`: Validate one LCONF-Schema-Section raw string.
+`compile_schema`: Compiles one LCONF-Schema-Section raw string into an immutable `LconfSchema`.
 `validate_schemas_from_file`: Validates a LCONF-Schema-File containing one or more LCONF-Schema-Sections.
+`LconfSchema`: A compiled LCONF-Schema: validates LCONF-Sections with `lconf_section.validate_one_section_complet`.
+`parse_section_typed`: Parses one LCONF-Section raw string with its LCONF-Schema: LCONF-Values are converted to their
+    LCONF-Value-Types.
+
+#### LCONF-Schema-Section Items
+
+* LCONF-Key-Value-Pair: `key :: LCONF-Item-Requirement-Option | LCONF-Value-Type`
+* Structures: a STRUCTURE_SINGLE_BLOCK `. key | STRUCTURE_TYPE` or `. key | STRUCTURE_TYPE | LCONF-Item-Requirement-Option`
+    (default `OPTIONAL`)
+
+    * `STRUCTURE_LIST`: one item `ITEM :: LCONF-Item-Requirement-Option | LCONF-Value-Type`: the LCONF-Value-Type of
+        all list values. The LCONF-Item-Requirement-Option applies to the list
+    * `STRUCTURE_TABLE`: one LCONF-Key-Value-Pair per column in column order
+    * `STRUCTURE_SINGLE_BLOCK`: the LCONF-Schema items of the block
+    * `STRUCTURE_NAMED_BLOCKS`, `STRUCTURE_UNNAMED_BLOCKS`: the LCONF-Schema items of each repeated block
+
+LCONF-Item-Requirement-Options:
+
+* `OPTIONAL`: the item may be missing
+* `REQUIRED`: the item must be defined: it may be empty
+* `REQUIRED_NOT_EMPTY`: the item must be defined and not empty: a structure must have at least one item
+
+A `STRICT` LCONF-Schema rejects LCONF-Key-Names it does not define: a `FLEXIBLE` one does not validate them.
 """
+from array import array
+from collections import namedtuple
+from hashlib import blake2b
+from os import stat as os_stat
+from re import compile as re_compile
+from time import perf_counter
+from types import MappingProxyType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from PyLCONF.constants import (
+    LCONF_FORMAT_LCONF,
+    LCONF_FORMAT_SCHEMA_STRICT,
+    LCONF_SCHEMA_SEPARATOR,
+    LCONF_SPACE,
+    LCONF_TRUE,
+    LCONF_FALSE,
+    LCONF_INTEGER_LOWEST,
+    LCONF_INTEGER_HIGHEST,
+    LCONF_KEY_VALUE_SEPARATOR,
+    LCONF_EMPTY_STRING,
+    STRUCTURE_LIST_VALUE_SEPARATOR,
+    STRUCTURE_TABLE_VALUE_SEPARATOR,
+    OPTIONAL,
+    REQUIRED,
+    REQUIRED_NOT_EMPTY,
+    TYPE_NOTSET,
+    TYPE_STRING,
+    TYPE_DIGITS,
+    TYPE_BOOLEAN,
+    TYPE_INTEGER,
+    TYPE_FLOAT,
+    TYPE_NUMBER,
+)
+from PyLCONF.lconf_classes import LconfSection
+from PyLCONF.lconf_section import (
+    extract_sections,
+    parse_section,
+    parse_section_lines,
+    section_bytes_from_span,
+    section_line_table,
+    validate_one_section_complet,
+    validate_one_section_schema,
+)
+from PyLCONF.line_engine import (
+    LINE_BLOCKS,
+    LINE_COMPACT_LIST,
+    LINE_LIST,
+    LINE_LIST_VALUE,
+    LINE_NAMED_BLOCK,
+    LINE_PAIR,
+    LINE_SINGLE_BLOCK,
+    LINE_TABLE,
+    LINE_TABLE_ROW,
+    LINE_UNNAMED_BLOCK,
+    iter_section_lines,
+)
+from PyLCONF.structure_classes import (
+    StructureArray,
+    StructureColumnTable,
+    StructureSingleBlock,
+    record_class,
+)
+from PyLCONF.utilities import (
+    ERR_SCHEMA,
+    ERR_SCHEMA_COLUMNS,
+    ERR_SCHEMA_DUPLICATE_KEY,
+    ERR_SCHEMA_ITEM_TYPE,
+    ERR_SCHEMA_KEY_VALUE_SEPARATOR,
+    ERR_SCHEMA_MISSING_KEY,
+    ERR_SCHEMA_NOT_EMPTY,
+    ERR_SCHEMA_UNKNOWN_KEY,
+    ERR_SCHEMA_VALUE_TYPE,
+    ERR_SECTION_FORMAT,
+    Err,
+    SectionErr,
+)
+from PyLCONF.validation_cache import VALIDATE_SCHEMA
+
+
+# Separates the parts of a LCONF-Schema item: `OPTIONAL | TYPE_STRING`, `players | STRUCTURE_LIST`
+SCHEMA_PARTS_SEPARATOR = LCONF_SPACE + LCONF_SCHEMA_SEPARATOR + LCONF_SPACE
+
+# The only item of a STRUCTURE_LIST LCONF-Schema
+SCHEMA_LIST_ITEM_KEY = 'ITEM'
+
+# LCONF-Item-Requirement-Option bits
+REQUIREMENT_PRESENT = 1
+REQUIREMENT_NOT_EMPTY = 2
+REQUIREMENT_FLAGS = {
+    OPTIONAL: 0,
+    REQUIRED: REQUIREMENT_PRESENT,
+    REQUIRED_NOT_EMPTY: REQUIREMENT_PRESENT | REQUIREMENT_NOT_EMPTY,
+}
+
+# LCONF-Schema item kinds
+SCHEMA_PAIR = 0
+SCHEMA_LIST = 1
+SCHEMA_TABLE = 2
+SCHEMA_SINGLE_BLOCK = 3
+SCHEMA_NAMED_BLOCKS = 4
+SCHEMA_UNNAMED_BLOCKS = 5
+# Validation only: the items of a LCONF-Key-Name a FLEXIBLE LCONF-Schema does not define
+SCHEMA_NOT_DEFINED = -1
+
+SCHEMA_KINDS_BY_STRUCTURE_NAME = {
+    'STRUCTURE_LIST': SCHEMA_LIST,
+    'STRUCTURE_TABLE': SCHEMA_TABLE,
+    'STRUCTURE_SINGLE_BLOCK': SCHEMA_SINGLE_BLOCK,
+    'STRUCTURE_NAMED_BLOCKS': SCHEMA_NAMED_BLOCKS,
+    'STRUCTURE_UNNAMED_BLOCKS': SCHEMA_UNNAMED_BLOCKS,
+}
+SCHEMA_KIND_NAMES = {
+    SCHEMA_PAIR: 'LCONF-Key-Value-Pair',
+    SCHEMA_LIST: 'STRUCTURE_LIST',
+    SCHEMA_TABLE: 'STRUCTURE_TABLE',
+    SCHEMA_SINGLE_BLOCK: 'STRUCTURE_SINGLE_BLOCK',
+    SCHEMA_NAMED_BLOCKS: 'STRUCTURE_NAMED_BLOCKS',
+    SCHEMA_UNNAMED_BLOCKS: 'STRUCTURE_UNNAMED_BLOCKS',
+}
+# The LCONF-Schema item kind expected for a line kind of the `line_engine` in a STRUCTURE_SINGLE_BLOCK
+#   NOTE: LINE_BLOCKS accepts SCHEMA_NAMED_BLOCKS too
+SCHEMA_KINDS_BY_LINE_KIND = {
+    LINE_PAIR: SCHEMA_PAIR,
+    LINE_LIST: SCHEMA_LIST,
+    LINE_COMPACT_LIST: SCHEMA_LIST,
+    LINE_TABLE: SCHEMA_TABLE,
+    LINE_SINGLE_BLOCK: SCHEMA_SINGLE_BLOCK,
+    LINE_BLOCKS: SCHEMA_UNNAMED_BLOCKS,
+}
+
+# Line kinds which open a structure: its lines have the next nesting level
+OPENING_LINE_KINDS = frozenset((LINE_LIST, LINE_TABLE, LINE_SINGLE_BLOCK, LINE_BLOCKS, LINE_NAMED_BLOCK,
+                                LINE_UNNAMED_BLOCK))
+
+
+def _to_digits(value):
+    if not (value.isdigit() and value.isascii()):
+        raise ValueError(value)
+    return value
+
+
+def _to_boolean(value):
+    if value == LCONF_TRUE:
+        return True
+    elif value == LCONF_FALSE:
+        return False
+    raise ValueError(value)
+
+
+# LCONF-Integer: an optional sign and ASCII digits. `int` and `float` also accept `_` between digits, surrounding
+#   whitespace and not ASCII digits
+INTEGER_RE = re_compile(r'[-+]?[0-9]+\Z')
+# One batch of LCONF-Integers joined with `\n`
+INTEGERS_RE = re_compile(r'(?:[-+]?[0-9]+\n)*[-+]?[0-9]+\Z')
+NOT_FLOAT_CHARS_RE = re_compile(r'[_\s]|[^\x00-\x7f]')
+
+
+def _to_integer(value):
+    if INTEGER_RE.match(value) is None:
+        raise ValueError(value)
+    integer = int(value)
+    if integer < LCONF_INTEGER_LOWEST or integer > LCONF_INTEGER_HIGHEST:
+        raise ValueError(value)
+    return integer
+
+
+def _to_float(value):
+    if NOT_FLOAT_CHARS_RE.search(value) is not None:
+        raise ValueError(value)
+    return float(value)
+
+
+def _to_number(value):
+    try:
+        return _to_integer(value)
+    except ValueError:
+        return _to_float(value)
+
+
+# Converter for each supported LCONF-Value-Type: raises a ValueError for a wrong LCONF-Value
+TYPE_CONVERTERS = {
+    TYPE_NOTSET: str,
+    TYPE_STRING: str,
+    TYPE_DIGITS: _to_digits,
+    TYPE_BOOLEAN: _to_boolean,
+    TYPE_INTEGER: _to_integer,
+    TYPE_FLOAT: _to_float,
+    TYPE_NUMBER: _to_number,
+}
+
+# `array.array` typecode of the STRUCTURE_LIST LCONF-Value-Types stored in a StructureArray.
+#   `'q'` (signed 64 bit) holds exact the LCONF-Integer range: LCONF_INTEGER_LOWEST to LCONF_INTEGER_HIGHEST
+ARRAY_TYPECODES = {
+    TYPE_INTEGER: 'q',
+    TYPE_FLOAT: 'd',
+    TYPE_BOOLEAN: 'b',
+}
+NUMPY_DTYPES = {
+    'q': 'int64',
+    'd': 'float64',
+    'b': 'bool',
+}
+BOOLEAN_VALUES = {
+    LCONF_TRUE: 1,
+    LCONF_FALSE: 0,
+}
+
+
+def _typed_array(value_type, values):
+    """ Converts all `values` in one batch: raises a ValueError, OverflowError (out of the LCONF-Integer range) or
+    KeyError (not a LCONF-Boolean) for a wrong LCONF-Value.
+
+    The LCONF-Integer and LCONF-Float forms are checked with one regular expression search over all `values`.
+    """
+    if value_type == TYPE_INTEGER:
+        if not isinstance(values, list):
+            values = list(values)
+        if values and INTEGERS_RE.match('\n'.join(values)) is None:
+            raise ValueError('not a LCONF-Integer')
+        return array('q', map(int, values))
+    elif value_type == TYPE_FLOAT:
+        if not isinstance(values, list):
+            values = list(values)
+        if NOT_FLOAT_CHARS_RE.search(''.join(values)) is not None:
+            raise ValueError('not a LCONF-Float')
+        return array('d', map(float, values))
+    return array('b', map(BOOLEAN_VALUES.__getitem__, values))
+
+
+# One LCONF-Schema item
+#   * `key_bit`: the bit of the item in its SchemaBlock: for table columns the column index
+#   * `requirement`: REQUIREMENT_* bits
+#   * `converter`: of the LCONF-Value-Type: for STRUCTURE_LIST the one of the list values
+#   * `child`: SchemaBlock for STRUCTURE_SINGLE_BLOCK, STRUCTURE_NAMED_BLOCKS, STRUCTURE_UNNAMED_BLOCKS:
+#       for STRUCTURE_TABLE a tuple of the column SchemaItems
+SchemaItem = namedtuple('SchemaItem', 'key schema_kind key_bit requirement value_type converter child')
+
+# The LCONF-Schema items of one STRUCTURE_SINGLE_BLOCK
+#   * `items`: read-only mapping of LCONF-Key-Name: SchemaItem
+#   * `keys`: tuple of the LCONF-Key-Names in bit order
+#   * `required_mask`: the bits of all REQUIRED and REQUIRED_NOT_EMPTY items
+SchemaBlock = namedtuple('SchemaBlock', 'items keys required_mask')
+
+
+class LconfSchema(object):
+    """ A compiled LCONF-Schema: immutable and can be shared between threads.
+
+    * `name`: (str) the LCONF-Schema-Section-Name
+    * `section_format`: (str) `STRICT` or `FLEXIBLE`
+    * `root`: (SchemaBlock) the top-level LCONF-Schema items
+    """
+    __slots__ = ('name', 'section_format', 'root')
+
+    def __init__(self, name, section_format, root):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'section_format', section_format)
+        object.__setattr__(self, 'root', root)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('LconfSchema is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('LconfSchema is immutable')
+
+    def __repr__(self):
+        return '<{} {!r} ({}): {} items>'.format(self.__class__.__name__, self.name, self.section_format,
+                                                 len(self.root.keys))
+
+    @property
+    def digest(self):
+        """ (bytes) A hash of the compiled LCONF-Schema: the same for equal LCONF-Schemas in all processes.
+        """
+        hash_obj = blake2b(digest_size=16)
+        hash_obj.update('{}\x00{}\x00'.format(self.name, self.section_format).encode('utf-8'))
+        _update_schema_digest(hash_obj, self.root)
+        return hash_obj.digest()
+
+    def validate_section_lines(self, line_table, section_indentation_number, section_format, section_name,
+                               error_origin, errors=None, first_line_number=1):
+        """ Validates the lines of one LCONF-Section (a `line_table.LineTable`) in one pass: used by
+        `lconf_section.validate_one_section_complet`: see there.
+
+        If `errors` (list) is given all errors are appended to it instead of raised: see
+        `line_engine.iter_section_lines`.
+
+        **Returns:** (bool) True if success else raises an error (with `errors`: always True)
+        """
+        for _ in self.iter_validated_lines(line_table, section_indentation_number, section_format, section_name,
+                                           error_origin, errors, first_line_number):
+            pass
+        return True
+
+    def iter_validated_lines(self, line_table, section_indentation_number, section_format, section_name,
+                             error_origin, errors=None, first_line_number=1, convert_values=True):
+        """ Yields the lines of `line_engine.iter_section_lines` and validates each with the LCONF-Schema: used by
+        `validate_section_lines` and `parse_section_typed`. A line is validated after it was yielded: the last one
+        before the iterator ends.
+
+        With `convert_values` False the LCONF-Values are not converted to their LCONF-Value-Types: all other checks
+        are done. `parse_section_typed` converts them once in batches.
+        """
+        is_strict = self.section_format == LCONF_FORMAT_SCHEMA_STRICT
+        text = line_table.text
+        if isinstance(text, str):
+            to_str = str.__str__
+            key_value_separator = LCONF_KEY_VALUE_SEPARATOR
+            table_split_separator = STRUCTURE_TABLE_VALUE_SEPARATOR
+            list_split_separator = STRUCTURE_LIST_VALUE_SEPARATOR
+        else:
+            to_str = bytes.decode
+            key_value_separator = LCONF_KEY_VALUE_SEPARATOR.encode('utf-8')
+            table_split_separator = STRUCTURE_TABLE_VALUE_SEPARATOR.encode('utf-8')
+            list_split_separator = STRUCTURE_LIST_VALUE_SEPARATOR.encode('utf-8')
+
+        def error(orig_line, line_number, code, info_list):
+            return SectionErr(error_origin, section_format, section_name, orig_line, info_list, code, line_number)
+
+        def line_error(line_start, line_end, line_number, code, info_list):
+            return error(text[line_start:line_end], line_number, code, info_list)
+
+        def report(err):
+            if errors is None:
+                raise err
+            errors.append(err)
+
+        def convert(schema_item, value, line_start, line_end, line_number):
+            try:
+                schema_item.converter(value)
+            except ValueError:
+                raise line_error(line_start, line_end, line_number, ERR_SCHEMA_VALUE_TYPE, [
+                    'LCONF-Value-Type ERROR: LCONF-Key-Name: <{}>'.format(schema_item.key),
+                    '',
+                    '    Expected LCONF-Value-Type: <{}>. Got: <{}>'.format(schema_item.value_type, value),
+                ])
+
+        def close(context):
+            # context: [schema kind, SchemaBlock or SchemaItem, seen bits or number of items, identifier line,
+            #           SchemaItem with the LCONF-Item-Requirement-Option of the structure or None, line number]
+            schema_kind, schema_obj, state, orig_line, schema_item, line_number = context
+            if schema_kind == SCHEMA_SINGLE_BLOCK:
+                missing_bits = schema_obj.required_mask & ~state
+                if missing_bits:
+                    report(error(orig_line, line_number, ERR_SCHEMA_MISSING_KEY, [
+                        'LCONF-Schema ERROR: missing REQUIRED LCONF-Key-Names:',
+                        '',
+                        '    <{}>'.format('>, <'.join(
+                            key for idx, key in enumerate(schema_obj.keys) if missing_bits >> idx & 1)),
+                    ]))
+            if schema_item is not None and not state and schema_item.requirement & REQUIREMENT_NOT_EMPTY:
+                report(error(orig_line, line_number, ERR_SCHEMA_NOT_EMPTY, [
+                    'LCONF-Schema ERROR: REQUIRED_NOT_EMPTY {} is empty: <{}>'.format(
+                        SCHEMA_KIND_NAMES[schema_item.schema_kind], schema_item.key),
+                ]))
+
+        # One context per open nesting level
+        contexts = [[SCHEMA_SINGLE_BLOCK, self.root, 0, line_table.line(0), None, first_line_number]]
+
+        for line in iter_section_lines(line_table, section_indentation_number, section_format, section_name,
+                                       error_origin, errors, first_line_number):
+            yield line
+            line_kind, cur_level, line_start, content_start, line_end, key_value_separator_idx, line_number = line
+            try:
+                while len(contexts) > cur_level + 1:
+                    close(contexts.pop())
+                context = contexts[cur_level]
+                schema_kind = context[0]
+
+                # Not defined in a FLEXIBLE LCONF-Schema: only the structure is validated
+                if schema_kind == SCHEMA_NOT_DEFINED:
+                    if line_kind != LINE_PAIR and line_kind != LINE_COMPACT_LIST and line_kind != LINE_LIST_VALUE and \
+                            line_kind != LINE_TABLE_ROW:
+                        contexts.append([SCHEMA_NOT_DEFINED, None, 0, text[line_start:line_end], None,
+                                         line_number])
+
+                # STRUCTURE_LIST item
+                elif line_kind == LINE_LIST_VALUE:
+                    context[2] += 1
+                    if convert_values:
+                        convert(context[1], to_str(text[content_start:line_end]), line_start, line_end, line_number)
+
+                # STRUCTURE_TABLE row: the LCONF-Schema defines the number of columns
+                elif line_kind == LINE_TABLE_ROW:
+                    context[2] += 1
+                    columns = context[1].child
+                    if line_end == content_start + 1:
+                        row_cells = []
+                    else:
+                        row_cells = text[content_start + 1:line_end - 1].split(table_split_separator)
+                    if len(row_cells) != len(columns):
+                        raise line_error(line_start, line_end, line_number, ERR_SCHEMA_COLUMNS, [
+                            'STRUCTURE_TABLE ERROR: wrong columns number: <{}>'.format(context[1].key),
+                            '',
+                            '    Number of columns defined in the LCONF-Schema: <{}>. Got: <{}>'.format(
+                                len(columns), len(row_cells)),
+                        ])
+                    for column, cell in zip(columns, row_cells):
+                        if cell:
+                            if convert_values:
+                                convert(column, to_str(cell), line_start, line_end, line_number)
+                        elif column.requirement & REQUIREMENT_NOT_EMPTY:
+                            raise line_error(line_start, line_end, line_number, ERR_SCHEMA_NOT_EMPTY, [
+                                'LCONF-Schema ERROR: REQUIRED_NOT_EMPTY table column is empty: <{}>'.format(column.key),
+                            ])
+
+                # STRUCTURE_NAMED_BLOCKS / STRUCTURE_UNNAMED_BLOCKS item
+                elif line_kind >= LINE_NAMED_BLOCK:
+                    blocks_schema_item = context[1]
+                    if (line_kind == LINE_NAMED_BLOCK) != (blocks_schema_item.schema_kind == SCHEMA_NAMED_BLOCKS):
+                        raise line_error(line_start, line_end, line_number, ERR_SCHEMA_ITEM_TYPE, [
+                            'LCONF-Schema ERROR: wrong STRUCTURE_BLOCKS type: <{}>'.format(blocks_schema_item.key),
+                            '',
+                            '    Expected: <{}>'.format(SCHEMA_KIND_NAMES[blocks_schema_item.schema_kind]),
+                        ])
+                    context[2] += 1
+                    contexts.append([SCHEMA_SINGLE_BLOCK, blocks_schema_item.child, 0, text[line_start:line_end], None,
+                                     line_number])
+
+                # Items of a STRUCTURE_SINGLE_BLOCK: these have a LCONF-Key-Name
+                else:
+                    if line_kind == LINE_PAIR:
+                        key = to_str(text[content_start:key_value_separator_idx - 1])
+                    elif line_kind == LINE_COMPACT_LIST:
+                        key = to_str(text[content_start + 2:key_value_separator_idx - 1])
+                    else:
+                        key = to_str(text[content_start + 2:line_end])
+
+                    schema_block = context[1]
+                    schema_item = schema_block.items.get(key)
+                    if schema_item is None:
+                        if is_strict:
+                            raise line_error(line_start, line_end, line_number, ERR_SCHEMA_UNKNOWN_KEY, [
+                                'LCONF-Schema ERROR: LCONF-Key-Name is not defined in the STRICT LCONF-Schema: '
+                                '<{}>'.format(key),
+                            ])
+                        if line_kind != LINE_PAIR and line_kind != LINE_COMPACT_LIST:
+                            contexts.append([SCHEMA_NOT_DEFINED, None, 0, text[line_start:line_end], None,
+                                             line_number])
+                        continue
+
+                    expected_schema_kind = SCHEMA_KINDS_BY_LINE_KIND[line_kind]
+                    if schema_item.schema_kind != expected_schema_kind and not (
+                            line_kind == LINE_BLOCKS and schema_item.schema_kind == SCHEMA_NAMED_BLOCKS):
+                        raise line_error(line_start, line_end, line_number, ERR_SCHEMA_ITEM_TYPE, [
+                            'LCONF-Schema ERROR: wrong item type: <{}>'.format(key),
+                            '',
+                            '    Expected: <{}>'.format(SCHEMA_KIND_NAMES[schema_item.schema_kind]),
+                        ])
+                    if context[2] & schema_item.key_bit:
+                        raise line_error(line_start, line_end, line_number, ERR_SCHEMA_DUPLICATE_KEY, [
+                            'LCONF-Schema ERROR: LCONF-Key-Name is not unique: <{}>'.format(key),
+                        ])
+                    context[2] |= schema_item.key_bit
+
+                    # Check for wrong multiple LCONF_KEY_VALUE_SEPARATOR in one line
+                    if key_value_separator_idx != -1 and \
+                            text.find(key_value_separator, key_value_separator_idx + 2, line_end) != -1:
+                        raise line_error(line_start, line_end, line_number, ERR_SCHEMA_KEY_VALUE_SEPARATOR, [
+                            'LCONF-Schema ERROR: more than one LCONF_KEY_VALUE_SEPARATOR < :: >',
+                        ])
+
+                    if line_kind == LINE_PAIR:
+                        if line_end == key_value_separator_idx + 2:
+                            if schema_item.requirement & REQUIREMENT_NOT_EMPTY:
+                                raise line_error(line_start, line_end, line_number, ERR_SCHEMA_NOT_EMPTY, [
+                                    'LCONF-Schema ERROR: REQUIRED_NOT_EMPTY LCONF-Key-Value-Pair is empty: <{}>'.format(
+                                        key),
+                                ])
+                        elif convert_values:
+                            convert(schema_item, to_str(text[key_value_separator_idx + 3:line_end]), line_start,
+                                    line_end, line_number)
+                    elif line_kind == LINE_COMPACT_LIST:
+                        if not convert_values:
+                            continue
+                        # An empty Compact_STRUCTURE_LIST value is only valid for TYPE_STRING / TYPE_NOTSET
+                        values = text[key_value_separator_idx + 3:line_end].split(list_split_separator)
+                        if schema_item.value_type in ARRAY_TYPECODES:
+                            try:
+                                _typed_array(schema_item.value_type, map(to_str, values))
+                                continue
+                            except (ValueError, OverflowError, KeyError):
+                                # Find the wrong LCONF-Value
+                                pass
+                        for value in values:
+                            convert(schema_item, to_str(value), line_start, line_end, line_number)
+                    elif line_kind == LINE_SINGLE_BLOCK:
+                        contexts.append([SCHEMA_SINGLE_BLOCK, schema_item.child, 0, text[line_start:line_end],
+                                         schema_item, line_number])
+                    else:
+                        contexts.append([schema_item.schema_kind, schema_item, 0, text[line_start:line_end],
+                                         schema_item, line_number])
+            except SectionErr as err:
+                if errors is None:
+                    raise
+                errors.append(err)
+                # Resynchronize: the lines of a wrong structure are only validated by the line engine
+                if line_kind in OPENING_LINE_KINDS and len(contexts) == cur_level + 1:
+                    contexts.append([SCHEMA_NOT_DEFINED, None, 0, text[line_start:line_end], None, line_number])
+
+        while contexts:
+            close(contexts.pop())
+
+
+def _update_schema_digest(hash_obj, schema_obj):
+    """ Helper for `LconfSchema.digest`: hashes one SchemaBlock or the column SchemaItems of a STRUCTURE_TABLE.
+    """
+    schema_items = [schema_obj.items[key] for key in schema_obj.keys] if isinstance(schema_obj, SchemaBlock) else \
+        schema_obj
+    hash_obj.update(b'(')
+    for schema_item in schema_items:
+        hash_obj.update('{}\x00{}\x00{}\x00{}\x00'.format(
+            schema_item.key, schema_item.schema_kind, schema_item.requirement, schema_item.value_type).encode('utf-8'))
+        if schema_item.child is not None:
+            _update_schema_digest(hash_obj, schema_item.child)
+    hash_obj.update(b')')
+
+
+# =================================================================================================================== #
+
+def compile_schema(section_text, buffer=None):
+    """
+    #### lconf_schema.compile_schema
+
+    Compiles one LCONF-Schema-Section raw string: it must be already correctly extracted.
+
+    `compile_schema(section_text, buffer=None)`
+
+    **Parameters:**
+
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Schema-Section
+    * `buffer`: (bytes, bytearray, mmap or memoryview) optional: if given `section_text` must be a section span
+        `(start, end, section_name, section_format)` into it: see `extract_sections(source, as_spans=True)`.
+
+    **Returns:** (LconfSchema) the compiled LCONF-Schema else raises an error
+
+    *Validates:*
+
+    * The LCONF-Schema-Section like `validate_one_section_schema`
+    * LCONF-Item-Requirement-Options and LCONF-Value-Types: see the module documentation
+    * Unique LCONF-Key-Names
+    """
+    section_obj = parse_section(section_text, buffer)
+    if section_obj.section_format == LCONF_FORMAT_LCONF:
+        raise Err('compile_schema', [
+            'SECTION FORMAT ERROR: expected a LCONF-Schema-Section format. Got: <{}>'.format(
+                section_obj.section_format),
+            '',
+            '    LCONF-Section-Name: <{}>'.format(section_obj.name),
+        ], ERR_SECTION_FORMAT)
+    return LconfSchema(section_obj.name, section_obj.section_format, _compile_block(section_obj, section_obj.name))
+
+
+def _schema_error(section_name, key, info):
+    return Err('compile_schema', [
+        'LCONF-Schema-Section-Name: <{}>'.format(section_name),
+        '',
+        '    LCONF-Schema item: <{}>'.format(key),
+        '    {}'.format(info),
+    ], ERR_SCHEMA)
+
+
+def _compile_pair(key, value, key_bit, section_name):
+    """ Helper for `compile_schema`: `key :: LCONF-Item-Requirement-Option | LCONF-Value-Type`.
+    """
+    parts = value.split(SCHEMA_PARTS_SEPARATOR)
+    if len(parts) != 2:
+        raise _schema_error(section_name, key, 'Expected: <LCONF-Item-Requirement-Option{}LCONF-Value-Type>'.format(
+            SCHEMA_PARTS_SEPARATOR))
+    requirement, value_type = parts
+    if requirement not in REQUIREMENT_FLAGS:
+        raise _schema_error(section_name, key, 'Unknown LCONF-Item-Requirement-Option: <{}>'.format(requirement))
+    if value_type not in TYPE_CONVERTERS:
+        raise _schema_error(section_name, key, 'Unknown or not supported LCONF-Value-Type: <{}>. Supported: <{}>'.format(
+            value_type, '>, <'.join(sorted(TYPE_CONVERTERS))))
+    return SchemaItem(key, SCHEMA_PAIR, key_bit, REQUIREMENT_FLAGS[requirement], value_type,
+                      TYPE_CONVERTERS[value_type], None)
+
+
+def _compile_block(block_obj, section_name):
+    """ Helper for `compile_schema`: returns the SchemaBlock of one parsed STRUCTURE_SINGLE_BLOCK.
+    """
+    items = {}
+    keys = []
+    required_mask = 0
+    for item_key, value in block_obj.items():
+        key_bit = 1 << len(keys)
+        if isinstance(value, str):
+            key = item_key
+            schema_item = _compile_pair(key, value, key_bit, section_name)
+        elif isinstance(value, StructureSingleBlock):
+            parts = item_key.split(SCHEMA_PARTS_SEPARATOR)
+            key = parts[0]
+            if len(parts) == 2:
+                requirement = OPTIONAL
+            elif len(parts) == 3:
+                requirement = parts[2]
+            else:
+                raise _schema_error(section_name, item_key, 'Expected: <key{0}STRUCTURE_TYPE> or '
+                                                            '<key{0}STRUCTURE_TYPE{0}LCONF-Item-Requirement-Option>'
+                                                            ''.format(SCHEMA_PARTS_SEPARATOR))
+            if requirement not in REQUIREMENT_FLAGS:
+                raise _schema_error(section_name, item_key, 'Unknown LCONF-Item-Requirement-Option: <{}>'.format(
+                    requirement))
+            schema_kind = SCHEMA_KINDS_BY_STRUCTURE_NAME.get(parts[1])
+            if schema_kind is None:
+                raise _schema_error(section_name, item_key, 'Unknown STRUCTURE_TYPE: <{}>. Expected one of: <{}>'.format(
+                    parts[1], '>, <'.join(sorted(SCHEMA_KINDS_BY_STRUCTURE_NAME))))
+
+            value_type = None
+            converter = None
+            if schema_kind == SCHEMA_LIST:
+                if value.keys() != [SCHEMA_LIST_ITEM_KEY] or not isinstance(value[SCHEMA_LIST_ITEM_KEY], str):
+                    raise _schema_error(section_name, item_key, 'A STRUCTURE_LIST must have exact one item: <{}{}>'.format(
+                        SCHEMA_LIST_ITEM_KEY, LCONF_KEY_VALUE_SEPARATOR))
+                list_item = _compile_pair(key, value[SCHEMA_LIST_ITEM_KEY], 0, section_name)
+                value_type = list_item.value_type
+                converter = list_item.converter
+                # The LCONF-Item-Requirement-Option of the list item applies to the list
+                if len(parts) == 2:
+                    requirement = [name for name, flags in REQUIREMENT_FLAGS.items()
+                                   if flags == list_item.requirement][0]
+                child = None
+            elif schema_kind == SCHEMA_TABLE:
+                columns = []
+                for column_key, column_value in value.items():
+                    if not isinstance(column_value, str):
+                        raise _schema_error(section_name, item_key, 'STRUCTURE_TABLE columns must be '
+                                                                    'LCONF-Key-Value-Pairs: <{}>'.format(column_key))
+                    columns.append(_compile_pair(column_key, column_value, len(columns), section_name))
+                if not columns:
+                    raise _schema_error(section_name, item_key, 'A STRUCTURE_TABLE must define at least one column.')
+                child = tuple(columns)
+            else:
+                child = _compile_block(value, section_name)
+            schema_item = SchemaItem(key, schema_kind, key_bit, REQUIREMENT_FLAGS[requirement], value_type, converter,
+                                     child)
+        else:
+            raise _schema_error(section_name, item_key, 'Expected a LCONF-Key-Value-Pair or a STRUCTURE_SINGLE_BLOCK '
+                                                        '`. key{}STRUCTURE_TYPE`'.format(SCHEMA_PARTS_SEPARATOR))
+
+        if key in items:
+            raise _schema_error(section_name, item_key, 'LCONF-Key-Name is not unique.')
+        items[key] = schema_item
+        keys.append(key)
+        if schema_item.requirement & REQUIREMENT_PRESENT:
+            required_mask |= key_bit
+    return SchemaBlock(MappingProxyType(items), tuple(keys), required_mask)
+
+
+def parse_section_typed(section_text, lconf_schema_obj, buffer=None, use_numpy=True, use_records=False):
+    """
+    #### lconf_schema.parse_section_typed
+
+    Parses one LCONF-Section raw string with its LCONF-Schema: it must be already correctly extracted.
+
+    `parse_section_typed(section_text, lconf_schema_obj, buffer=None, use_numpy=True, use_records=False)`
+
+    **Parameters:**
+
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+    * `lconf_schema_obj`: (LconfSchema) compiled LCONF-Schema: see `compile_schema`
+    * `buffer`: (bytes, bytearray, mmap or memoryview) optional: if given `section_text` must be a section span
+        `(start, end, section_name, section_format)` into it: see `extract_sections(source, as_spans=True)`.
+    * `use_numpy`: (bool) if True and NumPy is installed StructureArray values are NumPy arrays sharing the memory of
+        the `array.array` and each StructureColumnTable is backed by one NumPy structured array
+    * `use_records`: (bool) if True and the LCONF-Schema is STRICT each STRUCTURE_SINGLE_BLOCK below the root is a
+        `structure_classes.StructureRecord`: see below
+
+    **Returns:** (LconfSection) the parsed LCONF-Section else raises an error
+
+    The LCONF-Section is validated like `validate_one_section_complet`. Not empty LCONF-Values of items defined in the
+    LCONF-Schema are converted to their LCONF-Value-Types. STRUCTURE_LISTs of `TYPE_INTEGER`, `TYPE_FLOAT` and
+    `TYPE_BOOLEAN` are converted in one batch per list into a `StructureArray`: see `ARRAY_TYPECODES`.
+    STRUCTURE_TABLEs are stored column-wise in a `StructureColumnTable`: one typed column per LCONF-Schema column.
+
+    With `use_records` the blocks get one generated record class per block shape (`structure_classes.record_class`):
+    the many items of STRUCTURE_NAMED_BLOCKS and STRUCTURE_UNNAMED_BLOCKS share their LCONF-Key-Names instead of
+    storing them per block. Equal string LCONF-Values of the records share one str object per LCONF-Section. The items
+    of a record are in LCONF-Schema order.
+    """
+    section_bytes = section_bytes_from_span(buffer, section_text) if buffer is not None else section_text
+    line_table, section_indentation_number, section_format, section_name = section_line_table(section_bytes)
+    if section_format != LCONF_FORMAT_LCONF:
+        raise Err('parse_section_typed', [
+            'SECTION FORMAT ERROR: expected a LCONF-Section format <{}>. Got: <{}>'.format(
+                LCONF_FORMAT_LCONF, section_format),
+            '',
+            '    LCONF-Section-Name: <{}>'.format(section_name),
+        ], ERR_SECTION_FORMAT)
+
+    # One pass over the lines: the LCONF-Schema validation without converting the LCONF-Values and the parse
+    section_obj = LconfSection(section_name, section_format, section_indentation_number)
+    parse_section_lines(section_obj, line_table, section_indentation_number, section_format, section_name,
+                        'parse_section_typed', lconf_schema_obj.iter_validated_lines(
+                            line_table, section_indentation_number, section_format, section_name,
+                            'validate_one_section_complet', convert_values=False))
+    string_pool = {} if use_records and lconf_schema_obj.section_format == LCONF_FORMAT_SCHEMA_STRICT else None
+    try:
+        _convert_block(section_obj, lconf_schema_obj.root, use_numpy and numpy is not None, string_pool)
+    except (ValueError, OverflowError, KeyError):
+        # A wrong LCONF-Value: the validation with converting each LCONF-Value raises the error with its line
+        validate_one_section_complet(section_bytes, lconf_schema_obj)
+        raise
+    return section_obj
+
+
+def _convert_block(block_obj, schema_block, use_numpy, string_pool):
+    """ Helper for `parse_section_typed`: converts the LCONF-Values of one validated StructureSingleBlock in place.
+
+    `string_pool`: (dict or None) if given the nested blocks are replaced by records: see `_block_record`.
+    """
+    schema_items = schema_block.items
+    for item_idx, (key, value) in enumerate(block_obj.items()):
+        schema_item = schema_items.get(key)
+        # Not defined in a FLEXIBLE LCONF-Schema
+        if schema_item is None:
+            continue
+        schema_kind = schema_item.schema_kind
+        if schema_kind == SCHEMA_PAIR:
+            if value and schema_item.converter is not str:
+                block_obj.set_item_value(item_idx, schema_item.converter(value))
+        elif schema_kind == SCHEMA_LIST:
+            typecode = ARRAY_TYPECODES.get(schema_item.value_type)
+            if typecode is not None:
+                values = _typed_array(schema_item.value_type, value)
+                if use_numpy:
+                    values = numpy.frombuffer(values, dtype=NUMPY_DTYPES[typecode])
+                block_obj.set_item_value(item_idx, StructureArray(key, values, typecode == 'b'))
+            elif schema_item.converter is not str:
+                value[:] = map(schema_item.converter, value)
+        elif schema_kind == SCHEMA_TABLE:
+            block_obj.set_item_value(item_idx, _column_table(key, value.rows, schema_item.child, use_numpy))
+        elif schema_kind == SCHEMA_SINGLE_BLOCK:
+            _convert_block(value, schema_item.child, use_numpy, string_pool)
+            if string_pool is not None:
+                block_obj.set_item_value(item_idx, _block_record(value, schema_item.child, string_pool))
+        else:
+            for item_block_obj in value:
+                _convert_block(item_block_obj, schema_item.child, use_numpy, string_pool)
+            if string_pool is not None:
+                value[:] = [_block_record(item_block_obj, schema_item.child, string_pool) for item_block_obj in value]
+
+
+def _block_record(block_obj, schema_block, string_pool):
+    """ Helper for `parse_section_typed`: returns the StructureRecord of one converted StructureSingleBlock of a STRICT
+    LCONF-Schema. String LCONF-Values are looked up in the `string_pool` (dict): equal ones share one str object.
+    """
+    record = record_class(schema_block.keys)(block_obj.name)
+    slots_by_key = record._slots_by_key
+    pooled = string_pool.setdefault
+    for key, value in block_obj.items():
+        if value.__class__ is str:
+            value = pooled(value, value)
+        slots_by_key[key].__set__(record, value)
+    return record
+
+
+def _column_table(key, rows, schema_columns, use_numpy):
+    """ Helper for `parse_section_typed`: returns the StructureColumnTable of validated STRUCTURE_TABLE rows.
+    """
+    # Validation ensures all rows have one cell per LCONF-Schema column
+    cells_by_column = list(zip(*rows)) if rows else [()] * len(schema_columns)
+    columns = []
+    for schema_column, cells in zip(schema_columns, cells_by_column):
+        if schema_column.value_type in ARRAY_TYPECODES and LCONF_EMPTY_STRING not in cells:
+            columns.append(_typed_array(schema_column.value_type, cells))
+        elif schema_column.converter is str:
+            columns.append(list(cells))
+        else:
+            converter = schema_column.converter
+            columns.append([converter(cell) if cell else cell for cell in cells])
+
+    return build_column_table(key, tuple([schema_column.key for schema_column in schema_columns]),
+                              tuple([schema_column.value_type for schema_column in schema_columns]), columns,
+                              use_numpy)
+
+
+def build_column_table(key, column_names, column_types, columns, use_numpy):
+    """ Returns a StructureColumnTable of typed `columns` (`array.array` or list): used by `parse_section_typed` and
+    `lconf_binary.loads`.
 
+    With `use_numpy` the table is backed by one NumPy structured array: the columns are views of its fields.
+    """
+    if not use_numpy:
+        return StructureColumnTable(key, column_names, column_types, tuple(columns))
 
+    # One structured array: the columns are views of its fields
+    records = numpy.empty(len(columns[0]) if columns else 0, dtype=[
+        (column_name, NUMPY_DTYPES[column.typecode] if isinstance(column, array) else object)
+        for column_name, column in zip(column_names, columns)
+    ])
+    for column_name, column in zip(column_names, columns):
+        records[column_name] = column
+    return StructureColumnTable(key, column_names, column_types,
+                                tuple([records[column_name] for column_name in column_names]), records)
 
 
+def validate_schemas_from_file(path_to_lconfsd_file, cache=None):
+    """
+    #### lconf_schema.validate_schemas_from_file
 
+    Validates a LCONF-Schema-File containing one or more LCONF-Schema-Sections.
 
-# =====================================================================================================================
-def TOOD_deletelater():
-    print("\n\nTOOD_deletelater\n\n")
+    `validate_schemas_from_file(path_to_lconfsd_file, cache=None)`
 
+    **Parameters:**
 
-    # ===========
-    section_text = """___SECTION :: 4 :: Own Test Section
+    * `path_to_lconfsd_file`: (str) path to a LCONF-Schema-File
+    * `cache`: (validation_cache.ValidationCache) optional: cached LCONF-Schema-Sections are not validated, new valid
+        ones are stored. The file is not read if it did not change.
 
-# OWN COMMENT
-key1value_pair_name :: FRED
-key2value_pair_age :: 17
-___END"""
-    parse_section_obj = parse_section(default_obj_result, section_text, lconf_template_structure, validate=False)
-    print("\n\nparse_section_obj: \n\n", parse_section_obj, "\n\n")
-    print("\n\nparse_section_obj.section_name: <", parse_section_obj.section_name, ">")
-    print("\n\nparse_section_obj.is_parsed: <", parse_section_obj.is_parsed, ">")
+    **Returns:** (bool) True if success else raises an error
 
+    *Validates:*
 
-if __name__ == '__main__':
+    * Each LCONF-Schema-Section like `validate_one_section_schema` and `compile_schema`
+    """
+    if cache is None:
+        with open(path_to_lconfsd_file, 'r', encoding='utf-8') as file_obj:
+            source = file_obj.read()
+        for section_text in extract_sections(source):
+            validate_one_section_schema(section_text)
+            compile_schema(section_text)
+        return True
 
-    TOOD_deletelater()
+    if cache.unchanged_file_sections(path_to_lconfsd_file, VALIDATE_SCHEMA) is not None:
+        return True
+    stat_result = os_stat(path_to_lconfsd_file)
+    with open(path_to_lconfsd_file, 'rb') as file_obj:
+        buffer = file_obj.read()
+    section_spans = extract_sections(buffer, as_spans=True)
+    keys = []
+    new_valid = []
+    for section_span in section_spans:
+        section_bytes = section_bytes_from_span(buffer, section_span)
+        key = cache.section_key(section_bytes, VALIDATE_SCHEMA)
+        keys.append(key)
+        if cache.is_valid(key):
+            continue
+        start_time = perf_counter()
+        validate_one_section_schema(section_bytes)
+        compile_schema(section_bytes)
+        new_valid.append((key, perf_counter() - start_time))
+    cache.store_file(path_to_lconfsd_file, VALIDATE_SCHEMA, stat_result,
+                     [section_span[2] for section_span in section_spans], keys, new_valid)
+    return True
@@ -4,19 +4,59 @@
 #### Overview
 
 `extract_sections`: Extracts all LCONF-Sections from the source.
+`iter_sections`: Yields all LCONF-Sections from a file object or path reading it in chunks.
+`section_text_from_span`: Decodes one LCONF-Section span returned by `extract_sections(source, as_spans=True)`.
+`section_bytes_from_span`: Returns one LCONF-Section span as UTF-8 `bytes`: used by the bytes validation path.
+`section_first_line`: Validates a LCONF-Section-Start-Line and returns its parts.
 `section_splitlines`: Split one LCONF-Section into lines and validates the LCONF-Section-Start-Line / End-Line
+`section_line_table`: Scans one LCONF-Section into a `LineTable` and validates the LCONF-Section-Start-Line / End-Line
 `prepare_section_lines`: Prevalidate a LCONF-Section raw string and returns it's Section-Lines skipping
     LCONF_BLANK_LINE and LCONF-Section-Comment-Line.
 `validate_one_section_fast`: Validate one LCONF-Section raw string fast.
+`parse_section`: Parses one LCONF-Section raw string into a `LconfSection`: validates it in the same pass.
+`parse_section_lines`: Parses LCONF-Section lines into a root STRUCTURE_SINGLE_BLOCK.
 `validate_one_section_complet`: Validate one LCONF-Section raw string completly.
+`validate_sections_from_file`: Validates all LCONF-Sections of a LCONF-File.
+`validate_file`: Validates all LCONF-Sections of a LCONF-File: optional with worker processes over a shared mmap.
 
+The validators raise an error for the first problem. With `collect_all=True` they return a list of all errors found in
+one pass instead (empty if valid): after a wrong line the lines indented more than it are skipped and validation
+resynchronizes at the next line with the same or a lower indentation. A wrong LCONF-Section-Start-Line or
+LCONF-Section-End-Line is the only error of its LCONF-Section.
+
+The validators and the parser read the lines of a LCONF-Section from one `line_table.LineTable` (offsets into the
+LCONF-Section text): `section_splitlines` and `prepare_section_lines` return the lines as objects for other callers.
+
+#### Compiled Speedups
+
+If the Cython extension `PyLCONF._speedups` is built (`make build_ext`) `section_splitlines` and
+`prepare_section_lines` are its compiled versions and `validate_one_section_fast` checks a LCONF-Section with its
+compiled state machine first: else the pure-Python code is used. Both give the same results and raise the same errors:
+the pure-Python functions are also available as `py_section_splitlines` and `py_prepare_section_lines`.
+
+#### Profiling
+
+While a `profiling.ValidationProfile` is active `validate_one_section_fast`, `validate_one_section_schema` and
+`validate_sections_from_file` record the wall time of each phase and the line counts of each LCONF-Section to it.
 """
+from itertools import islice
+from mmap import (
+    mmap,
+    ACCESS_READ as MMAP_ACCESS_READ,
+)
+from multiprocessing import Pool
+from re import (
+    compile as re_compile,
+    escape as re_escape,
+)
 from os.path import (
     abspath as path_abspath,
     dirname as path_dirname,
+    getsize as path_getsize,
     isfile as path_isfile,
     join as path_join,
 )
+from time import perf_counter
 
 from PyLCONF.constants import (
     ### Single Characters
@@ -29,17 +69,41 @@ from PyLCONF.constants import (
     LCONF_FORMAT_SCHEMA_STRICT,
     LCONF_FORMAT_SCHEMA_FLEXIBLE,
     ### Structural Tokens
-    STRUCTURE_LIST_IDENTIFIER,
     STRUCTURE_LIST_VALUE_SEPARATOR,
-    STRUCTURE_TABLE_IDENTIFIER,
     STRUCTURE_TABLE_VALUE_SEPARATOR,
-    STRUCTURE_SINGLE_BLOCK_IDENTIFIER,
-    STRUCTURE_BLOCKS_IDENTIFIER,
-    LCONF_COMMENT_LINE_IDENTIFIER,
-    LCONF_KEY_VALUE_SEPARATOR,
 )
 
+from PyLCONF import profiling
+from PyLCONF.lconf_classes import LconfSection
+from PyLCONF.line_table import LineTable
+from PyLCONF.line_engine import (
+    BYTES_LINE_TOKENS,
+    LINE_BLOCKS,
+    LINE_COMPACT_LIST,
+    LINE_LIST,
+    LINE_LIST_VALUE,
+    LINE_NAMED_BLOCK,
+    LINE_PAIR,
+    LINE_SINGLE_BLOCK,
+    LINE_TABLE,
+    LINE_TABLE_ROW,
+    STR_LINE_TOKENS,
+    iter_section_lines,
+)
+from PyLCONF.structure_classes import (
+    StructureBlocks,
+    StructureList,
+    StructureSingleBlock,
+    StructureTable,
+)
 from PyLCONF.utilities import (
+    ERR_INDENTATION_JUMP,
+    ERR_INDENTATION_MULTIPLE,
+    ERR_SECTION_END_LINE,
+    ERR_SECTION_EXTRACT,
+    ERR_SECTION_FORMAT,
+    ERR_SECTION_START_LINE,
+    ERR_TRAILING_SPACE,
     Err,
     SectionErr,
 )
@@ -59,24 +123,53 @@ SECTION_NAME_START_IDX = 28
 SCHEMA_STRICT_NAME_START_IDX = 29
 SCHEMA_FLEXIBLE_NAME_START_IDX = 31
 
+# Number of characters `iter_sections` reads at once
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# `validate_file`: batches of LCONF-Section spans per worker process
+BATCHES_PER_WORKER = 4
+
+# Used by `extract_sections(source, as_spans=True)`: these search any bytes-like object (bytes, mmap, memoryview)
+# without copying it
+SECTION_START_TOKEN_BYTES_RE = re_compile(re_escape(SECTION_START_TOKEN.encode('utf-8')))
+SECTION_END_TOKEN_BYTES_RE = re_compile(re_escape(SECTION_END_TOKEN.encode('utf-8')))
+NEWLINE_BYTES_RE = re_compile(b'\n')
+
+SECTION_END_TOKEN_BYTES = SECTION_END_TOKEN.encode('utf-8')
+
+# `parse_section`: the result class of a structure by the line kind of its identifier line
+STRUCTURE_CLASSES = {
+    LINE_LIST: StructureList,
+    LINE_TABLE: StructureTable,
+    LINE_SINGLE_BLOCK: StructureSingleBlock,
+    LINE_BLOCKS: StructureBlocks,
+}
 
 # =================================================================================================================== #
 
-def extract_sections(source):
+def extract_sections(source, as_spans=False):
     """
     #### lconf_section.extract_sections
 
     Extracts all LCONF-Sections from the source.
 
-    `extract_sections(source)`
+    `extract_sections(source, as_spans=False)`
 
     **Parameters:**
 
     * `source`: (raw str) which contains one or more LCONF-Sections
+        if `as_spans` is True: (bytes, bytearray, mmap or memoryview) UTF-8 encoded
+    * `as_spans`: (bool) if True return spans into the source instead of copied LCONF-Sections text
 
     **Returns:** (list) of LCONF-Sections text each inclusive the `___SECTION, ___END` TAG these are not split by line
         but each in one txt
+
+        if `as_spans` is True: (list) of tuples `(start, end, section_name, section_format)`: byte offsets of each
+        LCONF-Section inclusive the `___SECTION, ___END` TAG. Only the LCONF-Section-Start-Line is decoded and validated
+        like in `section_splitlines`. Text outside of LCONF-Sections is skipped.
     """
+    if as_spans:
+        return _extract_section_spans(source)
 
     # NOTE: This seems to take only about 20% of the time of Regex alternatives
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -94,119 +187,278 @@ def extract_sections(source):
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
     lconf_sections = []
-    # Fastest: read the whole file at once and cut all between first : ___SECTION and last ___END in case there is a
-    #         lot of additional text.
+    # Fastest: find the first ___SECTION and the last ___END in case there is a lot of additional text.
     # Raise already error if one of them is not found(using str.index)
     first_start_idx = source.index(SECTION_START_TOKEN)
-    last_end_idx = source.rindex(SECTION_END_TOKEN)
-    main_text_source = source[first_start_idx:last_end_idx + LENGTH_END_TOKEN]
+    last_end_idx = source.rindex(SECTION_END_TOKEN) + LENGTH_END_TOKEN
 
+    # NOTE: all searches use start/end offsets into the source: no slicing of the remaining text (linear time)
     # Check multiple sections in source:
-    if SECTION_START_TOKEN in main_text_source[LENGTH_START_TOKEN:]:
-        start_idx = 0  # keep first ___SECTION extract_sections but search for ___END extract_sections
-        search_for_start = False
-        from_here_idx = start_idx
-        while True:
-            if search_for_start:
-                start_idx = main_text_source[from_here_idx:].find(SECTION_START_TOKEN)
-                if start_idx == -1:
-                    break  # no more docs
-                search_for_start = False
-                from_here_idx = from_here_idx + start_idx
-            else:
-                end_idx = main_text_source[from_here_idx:].find(SECTION_END_TOKEN)
-                if end_idx == -1:
-                    raise Err('extract_sections', [
-                        'SECTION_END_TOKEN NOT FOUND: expected <{}>'.format(SECTION_END_TOKEN),
-                        '',
-                        '==================',
-                        '{}'.format(main_text_source[from_here_idx:]),
-                        '==================',
-                        ''
-                    ])
-                # add doc
-                end_idx_with_extract_sections = from_here_idx + end_idx + LENGTH_END_TOKEN
-                tmp_section_txt = main_text_source[from_here_idx:end_idx_with_extract_sections]
-                if SECTION_START_TOKEN in tmp_section_txt[LENGTH_START_TOKEN:]:
-                    raise Err('extract_sections', [
-                        'LCONF_SECTION_START FOUND within LCONF-Section. Section text:',
-                        '',
-                        '==================',
-                        '{}'.format(tmp_section_txt),
-                        '==================',
-                        ''
-                    ])
-                lconf_sections.append(main_text_source[from_here_idx:end_idx_with_extract_sections])
-                search_for_start = True
-                from_here_idx = end_idx_with_extract_sections
+    if source.find(SECTION_START_TOKEN, first_start_idx + LENGTH_START_TOKEN, last_end_idx) != -1:
+        from_here_idx = first_start_idx  # keep first ___SECTION but search for ___END
+        while from_here_idx != -1:
+            end_idx = source.find(SECTION_END_TOKEN, from_here_idx, last_end_idx)
+            if end_idx == -1:
+                raise Err('extract_sections', [
+                    'SECTION_END_TOKEN NOT FOUND: expected <{}>'.format(SECTION_END_TOKEN),
+                    '',
+                    '==================',
+                    '{}'.format(source[from_here_idx:last_end_idx]),
+                    '==================',
+                    ''
+                ], ERR_SECTION_EXTRACT)
+            # add section
+            end_idx_with_end_token = end_idx + LENGTH_END_TOKEN
+            if source.find(SECTION_START_TOKEN, from_here_idx + LENGTH_START_TOKEN, end_idx) != -1:
+                raise Err('extract_sections', [
+                    'LCONF_SECTION_START FOUND within LCONF-Section. Section text:',
+                    '',
+                    '==================',
+                    '{}'.format(source[from_here_idx:end_idx_with_end_token]),
+                    '==================',
+                    ''
+                ], ERR_SECTION_EXTRACT)
+            lconf_sections.append(source[from_here_idx:end_idx_with_end_token])
+            from_here_idx = source.find(SECTION_START_TOKEN, end_idx_with_end_token, last_end_idx)
     else:
-        if SECTION_END_TOKEN in main_text_source[:-LENGTH_END_TOKEN]:
+        if source.find(SECTION_END_TOKEN, first_start_idx, last_end_idx - LENGTH_END_TOKEN) != -1:
             raise Err('extract_sections', [
                 'LCONF_SECTION_END FOUND within LCONF-Section. Section text:',
                 '',
                 '==================',
-                '{}'.format(main_text_source),
+                '{}'.format(source[first_start_idx:last_end_idx]),
                 '==================',
                 ''
-            ])
-        lconf_sections.append(main_text_source)
+            ], ERR_SECTION_EXTRACT)
+        lconf_sections.append(source[first_start_idx:last_end_idx])
     return lconf_sections
 
 
-def section_splitlines(section_text):
+def _extract_section_spans(buffer):
+    """ Helper for `extract_sections(source, as_spans=True)`: see there.
     """
-    #### lconf_section.section_splitlines
+    section_spans = []
+    buffer_length = len(buffer)
+    match_start = SECTION_START_TOKEN_BYTES_RE.search(buffer)
+    if match_start is None:
+        raise Err('extract_sections', [
+            'SECTION_START_TOKEN NOT FOUND: expected <{}>'.format(SECTION_START_TOKEN),
+        ], ERR_SECTION_EXTRACT)
+    while match_start is not None:
+        start_idx = match_start.start()
+        match_end = SECTION_END_TOKEN_BYTES_RE.search(buffer, start_idx + LENGTH_START_TOKEN)
+        if match_end is None:
+            raise Err('extract_sections', [
+                'SECTION_END_TOKEN NOT FOUND: expected <{}>'.format(SECTION_END_TOKEN),
+                '',
+                '    LCONF-Section starts at byte offset: <{}>'.format(start_idx),
+            ], ERR_SECTION_EXTRACT)
+        end_idx = match_end.end()
+        match_start = SECTION_START_TOKEN_BYTES_RE.search(buffer, start_idx + LENGTH_START_TOKEN, buffer_length)
+        if match_start is not None and match_start.start() < match_end.start():
+            raise Err('extract_sections', [
+                'LCONF_SECTION_START FOUND within LCONF-Section.',
+                '',
+                '    LCONF-Section starts at byte offset: <{}>'.format(start_idx),
+                '    LCONF_SECTION_START found at byte offset: <{}>'.format(match_start.start()),
+            ], ERR_SECTION_EXTRACT)
 
-    Split one LCONF-Section into lines.
+        # decode only the LCONF-Section-Start-Line
+        match_newline = NEWLINE_BYTES_RE.search(buffer, start_idx, end_idx)
+        first_line_end_idx = end_idx if match_newline is None else match_newline.start()
+        with memoryview(buffer) as buffer_view:
+            first_line = str(buffer_view[start_idx:first_line_end_idx], 'utf-8')
+        if first_line and first_line[-1] == '\r':
+            first_line = first_line[:-1]
+        section_indentation_number, section_format, section_name = section_first_line(first_line)
 
-    `section_splitlines(section_text)`
+        section_spans.append((start_idx, end_idx, section_name, section_format))
+    return section_spans
+
+
+def section_text_from_span(buffer, section_span):
+    """
+    #### lconf_section.section_text_from_span
+
+    Decodes one LCONF-Section span returned by `extract_sections(source, as_spans=True)`.
+
+    `section_text_from_span(buffer, section_span)`
 
     **Parameters:**
 
-    * `section_text`: (raw str) which contains exact one LCONF-Section
+    * `buffer`: (bytes, bytearray, mmap or memoryview) UTF-8 encoded: the source used for `extract_sections`
+    * `section_span`: (tuple) `(start, end, section_name, section_format)`
 
-    **Returns:** (tuple) section_lines, section_indentation_number, section_format, section_name
+    **Returns:** (str) the LCONF-Section text inclusive the `___SECTION, ___END` TAG
+    """
+    with memoryview(buffer) as buffer_view:
+        return str(buffer_view[section_span[0]:section_span[1]], 'utf-8')
 
-    *Validates:*
 
-    * LCONF-Section-Start-Line (first line)
-    * LCONF-Section-End-Line (last line)
+def iter_sections(fileobj_or_path, chunk_size=DEFAULT_CHUNK_SIZE):
     """
+    #### lconf_section.iter_sections
 
-    section_lines = section_text.splitlines()
-    first_line = section_lines[0]
+    Yields all LCONF-Sections from a file object or a file path: reads the source in chunks.
+
+    `iter_sections(fileobj_or_path, chunk_size=DEFAULT_CHUNK_SIZE)`
+
+    **Parameters:**
+
+    * `fileobj_or_path`: (str or file object opened in text mode) which contains one or more LCONF-Sections
+    * `chunk_size`: (int) number of characters read per chunk
+
+    **Yields:** (str) each LCONF-Section text inclusive the `___SECTION, ___END` TAG as soon as its `___END` was read
+
+    Any text is only scanned once: memory use is bounded by the largest single LCONF-Section plus one chunk.
+    Text outside of LCONF-Sections is skipped.
+    """
+    if isinstance(fileobj_or_path, str):
+        with open(fileobj_or_path, 'r', encoding='utf-8') as file_obj:
+            yield from _iter_sections_fileobj(file_obj, chunk_size)
+    else:
+        yield from _iter_sections_fileobj(fileobj_or_path, chunk_size)
+
+
+def _iter_sections_fileobj(file_obj, chunk_size):
+    """ Helper for `iter_sections`: see there.
+    """
+    # Text which must be kept to find a token which is split between two chunks
+    keep_length = LENGTH_START_TOKEN - 1
+    found_section = False
+    # None: outside of a LCONF-Section; else the already scanned parts of the current LCONF-Section
+    section_parts = None
+    # text[pos:]: not yet consumed text - scan_from: offset in text from where to search for tokens
+    text = ''
+    pos = 0
+    scan_from = 0
+    while True:
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            break
+        # rebase once per chunk: positions stay valid as offsets into the new text
+        text = text[pos:] + chunk
+        scan_from -= pos
+        pos = 0
+        while True:
+            if section_parts is None:
+                start_idx = text.find(SECTION_START_TOKEN, pos)
+                if start_idx == -1:
+                    pos = max(pos, len(text) - keep_length)
+                    break
+                found_section = True
+                section_parts = []
+                pos = start_idx
+                scan_from = start_idx + LENGTH_START_TOKEN
+
+            end_idx = text.find(SECTION_END_TOKEN, scan_from)
+            nested_start_idx = text.find(SECTION_START_TOKEN, scan_from, len(text) if end_idx == -1 else end_idx)
+            if nested_start_idx != -1:
+                section_parts.append(text[pos:nested_start_idx + LENGTH_START_TOKEN])
+                raise Err('iter_sections', [
+                    'LCONF_SECTION_START FOUND within LCONF-Section. Section text:',
+                    '',
+                    '==================',
+                    '{}'.format(''.join(section_parts)),
+                    '==================',
+                    ''
+                ], ERR_SECTION_EXTRACT)
+            if end_idx == -1:
+                # keep only the tail: a token may start in it
+                keep_from = len(text) - keep_length
+                if keep_from > pos:
+                    section_parts.append(text[pos:keep_from])
+                    pos = keep_from
+                scan_from = pos
+                break
+
+            end_idx_with_end_token = end_idx + LENGTH_END_TOKEN
+            section_parts.append(text[pos:end_idx_with_end_token])
+            yield ''.join(section_parts)
+            section_parts = None
+            pos = end_idx_with_end_token
+
+    if section_parts is not None:
+        section_parts.append(text[pos:])
+        raise Err('iter_sections', [
+            'SECTION_END_TOKEN NOT FOUND: expected <{}>'.format(SECTION_END_TOKEN),
+            '',
+            '==================',
+            '{}'.format(''.join(section_parts)),
+            '==================',
+            ''
+        ], ERR_SECTION_EXTRACT)
+    if not found_section:
+        raise Err('iter_sections', [
+            'SECTION_START_TOKEN NOT FOUND: expected <{}>'.format(SECTION_START_TOKEN),
+        ], ERR_SECTION_EXTRACT)
+
+
+def section_bytes_from_span(buffer, section_span):
+    """
+    #### lconf_section.section_bytes_from_span
+
+    Returns one LCONF-Section span returned by `extract_sections(source, as_spans=True)` as `bytes`.
+
+    `section_bytes_from_span(buffer, section_span)`
+
+    **Parameters:**
+
+    * `buffer`: (bytes, bytearray, mmap or memoryview) UTF-8 encoded: the source used for `extract_sections`
+    * `section_span`: (tuple) `(start, end, section_name, section_format)`
+
+    **Returns:** (bytes) the UTF-8 LCONF-Section inclusive the `___SECTION, ___END` TAG: not decoded
+    """
+    with memoryview(buffer) as buffer_view:
+        return buffer_view[section_span[0]:section_span[1]].tobytes()
+
+
+def section_first_line(first_line):
+    """
+    #### lconf_section.section_first_line
+
+    Validates a LCONF-Section-Start-Line and returns its parts.
+
+    `section_first_line(first_line)`
+
+    **Parameters:**
+
+    * `first_line`: (str) the LCONF-Section-Start-Line
+
+    **Returns:** (tuple) section_indentation_number, section_format, section_name
+    """
     length_first_line = len(first_line)
     # FIRST LINE: special
     if length_first_line < MIN_FIRSTLINE_LENGTH:
-        raise Err('section_splitlines', [
+        raise Err('section_first_line', [
             'FIRST LINE ERROR: Minimum expected length: <{}> Got: <{}>'.format(MIN_FIRSTLINE_LENGTH,
                                                                                length_first_line),
             '',
             '<{}>'.format(first_line)
-        ])
+        ], ERR_SECTION_START_LINE)
     elif first_line[-1] == LCONF_SPACE:
-        raise Err('section_splitlines', [
+        raise Err('section_first_line', [
             'FIRST LINE ERROR: Trailing space',
             '',
             '<{}>'.format(first_line)
-        ])
+        ], ERR_SECTION_START_LINE)
     elif not first_line.startswith('{} :: '.format(SECTION_START_TOKEN)):
-        raise Err('section_splitlines', [
+        raise Err('section_first_line', [
            'FIRST LINE ERROR: MUST start with <{} :: >'.format(SECTION_START_TOKEN),
            '',
            '    <{}>'.format(first_line)
-        ])
+        ], ERR_SECTION_START_LINE)
 
     # LCONF-Indentation-Per-Level | One LCONF-Digit (DIGIT TWO THROUGH DIGIT EIGHT) minimum 2 and maximum 8.
     section_indentation_number_char = first_line[LENGTH_START_TOKEN + 4]
     section_indentation_number_ord = ord(section_indentation_number_char)
     if section_indentation_number_ord < 50 or section_indentation_number_ord > 56:
-        raise Err('section_splitlines', [
+        raise Err('section_first_line', [
             'FIRST LINE ERROR: Wrong LCONF-Indentation-Per-Level Number:',
             '                  MUST be one of <2,3,4,5,6,7,8>. Got: <{}>'.format(section_indentation_number_char),
             '',
             '<{}>'.format(first_line)
-        ])
+        ], ERR_SECTION_START_LINE)
 
     # Second part of the first line: all after the LCONF-Indentation-Per-Level Number
     section_first_line_second_part = first_line[LENGTH_START_TOKEN + 5:]
@@ -220,7 +472,7 @@ def section_splitlines(section_text):
         section_format = LCONF_FORMAT_SCHEMA_FLEXIBLE
         section_name_start_idx = SCHEMA_FLEXIBLE_NAME_START_IDX
     else:
-        raise Err('section_splitlines', [
+        raise Err('section_first_line', [
             'FIRST LINE ERROR: After the Indentation-Per-Level Number we expected a LCONF_FORMAT_LCONF Pattern',
             '                  <{}>'.format(SECTION_FORMAT_PATTERN),
             '                  <{} >'.format(SCHEMA_STRICT_FORMAT_PATTERN),
@@ -229,46 +481,83 @@ def section_splitlines(section_text):
             '                  But Got: <{}>'.format(section_first_line_second_part),
             '',
             '<{}>'.format(first_line)
-        ])
-
+        ], ERR_SECTION_START_LINE)
 
     if first_line[section_name_start_idx] == LCONF_SPACE:
-        raise Err('section_splitlines', [
+        raise Err('section_first_line', [
             'FIRST LINE ERROR: LCONF-Section-Name MUST be preceded by only ONE Space.',
             '',
             '    <{}>'.format(first_line)
-        ])
-    section_indentation_number = int(section_indentation_number_char)
+        ], ERR_SECTION_START_LINE)
     section_name = first_line[section_name_start_idx:]
+    return int(section_indentation_number_char), section_format, section_name
+
+
+def section_splitlines(section_text):
+    """
+    #### lconf_section.section_splitlines
+
+    Split one LCONF-Section into lines.
+
+    `section_splitlines(section_text)`
+
+    **Parameters:**
+
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+
+    **Returns:** (tuple) section_lines, section_indentation_number, section_format, section_name
+
+        For `bytes` input the section_lines are `bytes`: only the LCONF-Section-Start-Line is decoded.
+
+    *Validates:*
+
+    * LCONF-Section-Start-Line (first line)
+    * LCONF-Section-End-Line (last line)
+    """
+
+    section_lines = section_text.splitlines()
+    if isinstance(section_text, str):
+        end_token = SECTION_END_TOKEN
+        first_line = section_lines[0]
+    else:
+        end_token = SECTION_END_TOKEN_BYTES
+        first_line = section_lines[0].decode('utf-8')
+    section_indentation_number, section_format, section_name = section_first_line(first_line)
 
     # Validate LCONF_SECTION_END (last line): no indent
-    if section_lines[-1] != SECTION_END_TOKEN:
+    if section_lines[-1] != end_token:
         raise Err('section_splitlines', [
             'LCONF-Section-Name: {}'.format(section_name),
             '  LCONF_SECTION_END LINE ERROR: EXPECTED: <{}>'.format(SECTION_END_TOKEN),
-            '      <{}>'.format(section_lines[-1])
-        ])
+            '      <{!s}>'.format(section_lines[-1] if isinstance(section_lines[-1], str) else
+                                 section_lines[-1].decode('utf-8', 'replace'))
+        ], ERR_SECTION_END_LINE)
 
-    return section_lines, int(section_indentation_number_char), section_format, section_name
+    return section_lines, section_indentation_number, section_format, section_name
 
 
-def prepare_section_lines(section_lines, section_indentation_number, section_format, section_name):
+def prepare_section_lines(section_lines, section_indentation_number, section_format, section_name,
+                          first_line_number=1):
     """
     #### lconf_section.prepare_section_lines
 
     Prevalidate a LCONF-Section raw string and returns it's Section-Lines skipping LCONF_BLANK_LINE and
     LCONF-Section-Comment-Line.
 
-    `prepare_section_lines(section_lines, section_indentation_number, section_format, section_name)`
+    `prepare_section_lines(section_lines, section_indentation_number, section_format, section_name,
+                          first_line_number=1)`
 
     **Parameters:**
 
-    * `section_lines`: (list) which contains exact one LCONF-Section's lines (inclusive Blank and Comment Lines)
+    * `section_lines`: (list) which contains exact one LCONF-Section's lines (inclusive Blank and Comment Lines):
+        all `str` or all UTF-8 `bytes`
     * `section_indentation_number`: (int) the LCONF-Indentation-Per-Level number
     * `section_format`: (string) the section format
     * `section_name`: (string) the section name
+    * `first_line_number`: (int) the line number of the LCONF-Section-Start-Line: e.g. its line number in the file
 
-    **Returns:** (list) prepared_lines without the LCONF-Section-Start-Line or raises an error
+    **Returns:** (list) prepared_lines `(line_indent, orig_line, line_number)` without the LCONF-Section-Start-Line or
+        raises an error
 
     *Validates:*
 
@@ -276,20 +565,23 @@ def prepare_section_lines(section_lines, section_indentation_number, section_for
     * Indentation increase jumps (increase more than one LCONF-Indentation-Per-Level)
     * Indentation is a multiple of LCONF-Indentation-Per-Level
     """
+    (space, list_identifier, table_identifier, table_value_separator, single_block_identifier, blocks_identifier,
+     comment_line_identifier, key_value_separator) = (
+        STR_LINE_TOKENS if isinstance(section_lines[0], str) else BYTES_LINE_TOKENS)
     prepared_lines = []
     prev_indent = 0
-    for orig_line in section_lines[1:]:
+    for line_number, orig_line in enumerate(islice(section_lines, 1, None), first_line_number + 1):
         # Skip complete Blank-Line (zero characters)
         if orig_line:
             # Check Trailing Space
-            if orig_line[-1] == LCONF_SPACE:
+            if orig_line[-1] == space:
                 raise SectionErr('prepare_section_lines', section_format, section_name, orig_line, [
                     'TRAILING SPACE ERROR',
-                ])
+                ], ERR_TRAILING_SPACE, line_number, len(orig_line))
             # Get Indentation
             line_indent = len(orig_line) - len(orig_line.lstrip())
             # Skip LCONF-Section-Comment-Line
-            if orig_line[line_indent] == LCONF_COMMENT_LINE_IDENTIFIER:
+            if orig_line[line_indent] == comment_line_identifier:
                 continue
             # No Indentation Increase Jump
             if line_indent > prev_indent + section_indentation_number:
@@ -300,7 +592,7 @@ def prepare_section_lines(section_lines, section_indentation_number, section_for
                     '    Maximum expected indent: <{}> !!'.format(prev_indent + section_indentation_number),
                     '    Indentation must be a multiple of section_indentation_number: <{}>'.format(
                         section_indentation_number),
-                ])
+                ], ERR_INDENTATION_JUMP, line_number, line_indent + 1)
             # less indentation must be a multiple of section_indentation_number
             elif line_indent != prev_indent:
                 if (line_indent % section_indentation_number) != 0:
@@ -310,25 +602,88 @@ def prepare_section_lines(section_lines, section_indentation_number, section_for
                         '  prev_indent: <{}> - current line_indent: <{}>'.format(prev_indent, line_indent),
                         '    Indentation must be a multiple of section_indentation_number: <{}>'.format(
                             section_indentation_number),
-                    ])
-            prepared_lines.append((line_indent, orig_line))
+                    ], ERR_INDENTATION_MULTIPLE, line_number, line_indent + 1)
+            prepared_lines.append((line_indent, orig_line, line_number))
             prev_indent = line_indent
     return prepared_lines
 
 
-def validate_one_section_fast(section_text):
+# The pure-Python implementations: the fallback if the compiled `PyLCONF._speedups` extension is not built (see
+#   `PyLCONF/cython/_speedups.pyx`). The compiled functions call them again to raise the same errors.
+py_section_splitlines = section_splitlines
+py_prepare_section_lines = prepare_section_lines
+try:
+    from PyLCONF._speedups import (
+        check_section_text,
+        prepare_section_lines,
+        section_splitlines,
+    )
+except ImportError:
+    check_section_text = None
+
+
+def section_line_table(section_text):
+    """
+    #### lconf_section.section_line_table
+
+    Scans one LCONF-Section into a `LineTable`: used by the validators and the parser.
+
+    `section_line_table(section_text)`
+
+    **Parameters:**
+
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+
+    **Returns:** (tuple) line_table, section_indentation_number, section_format, section_name
+
+        The `LineTable` holds `section_text` and the offsets of its lines: only the LCONF-Section-Start-Line and the
+        LCONF-Section-End-Line are sliced (and the first one decoded for `bytes` input).
+
+    *Validates:*
+
+    * LCONF-Section-Start-Line (first line)
+    * LCONF-Section-End-Line (last line)
+    """
+    line_table = LineTable(section_text)
+    first_line = line_table.line(0)
+    if isinstance(section_text, str):
+        end_token = SECTION_END_TOKEN
+    else:
+        end_token = SECTION_END_TOKEN_BYTES
+        first_line = first_line.decode('utf-8')
+    section_indentation_number, section_format, section_name = section_first_line(first_line)
+
+    # Validate LCONF_SECTION_END (last line): no indent
+    last_line = line_table.line(-1)
+    if last_line != end_token:
+        raise Err('section_line_table', [
+            'LCONF-Section-Name: {}'.format(section_name),
+            '  LCONF_SECTION_END LINE ERROR: EXPECTED: <{}>'.format(SECTION_END_TOKEN),
+            '      <{!s}>'.format(last_line if isinstance(last_line, str) else last_line.decode('utf-8', 'replace'))
+        ], ERR_SECTION_END_LINE)
+
+    return line_table, section_indentation_number, section_format, section_name
+
+
+def validate_one_section_fast(section_text, buffer=None, collect_all=False, first_line_number=1):
     """
     #### lconf_section.validate_one_section_fast
 
     Validate one LCONF-Section raw string: it must be already correctly extracted.
 
-    `validate_one_section_fast(section_text)`
+    `validate_one_section_fast(section_text, buffer=None, collect_all=False, first_line_number=1)`
 
     **Parameters:**
 
-    * `section_text`: (raw str) which contains exact one LCONF-Section
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+    * `buffer`: (bytes, bytearray, mmap or memoryview) optional: if given `section_text` must be a section span
+        `(start, end, section_name, section_format)` into it: see `extract_sections(source, as_spans=True)`.
+        This LCONF-Section is validated without decoding it.
+    * `collect_all`: (bool) if True the errors are returned instead of raised: see the module Overview
+    * `first_line_number`: (int) the line number of the LCONF-Section-Start-Line used in the errors: e.g. its line
+        number in the file
 
-    **Returns:** (bool) True if success else raises an error
+    **Returns:** (bool) True if success else raises an error: with `collect_all` (list) all errors: empty if success
 
     *Limitations:*
 
@@ -345,353 +700,181 @@ def validate_one_section_fast(section_text):
     * Validates Identifiers
     * Table rows same number of columns
 
+    All lines are validated in one pass by `line_engine.iter_section_lines`. With the compiled `PyLCONF._speedups`
+    extension a valid LCONF-Section is checked by `_speedups.check_section_text` (without splitting it into lines):
+    only a not valid one is validated again by `iter_section_lines` to get its errors.
     """
-    section_lines, section_indentation_number, section_format, section_name = section_splitlines(section_text)
-    prepared_lines = prepare_section_lines(section_lines, section_indentation_number, section_format, section_name)
+    if buffer is not None:
+        section_text = section_bytes_from_span(buffer, section_text)
+    if profiling.active_profile is not None:
+        return _validate_section_profiled(section_text, 'validate_one_section_fast', collect_all, first_line_number)
+    if check_section_text is not None and check_section_text(section_text):
+        return True if not collect_all else []
+    errors = [] if collect_all else None
+    try:
+        line_table, section_indentation_number, section_format, section_name = section_line_table(section_text)
+    except Err as err:
+        if errors is None:
+            raise
+        return [err]
+    for _ in iter_section_lines(line_table, section_indentation_number, section_format, section_name,
+                                'validate_one_section_fast', errors, first_line_number):
+        pass
+    return True if errors is None else errors
+
+
+def parse_section(section_text, buffer=None):
+    """
+    #### lconf_section.parse_section
 
-    # ------------------------------------------------------------------
-    is_single_block = 'is_single_block'
-    is_general_list = 'is_general_list'
-    is_table = 'is_table'
-    is_repeated_block = 'is_repeated_block'
-    # is_repeated_block_type: NAMED or UNNAMED or EMPTY
-    is_repeated_block_type = 'NONE'
+    Parses one LCONF-Section raw string: it must be already correctly extracted.
 
-    is_root = 'is_root'
+    The LCONF-Section is validated like `validate_one_section_fast` in the same pass over its lines.
 
-    # Number of LCONF_VERTICAL_LINE in table rows: will be based on the first row
-    table_rows_expected_pipes = -1
+    `parse_section(section_text, buffer=None)`
 
-    prev_indent = 0
-    check_indent = 0
-    stack = ['STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK']
-    len_stack = 10
-    cur_stack_idx = -1
-    stack_situation = is_root
-    next_idx = 0
-
-    len_prepared_lines = len(prepared_lines)
-
-    for cur_indent, orig_line in prepared_lines:
-        next_idx += 1
-        if next_idx < len_prepared_lines:
-            # indentation_next_possible_level = cur_indent + section_indentation_number
-            # CHECK NESTED STACK
-            if cur_stack_idx >= 0:
-                # Current Indent same or less than: check_indent
-                if cur_indent <= check_indent:
-                    check_idx = int(cur_indent / section_indentation_number)
-                    if check_idx == 0:
-                        stack = ['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                 'STACK', 'STACK', 'STACK', 'STACK', 'STACK']
-                        len_stack = 10
-                        cur_stack_idx = -1
-                        stack_situation = is_root
-                        check_indent = 0
-                    else:
-                        cur_stack_idx = check_idx - 1
-                        stack_situation = stack[cur_stack_idx]
+    **Parameters:**
+
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+    * `buffer`: (bytes, bytearray, mmap or memoryview) optional: if given `section_text` must be a section span
+        `(start, end, section_name, section_format)` into it: see `extract_sections(source, as_spans=True)`.
+
+    **Returns:** (LconfSection) the parsed LCONF-Section else raises an error
+
+    *Limitations:*
+
+    All LCONF-Values are returned as `str`: no LCONF-Schema is used.
+    It does also not validate unique LCONF-Key-Names: a lookup by key returns the first item.
+    """
+    if buffer is not None:
+        section_text = section_bytes_from_span(buffer, section_text)
+    line_table, section_indentation_number, section_format, section_name = section_line_table(section_text)
+    section_obj = LconfSection(section_name, section_format, section_indentation_number)
+    parse_section_lines(section_obj, line_table, section_indentation_number, section_format, section_name,
+                        'parse_section')
+    return section_obj
+
+
+def parse_section_lines(root_obj, line_table, section_indentation_number, section_format, section_name,
+                        error_origin, section_lines=None, first_line_number=1):
+    """
+    #### lconf_section.parse_section_lines
+
+    Parses LCONF-Section lines into a root STRUCTURE_SINGLE_BLOCK: used by `parse_section`, `LazySection` and
+    `lconf_schema.parse_section_typed`.
+
+    `parse_section_lines(root_obj, line_table, section_indentation_number, section_format, section_name,
+        error_origin, section_lines=None, first_line_number=1)`
+
+    **Parameters:**
+
+    * `root_obj`: (StructureSingleBlock) gets the top-level items
+    * `line_table`: (LineTable) LCONF-Section lines inclusive a first (LCONF-Section-Start-Line) and a last line which
+        are skipped: its text is `str` or UTF-8 `bytes`
+    * `section_indentation_number`: (int) the LCONF-Indentation-Per-Level number
+    * `section_format`: (string) the section format
+    * `section_name`: (string) the section name
+    * `error_origin`: (str) used for raised errors: the name of the calling function
+    * `section_lines`: (iterator) optional: the lines of `line_engine.iter_section_lines` for the `line_table`: e.g.
+        `LconfSchema.iter_validated_lines`. Default: `iter_section_lines` of the `line_table`
+    * `first_line_number`: (int) the line number of the first line in the LCONF-File: used for errors. Ignored with
+        `section_lines`
+
+    **Returns:** (StructureSingleBlock) the `root_obj` else raises an error
+
+    The LCONF-Key-Names and LCONF-Values are sliced from the text of the `line_table`: no line objects.
+    """
+    text = line_table.text
+    if isinstance(text, str):
+        to_str = str.__str__
+        to_row = tuple
+        table_split_separator = STRUCTURE_TABLE_VALUE_SEPARATOR
+        list_split_separator = STRUCTURE_LIST_VALUE_SEPARATOR
+    else:
+        to_str = bytes.decode
+        to_row = _decoded_row
+        table_split_separator = STRUCTURE_TABLE_VALUE_SEPARATOR.encode('utf-8')
+        list_split_separator = STRUCTURE_LIST_VALUE_SEPARATOR.encode('utf-8')
+
+    # ------------------------------------------------------------------
+    # One item per open nesting level: the object which gets the lines of that level
+    stack_objs = [root_obj]
+    parent_obj = root_obj
+    # -1: the stack must be checked for the next line
+    prev_level = 0
+
+    if section_lines is None:
+        section_lines = iter_section_lines(line_table, section_indentation_number, section_format, section_name,
+                                           error_origin, None, first_line_number)
+    for line_kind, cur_level, _, content_start, line_end, key_value_separator_idx, _ in section_lines:
+        if cur_level != prev_level:
+            prev_level = cur_level
+            del stack_objs[cur_level + 1:]
+            parent_obj = stack_objs[cur_level]
+
+        # `STRUCTURE_PAIR`
+        if line_kind == LINE_PAIR:
+            parent_obj.append_item(to_str(text[content_start:key_value_separator_idx - 1]),
+                                   to_str(text[key_value_separator_idx + 3:line_end]))
+        # STRUCTURE_LIST item
+        elif line_kind == LINE_LIST_VALUE:
+            parent_obj.append(to_str(text[content_start:line_end]))
+        # STRUCTURE_TABLE row: a row with only one STRUCTURE_TABLE_VALUE_SEPARATOR has no cells
+        elif line_kind == LINE_TABLE_ROW:
+            if line_end == content_start + 1:
+                parent_obj.rows.append(())
             else:
-                # Reset
-                cur_indent = 0
-                check_indent = cur_indent
-                cur_stack_idx = -1
-
-            # PROCESS ALL
-            orig_stack_situation = stack_situation
-
-            # ====  ==== ==== continue orig_stack_situation ====  ==== ====   #
-            # STRUCTURE_LIST (General-List): Associates a LCONF-Key-Name with an ordered sequence (list) of data values
-            if orig_stack_situation == is_general_list:
-                # MUST NOTt contain value items:
-                #   STRUCTURE_LIST_IDENTIFIER
-                #   STRUCTURE_TABLE_IDENTIFIER
-                #   STRUCTURE_SINGLE_BLOCK_IDENTIFIER
-                #   STRUCTURE_BLOCKS_IDENTIFIER
-                #   LCONF_KEY_VALUE_SEPARATOR
-                if (orig_line[cur_indent] == STRUCTURE_LIST_IDENTIFIER or
-                    orig_line[cur_indent] == STRUCTURE_TABLE_IDENTIFIER or
-                    orig_line[cur_indent] == STRUCTURE_SINGLE_BLOCK_IDENTIFIER or
-                    orig_line[cur_indent] == STRUCTURE_BLOCKS_IDENTIFIER or
-                    LCONF_KEY_VALUE_SEPARATOR in orig_line
-                    ):
-                    raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                        'STRUCTURE_LIST ERROR: wrong item',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        `Lists` may only contain LCONF-Values',
-                    ])
-
-            # STRUCTURE_TABLE: Associates a LCONF-Key-Name with ordered tabular-data (columns and rows).
-            elif orig_stack_situation == is_table:
-                # MUST NOTt contain value items:
-                #   STRUCTURE_LIST_IDENTIFIER
-                #   STRUCTURE_SINGLE_BLOCK_IDENTIFIER
-                #   STRUCTURE_BLOCKS_IDENTIFIER
-                #   LCONF_KEY_VALUE_SEPARATOR
-                #
-                #   NOTE: STRUCTURE_TABLE_IDENTIFIER and STRUCTURE_TABLE_VALUE_SEPARATOR are the same.
-                #   First and last must be a STRUCTURE_TABLE_VALUE_SEPARATOR - No need to check other identifiers
-                if (orig_line[cur_indent] != STRUCTURE_TABLE_VALUE_SEPARATOR or
-                    orig_line[-1] != STRUCTURE_TABLE_VALUE_SEPARATOR or
-                    LCONF_KEY_VALUE_SEPARATOR in orig_line
-                    ):
-                    raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                        'STRUCTURE_TABLE ERROR: wrong item',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        `Table Rows` MUST start and end with STRUCTURE_TABLE_VALUE_SEPARATORs" <{}>'.format(
-                            STRUCTURE_TABLE_VALUE_SEPARATOR),
-                        '    STRUCTURE_TABLE Row lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                    ])
-
-                # Item Lines (table rows) must contain all the same:
-                #    Number of STRUCTURE_TABLE_VALUE_SEPARATOR in table rows: will be based on the first row
-                #   table_rows_expected_pipes
-                elif orig_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR) != table_rows_expected_pipes:
-                    raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                        'STRUCTURE_TABLE ERROR: wrong columns number.',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        Number of expected `STRUCTURE_TABLE_VALUE_SEPARATOR`: <{}>.'.format(
-                            table_rows_expected_pipes),
-                        '        Counted `Vertical-Line`: <{}>'.format(
-                            orig_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR)),
-                    ])
-
-            # STRUCTURE_NAMED_BLOCKS: A collection of repeated named STRUCTURE_SINGLE_BLOCKs.
-            # STRUCTURE_UNNAMED_BLOCKS: A collection of repeated unnamed STRUCTURE_SINGLE_BLOCKs.
-            elif orig_stack_situation == is_repeated_block:
-                # Repeated-Block may only contain single indented values: named or unnamed STRUCTURE_SINGLE_BLOCKs
-                if (LCONF_KEY_VALUE_SEPARATOR in orig_line or
-                    orig_line[cur_indent] != STRUCTURE_SINGLE_BLOCK_IDENTIFIER
-                    ):
-                    raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                        'STRUCTURE_BLOCKS ERROR: wrong item type.',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        `STRUCTURE_BLOCKS` MUST contain `STRUCTURE_SINGLE_BLOCKs`.',
-                    ])
-                # Check STRUCTURE_NAMED_BLOCKS Identifier has a Name.
-                if is_repeated_block_type == 'NAMED':
-                    if len(orig_line) <= cur_indent + 1:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_NAMED_BLOCKS ERROR: IDENTIFIER line.',
-                            '',
-                            '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                            '       `STRUCTURE_NAMED_BLOCKS` item line MUST have a name.',
-                        ])
-                    elif orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_NAMED_BLOCKS ERROR: IDENTIFIER line.',
-                            '',
-                            '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                            '    There MUST be ONE SPACE after the STRUCTURE_SINGLE_BLOCK_IDENTIFIER <{}>.'.format(
-                                STRUCTURE_SINGLE_BLOCK_IDENTIFIER),
-                        ])
-                elif is_repeated_block_type == 'UNNAMED':
-                    if len(orig_line) > cur_indent + 1:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_UNNAMED_BLOCKS ERROR: IDENTIFIER line.',
-                            '',
-                            '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                            '       `STRUCTURE_UNNAMED_BLOCKS` item line MUST NOT have a name.',
-                        ])
-                else:
-                    raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                        'STRUCTURE_BLOCKS ERROR: WRONG Blocks type.',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '       `STRUCTURE_BLOCKS` Expected a: NAMED or UNNAMED is_repeated_block_type.',
-                        '       Got: <{}>'.format(is_repeated_block_type),
-                    ])
-
-                # Check STRUCTURE_BLOCKS: Item Empty STRUCTURE_SINGLE_BLOCK
-                next_line_indent, next_line = prepared_lines[next_idx]
-                if next_line_indent == cur_indent + section_indentation_number:
-                    stack_situation = is_single_block
-                    check_indent = cur_indent
-                    cur_stack_idx += 1
-                    stack[cur_stack_idx] = stack_situation
-                    if cur_stack_idx > len_stack - 3:
-                        stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                      'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                        len_stack += 10
-                # STRUCTURE_BLOCKS: EMPTY BLK-Item (STRUCTURE_SINGLE_BLOCK):  No need to adjust the stack for this
-                else:
-                    # strictly speaking this is not needed
-                    is_repeated_block_type == 'EMPTY'
-
-
-            # STRUCTURE_SINGLE_BLOCK: no need to do anything here: orig_stack_situation == is_single_block
-
-            # Root: check any new situation: no need to do anything here: orig_stack_situation == is_root
-
-            # ====  ==== ==== check new orig_stack_situation ====  ==== ====   #
+                parent_obj.rows.append(to_row(text[content_start + 1:line_end - 1].split(table_split_separator)))
+        # Compact_STRUCTURE_LIST
+        elif line_kind == LINE_COMPACT_LIST:
+            key = to_str(text[content_start + 2:key_value_separator_idx - 1])
+            parent_obj.append_item(key, StructureList(key, map(
+                to_str, text[key_value_separator_idx + 3:line_end].split(list_split_separator))))
+        # STRUCTURE_NAMED_BLOCKS / STRUCTURE_UNNAMED_BLOCKS item
+        elif line_kind >= LINE_NAMED_BLOCK:
+            if line_kind == LINE_NAMED_BLOCK:
+                block_obj = StructureSingleBlock(to_str(text[content_start + 2:line_end]))
+                parent_obj.is_named = True
             else:
-                # STRUCTURE_LIST_IDENTIFIER
-                if orig_line[cur_indent] == STRUCTURE_LIST_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_LIST_IDENTIFIER ERROR.',
-                            '',
-                            '    There MUST be ONE SPACE before the List LCONF-Key-Name.',
-                        ])
-
-                    # Compact_STRUCTURE_LIST
-                    if LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        # Validate: LCONF_KEY_VALUE_SEPARATOR
-                        if ' :: ' not in orig_line or '  ::' in orig_line or '::  ' in orig_line:
-                            raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                                'Compact_STRUCTURE_LIST: KEY-VALUE-SEPARATOR ERROR: expected < :: >',
-                            ])
-                    # General STRUCTURE_LIST
-                    else:
-                        # Check STRUCTURE_LIST: Item Empty STRUCTURE_LIST
-                        next_line_indent, next_line = prepared_lines[next_idx]
-                        if next_line_indent == cur_indent + section_indentation_number:
-                            stack_situation = is_general_list
-                            check_indent = cur_indent
-                            cur_stack_idx += 1
-                            stack[cur_stack_idx] = stack_situation
-                            if cur_stack_idx > len_stack - 3:
-                                stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                              'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                                len_stack += 10
-                        # else: STRUCTURE_LIST: EMPTY:  No need to adjust the stack for this
-
-                # STRUCTURE_TABLE_IDENTIFIER
-                elif orig_line[cur_indent] == STRUCTURE_TABLE_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_TABLE_IDENTIFIER ERROR.',
-                            '',
-                            '    There MUST be ONE SPACE before the Table LCONF-Key-Name.',
-                        ])
-                    elif orig_line[-1] == STRUCTURE_TABLE_VALUE_SEPARATOR:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_TABLE_IDENTIFIER line MUST NOT end with a STRUCTURE_TABLE_VALUE_SEPARATOR.',
-                        ])
-                    elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_TABLE_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                        ])
-
-                    # Check STRUCTURE_TABLE: Empty (no Row lines)
-                    next_line_indent, next_line = prepared_lines[next_idx]
-                    if next_line_indent == cur_indent + section_indentation_number:
-                        stack_situation = is_table
-                        check_indent = cur_indent
-                        cur_stack_idx += 1
-                        stack[cur_stack_idx] = stack_situation
-                        if cur_stack_idx > len_stack - 3:
-                            stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                          'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                            len_stack += 10
-
-                        # Item Lines (table rows) must contain all the same:
-                        #    Number of STRUCTURE_TABLE_VALUE_SEPARATOR in table rows: will be based on the first row
-                        #    At least 2
-                        table_rows_expected_pipes = next_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR)
-                        if table_rows_expected_pipes < 2:
-                            raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                                'STRUCTURE_TABLE ITEM Line (Row).',
-                                '    Number of expected `STRUCTURE_TABLE_VALUE_SEPARATOR` must be at least 2.',
-                                '    Counted `Vertical-Line`: <{}>'.format(
-                                    orig_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR)),
-                                '',
-                                'next_line: <{}>'.format(next_line),
-                                '',
-                                'orig_line: <{}>'.format(orig_line)
-                            ])
-                    # else: STRUCTURE_TABLE: EMPTY:  No need to adjust the stack for this
-
-                # `STRUCTURE_SINGLE_BLOCK_IDENTIFIER`: These can only be Named STRUCTURE_SINGLE_BLOCKs
-                elif orig_line[cur_indent] == STRUCTURE_SINGLE_BLOCK_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'There MUST be ONE SPACE before the SINGLE_BLOCK name.',
-                        ])
-                    elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_SINGLE_BLOCK_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                        ])
-
-                    # Check STRUCTURE_SINGLE_BLOCK: Empty
-                    next_line_indent, next_line = prepared_lines[next_idx]
-                    if next_line_indent == cur_indent + section_indentation_number:
-                        stack_situation = is_single_block
-                        check_indent = cur_indent
-                        cur_stack_idx += 1
-                        stack[cur_stack_idx] = stack_situation
-                        if cur_stack_idx > len_stack - 3:
-                            stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                          'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                            len_stack += 10
-                    # else: STRUCTURE_SINGLE_BLOCK: EMPTY:  No need to adjust the stack for this
-
-                # `STRUCTURE_BLOCKS_IDENTIFIER`
-                elif orig_line[cur_indent] == STRUCTURE_BLOCKS_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'There MUST be ONE SPACE before the STRUCTURE_BLOCKS_IDENTIFIER name.',
-                        ])
-                    elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'STRUCTURE_BLOCKS_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                        ])
-
-
-                    # Check STRUCTURE_BLOCKS: Empty
-                    next_line_indent, next_line = prepared_lines[next_idx]
-                    if next_line_indent == cur_indent + section_indentation_number:
-                        stack_situation = is_repeated_block
-                        check_indent = cur_indent
-                        cur_stack_idx += 1
-                        stack[cur_stack_idx] = stack_situation
-                        if cur_stack_idx > len_stack - 3:
-                            stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                          'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                            len_stack += 10
-
-                        if len(next_line) == next_line_indent + 1:
-                            is_repeated_block_type = 'UNNAMED'
-                        else:
-                            is_repeated_block_type = 'NAMED'
-                    # else: LCONF-Single-Block: EMPTY:  No need to adjust the stack for this
-
-                # `STRUCTURE_PAIR:  we checked already for: Compact_STRUCTURE_LIST
-                elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                    # Validate: LCONF_KEY_VALUE_SEPARATOR
-                    if ('  ::' in orig_line or '::  ' in orig_line or
-                        (' :: ' not in orig_line and orig_line[-3:] != ' ::')
-                        ):
-                        raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                            'LCONF_KEY_VALUE_SEPARATOR < :: > ERROR:',
-                        ])
-                # WRONG
-                else:
-                    raise SectionErr('validate_one_section_fast', section_format, section_name, orig_line, [
-                        'SOMETHING Wrong with this line: maybe indentation, wrong type ..',
-                    ])
-            prev_indent = cur_indent
-    return True
-
-
-def validate_one_section_complet(section_text, lconf_schema_obj):
+                block_obj = StructureSingleBlock(None)
+            parent_obj.append(block_obj)
+            stack_objs.append(block_obj)
+            prev_level = -1
+        # Identifier lines: a new structure
+        else:
+            key = to_str(text[content_start + 2:line_end])
+            structure_obj = STRUCTURE_CLASSES[line_kind](key)
+            parent_obj.append_item(key, structure_obj)
+            stack_objs.append(structure_obj)
+            prev_level = -1
+    return root_obj
+
+
+def _decoded_row(row_cells):
+    """ Helper for `parse_section`: returns the UTF-8 `bytes` cells of a STRUCTURE_TABLE row as a tuple of `str`.
+    """
+    return tuple([cell.decode() for cell in row_cells])
+
+
+def validate_one_section_complet(section_text, lconf_schema_obj, buffer=None, collect_all=False, first_line_number=1):
     """
     #### lconf_section.validate_one_section_complet
 
     Validate one LCONF-Section raw string completly: it must be already correctly extracted.
 
-    `validate_one_section_complet(section_text)`
+    `validate_one_section_complet(section_text, lconf_schema_obj, buffer=None, collect_all=False, first_line_number=1)`
 
     **Parameters:**
 
-    * `section_text`: (raw str) which contains exact one LCONF-Section
-    * `lconf_schema_obj`: (obj) LCONF-Schema object.
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section
+    * `lconf_schema_obj`: (LconfSchema) compiled LCONF-Schema: see `lconf_schema.compile_schema`
+    * `buffer`: (bytes, bytearray, mmap or memoryview) optional: if given `section_text` must be a section span
+        `(start, end, section_name, section_format)` into it: see `extract_sections(source, as_spans=True)`.
+    * `collect_all`: (bool) if True the errors are returned instead of raised: see the module Overview. The lines of a
+        structure with a LCONF-Schema error are only validated like `validate_one_section_fast`.
+    * `first_line_number`: (int) the line number of the LCONF-Section-Start-Line used in the errors
 
-    **Returns:** (bool) True if success else raises an error
+    **Returns:** (bool) True if success else raises an error: with `collect_all` (list) all errors: empty if success
 
     *Validates:*
 
@@ -704,45 +887,53 @@ def validate_one_section_complet(section_text, lconf_schema_obj):
 
     * Additional Validation
 
-        * Checks for wrong multiple LCONF-List-Value-Separator in one line
+        * Checks for wrong multiple LCONF_KEY_VALUE_SEPARATOR in one line
         * Validates correct LCONF-Key-Names, LCONF-Item-Requirement-Option and LCONF-Value-Types with a corresponding
             LCONF-Schema object.
         * Table rows same number of columns as defined in the LCONF-Schema object.
 
+    All lines are validated in one pass by `line_engine.iter_section_lines`: the compiled LCONF-Schema is not changed
+    and can be shared between threads.
     """
-    print("\n\nvalidate_one_section_complet NOT YET IMPLEMENTED\n\n")
-
-                        # # Check for wrong double LCONF_KEY_VALUE_SEPARATOR
-                        # if orig_line.count(LCONF_KEY_VALUE_SEPARATOR) > 1:
-                        #     raise Err('validate_one_section_fast', [
-                        #        'SectionName: {}'.format(section_name),
-                        #        'Compact_STRUCTURE_LIST: more than one KEY-VALUE-SEPARATOR ERROR',
-                        #        '  <{}>'.format(orig_line)
-                        #     ])
-                        # # No need to adjust the stack for Compact_STRUCTURE_LIST
-
-    #                 # Check for wrong double LCONF_KEY_VALUE_SEPARATOR
-    #                 if orig_line.count(LCONF_KEY_VALUE_SEPARATOR) > 1:
-    #                     raise Err('validate_one_section_fast', [
-    #                        'SectionName: {}'.format(section_name),
-    #                        'LCONF-Key-Value-Pair: more than one KEY-VALUE-SEPARATOR ERROR',
-    #                        '  <{}>'.format(orig_line)
-    #                     ])
-
-
-def validate_one_section_schema(section_text):
+    if buffer is not None:
+        section_text = section_bytes_from_span(buffer, section_text)
+    errors = [] if collect_all else None
+    try:
+        line_table, section_indentation_number, section_format, section_name = section_line_table(section_text)
+        if section_format != LCONF_FORMAT_LCONF:
+            raise Err('validate_one_section_complet', [
+                'SECTION FORMAT ERROR: expected a LCONF-Section format <{}>. Got: <{}>'.format(
+                    LCONF_FORMAT_LCONF, section_format),
+                '',
+                '    LCONF-Section-Name: <{}>'.format(section_name),
+            ], ERR_SECTION_FORMAT)
+    except Err as err:
+        if errors is None:
+            raise
+        return [err]
+    lconf_schema_obj.validate_section_lines(line_table, section_indentation_number, section_format, section_name,
+                                            'validate_one_section_complet', errors, first_line_number)
+    return True if errors is None else errors
+
+
+def validate_one_section_schema(section_text, buffer=None, collect_all=False, first_line_number=1):
     """
     #### lconf_section.validate_one_section_schema
 
     Validate one LCONF-Section-Schema raw string: it must be already correctly extracted.
 
-    `validate_one_section_schema(section_text)`
+    `validate_one_section_schema(section_text, buffer=None, collect_all=False, first_line_number=1)`
 
     **Parameters:**
 
-    * `section_text`: (raw str) which contains exact one LCONF-Section-Schema
+    * `section_text`: (raw str or UTF-8 bytes) which contains exact one LCONF-Section-Schema
+    * `buffer`: (bytes, bytearray, mmap or memoryview) optional: if given `section_text` must be a section span
+        `(start, end, section_name, section_format)` into it: see `extract_sections(source, as_spans=True)`.
+        This LCONF-Section is validated without decoding it.
+    * `collect_all`: (bool) if True the errors are returned instead of raised: see the module Overview
+    * `first_line_number`: (int) the line number of the LCONF-Section-Start-Line used in the errors
 
-    **Returns:** (bool) True if success else raises an error
+    **Returns:** (bool) True if success else raises an error: with `collect_all` (list) all errors: empty if success
 
     *Limitations:*
 
@@ -759,341 +950,217 @@ def validate_one_section_schema(section_text):
     * Table rows same number of columns
 
     """
-    section_lines, section_indentation_number, section_format, section_name = section_splitlines(section_text)
+    if buffer is not None:
+        section_text = section_bytes_from_span(buffer, section_text)
+    if profiling.active_profile is not None:
+        return _validate_section_profiled(section_text, 'validate_one_section_schema', collect_all, first_line_number)
+    errors = [] if collect_all else None
+    try:
+        line_table, section_indentation_number, section_format, section_name = section_line_table(section_text)
+        _check_schema_format(section_format, section_name)
+    except Err as err:
+        if errors is None:
+            raise
+        return [err]
+    for _ in iter_section_lines(line_table, section_indentation_number, section_format, section_name,
+                                'validate_one_section_schema', errors, first_line_number):
+        pass
+    return True if errors is None else errors
+
+
+def _check_schema_format(section_format, section_name):
+    """ Helper for `validate_one_section_schema`: raises an error for a LCONF-Section which is not a
+    LCONF-Schema-Section.
+    """
+    if section_format == LCONF_FORMAT_LCONF:
+        raise Err('validate_one_section_schema', [
+            'SECTION FORMAT ERROR: expected a LCONF-Schema-Section format <{}> or <{}>. Got: <{}>'.format(
+                LCONF_FORMAT_SCHEMA_STRICT, LCONF_FORMAT_SCHEMA_FLEXIBLE, section_format),
+            '',
+            '    LCONF-Section-Name: <{}>'.format(section_name),
+        ], ERR_SECTION_FORMAT)
 
-    if section_format ==
-    prepared_lines = prepare_section_lines(section_lines, section_indentation_number, section_format, section_name)
 
-    # ------------------------------------------------------------------
-    is_single_block = 'is_single_block'
-    is_general_list = 'is_general_list'
-    is_table = 'is_table'
-    is_repeated_block = 'is_repeated_block'
-    # is_repeated_block_type: NAMED or UNNAMED or EMPTY
-    is_repeated_block_type = 'NONE'
+def _validate_section_profiled(section_text, error_origin, collect_all, first_line_number):
+    """ Helper for the validators: validates one LCONF-Section like `error_origin` and records each phase to the
+    `profiling.active_profile`: see `profiling`.
+    """
+    section_profile = profiling.active_profile.start_section(len(section_text))
+    seconds = section_profile.seconds
+    errors = [] if collect_all else None
+    if check_section_text is not None and error_origin == 'validate_one_section_fast':
+        start_time = perf_counter()
+        check_section_text(section_text)
+        seconds[profiling.PHASE_CHECK] = perf_counter() - start_time
+
+    start_time = perf_counter()
+    try:
+        line_table, section_indentation_number, section_format, section_name = section_line_table(section_text)
+        section_profile.section = section_name
+        section_profile.lines = len(line_table)
+        if error_origin == 'validate_one_section_schema':
+            _check_schema_format(section_format, section_name)
+    except Err as err:
+        if errors is None:
+            raise
+        return [err]
+    finally:
+        seconds[profiling.PHASE_LINE_TABLE] = perf_counter() - start_time
+
+    line_kinds = section_profile.line_kinds
+    max_level = 0
+    start_time = perf_counter()
+    try:
+        for line_kind, cur_level, _, _, _, _, _ in iter_section_lines(
+                line_table, section_indentation_number, section_format, section_name, error_origin, errors,
+                first_line_number):
+            line_kinds[line_kind] += 1
+            if cur_level > max_level:
+                max_level = cur_level
+    finally:
+        seconds[profiling.PHASE_VALIDATE] = perf_counter() - start_time
+        section_profile.max_depth = max_level
+    return True if errors is None else errors
 
-    is_root = 'is_root'
 
-    # Number of LCONF_VERTICAL_LINE in table rows: will be based on the first row
-    table_rows_expected_pipes = -1
+# =====================================================================================================================
+def validate_sections_from_file(path_to_lconf_file, collect_all=False):
+    """
+    #### lconf_section.validate_sections_from_file
 
-    prev_indent = 0
-    check_indent = 0
-    stack = ['STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK']
-    len_stack = 10
-    cur_stack_idx = -1
-    stack_situation = is_root
-    next_idx = 0
-
-    len_prepared_lines = len(prepared_lines)
-
-    for cur_indent, orig_line in prepared_lines:
-        next_idx += 1
-        if next_idx < len_prepared_lines:
-            # indentation_next_possible_level = cur_indent + section_indentation_number
-            # CHECK NESTED STACK
-            if cur_stack_idx >= 0:
-                # Current Indent same or less than: check_indent
-                if cur_indent <= check_indent:
-                    check_idx = int(cur_indent / section_indentation_number)
-                    if check_idx == 0:
-                        stack = ['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                 'STACK', 'STACK', 'STACK', 'STACK', 'STACK']
-                        len_stack = 10
-                        cur_stack_idx = -1
-                        stack_situation = is_root
-                        check_indent = 0
-                    else:
-                        cur_stack_idx = check_idx - 1
-                        stack_situation = stack[cur_stack_idx]
-            else:
-                # Reset
-                cur_indent = 0
-                check_indent = cur_indent
-                cur_stack_idx = -1
-
-            # PROCESS ALL
-            orig_stack_situation = stack_situation
-
-            # ====  ==== ==== continue orig_stack_situation ====  ==== ====   #
-            # STRUCTURE_LIST (General-List): Associates a LCONF-Key-Name with an ordered sequence (list) of data values
-            if orig_stack_situation == is_general_list:
-                # MUST NOTt contain value items:
-                #   STRUCTURE_LIST_IDENTIFIER
-                #   STRUCTURE_TABLE_IDENTIFIER
-                #   STRUCTURE_SINGLE_BLOCK_IDENTIFIER
-                #   STRUCTURE_BLOCKS_IDENTIFIER
-                #   LCONF_KEY_VALUE_SEPARATOR
-                if (orig_line[cur_indent] == STRUCTURE_LIST_IDENTIFIER or
-                    orig_line[cur_indent] == STRUCTURE_TABLE_IDENTIFIER or
-                    orig_line[cur_indent] == STRUCTURE_SINGLE_BLOCK_IDENTIFIER or
-                    orig_line[cur_indent] == STRUCTURE_BLOCKS_IDENTIFIER or
-                    LCONF_KEY_VALUE_SEPARATOR in orig_line
-                    ):
-                    raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                        'STRUCTURE_LIST ERROR: wrong item',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        `Lists` may only contain LCONF-Values',
-                    ])
-
-            # STRUCTURE_TABLE: Associates a LCONF-Key-Name with ordered tabular-data (columns and rows).
-            elif orig_stack_situation == is_table:
-                # MUST NOTt contain value items:
-                #   STRUCTURE_LIST_IDENTIFIER
-                #   STRUCTURE_SINGLE_BLOCK_IDENTIFIER
-                #   STRUCTURE_BLOCKS_IDENTIFIER
-                #   LCONF_KEY_VALUE_SEPARATOR
-                #
-                #   NOTE: STRUCTURE_TABLE_IDENTIFIER and STRUCTURE_TABLE_VALUE_SEPARATOR are the same.
-                #   First and last must be a STRUCTURE_TABLE_VALUE_SEPARATOR - No need to check other identifiers
-                if (orig_line[cur_indent] != STRUCTURE_TABLE_VALUE_SEPARATOR or
-                    orig_line[-1] != STRUCTURE_TABLE_VALUE_SEPARATOR or
-                    LCONF_KEY_VALUE_SEPARATOR in orig_line
-                    ):
-                    raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                        'STRUCTURE_TABLE ERROR: wrong item',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        `Table Rows` MUST start and end with STRUCTURE_TABLE_VALUE_SEPARATORs" <{}>'.format(
-                            STRUCTURE_TABLE_VALUE_SEPARATOR),
-                        '    STRUCTURE_TABLE Row lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                    ])
-
-                # Item Lines (table rows) must contain all the same:
-                #    Number of STRUCTURE_TABLE_VALUE_SEPARATOR in table rows: will be based on the first row
-                #   table_rows_expected_pipes
-                elif orig_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR) != table_rows_expected_pipes:
-                    raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                        'STRUCTURE_TABLE ERROR: wrong columns number.',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        Number of expected `STRUCTURE_TABLE_VALUE_SEPARATOR`: <{}>.'.format(
-                            table_rows_expected_pipes),
-                        '        Counted `Vertical-Line`: <{}>'.format(
-                            orig_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR)),
-                    ])
-
-            # STRUCTURE_NAMED_BLOCKS: A collection of repeated named STRUCTURE_SINGLE_BLOCKs.
-            # STRUCTURE_UNNAMED_BLOCKS: A collection of repeated unnamed STRUCTURE_SINGLE_BLOCKs.
-            elif orig_stack_situation == is_repeated_block:
-                # Repeated-Block may only contain single indented values: named or unnamed STRUCTURE_SINGLE_BLOCKs
-                if (LCONF_KEY_VALUE_SEPARATOR in orig_line or
-                    orig_line[cur_indent] != STRUCTURE_SINGLE_BLOCK_IDENTIFIER
-                    ):
-                    raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                        'STRUCTURE_BLOCKS ERROR: wrong item type.',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '        `STRUCTURE_BLOCKS` MUST contain `STRUCTURE_SINGLE_BLOCKs`.',
-                    ])
-                # Check STRUCTURE_NAMED_BLOCKS Identifier has a Name.
-                if is_repeated_block_type == 'NAMED':
-                    if len(orig_line) <= cur_indent + 1:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_NAMED_BLOCKS ERROR: IDENTIFIER line.',
-                            '',
-                            '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                            '       `STRUCTURE_NAMED_BLOCKS` item line MUST have a name.',
-                        ])
-                    elif orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_NAMED_BLOCKS ERROR: IDENTIFIER line.',
-                            '',
-                            '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                            '    There MUST be ONE SPACE after the STRUCTURE_SINGLE_BLOCK_IDENTIFIER <{}>.'.format(
-                                STRUCTURE_SINGLE_BLOCK_IDENTIFIER),
-                        ])
-                elif is_repeated_block_type == 'UNNAMED':
-                    if len(orig_line) > cur_indent + 1:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_UNNAMED_BLOCKS ERROR: IDENTIFIER line.',
-                            '',
-                            '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                            '       `STRUCTURE_UNNAMED_BLOCKS` item line MUST NOT have a name.',
-                        ])
-                else:
-                    raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                        'STRUCTURE_BLOCKS ERROR: WRONG Blocks type.',
-                        '',
-                        '    orig_stack_situation: <{}>'.format(orig_stack_situation),
-                        '       `STRUCTURE_BLOCKS` Expected a: NAMED or UNNAMED is_repeated_block_type.',
-                        '       Got: <{}>'.format(is_repeated_block_type),
-                    ])
-
-                # Check STRUCTURE_BLOCKS: Item Empty STRUCTURE_SINGLE_BLOCK
-                next_line_indent, next_line = prepared_lines[next_idx]
-                if next_line_indent == cur_indent + section_indentation_number:
-                    stack_situation = is_single_block
-                    check_indent = cur_indent
-                    cur_stack_idx += 1
-                    stack[cur_stack_idx] = stack_situation
-                    if cur_stack_idx > len_stack - 3:
-                        stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                      'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                        len_stack += 10
-                # STRUCTURE_BLOCKS: EMPTY BLK-Item (STRUCTURE_SINGLE_BLOCK):  No need to adjust the stack for this
-                else:
-                    # strictly speaking this is not needed
-                    is_repeated_block_type == 'EMPTY'
-
-
-            # STRUCTURE_SINGLE_BLOCK: no need to do anything here: orig_stack_situation == is_single_block
-
-            # Root: check any new situation: no need to do anything here: orig_stack_situation == is_root
-
-            # ====  ==== ==== check new orig_stack_situation ====  ==== ====   #
-            else:
-                # STRUCTURE_LIST_IDENTIFIER
-                if orig_line[cur_indent] == STRUCTURE_LIST_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_LIST_IDENTIFIER ERROR.',
-                            '',
-                            '    There MUST be ONE SPACE before the List LCONF-Key-Name.',
-                        ])
-
-                    # Compact_STRUCTURE_LIST
-                    if LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        # Validate: LCONF_KEY_VALUE_SEPARATOR
-                        if ' :: ' not in orig_line or '  ::' in orig_line or '::  ' in orig_line:
-                            raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                                'Compact_STRUCTURE_LIST: KEY-VALUE-SEPARATOR ERROR: expected < :: >',
-                            ])
-                    # General STRUCTURE_LIST
-                    else:
-                        # Check STRUCTURE_LIST: Item Empty STRUCTURE_LIST
-                        next_line_indent, next_line = prepared_lines[next_idx]
-                        if next_line_indent == cur_indent + section_indentation_number:
-                            stack_situation = is_general_list
-                            check_indent = cur_indent
-                            cur_stack_idx += 1
-                            stack[cur_stack_idx] = stack_situation
-                            if cur_stack_idx > len_stack - 3:
-                                stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                              'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                                len_stack += 10
-                        # else: STRUCTURE_LIST: EMPTY:  No need to adjust the stack for this
-
-                # STRUCTURE_TABLE_IDENTIFIER
-                elif orig_line[cur_indent] == STRUCTURE_TABLE_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_TABLE_IDENTIFIER ERROR.',
-                            '',
-                            '    There MUST be ONE SPACE before the Table LCONF-Key-Name.',
-                        ])
-                    elif orig_line[-1] == STRUCTURE_TABLE_VALUE_SEPARATOR:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_TABLE_IDENTIFIER line MUST NOT end with a STRUCTURE_TABLE_VALUE_SEPARATOR.',
-                        ])
-                    elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_TABLE_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                        ])
-
-                    # Check STRUCTURE_TABLE: Empty (no Row lines)
-                    next_line_indent, next_line = prepared_lines[next_idx]
-                    if next_line_indent == cur_indent + section_indentation_number:
-                        stack_situation = is_table
-                        check_indent = cur_indent
-                        cur_stack_idx += 1
-                        stack[cur_stack_idx] = stack_situation
-                        if cur_stack_idx > len_stack - 3:
-                            stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                          'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                            len_stack += 10
-
-                        # Item Lines (table rows) must contain all the same:
-                        #    Number of STRUCTURE_TABLE_VALUE_SEPARATOR in table rows: will be based on the first row
-                        #    At least 2
-                        table_rows_expected_pipes = next_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR)
-                        if table_rows_expected_pipes < 2:
-                            raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                                'STRUCTURE_TABLE ITEM Line (Row).',
-                                '    Number of expected `STRUCTURE_TABLE_VALUE_SEPARATOR` must be at least 2.',
-                                '    Counted `Vertical-Line`: <{}>'.format(
-                                    orig_line.count(STRUCTURE_TABLE_VALUE_SEPARATOR)),
-                                '',
-                                'next_line: <{}>'.format(next_line),
-                                '',
-                                'orig_line: <{}>'.format(orig_line)
-                            ])
-                    # else: STRUCTURE_TABLE: EMPTY:  No need to adjust the stack for this
-
-                # `STRUCTURE_SINGLE_BLOCK_IDENTIFIER`: These can only be Named STRUCTURE_SINGLE_BLOCKs
-                elif orig_line[cur_indent] == STRUCTURE_SINGLE_BLOCK_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'There MUST be ONE SPACE before the SINGLE_BLOCK name.',
-                        ])
-                    elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_SINGLE_BLOCK_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                        ])
-
-                    # Check STRUCTURE_SINGLE_BLOCK: Empty
-                    next_line_indent, next_line = prepared_lines[next_idx]
-                    if next_line_indent == cur_indent + section_indentation_number:
-                        stack_situation = is_single_block
-                        check_indent = cur_indent
-                        cur_stack_idx += 1
-                        stack[cur_stack_idx] = stack_situation
-                        if cur_stack_idx > len_stack - 3:
-                            stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                          'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                            len_stack += 10
-                    # else: STRUCTURE_SINGLE_BLOCK: EMPTY:  No need to adjust the stack for this
-
-                # `STRUCTURE_BLOCKS_IDENTIFIER`
-                elif orig_line[cur_indent] == STRUCTURE_BLOCKS_IDENTIFIER:
-                    if orig_line[cur_indent + 1] != LCONF_SPACE or orig_line[cur_indent + 2] == LCONF_SPACE:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'There MUST be ONE SPACE before the STRUCTURE_BLOCKS_IDENTIFIER name.',
-                        ])
-                    elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'STRUCTURE_BLOCKS_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
-                        ])
-
-
-                    # Check STRUCTURE_BLOCKS: Empty
-                    next_line_indent, next_line = prepared_lines[next_idx]
-                    if next_line_indent == cur_indent + section_indentation_number:
-                        stack_situation = is_repeated_block
-                        check_indent = cur_indent
-                        cur_stack_idx += 1
-                        stack[cur_stack_idx] = stack_situation
-                        if cur_stack_idx > len_stack - 3:
-                            stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK',
-                                          'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
-                            len_stack += 10
-
-                        if len(next_line) == next_line_indent + 1:
-                            is_repeated_block_type = 'UNNAMED'
-                        else:
-                            is_repeated_block_type = 'NAMED'
-                    # else: LCONF-Single-Block: EMPTY:  No need to adjust the stack for this
-
-                # `STRUCTURE_PAIR:  we checked already for: Compact_STRUCTURE_LIST
-                elif LCONF_KEY_VALUE_SEPARATOR in orig_line:
-                    # Validate: LCONF_KEY_VALUE_SEPARATOR
-                    if ('  ::' in orig_line or '::  ' in orig_line or
-                        (' :: ' not in orig_line and orig_line[-3:] != ' ::')
-                        ):
-                        raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                            'LCONF_KEY_VALUE_SEPARATOR < :: > ERROR:',
-                        ])
-                # WRONG
-                else:
-                    raise SectionErr('validate_one_section_schema', section_format, section_name, orig_line, [
-                        'SOMETHING Wrong with this line: maybe indentation, wrong type ..',
-                    ])
-            prev_indent = cur_indent
-    return True
+    Validates all LCONF-Sections of a LCONF-File like `validate_one_section_fast`.
+
+    `validate_sections_from_file(path_to_lconf_file, collect_all=False)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File containing one or more LCONF-Sections
+    * `collect_all`: (bool) if True the errors of all LCONF-Sections are returned instead of raised: see the module
+        Overview. The line numbers of the errors are the line numbers in the file.
+
+    **Returns:** (bool) True if success else raises an error: with `collect_all` (list) all errors: empty if success
+
+    The file is read as UTF-8 bytes: the LCONF-Sections are validated as spans on the bytes path.
+    """
+    with open(path_to_lconf_file, 'rb') as file_obj:
+        buffer = file_obj.read()
+    profile = profiling.active_profile
+    if profile is not None:
+        profile.start_file(path_to_lconf_file, len(buffer))
+        start_time = perf_counter()
+    try:
+        section_spans = extract_sections(buffer, as_spans=True)
+    except Err as err:
+        if not collect_all:
+            raise
+        return [err]
+    finally:
+        if profile is not None:
+            profile.add_extract(perf_counter() - start_time)
+    if not collect_all:
+        for section_span in section_spans:
+            validate_one_section_fast(section_span, buffer)
+        return True
+
+    errors = []
+    # Line number of the LCONF-Section-Start-Line: the newlines are counted once from span to span
+    line_number = 1
+    count_from_idx = 0
+    for section_span in section_spans:
+        line_number += buffer.count(b'\n', count_from_idx, section_span[0])
+        count_from_idx = section_span[0]
+        errors.extend(validate_one_section_fast(section_span, buffer, True, line_number))
+    return errors
+
+
+def validate_file(path_to_lconf_file, workers=1):
+    """
+    #### lconf_section.validate_file
+
+    Validates all LCONF-Sections of a LCONF-File like `validate_one_section_fast`: optional in worker processes.
+
+    `validate_file(path_to_lconf_file, workers=1)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File containing one or more LCONF-Sections
+    * `workers`: (int) number of worker processes: 1 validates in the calling process
+
+    **Returns:** (bool) True if success else raises the error of the first (in file order) not valid LCONF-Section
+
+    The file is memory mapped. With more than one worker the LCONF-Section spans are split in contiguous batches of
+    about the same size in bytes (BATCHES_PER_WORKER per worker): each worker maps the same file once and gets only
+    the byte offsets of its spans, no LCONF-Section text is pickled. Batch results are collected in file order: the
+    error of the first not valid LCONF-Section is returned by its worker and raised in the calling process.
+
+    Each worker costs a process start and one `mmap`: measure with `benchmarks/run_parallel_benchmark.py` before
+    using more than one.
+    """
+    with open(path_to_lconf_file, 'rb') as file_obj:
+        file_size = path_getsize(path_to_lconf_file)
+        buffer = mmap(file_obj.fileno(), 0, access=MMAP_ACCESS_READ) if file_size else b''
+        try:
+            section_spans = extract_sections(buffer, as_spans=True)
+            if workers <= 1 or len(section_spans) < 2:
+                for section_span in section_spans:
+                    validate_one_section_fast(section_span, buffer)
+                return True
+
+            batches = _span_batches(section_spans, workers * BATCHES_PER_WORKER)
+            with Pool(min(workers, len(batches)), _init_validate_worker, (path_to_lconf_file,)) as pool:
+                for err in pool.imap(_validate_span_batch, batches):
+                    if err is not None:
+                        raise err
+            return True
+        finally:
+            if file_size:
+                buffer.close()
+
+
+def _span_batches(section_spans, batches_number):
+    """ Helper for `validate_file`: splits the spans in contiguous batches of about the same size in bytes.
+    """
+    batch_size = max(1, (section_spans[-1][1] - section_spans[0][0]) // batches_number)
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for section_span in section_spans:
+        batch.append(section_span)
+        batch_bytes += section_span[1] - section_span[0]
+        if batch_bytes >= batch_size:
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# `validate_file` worker processes: the memory mapped LCONF-File
+_worker_buffer = None
+
+
+def _init_validate_worker(path_to_lconf_file):
+    """ Helper for `validate_file`: the initializer of each worker process. Maps the LCONF-File once read-only to
+    `_worker_buffer`: the worker validates all its span batches in it. The mapping is closed when the process ends.
+    """
+    global _worker_buffer
+    with open(path_to_lconf_file, 'rb') as file_obj:
+        _worker_buffer = mmap(file_obj.fileno(), 0, access=MMAP_ACCESS_READ)
+
+
+def _validate_span_batch(section_spans):
+    """ Helper for `validate_file`: returns the error of the first not valid LCONF-Section span or None.
+    """
+    # Err and SectionErr are picklable: the calling process raises the returned error
+    for section_span in section_spans:
+        try:
+            validate_one_section_fast(section_span, _worker_buffer)
+        except (Err, SectionErr) as err:
+            return err
+    return None
 
 
-# =====================================================================================================================
 def TOOD_deletelater():
     print("\n\nTOOD_deletelater\n\n")
     path_to_lconf_file = path_join(path_dirname(path_abspath(__file__)), "../lconf-examples/test.lconfsd")
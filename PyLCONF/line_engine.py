@@ -0,0 +1,464 @@
+"""
+### PyLCONF.line_engine
+
+#### Overview
+
+The table-driven line engine shared by the LCONF-Section validators and `lconf_section.parse_section`.
+
+`iter_section_lines`: Classifies and validates each LCONF-Section line once and yields its line kind.
+
+One pass over the lines of a `line_table.LineTable`: the checks of `lconf_section.prepare_section_lines` are done in the
+same loop. Each line is searched once for the LCONF_KEY_VALUE_SEPARATOR: its offset is yielded with the line offsets.
+The stack of open structures holds integer situations (`IS_*`) and the line kind of a line in a STRUCTURE_SINGLE_BLOCK
+(or the root) is looked up by its first significant character (`LINE_KINDS_BY_FIRST_CHAR`).
+
+#### LCONF_KEY_VALUE_SEPARATOR
+
+The first `::` of a line is its LCONF_KEY_VALUE_SEPARATOR: it needs exactly one space before and one space after it
+(or the line end after ` ::`: an empty value). The rest of the line is the value: it is not searched again.
+
+* LCONF-Key-Names can not contain `::`: `a::b :: v` is wrong (its first `::` has no space before it)
+* LCONF-Values and Compact_STRUCTURE_LIST items may contain `::` with any spacing: `key :: a  :: x` and
+    `key :: ::  x` are valid: the value is `a  :: x` and `::  x`
+
+NOTE: the validators before the line engine checked the whole line for `  ::` and `::  `: they accepted
+`a::b :: v` and rejected the values above. `lconf_section.validate_one_section_complet` still rejects a second `::`
+in a line of a LCONF-Section with a LCONF-Schema.
+"""
+from itertools import (
+    count,
+    islice,
+)
+from sys import maxsize
+
+from PyLCONF.constants import (
+    LCONF_SPACE,
+    STRUCTURE_LIST_IDENTIFIER,
+    STRUCTURE_TABLE_IDENTIFIER,
+    STRUCTURE_TABLE_VALUE_SEPARATOR,
+    STRUCTURE_SINGLE_BLOCK_IDENTIFIER,
+    STRUCTURE_BLOCKS_IDENTIFIER,
+    LCONF_COMMENT_LINE_IDENTIFIER,
+    LCONF_KEY_VALUE_SEPARATOR,
+)
+from PyLCONF.utilities import (
+    ERR_BLOCKS_ITEM,
+    ERR_IDENTIFIER_KEY_VALUE_SEPARATOR,
+    ERR_IDENTIFIER_SPACE,
+    ERR_INDENTATION_JUMP,
+    ERR_INDENTATION_MULTIPLE,
+    ERR_KEY_VALUE_SEPARATOR,
+    ERR_LIST_ITEM,
+    ERR_NAMED_BLOCKS_ITEM,
+    ERR_TABLE_COLUMNS,
+    ERR_TABLE_IDENTIFIER,
+    ERR_TABLE_ROW,
+    ERR_TRAILING_SPACE,
+    ERR_UNNAMED_BLOCKS_ITEM,
+    ERR_WRONG_LINE,
+    SectionErr,
+)
+
+
+# Tokens used to validate LCONF-Section lines: one set for `str` and one for UTF-8 `bytes` input.
+#   All structural tokens are ASCII: single characters are compared with one indexed line item which is for `bytes`
+#   the `int` ordinal of the character.
+#   NOTE: each line is searched once with `find`: `bytes.__contains__` is much slower than `str.__contains__`
+STR_LINE_TOKENS = (
+    LCONF_SPACE,
+    STRUCTURE_LIST_IDENTIFIER,
+    STRUCTURE_TABLE_IDENTIFIER,
+    STRUCTURE_TABLE_VALUE_SEPARATOR,
+    STRUCTURE_SINGLE_BLOCK_IDENTIFIER,
+    STRUCTURE_BLOCKS_IDENTIFIER,
+    LCONF_COMMENT_LINE_IDENTIFIER,
+    LCONF_KEY_VALUE_SEPARATOR,
+)
+BYTES_LINE_TOKENS = tuple(
+    ord(token_) if len(token_) == 1 else token_.encode('utf-8') for token_ in STR_LINE_TOKENS
+)
+
+# Stack situations: the structure a line is nested in
+#   NOTE: IS_REPEATED_BLOCK (type not yet known), IS_NAMED_BLOCKS, IS_UNNAMED_BLOCKS must stay the highest numbers
+IS_ROOT = 0
+IS_SINGLE_BLOCK = 1
+IS_GENERAL_LIST = 2
+IS_TABLE = 3
+IS_REPEATED_BLOCK = 4
+IS_NAMED_BLOCKS = 5
+IS_UNNAMED_BLOCKS = 6
+
+# `iter_section_lines`: no wrong line to resynchronize after
+NO_RESYNC = maxsize
+
+# Line kinds yielded by `iter_section_lines`
+#   In the root or a STRUCTURE_SINGLE_BLOCK
+LINE_PAIR = 0
+LINE_LIST = 1
+LINE_COMPACT_LIST = 2
+LINE_TABLE = 3
+LINE_SINGLE_BLOCK = 4
+LINE_BLOCKS = 5
+#   Items of the other structures
+LINE_LIST_VALUE = 6
+LINE_TABLE_ROW = 7
+LINE_NAMED_BLOCK = 8
+LINE_UNNAMED_BLOCK = 9
+
+# Line kind of a line in the root or a STRUCTURE_SINGLE_BLOCK by its first significant character: all other
+# characters start a LCONF-Key-Value-Pair. One table for `str` and one for `bytes` lines.
+LINE_KINDS_BY_FIRST_CHAR = {
+    STRUCTURE_LIST_IDENTIFIER: LINE_LIST,
+    STRUCTURE_TABLE_IDENTIFIER: LINE_TABLE,
+    STRUCTURE_SINGLE_BLOCK_IDENTIFIER: LINE_SINGLE_BLOCK,
+    STRUCTURE_BLOCKS_IDENTIFIER: LINE_BLOCKS,
+}
+BYTES_LINE_KINDS_BY_FIRST_CHAR = {ord(char_): line_kind for char_, line_kind in LINE_KINDS_BY_FIRST_CHAR.items()}
+
+# Stack situation opened by a line kind
+OPENED_SITUATIONS = {
+    LINE_LIST: IS_GENERAL_LIST,
+    LINE_TABLE: IS_TABLE,
+    LINE_SINGLE_BLOCK: IS_SINGLE_BLOCK,
+    LINE_BLOCKS: IS_REPEATED_BLOCK,
+}
+
+# Error messages of a wrong identifier line: there must be ONE SPACE between the identifier and the LCONF-Key-Name
+IDENTIFIER_SPACE_ERRORS = {
+    LINE_LIST: [
+        'STRUCTURE_LIST_IDENTIFIER ERROR.',
+        '',
+        '    There MUST be ONE SPACE before the List LCONF-Key-Name.',
+    ],
+    LINE_TABLE: [
+        'STRUCTURE_TABLE_IDENTIFIER ERROR.',
+        '',
+        '    There MUST be ONE SPACE before the Table LCONF-Key-Name.',
+    ],
+    LINE_SINGLE_BLOCK: [
+        'There MUST be ONE SPACE before the SINGLE_BLOCK name.',
+    ],
+    LINE_BLOCKS: [
+        'There MUST be ONE SPACE before the STRUCTURE_BLOCKS_IDENTIFIER name.',
+    ],
+}
+IDENTIFIER_KEY_VALUE_SEPARATOR_ERRORS = {
+    LINE_TABLE: [
+        'STRUCTURE_TABLE_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
+    ],
+    LINE_SINGLE_BLOCK: [
+        'STRUCTURE_SINGLE_BLOCK_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
+    ],
+    LINE_BLOCKS: [
+        'STRUCTURE_BLOCKS_IDENTIFIER lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
+    ],
+}
+
+
+# =================================================================================================================== #
+
+def iter_section_lines(line_table, section_indentation_number, section_format, section_name, error_origin,
+                       errors=None, first_line_number=1):
+    """
+    #### line_engine.iter_section_lines
+
+    Classifies and validates each LCONF-Section line once: LCONF_BLANK_LINEs and LCONF-Section-Comment-Lines are
+    skipped.
+
+    `iter_section_lines(line_table, section_indentation_number, section_format, section_name, error_origin,
+                       errors=None, first_line_number=1)`
+
+    **Parameters:**
+
+    * `line_table`: (LineTable) the lines of exact one LCONF-Section as returned by `lconf_section.section_line_table`:
+        its text is `str` or UTF-8 `bytes`
+    * `section_indentation_number`: (int) the LCONF-Indentation-Per-Level number
+    * `section_format`: (string) the section format
+    * `section_name`: (string) the section name
+    * `error_origin`: (str) used for raised errors: the name of the calling function
+    * `errors`: (list) optional: if given the errors are appended to it instead of raised: see below
+    * `first_line_number`: (int) the line number of the LCONF-Section-Start-Line: e.g. its line number in the file
+
+    **Yields:** (tuple) `(line_kind, cur_level, line_start, content_start, line_end, key_value_separator_idx,
+        line_number)` for each line between the LCONF-Section-Start-Line and the LCONF-Section-End-Line
+
+    * `line_kind`: one of the `LINE_*` numbers
+    * `cur_level`: the nesting level: the lines of a structure opened at level N have level N + 1
+    * `line_start`, `content_start`, `line_end`: offsets in `line_table.text`: the line is `text[line_start:line_end]`
+        and `content_start` is its first character after the indentation
+    * `key_value_separator_idx`: the offset of the LCONF_KEY_VALUE_SEPARATOR in `line_table.text` or -1
+    * `line_number`: the number of the line: `first_line_number` is the LCONF-Section-Start-Line
+
+    No line object is created: the characters are read from `line_table.text`. A line is only sliced for an error.
+
+    Raises a `SectionErr` with an `ERR_*` code, the line number and the column for the first wrong line.
+
+    With `errors` all wrong lines are collected in one pass: a wrong line is not yielded and the following lines which
+    are indented more than it are skipped. Validation resynchronizes at the next line with the same or a lower
+    indentation.
+
+    *Validates:*
+
+    * No Trailing Spaces
+    * Indentation increase jumps (increase more than one LCONF-Indentation-Per-Level)
+    * Indentation is a multiple of LCONF-Indentation-Per-Level
+    * Identifiers
+    * LCONF_KEY_VALUE_SEPARATOR spacing
+    * Items of STRUCTURE_LIST, STRUCTURE_TABLE, STRUCTURE_NAMED_BLOCKS and STRUCTURE_UNNAMED_BLOCKS
+    * Table rows same number of columns
+    * Lines indented more than the open structures
+    """
+    text = line_table.text
+    if isinstance(text, str):
+        line_kinds_by_first_char = LINE_KINDS_BY_FIRST_CHAR
+        (space, list_identifier, table_identifier, table_value_separator, single_block_identifier, blocks_identifier,
+         comment_line_identifier, key_value_separator) = STR_LINE_TOKENS
+    else:
+        line_kinds_by_first_char = BYTES_LINE_KINDS_BY_FIRST_CHAR
+        (space, list_identifier, table_identifier, table_value_separator, single_block_identifier, blocks_identifier,
+         comment_line_identifier, key_value_separator) = BYTES_LINE_TOKENS
+    starts = line_table.starts
+    lengths = line_table.lengths
+    indents = line_table.indents
+
+    # One item per open nesting level
+    stack_situations = [IS_ROOT]
+    stack_situation = IS_ROOT
+    cur_level = 0
+    # Indentation of the previous line
+    prev_indent = 0
+    # -1: the stack must be checked for the next line: else the indentation of the previous line
+    check_indent = -1
+
+    # Number of LCONF_VERTICAL_LINE in table rows: will be based on the first row
+    table_rows_expected_pipes = -1
+    # Indentation of the last wrong line if `errors` is given
+    resync_indent = NO_RESYNC
+
+    # The lines between the LCONF-Section-Start-Line and the LCONF-Section-End-Line
+    last_line_idx = len(starts) - 1
+    for line_number, line_start, line_length, cur_indent in zip(
+            count(first_line_number + 1), islice(starts, 1, last_line_idx), islice(lengths, 1, last_line_idx),
+            islice(indents, 1, last_line_idx)):
+        # Skip complete Blank-Line (zero characters)
+        if not line_length:
+            continue
+        line_end = line_start + line_length
+        try:
+            # Check Trailing Space
+            if text[line_end - 1] == space:
+                raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                    'TRAILING SPACE ERROR',
+                ], ERR_TRAILING_SPACE, line_number, line_length)
+            # A line of only whitespace
+            if cur_indent == line_length:
+                raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                    'SOMETHING Wrong with this line: maybe indentation, wrong type ..',
+                ], ERR_WRONG_LINE, line_number, 1)
+            content_start = line_start + cur_indent
+            first_char = text[content_start]
+            # Skip LCONF-Section-Comment-Line
+            if first_char == comment_line_identifier:
+                continue
+            # `errors` given: skip the lines after a wrong line which are indented more than it
+            if cur_indent > resync_indent:
+                continue
+
+            # A line with the same indentation as the previous line (which opened no structure) has the same situation
+            if cur_indent != check_indent:
+                resync_indent = NO_RESYNC
+                if cur_indent != prev_indent:
+                    # No Indentation Increase Jump
+                    if cur_indent > prev_indent + section_indentation_number:
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'INDENTATION INCREASE JUMP ERROR',
+                            '',
+                            '  prev_indent: <{}> - current line_indent: <{}>'.format(prev_indent, cur_indent),
+                            '    Maximum expected indent: <{}> !!'.format(prev_indent + section_indentation_number),
+                            '    Indentation must be a multiple of section_indentation_number: <{}>'.format(
+                                section_indentation_number),
+                        ], ERR_INDENTATION_JUMP, line_number, cur_indent + 1)
+                    # less indentation must be a multiple of section_indentation_number
+                    elif cur_indent % section_indentation_number != 0:
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'INDENTATION INCREASE JUMP ERROR',
+                            '',
+                            '  prev_indent: <{}> - current line_indent: <{}>'.format(prev_indent, cur_indent),
+                            '    Indentation must be a multiple of section_indentation_number: <{}>'.format(
+                                section_indentation_number),
+                        ], ERR_INDENTATION_MULTIPLE, line_number, cur_indent + 1)
+                    prev_indent = cur_indent
+                check_indent = cur_indent
+                cur_level = cur_indent // section_indentation_number
+                len_stack = len(stack_situations)
+                if cur_level < len_stack - 1:
+                    del stack_situations[cur_level + 1:]
+                elif cur_level >= len_stack:
+                    raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                        'SOMETHING Wrong with this line: maybe indentation, wrong type ..',
+                    ], ERR_WRONG_LINE, line_number, cur_indent + 1)
+                stack_situation = stack_situations[cur_level]
+            key_value_separator_idx = text.find(key_value_separator, content_start, line_end)
+
+            # ====  ==== ==== Root or STRUCTURE_SINGLE_BLOCK: check any new situation ====  ==== ====   #
+            if stack_situation <= IS_SINGLE_BLOCK:
+                # `STRUCTURE_PAIR`: all lines which do not start with an identifier
+                if first_char not in line_kinds_by_first_char:
+                    # Validate: LCONF_KEY_VALUE_SEPARATOR
+                    # exactly one space before and after: or one space before and line end (empty value)
+                    if (key_value_separator_idx < content_start + 2 or
+                        text[key_value_separator_idx - 1] != space or
+                        text[key_value_separator_idx - 2] == space or
+                        (line_end != key_value_separator_idx + 2 and
+                         (text[key_value_separator_idx + 2] != space or
+                          text[key_value_separator_idx + 3] == space))
+                        ):
+                        if key_value_separator_idx == -1:
+                            raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                                'SOMETHING Wrong with this line: maybe indentation, wrong type ..',
+                            ], ERR_WRONG_LINE, line_number, cur_indent + 1)
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'LCONF_KEY_VALUE_SEPARATOR < :: > ERROR:',
+                        ], ERR_KEY_VALUE_SEPARATOR, line_number, key_value_separator_idx - line_start + 1)
+                    yield (LINE_PAIR, cur_level, line_start, content_start, line_end, key_value_separator_idx,
+                           line_number)
+                    continue
+
+                line_kind = line_kinds_by_first_char[first_char]
+                # Identifier lines: `- `, `| `, `. `, `* ` followed by the LCONF-Key-Name
+                if line_length < cur_indent + 3 or text[content_start + 1] != space or \
+                        text[content_start + 2] == space:
+                    raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end],
+                                     IDENTIFIER_SPACE_ERRORS[line_kind], ERR_IDENTIFIER_SPACE, line_number,
+                                     cur_indent + 2)
+                if key_value_separator_idx != -1:
+                    # Compact_STRUCTURE_LIST
+                    if line_kind == LINE_LIST:
+                        # Validate: LCONF_KEY_VALUE_SEPARATOR: exactly one space before and after
+                        if (text[key_value_separator_idx - 1] != space or
+                            text[key_value_separator_idx - 2] == space or
+                            line_end < key_value_separator_idx + 4 or
+                            text[key_value_separator_idx + 2] != space or
+                            text[key_value_separator_idx + 3] == space
+                            ):
+                            raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                                'Compact_STRUCTURE_LIST: KEY-VALUE-SEPARATOR ERROR: expected < :: >',
+                            ], ERR_KEY_VALUE_SEPARATOR, line_number, key_value_separator_idx - line_start + 1)
+                        yield (LINE_COMPACT_LIST, cur_level, line_start, content_start, line_end,
+                               key_value_separator_idx, line_number)
+                        continue
+                    raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end],
+                                     IDENTIFIER_KEY_VALUE_SEPARATOR_ERRORS[line_kind],
+                                     ERR_IDENTIFIER_KEY_VALUE_SEPARATOR, line_number,
+                                     key_value_separator_idx - line_start + 1)
+                if line_kind == LINE_TABLE:
+                    if text[line_end - 1] == table_value_separator:
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'STRUCTURE_TABLE_IDENTIFIER line MUST NOT end with a STRUCTURE_TABLE_VALUE_SEPARATOR.',
+                        ], ERR_TABLE_IDENTIFIER, line_number, line_length)
+                    table_rows_expected_pipes = -1
+                stack_situations.append(OPENED_SITUATIONS[line_kind])
+                check_indent = -1
+
+            # ====  ==== ==== continue stack_situation ====  ==== ====   #
+            # STRUCTURE_LIST (General-List): Associates a LCONF-Key-Name with an ordered sequence (list) of data values
+            elif stack_situation == IS_GENERAL_LIST:
+                if first_char in line_kinds_by_first_char or key_value_separator_idx != -1:
+                    raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                        'STRUCTURE_LIST ERROR: wrong item',
+                        '',
+                        '        `Lists` may only contain LCONF-Values',
+                    ], ERR_LIST_ITEM, line_number, cur_indent + 1)
+                line_kind = LINE_LIST_VALUE
+
+            # STRUCTURE_TABLE: Associates a LCONF-Key-Name with ordered tabular-data (columns and rows).
+            elif stack_situation == IS_TABLE:
+                #   NOTE: STRUCTURE_TABLE_IDENTIFIER and STRUCTURE_TABLE_VALUE_SEPARATOR are the same.
+                #   First and last must be a STRUCTURE_TABLE_VALUE_SEPARATOR - No need to check other identifiers
+                if (first_char != table_value_separator or
+                    text[line_end - 1] != table_value_separator or
+                    key_value_separator_idx != -1
+                    ):
+                    raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                        'STRUCTURE_TABLE ERROR: wrong item',
+                        '',
+                        '        `Table Rows` MUST start and end with STRUCTURE_TABLE_VALUE_SEPARATORs" <{}>'.format(
+                            STRUCTURE_TABLE_VALUE_SEPARATOR),
+                        '    STRUCTURE_TABLE Row lines MUST NOT contain LCONF_KEY_VALUE_SEPARATORs.',
+                    ], ERR_TABLE_ROW, line_number, cur_indent + 1)
+                # Item Lines (table rows) must contain all the same:
+                #    Number of STRUCTURE_TABLE_VALUE_SEPARATOR in table rows: will be based on the first row
+                #    At least 2
+                row_pipes = text.count(table_value_separator, content_start, line_end)
+                if table_rows_expected_pipes == -1:
+                    if row_pipes < 2:
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'STRUCTURE_TABLE ITEM Line (Row).',
+                            '    Number of expected `STRUCTURE_TABLE_VALUE_SEPARATOR` must be at least 2.',
+                            '    Counted `Vertical-Line`: <{}>'.format(row_pipes),
+                        ], ERR_TABLE_ROW, line_number, cur_indent + 1)
+                    table_rows_expected_pipes = row_pipes
+                elif row_pipes != table_rows_expected_pipes:
+                    raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                        'STRUCTURE_TABLE ERROR: wrong columns number.',
+                        '',
+                        '        Number of expected `STRUCTURE_TABLE_VALUE_SEPARATOR`: <{}>.'.format(
+                            table_rows_expected_pipes),
+                        '        Counted `Vertical-Line`: <{}>'.format(row_pipes),
+                    ], ERR_TABLE_COLUMNS, line_number, cur_indent + 1)
+                line_kind = LINE_TABLE_ROW
+
+            # STRUCTURE_NAMED_BLOCKS: A collection of repeated named STRUCTURE_SINGLE_BLOCKs.
+            # STRUCTURE_UNNAMED_BLOCKS: A collection of repeated unnamed STRUCTURE_SINGLE_BLOCKs.
+            else:
+                # Repeated-Block may only contain single indented values: named or unnamed STRUCTURE_SINGLE_BLOCKs
+                if key_value_separator_idx != -1 or first_char != single_block_identifier:
+                    raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                        'STRUCTURE_BLOCKS ERROR: wrong item type.',
+                        '',
+                        '        `STRUCTURE_BLOCKS` MUST contain `STRUCTURE_SINGLE_BLOCKs`.',
+                    ], ERR_BLOCKS_ITEM, line_number, cur_indent + 1)
+                # The first item decides: NAMED or UNNAMED
+                if stack_situation == IS_REPEATED_BLOCK:
+                    if line_length == cur_indent + 1:
+                        stack_situation = IS_UNNAMED_BLOCKS
+                    else:
+                        stack_situation = IS_NAMED_BLOCKS
+                    stack_situations[cur_level] = stack_situation
+
+                # Check STRUCTURE_NAMED_BLOCKS Identifier has a Name.
+                if stack_situation == IS_NAMED_BLOCKS:
+                    if line_length <= cur_indent + 1:
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'STRUCTURE_NAMED_BLOCKS ERROR: IDENTIFIER line.',
+                            '',
+                            '       `STRUCTURE_NAMED_BLOCKS` item line MUST have a name.',
+                        ], ERR_NAMED_BLOCKS_ITEM, line_number, cur_indent + 2)
+                    elif text[content_start + 1] != space or text[content_start + 2] == space:
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'STRUCTURE_NAMED_BLOCKS ERROR: IDENTIFIER line.',
+                            '',
+                            '    There MUST be ONE SPACE after the STRUCTURE_SINGLE_BLOCK_IDENTIFIER <{}>.'.format(
+                                STRUCTURE_SINGLE_BLOCK_IDENTIFIER),
+                        ], ERR_NAMED_BLOCKS_ITEM, line_number, cur_indent + 2)
+                    line_kind = LINE_NAMED_BLOCK
+                else:
+                    if line_length > cur_indent + 1:
+                        raise SectionErr(error_origin, section_format, section_name, text[line_start:line_end], [
+                            'STRUCTURE_UNNAMED_BLOCKS ERROR: IDENTIFIER line.',
+                            '',
+                            '       `STRUCTURE_UNNAMED_BLOCKS` item line MUST NOT have a name.',
+                        ], ERR_UNNAMED_BLOCKS_ITEM, line_number, cur_indent + 2)
+                    line_kind = LINE_UNNAMED_BLOCK
+                stack_situations.append(IS_SINGLE_BLOCK)
+                check_indent = -1
+
+            yield line_kind, cur_level, line_start, content_start, line_end, key_value_separator_idx, line_number
+        except SectionErr as err:
+            if errors is None:
+                raise
+            # Resynchronize at the next line with the same or a lower indentation
+            if cur_indent <= resync_indent:
+                errors.append(err)
+                resync_indent = cur_indent
+                check_indent = -1
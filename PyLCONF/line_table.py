@@ -0,0 +1,131 @@
+"""
+### PyLCONF.line_table
+
+#### Overview
+
+`LineTable`: The lines of one LCONF-Section as offsets into its text: read by all validation stages and the parser.
+`scan_lines`: Scans a text once and returns the start offsets, lengths and indentations of its lines.
+
+A `LineTable` holds the text and three parallel `array` buffers: one item per line, no line objects. The lines are
+split like `str.splitlines` / `bytes.splitlines` and the indentation of a line is the number of its leading
+whitespace characters (like `len(line) - len(line.lstrip())`). The line engine reads the characters, separators and
+table cells of a line directly from the text: a line (or a part of it) is only sliced for a parsed LCONF-Value or an
+error message.
+
+Memory per line: 16 bytes (start offset 8 bytes, length 4 bytes, indentation 4 bytes) instead of a `str` / `bytes`
+object (about 33 / 49 bytes plus the characters) and its list item.
+
+#### Compiled Speedups
+
+If the Cython extension `PyLCONF._speedups` is built `scan_lines` is its compiled version: one scan over the characters
+in place. Else the lines are split and measured with `map` (a text with `\\r\\n` line breaks: one regular expression scan):
+the line objects only exist during the scan. The pure-Python function is also available as `py_scan_lines`.
+"""
+from array import array
+from itertools import (
+    accumulate,
+    chain,
+    repeat,
+)
+from operator import (
+    add,
+    sub,
+)
+from re import compile as re_compile
+
+
+# Typecodes of the `LineTable` arrays
+STARTS_TYPECODE = 'q'
+LENGTHS_TYPECODE = 'i'
+INDENTS_TYPECODE = 'i'
+
+# The line boundaries of `str.splitlines` / `bytes.splitlines`
+STR_LINE_BREAKS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+BYTES_LINE_BREAKS = '\n\r'
+
+# One match per line: group 1: the indentation (whitespace which is not a line break): group 2: the line break
+STR_LINE_RE = re_compile(r'([^\S{0}]*)[^{0}]*(\r\n|[{0}]|\Z)'.format(STR_LINE_BREAKS))
+BYTES_LINE_RE = re_compile(r'([^\S{0}]*)[^{0}]*(\r\n|[{0}]|\Z)'.format(BYTES_LINE_BREAKS).encode('ascii'))
+
+
+def scan_lines(text):
+    """
+    #### line_table.scan_lines
+
+    Scans a text once and returns the lines as offsets.
+
+    `scan_lines(text)`
+
+    **Parameters:**
+
+    * `text`: (str or bytes) split like `str.splitlines` / `bytes.splitlines`
+
+    **Returns:** (tuple) `(starts, lengths, indents)`: `array` buffers with one item per line: the offset of the line in
+        `text`, its length (without the line break) and its number of leading whitespace characters
+    """
+    # Only single character line breaks: the lines are split and measured by C-level iteration
+    if (b'\r\n' if isinstance(text, bytes) else '\r\n') not in text:
+        lines = text.splitlines()
+        # Filled from iterators: no temporary lists of integers next to the lines
+        lengths = array(LENGTHS_TYPECODE, map(len, lines))
+        indents = array(INDENTS_TYPECODE, map(sub, lengths, map(len, map(type(text).lstrip, lines))))
+        del lines
+        starts = array(STARTS_TYPECODE, chain((0,), accumulate(map(add, lengths, repeat(1)))))
+        # The offset after the last line
+        starts.pop()
+        return starts, lengths, indents
+
+    starts = array(STARTS_TYPECODE)
+    lengths = array(LENGTHS_TYPECODE)
+    indents = array(INDENTS_TYPECODE)
+    starts_append = starts.append
+    lengths_append = lengths.append
+    indents_append = indents.append
+    text_length = len(text)
+    for match in (STR_LINE_RE if isinstance(text, str) else BYTES_LINE_RE).finditer(text):
+        line_start = match.start()
+        # The empty match at the end of the text: no line
+        if line_start == text_length:
+            break
+        starts_append(line_start)
+        indents_append(match.end(1) - line_start)
+        lengths_append(match.start(2) - line_start)
+    return starts, lengths, indents
+
+
+py_scan_lines = scan_lines
+try:
+    from PyLCONF._speedups import scan_lines
+except ImportError:
+    pass
+
+
+class LineTable(object):
+    """ The lines of one LCONF-Section as offsets into its text.
+
+    `LineTable(text)`
+
+    * `text`: (str or UTF-8 bytes) the LCONF-Section
+    * `starts`: (array) the offset of each line in `text`
+    * `lengths`: (array) the length of each line without its line break
+    * `indents`: (array) the number of leading whitespace characters of each line
+
+    `len(line_table)` is the number of lines: `line_table.line(line_idx)` returns one line as `str` / `bytes`.
+    """
+    __slots__ = ('text', 'starts', 'lengths', 'indents')
+
+    def __init__(self, text):
+        self.text = text
+        self.starts, self.lengths, self.indents = scan_lines(text)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def line(self, line_idx):
+        """ Returns the line `line_idx` (negative indexes count from the last line): sliced from the text.
+        """
+        line_start = self.starts[line_idx]
+        return self.text[line_start:line_start + self.lengths[line_idx]]
+
+    def __repr__(self):
+        return '<{}: {} lines>'.format(self.__class__.__name__, len(self.starts))
@@ -0,0 +1,218 @@
+"""
+### PyLCONF.profiling
+
+#### Overview
+
+`ValidationProfile`: Records per-phase wall times and line counts of the LCONF-Section validators while it is active.
+`SectionProfile`: The recorded values of one validated LCONF-Section.
+
+```python
+from PyLCONF.lconf_section import validate_sections_from_file
+from PyLCONF.profiling import ValidationProfile
+
+with ValidationProfile() as profile:
+    validate_sections_from_file('path-to.lconf')
+print(profile.format_report())
+```
+
+`pylconf-validate --stats` prints the same report to stderr.
+
+Phases:
+
+* `extract`: `extract_sections` of a whole LCONF-File: recorded per file by `validate_sections_from_file` and
+    `pylconf-validate`
+* `check`: the compiled `_speedups.check_section_text` (only `validate_one_section_fast` with the extension built)
+* `line_table`: `section_line_table`: the line offsets and indentations, the LCONF-Section-Start-Line and
+    LCONF-Section-End-Line
+* `validate`: the state machine `line_engine.iter_section_lines`: also counts the lines per line kind and the maximum
+    nesting depth
+
+Without an active profile the validators test only the module attribute `active_profile` once per LCONF-Section.
+With an active profile each phase runs on its own: the compiled check does not skip the other phases. So the sum of
+the phases is larger than the time of an unprofiled validation: compare the phases and the LCONF-Sections with each
+other.
+
+The active profile is global to the process (not thread-safe): worker processes record their own profiles which are
+combined with `ValidationProfile.merge`.
+"""
+from PyLCONF.line_engine import (
+    LINE_BLOCKS,
+    LINE_COMPACT_LIST,
+    LINE_LIST,
+    LINE_LIST_VALUE,
+    LINE_NAMED_BLOCK,
+    LINE_PAIR,
+    LINE_SINGLE_BLOCK,
+    LINE_TABLE,
+    LINE_TABLE_ROW,
+    LINE_UNNAMED_BLOCK,
+)
+
+
+PHASE_EXTRACT = 'extract'
+PHASE_CHECK = 'check'
+PHASE_LINE_TABLE = 'line_table'
+PHASE_VALIDATE = 'validate'
+PHASES = (PHASE_EXTRACT, PHASE_CHECK, PHASE_LINE_TABLE, PHASE_VALIDATE)
+
+# Report names of the `line_engine.LINE_*` kinds: indexed by the line kind
+LINE_KIND_NAMES = [None] * 10
+LINE_KIND_NAMES[LINE_PAIR] = 'pair'
+LINE_KIND_NAMES[LINE_LIST] = 'list'
+LINE_KIND_NAMES[LINE_COMPACT_LIST] = 'compact_list'
+LINE_KIND_NAMES[LINE_TABLE] = 'table'
+LINE_KIND_NAMES[LINE_SINGLE_BLOCK] = 'single_block'
+LINE_KIND_NAMES[LINE_BLOCKS] = 'blocks'
+LINE_KIND_NAMES[LINE_LIST_VALUE] = 'list_value'
+LINE_KIND_NAMES[LINE_TABLE_ROW] = 'table_row'
+LINE_KIND_NAMES[LINE_NAMED_BLOCK] = 'named_block'
+LINE_KIND_NAMES[LINE_UNNAMED_BLOCK] = 'unnamed_block'
+LINE_KIND_NAMES = tuple(LINE_KIND_NAMES)
+
+DEFAULT_REPORT_SECTIONS = 10
+
+# The profile the validators record to: None if profiling is disabled
+active_profile = None
+
+
+class SectionProfile(object):
+    """ The recorded values of one validated LCONF-Section.
+
+    * `file`: (str) path of the LCONF-File or None if the LCONF-Section was not validated from a file
+    * `section`: (str) the LCONF-Section-Name or None if the LCONF-Section-Start-Line is wrong
+    * `size`: (int) the length of the LCONF-Section: bytes (UTF-8 input) or characters (`str` input)
+    * `lines`: (int) number of lines (inclusive LCONF_BLANK_LINEs and LCONF-Section-Comment-Lines)
+    * `seconds`: (dict) phase name: seconds
+    * `line_kinds`: (list) number of validated lines per line kind: indexed by the `line_engine.LINE_*` kind
+    * `max_depth`: (int) the deepest nesting level of a line: 0 for only top-level lines
+    """
+    __slots__ = ('file', 'section', 'size', 'lines', 'seconds', 'line_kinds', 'max_depth')
+
+    def __init__(self, file, size):
+        self.file = file
+        self.section = None
+        self.size = size
+        self.lines = 0
+        self.seconds = {}
+        self.line_kinds = [0] * len(LINE_KIND_NAMES)
+        self.max_depth = 0
+
+    def add_phase(self, phase, seconds):
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+
+    @property
+    def total_seconds(self):
+        return sum(self.seconds.values())
+
+    def __repr__(self):
+        return '<{} {!r}: {:.6f} s>'.format(self.__class__.__name__, self.section, self.total_seconds)
+
+
+class ValidationProfile(object):
+    """ Records per-phase wall times and line counts of the LCONF-Section validators: a context manager which is the
+    `active_profile` while it is entered.
+
+    `ValidationProfile()`
+
+    * `sections`: (list) one `SectionProfile` per validated LCONF-Section
+    * `files`: (list) `[path, size, extract_seconds]` per LCONF-File
+    """
+    __slots__ = ('sections', 'files', '_previous_profile')
+
+    def __init__(self):
+        self.sections = []
+        self.files = []
+        self._previous_profile = None
+
+    def __enter__(self):
+        global active_profile
+        self._previous_profile = active_profile
+        active_profile = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global active_profile
+        active_profile = self._previous_profile
+        self._previous_profile = None
+        return False
+
+    def start_file(self, path, size):
+        """ Starts a LCONF-File: the following LCONF-Sections are recorded with its path.
+        """
+        self.files.append([path, size, 0.0])
+
+    def add_extract(self, seconds):
+        """ Adds the `extract_sections` time of the current LCONF-File.
+        """
+        self.files[-1][2] += seconds
+
+    def start_section(self, size):
+        """ Returns a new `SectionProfile` of the current LCONF-File: the validator records its phases to it.
+        """
+        section_profile = SectionProfile(self.files[-1][0] if self.files else None, size)
+        self.sections.append(section_profile)
+        return section_profile
+
+    def merge(self, other_profile):
+        """ Adds the LCONF-Files and LCONF-Sections of another profile: e.g. of a worker process.
+        """
+        self.files.extend(other_profile.files)
+        self.sections.extend(other_profile.sections)
+
+    def phase_seconds(self):
+        """ Returns (dict) phase name: the seconds of all LCONF-Files and LCONF-Sections: all `PHASES` in order.
+        """
+        totals = dict.fromkeys(PHASES, 0.0)
+        totals[PHASE_EXTRACT] = sum(extract_seconds for _, _, extract_seconds in self.files)
+        for section_profile in self.sections:
+            for phase, seconds in section_profile.seconds.items():
+                totals[phase] += seconds
+        return totals
+
+    def line_kind_counts(self):
+        """ Returns (dict) line kind name: number of validated lines of all LCONF-Sections.
+        """
+        counts = [0] * len(LINE_KIND_NAMES)
+        for section_profile in self.sections:
+            for line_kind, count in enumerate(section_profile.line_kinds):
+                counts[line_kind] += count
+        return dict(zip(LINE_KIND_NAMES, counts))
+
+    def heaviest_sections(self, number=DEFAULT_REPORT_SECTIONS):
+        """ Returns (list) the `number` `SectionProfile`s with the largest total time: the heaviest first.
+        """
+        return sorted(self.sections, key=lambda section_profile: section_profile.total_seconds, reverse=True)[:number]
+
+    def format_report(self, number=DEFAULT_REPORT_SECTIONS):
+        """ Returns (str) the report: totals, the phase breakdown, the lines per line kind and the `number` heaviest
+        LCONF-Sections.
+        """
+        phase_seconds = self.phase_seconds()
+        total_seconds = sum(phase_seconds.values()) or 1e-12
+        lines = [
+            'LCONF-Sections: {} in {} files: {:.2f} MB, {} lines, max depth {}'.format(
+                len(self.sections), len(self.files), sum(section.size for section in self.sections) / 1e6,
+                sum(section.lines for section in self.sections),
+                max((section.max_depth for section in self.sections), default=0)),
+            '',
+            '{:<14}{:>12}{:>8}'.format('phase', 'seconds', '%'),
+        ]
+        lines.extend('{:<14}{:>12.6f}{:>8.1f}'.format(phase, seconds, seconds * 100.0 / total_seconds)
+                     for phase, seconds in phase_seconds.items())
+        lines.extend(('', '{:<14}{:>12}'.format('line kind', 'lines')))
+        lines.extend('{:<14}{:>12}'.format(name, count) for name, count in self.line_kind_counts().items() if count)
+        lines.extend(('', 'heaviest LCONF-Sections:',
+                      '{:>12}{:>10}{:>10}{:>7}  {:<12}{}'.format('seconds', 'KB', 'lines', 'depth', 'phase',
+                                                                 'LCONF-Section')))
+        for section_profile in self.heaviest_sections(number):
+            heaviest_phase = max(section_profile.seconds, key=section_profile.seconds.get, default='-')
+            lines.append('{:>12.6f}{:>10.1f}{:>10}{:>7}  {:<12}{}<{}>'.format(
+                section_profile.total_seconds, section_profile.size / 1e3, section_profile.lines,
+                section_profile.max_depth, heaviest_phase,
+                '{}: '.format(section_profile.file) if section_profile.file is not None else '',
+                section_profile.section))
+        return '\n'.join(lines) + '\n'
+
+    def __repr__(self):
+        return '<{}: {} files, {} LCONF-Sections>'.format(self.__class__.__name__, len(self.files),
+                                                          len(self.sections))
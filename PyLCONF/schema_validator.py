@@ -1,5 +1,5 @@
 """
-### PyLCONF.validator
+### PyLCONF.schema_validator
 
 #### Overview
 
@@ -7,13 +7,25 @@ This module is used by the PyLCONF validation script: `pylconfsd-validate`
 
 ```bash
 pylconfsd-validate path-to-first.lconfsd path-to-second.lconfsd
+pylconfsd-validate --cache-dir .lconf_cache path-to-first.lconfsd path-to-second.lconfsd
 ```
+
+With `--cache-dir` valid LCONF-Schema-Sections are cached on disk (see `validation_cache.ValidationCache`): unchanged
+LCONF-Schema-Sections are not validated again and unchanged files are not read. The hit / miss counts are written to
+stderr.
 """
 import argparse
 from argparse import RawDescriptionHelpFormatter
-from sys import exit as sys_exit
+from sys import (
+    exit as sys_exit,
+    stderr as sys_stderr,
+)
 
 from PyLCONF.lconf_schema import validate_schemas_from_file
+from PyLCONF.validation_cache import (
+    DEFAULT_MAX_ENTRIES,
+    ValidationCache,
+)
 
 
 def parse_commandline():
@@ -22,6 +34,7 @@ def parse_commandline():
        formatter_class=RawDescriptionHelpFormatter,
        epilog='''EXAMPLES:
     pylconsdf-validate path-to-first.lconf path-to-second.lconf
+    pylconfsd-validate --cache-dir .lconf_cache path-to-first.lconfsd path-to-second.lconfsd
     '''
     )
 
@@ -31,6 +44,18 @@ def parse_commandline():
        default=[],
        help='List of files to be validates',
     )
+    main_parser.add_argument(
+       '--cache-dir',
+       default=None,
+       help='Directory of the validation cache: unchanged LCONF-Schema-Sections are not validated again '
+            '(default: no cache)',
+    )
+    main_parser.add_argument(
+       '--cache-size',
+       type=int,
+       default=DEFAULT_MAX_ENTRIES,
+       help='Maximum number of LCONF-Sections kept in the validation cache (default: {})'.format(DEFAULT_MAX_ENTRIES),
+    )
 
     args = main_parser.parse_args()
     if not args.in_files:
@@ -43,8 +68,21 @@ def parse_commandline():
 def main():
     args = parse_commandline()
 
-    for path_to_lconsd_file in args.in_files:
-        validate_schemas_from_file(path_to_lconsd_file)
+    if args.cache_dir is None:
+        for path_to_lconsd_file in args.in_files:
+            validate_schemas_from_file(path_to_lconsd_file)
+        return
+
+    cache = ValidationCache(args.cache_dir, args.cache_size)
+    try:
+        for path_to_lconsd_file in args.in_files:
+            validate_schemas_from_file(path_to_lconsd_file, cache)
+        evicted = cache.evict()
+    finally:
+        cache.close()
+    sys_stderr.write('pylconfsd-validate: cache: {} hits, {} misses, {} unchanged files, {} evicted: saved {:.4f} s '
+                     'of validation\n'.format(cache.hits, cache.misses, cache.unchanged_files, evicted,
+                                              cache.saved_seconds))
 
 
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
@@ -0,0 +1,288 @@
+"""
+### PyLCONF.section_index
+
+#### Overview
+
+`SectionIndex`: The sidecar index of one LCONF-File: finds a LCONF-Section by its name without reading the LCONF-File.
+`open_index`: Returns the `SectionIndex` of a LCONF-File: builds (or rebuilds) its index file if it is missing or stale.
+`build_index`: Scans a LCONF-File and writes its index file.
+`index_path`: Returns the path of the index file of a LCONF-File: `<path>.idx` (e.g. `bundle.lconf.idx`).
+
+`lconf_loader.load_section` reads one LCONF-Section with `seek` and one bounded `read` at the offsets of the index.
+The script `pylconf-index` (see `indexer`) builds the index files of LCONF-Files and directory trees.
+
+#### Index File
+
+All numbers are little-endian. Lookups read a fixed number of small parts: the time does not depend on the size of the
+LCONF-File or the number of its LCONF-Sections.
+
+* header (INDEX_HEADER): INDEX_MAGIC, the fingerprint of the LCONF-File, the number of LCONF-Sections and of buckets
+* buckets (INDEX_BUCKET): one `(offset, size)` of the records per bucket: the bucket of a LCONF-Section-Name is
+    the first 8 bytes of its BLAKE2b hash modulo the number of buckets (a power of two)
+* records (INDEX_RECORD followed by the UTF-8 LCONF-Section-Name): per bucket in file order: the byte offsets of the
+    LCONF-Section inclusive the `___SECTION, ___END` TAG (like `extract_sections(source, as_spans=True)`), its format
+    and the BLAKE2b hash of its bytes
+
+The fingerprint is the `st_size` and `st_mtime_ns` of the LCONF-File and the BLAKE2b hash of its first and last
+FINGERPRINT_SAMPLE_SIZE bytes: an index file with another fingerprint is stale. `lconf_loader.load_section` also checks
+the hash of the LCONF-Section it read: a change which kept the fingerprint rebuilds the index file too.
+
+Index files are written to a temporary file in the same directory and moved into place with `os.replace`: concurrent
+readers never see a partial file. If the index file can not be written `open_index` keeps the index in memory.
+"""
+from hashlib import blake2b
+from mmap import (
+    mmap,
+    ACCESS_READ as MMAP_ACCESS_READ,
+)
+from os import (
+    fstat,
+    replace as os_replace,
+    unlink,
+)
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+)
+from struct import Struct
+from tempfile import mkstemp
+
+from PyLCONF.constants import (
+    LCONF_FORMAT_LCONF,
+    LCONF_FORMAT_SCHEMA_STRICT,
+    LCONF_FORMAT_SCHEMA_FLEXIBLE,
+)
+from PyLCONF.lconf_section import extract_sections
+from PyLCONF.utilities import Err
+
+
+INDEX_FILE_EXTENSION = '.idx'
+INDEX_MAGIC = b'LCONFIX2'
+
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+SAMPLE_DIGEST_SIZE = 16
+SECTION_DIGEST_SIZE = 16
+
+# magic, st_size, st_mtime_ns, sample digest, LCONF-Sections number, buckets number
+INDEX_HEADER = Struct('<8sQq{}sII'.format(SAMPLE_DIGEST_SIZE))
+# offset of the first record in the index file, size of all records of the bucket
+INDEX_BUCKET = Struct('<QI')
+# start, end, section digest, format code, LCONF-Section-Name size
+INDEX_RECORD = Struct('<QQ{}sBI'.format(SECTION_DIGEST_SIZE))
+
+SECTION_FORMATS = (LCONF_FORMAT_LCONF, LCONF_FORMAT_SCHEMA_STRICT, LCONF_FORMAT_SCHEMA_FLEXIBLE)
+SECTION_FORMAT_CODES = {section_format: code for code, section_format in enumerate(SECTION_FORMATS)}
+
+
+class SectionIndex(object):
+    """ The sidecar index of one LCONF-File: finds a LCONF-Section by its name without reading the LCONF-File.
+
+    `SectionIndex(path_to_index_file, header, data=None)`: see `open_index`
+
+    * `path_to_index_file`: (str) the index file
+    * `fingerprint`: (tuple) `(st_size, st_mtime_ns, sample digest)` of the indexed LCONF-File
+    * `section_count`: (int) the number of LCONF-Sections
+
+    `find` reads the bucket and its records from the index file: or from `data` (the index file content) if the index
+    file could not be written.
+    """
+    __slots__ = ('path_to_index_file', 'fingerprint', 'section_count', '_buckets_count', '_data')
+
+    def __init__(self, path_to_index_file, header, data=None):
+        _, st_size, st_mtime_ns, sample_digest, self.section_count, self._buckets_count = header
+        self.path_to_index_file = path_to_index_file
+        self.fingerprint = (st_size, st_mtime_ns, sample_digest)
+        self._data = data
+
+    def find(self, section_name):
+        """ Returns the first LCONF-Section with the `section_name`.
+
+        **Returns:** (tuple) `(start, end, section_name, section_format, section_digest)` or None if not found
+        """
+        name_bytes = section_name.encode('utf-8')
+        bucket_offset = INDEX_HEADER.size + _bucket_idx(name_bytes, self._buckets_count) * INDEX_BUCKET.size
+        if self._data is None:
+            with open(self.path_to_index_file, 'rb') as file_obj:
+                file_obj.seek(bucket_offset)
+                bucket_bytes = file_obj.read(INDEX_BUCKET.size)
+                if len(bucket_bytes) != INDEX_BUCKET.size:
+                    raise Err('SectionIndex.find', [
+                        'INDEX FILE ERROR: truncated: <{}>'.format(self.path_to_index_file),
+                    ])
+                records_offset, records_size = INDEX_BUCKET.unpack(bucket_bytes)
+                file_obj.seek(records_offset)
+                records = file_obj.read(records_size)
+        else:
+            records_offset, records_size = INDEX_BUCKET.unpack_from(self._data, bucket_offset)
+            records = self._data[records_offset:records_offset + records_size]
+        if len(records) != records_size:
+            raise Err('SectionIndex.find', [
+                'INDEX FILE ERROR: truncated: <{}>'.format(self.path_to_index_file),
+            ])
+        record_offset = 0
+        while record_offset < records_size:
+            start, end, section_digest, format_code, name_size = INDEX_RECORD.unpack_from(records, record_offset)
+            name_offset = record_offset + INDEX_RECORD.size
+            if records[name_offset:name_offset + name_size] == name_bytes:
+                return start, end, section_name, SECTION_FORMATS[format_code], section_digest
+            record_offset = name_offset + name_size
+        return None
+
+    def __len__(self):
+        return self.section_count
+
+    def __repr__(self):
+        return '<{} {!r}: {} LCONF-Sections>'.format(self.__class__.__name__, self.path_to_index_file,
+                                                     self.section_count)
+
+
+def index_path(path_to_lconf_file):
+    """
+    #### section_index.index_path
+
+    Returns the path of the index file of a LCONF-File.
+
+    `index_path(path_to_lconf_file)`
+
+    **Returns:** (str) `<path_to_lconf_file>.idx`
+    """
+    return path_to_lconf_file + INDEX_FILE_EXTENSION
+
+
+def open_index(path_to_lconf_file, must_write=False):
+    """
+    #### section_index.open_index
+
+    Returns the `SectionIndex` of a LCONF-File: builds (or rebuilds) its index file if it is missing or stale.
+
+    `open_index(path_to_lconf_file, must_write=False)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File containing one or more LCONF-Sections
+    * `must_write`: (bool) see `build_index`: by default an index file which can not be written is kept in memory
+
+    **Returns:** (SectionIndex) else raises an error: e.g. for a LCONF-File without LCONF-Sections
+
+        Reads the header of the index file and FINGERPRINT_SAMPLE_SIZE bytes of the start and the end of the
+        LCONF-File.
+    """
+    path_to_index_file = index_path(path_to_lconf_file)
+    with open(path_to_lconf_file, 'rb') as file_obj:
+        fingerprint = _fingerprint(file_obj)
+    try:
+        with open(path_to_index_file, 'rb') as file_obj:
+            header_bytes = file_obj.read(INDEX_HEADER.size)
+    except OSError:
+        header_bytes = b''
+    if len(header_bytes) == INDEX_HEADER.size:
+        header = INDEX_HEADER.unpack(header_bytes)
+        if header[0] == INDEX_MAGIC and header[1:4] == fingerprint:
+            return SectionIndex(path_to_index_file, header)
+    return build_index(path_to_lconf_file, must_write)
+
+
+def build_index(path_to_lconf_file, must_write=True):
+    """
+    #### section_index.build_index
+
+    Scans a LCONF-File and writes its index file: `index_path(path_to_lconf_file)`.
+
+    `build_index(path_to_lconf_file, must_write=True)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File containing one or more LCONF-Sections
+    * `must_write`: (bool) if False an index file which can not be written is ignored: the returned `SectionIndex`
+        keeps the index in memory
+
+    **Returns:** (SectionIndex) else raises an error
+
+        The LCONF-File is mapped with `mmap`: the LCONF-Sections are found by `extract_sections(source, as_spans=True)`
+        (which validates each LCONF-Section-Start-Line) and hashed without copying them.
+    """
+    path_to_index_file = index_path(path_to_lconf_file)
+    with open(path_to_lconf_file, 'rb') as file_obj:
+        fingerprint = _fingerprint(file_obj)
+        if fingerprint[0]:
+            with mmap(file_obj.fileno(), 0, access=MMAP_ACCESS_READ) as buffer:
+                records = _index_records(buffer)
+        else:
+            records = _index_records(b'')
+    data = _index_bytes(fingerprint, records)
+    try:
+        _write_index_file(path_to_index_file, data)
+    except OSError:
+        if must_write:
+            raise
+        return SectionIndex(path_to_index_file, INDEX_HEADER.unpack_from(data), data)
+    return SectionIndex(path_to_index_file, INDEX_HEADER.unpack_from(data))
+
+
+def _fingerprint(file_obj):
+    """ Helper for `open_index` and `build_index`: returns `(st_size, st_mtime_ns, sample digest)` of an open file.
+    """
+    stat_result = fstat(file_obj.fileno())
+    hash_obj = blake2b(digest_size=SAMPLE_DIGEST_SIZE)
+    hash_obj.update(file_obj.read(FINGERPRINT_SAMPLE_SIZE))
+    if stat_result.st_size > FINGERPRINT_SAMPLE_SIZE:
+        file_obj.seek(max(FINGERPRINT_SAMPLE_SIZE, stat_result.st_size - FINGERPRINT_SAMPLE_SIZE))
+        hash_obj.update(file_obj.read(FINGERPRINT_SAMPLE_SIZE))
+    file_obj.seek(0)
+    return stat_result.st_size, stat_result.st_mtime_ns, hash_obj.digest()
+
+
+def _index_records(buffer):
+    """ Helper for `build_index`: returns one `(bucket key, record bytes)` per LCONF-Section in file order.
+    """
+    records = []
+    with memoryview(buffer) as buffer_view:
+        for start, end, section_name, section_format in extract_sections(buffer, as_spans=True):
+            name_bytes = section_name.encode('utf-8')
+            records.append((name_bytes, INDEX_RECORD.pack(
+                start, end, blake2b(buffer_view[start:end], digest_size=SECTION_DIGEST_SIZE).digest(),
+                SECTION_FORMAT_CODES[section_format], len(name_bytes)) + name_bytes))
+    return records
+
+
+def _index_bytes(fingerprint, records):
+    """ Helper for `build_index`: returns the content of the index file.
+    """
+    buckets_count = 1
+    while buckets_count < len(records):
+        buckets_count *= 2
+    bucket_records = [[] for _ in range(buckets_count)]
+    for name_bytes, record in records:
+        bucket_records[_bucket_idx(name_bytes, buckets_count)].append(record)
+
+    parts = [INDEX_HEADER.pack(INDEX_MAGIC, fingerprint[0], fingerprint[1], fingerprint[2], len(records),
+                               buckets_count)]
+    records_offset = INDEX_HEADER.size + buckets_count * INDEX_BUCKET.size
+    for records_ in bucket_records:
+        records_size = sum(map(len, records_))
+        parts.append(INDEX_BUCKET.pack(records_offset, records_size))
+        records_offset += records_size
+    for records_ in bucket_records:
+        parts.extend(records_)
+    return b''.join(parts)
+
+
+def _bucket_idx(name_bytes, buckets_count):
+    return int.from_bytes(blake2b(name_bytes, digest_size=8).digest(), 'little') & (buckets_count - 1)
+
+
+def _write_index_file(path_to_index_file, data):
+    """ Helper for `build_index`: writes the index file atomically.
+    """
+    file_descriptor, tmp_path = mkstemp(suffix='.tmp', dir=path_dirname(path_abspath(path_to_index_file)))
+    try:
+        with open(file_descriptor, 'wb') as file_obj:
+            file_obj.write(data)
+        os_replace(tmp_path, path_to_index_file)
+    except OSError:
+        try:
+            unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
@@ -0,0 +1,480 @@
+"""
+### PyLCONF.structure_classes
+
+#### Overview
+
+Compact result objects built by `lconf_section.parse_section`. All use `__slots__`: no per-instance `__dict__`.
+
+`StructureSingleBlock`: STRUCTURE_SINGLE_BLOCK: ordered LCONF-Key-Names with their values.
+`StructureRecord`: STRUCTURE_SINGLE_BLOCK with a STRICT LCONF-Schema: base of the generated record classes, one per
+    block shape: see `record_class`.
+`StructureBlocks`: STRUCTURE_NAMED_BLOCKS or STRUCTURE_UNNAMED_BLOCKS: a list of repeated STRUCTURE_SINGLE_BLOCKs.
+`StructureList`: STRUCTURE_LIST and Compact_STRUCTURE_LIST: a list of LCONF-Values.
+`StructureArray`: STRUCTURE_LIST of one numeric LCONF-Value-Type: the values in one `array.array` or NumPy array.
+`StructureTable`: STRUCTURE_TABLE: rows of LCONF-Values.
+`StructureColumnTable`: STRUCTURE_TABLE with a LCONF-Schema: one typed column per LCONF-Schema column.
+
+LCONF-Key-Value-Pairs are not wrapped: their value is stored directly in the parent StructureSingleBlock.
+"""
+from array import array
+from functools import lru_cache
+from keyword import iskeyword
+from sys import intern
+
+from PyLCONF.constants import (
+    LCONF_EMPTY_STRING,
+    TYPE_BOOLEAN,
+)
+from PyLCONF.utilities import Err
+
+# StructureSingleBlock: blocks with more items than this build a dict index on the first lookup by key
+SINGLE_BLOCK_INDEX_MIN_ITEMS = 8
+
+# `record_class`: the most recently used record classes kept: a process which compiles many LCONF-Schemas does not keep
+#   the classes of all of them
+RECORD_CLASSES_CACHE_SIZE = 1024
+
+
+class StructureSingleBlock(object):
+    """ STRUCTURE_SINGLE_BLOCK: ordered LCONF-Key-Names with their values.
+
+    Supports the read-only mapping protocol: `block[key]`, `key in block`, `len(block)`, `iter(block)`, `get`, `keys`,
+    `values`, `items`.
+
+    Keys and values are stored in one flat list `[key1, value1, key2, value2, ..]`: smaller than a dict for the
+    typical small block. Blocks with more than SINGLE_BLOCK_INDEX_MIN_ITEMS items build a dict index on the first
+    lookup by key.
+
+    * `name`: (str or None) the LCONF-Key-Name of the block: None for the root block and STRUCTURE_UNNAMED_BLOCKS items.
+    """
+    __slots__ = ('name', '_items', '_index')
+
+    def __init__(self, name):
+        self.name = name
+        self._items = []
+        self._index = None
+
+    def append_item(self, key, value):
+        """ Adds one item: used while parsing.
+        """
+        if self._index is not None:
+            self._index.setdefault(key, len(self._items) + 1)
+        self._items.append(key)
+        self._items.append(value)
+
+    def extend_items(self, keys, values):
+        """ Adds the items of two sequences of the same length: used by `lconf_binary.loads`.
+        """
+        new_items = [None] * (len(keys) * 2)
+        new_items[::2] = keys
+        new_items[1::2] = values
+        self._items.extend(new_items)
+        self._index = None
+
+    def set_item_value(self, item_idx, value):
+        """ Replaces the value of the item number `item_idx`: used by `lconf_schema.parse_section_typed`.
+        """
+        self._items[item_idx * 2 + 1] = value
+
+    def _value_idx(self, key):
+        items = self._items
+        if len(items) > SINGLE_BLOCK_INDEX_MIN_ITEMS * 2:
+            if self._index is None:
+                self._index = index = {}
+                for idx in range(len(items) - 2, -1, -2):
+                    index[items[idx]] = idx + 1
+            return self._index[key]
+        for idx in range(0, len(items), 2):
+            if items[idx] == key:
+                return idx + 1
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        return self._items[self._value_idx(key)]
+
+    def get(self, key, default=None):
+        try:
+            return self._items[self._value_idx(key)]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self._value_idx(key)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return len(self._items) // 2
+
+    def __iter__(self):
+        return iter(self._items[::2])
+
+    def keys(self):
+        return self._items[::2]
+
+    def values(self):
+        return self._items[1::2]
+
+    def items(self):
+        return list(zip(self._items[::2], self._items[1::2]))
+
+    def to_python(self):
+        """ Returns the block as a plain dict: nested structures are converted too.
+        """
+        return {
+            key: value.to_python() if isinstance(value, STRUCTURE_TYPES) else value
+            for key, value in zip(self._items[::2], self._items[1::2])
+        }
+
+    def __repr__(self):
+        return '<{} {!r}: {} items>'.format(self.__class__.__name__, self.name, len(self._items) // 2)
+
+
+class StructureRecord(object):
+    """ STRUCTURE_SINGLE_BLOCK with a STRICT LCONF-Schema: the base class of the record classes built by `record_class`.
+
+    A record class has one slot per LCONF-Key-Name of the block shape: a record has no per-instance `__dict__`, list
+    or dict index and stores no LCONF-Key-Names. LCONF-Key-Names which are Python identifiers (not starting with `_`)
+    are the slot names: `record.key` is a plain slot lookup. All items are also available with the read-only mapping
+    protocol of `StructureSingleBlock`: in LCONF-Schema order. A not set slot is a missing OPTIONAL item.
+
+    * `name`: (str or None) the LCONF-Key-Name of the block: None for STRUCTURE_UNNAMED_BLOCKS items.
+    """
+    __slots__ = ('name',)
+
+    # Set by `record_class`: the interned LCONF-Key-Names, the slot names in the same order and the slot descriptor
+    #   of each LCONF-Key-Name
+    _keys = ()
+    _slot_names = ()
+    _slots_by_key = {}
+
+    def __init__(self, name):
+        self.name = name
+
+    def set_item(self, key, value):
+        """ Sets the value of one LCONF-Key-Name of the block shape: used by `lconf_schema.parse_section_typed`.
+        """
+        self._slots_by_key[key].__set__(self, value)
+
+    def __getitem__(self, key):
+        try:
+            return self._slots_by_key[key].__get__(self)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return [key for key, slot_name in zip(self._keys, self._slot_names) if hasattr(self, slot_name)]
+
+    def values(self):
+        return [getattr(self, slot_name) for slot_name in self._slot_names if hasattr(self, slot_name)]
+
+    def items(self):
+        return [(key, getattr(self, slot_name)) for key, slot_name in zip(self._keys, self._slot_names)
+                if hasattr(self, slot_name)]
+
+    def to_python(self):
+        """ Returns the block as a plain dict: nested structures are converted too.
+        """
+        return {key: value.to_python() if isinstance(value, STRUCTURE_TYPES) else value for key, value in self.items()}
+
+    def __reduce__(self):
+        # Generated classes are not importable: pickle the LCONF-Key-Names of the shape instead
+        return _record_from_items, (self._keys, self.name, self.items())
+
+    def __repr__(self):
+        return '<{} {!r}: {} items>'.format(self.__class__.__name__, self.name, len(self))
+
+
+@lru_cache(maxsize=RECORD_CLASSES_CACHE_SIZE)
+def record_class(keys):
+    """
+    #### structure_classes.record_class
+
+    Returns the record class of one block shape: generated on the first call, afterwards the same class while it is
+    one of the RECORD_CLASSES_CACHE_SIZE most recently used ones.
+
+    `record_class(keys)`
+
+    **Parameters:**
+
+    * `keys`: (tuple of str) the LCONF-Key-Names of the block shape: e.g. `SchemaBlock.keys` of a STRICT LCONF-Schema
+
+    **Returns:** (type) a StructureRecord subclass with one slot per LCONF-Key-Name
+
+        A class dropped from the cache is freed with its last record: a later call generates a new class for the same
+        block shape. Records of both classes behave the same: only their `__class__` differs.
+    """
+    keys = tuple([intern(key) for key in keys])
+    slot_names = tuple([
+        key if key.isidentifier() and not iskeyword(key) and key[0] != '_' and not hasattr(StructureRecord, key)
+        else '_item_{}'.format(idx) for idx, key in enumerate(keys)
+    ])
+    cls = type('StructureRecord', (StructureRecord,), {
+        '__slots__': slot_names,
+        '_keys': keys,
+        '_slot_names': slot_names,
+    })
+    cls._slots_by_key = {key: getattr(cls, slot_name) for key, slot_name in zip(keys, slot_names)}
+    return cls
+
+
+def _record_from_items(keys, name, items):
+    """ Helper for `StructureRecord.__reduce__`: unpickles one record.
+    """
+    record = record_class(keys)(name)
+    for key, value in items:
+        record.set_item(key, value)
+    return record
+
+
+class StructureBlocks(list):
+    """ STRUCTURE_NAMED_BLOCKS or STRUCTURE_UNNAMED_BLOCKS: a list of repeated STRUCTURE_SINGLE_BLOCKs.
+
+    For STRUCTURE_NAMED_BLOCKS each StructureSingleBlock has its name: see also `get_block`.
+
+    * `name`: (str) the LCONF-Key-Name
+    * `is_named`: (bool) True for STRUCTURE_NAMED_BLOCKS: False for STRUCTURE_UNNAMED_BLOCKS or if empty
+    """
+    __slots__ = ('name', 'is_named')
+
+    def __init__(self, name, blocks=()):
+        list.__init__(self, blocks)
+        self.name = name
+        self.is_named = False
+
+    def get_block(self, block_name):
+        """ Returns the first STRUCTURE_NAMED_BLOCKS item with the `block_name`: raises a KeyError if not found.
+        """
+        for block in self:
+            if block.name == block_name:
+                return block
+        raise KeyError(block_name)
+
+    def to_python(self):
+        """ Returns STRUCTURE_NAMED_BLOCKS as a dict: STRUCTURE_UNNAMED_BLOCKS as a list of dicts.
+        """
+        if self.is_named:
+            return {block.name: block.to_python() for block in self}
+        return [block.to_python() for block in self]
+
+    def __repr__(self):
+        return '<{} {!r}: {} blocks>'.format(self.__class__.__name__, self.name, len(self))
+
+
+class StructureList(list):
+    """ STRUCTURE_LIST and Compact_STRUCTURE_LIST: a list of LCONF-Values.
+
+    * `name`: (str) the LCONF-Key-Name
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name, items=()):
+        list.__init__(self, items)
+        self.name = name
+
+    def to_python(self):
+        return list(self)
+
+    def __repr__(self):
+        return '<{} {!r}: {} items>'.format(self.__class__.__name__, self.name, len(self))
+
+
+class StructureTable(object):
+    """ STRUCTURE_TABLE: rows of LCONF-Values.
+
+    * `name`: (str) the LCONF-Key-Name
+    * `rows`: (list) of tuples: one LCONF-Value per column
+    """
+    __slots__ = ('name', 'rows')
+
+    def __init__(self, name):
+        self.name = name
+        self.rows = []
+
+    def __getitem__(self, idx):
+        return self.rows[idx]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def to_python(self):
+        return [list(row) for row in self.rows]
+
+    def __repr__(self):
+        return '<{} {!r}: {} rows>'.format(self.__class__.__name__, self.name, len(self.rows))
+
+
+class StructureArray(object):
+    """ STRUCTURE_LIST of one numeric LCONF-Value-Type: the values in one `array.array` or NumPy array.
+
+    Built by `lconf_schema.parse_section_typed` for STRUCTURE_LISTs with the LCONF-Value-Type `TYPE_INTEGER` (`'q'`),
+    `TYPE_FLOAT` (`'d'`) or `TYPE_BOOLEAN` (`'b'`: 0 or 1): one machine value per item instead of a Python object.
+
+    * `name`: (str) the LCONF-Key-Name
+    * `values`: (array.array or numpy.ndarray) the values
+    * `is_boolean`: (bool) True for `TYPE_BOOLEAN`: `to_python` returns `bool` items
+    """
+    __slots__ = ('name', 'values', 'is_boolean')
+
+    def __init__(self, name, values, is_boolean=False):
+        self.name = name
+        self.values = values
+        self.is_boolean = is_boolean
+
+    def __getitem__(self, idx):
+        return self.values[idx]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def to_python(self):
+        if self.is_boolean:
+            return [bool(value) for value in self.values]
+        return self.values.tolist()
+
+    def __repr__(self):
+        values = self.values
+        typecode = values.typecode if isinstance(values, array) else values.dtype.str
+        return '<{} {!r}: {} items ({})>'.format(self.__class__.__name__, self.name, len(values), typecode)
+
+
+class StructureColumnTable(object):
+    """ STRUCTURE_TABLE with a LCONF-Schema: one typed column per LCONF-Schema column.
+
+    Built by `lconf_schema.parse_section_typed`. A column of `TYPE_INTEGER`, `TYPE_FLOAT` or `TYPE_BOOLEAN` without
+    empty cells is an `array.array` like in `StructureArray`: all other columns are lists of LCONF-Values (empty cells
+    are LCONF_EMPTY_STRING).
+
+    If built with NumPy the table is one NumPy structured array `records`: the columns are views of its fields and
+    `to_numpy` returns it without a copy. Columns which are lists are NumPy object fields.
+
+    * `name`: (str) the LCONF-Key-Name
+    * `column_names`: (tuple) the LCONF-Key-Names of the LCONF-Schema columns
+    * `column_types`: (tuple) the LCONF-Value-Types of the columns
+    * `columns`: (tuple) one `array.array`, list or NumPy array per column
+    * `records`: (numpy.ndarray or None) the NumPy structured array
+    """
+    __slots__ = ('name', 'column_names', 'column_types', 'columns', 'records', '_index')
+
+    def __init__(self, name, column_names, column_types, columns, records=None):
+        self.name = name
+        self.column_names = column_names
+        self.column_types = column_types
+        self.columns = columns
+        self.records = records
+        self._index = {column_name: idx for idx, column_name in enumerate(column_names)}
+
+    def column(self, key):
+        """ Returns one column by its LCONF-Key-Name or index: no copy.
+        """
+        if isinstance(key, int):
+            return self.columns[key]
+        return self.columns[self._index[key]]
+
+    def row(self, idx):
+        """ Returns one row as a tuple.
+        """
+        return tuple([column[idx] for column in self.columns])
+
+    def __getitem__(self, idx):
+        """ `table[idx]` returns one row as a tuple: `table[start:stop]` a new StructureColumnTable.
+        """
+        if isinstance(idx, slice):
+            records = None if self.records is None else self.records[idx]
+            if records is None:
+                columns = tuple([column[idx] for column in self.columns])
+            else:
+                columns = tuple([records[column_name] for column_name in self.column_names])
+            return StructureColumnTable(self.name, self.column_names, self.column_types, columns, records)
+        return self.row(idx)
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def __iter__(self):
+        """ Yields the rows as tuples: use `column` for fast column access.
+        """
+        return zip(*self.columns)
+
+    def column_sum(self, key):
+        """ Returns the sum of one column: empty cells are skipped.
+        """
+        column = self._column_values(key)
+        return sum(column) if isinstance(column, (array, list)) else column.sum()
+
+    def column_min(self, key):
+        """ Returns the minimum of one column: empty cells are skipped. Raises ValueError if it has no values.
+        """
+        column = self._column_values(key)
+        return min(column) if isinstance(column, (array, list)) else column.min()
+
+    def column_max(self, key):
+        """ Returns the maximum of one column: empty cells are skipped. Raises ValueError if it has no values.
+        """
+        column = self._column_values(key)
+        return max(column) if isinstance(column, (array, list)) else column.max()
+
+    def _column_values(self, key):
+        """ Helper for `column_sum`, `column_min` and `column_max`: returns the column without its empty cells.
+
+        Native columns (`array.array`, NumPy fields which are not object fields) have no empty cells: no copy.
+        """
+        column = self.column(key)
+        if isinstance(column, array) or (not isinstance(column, list) and column.dtype.kind != 'O'):
+            return column
+        return [value for value in column if value != LCONF_EMPTY_STRING]
+
+    def to_numpy(self):
+        """ Returns the table as NumPy structured array: no copy. Raises an error if built without NumPy.
+        """
+        if self.records is None:
+            raise Err('StructureColumnTable.to_numpy', [
+                'STRUCTURE_TABLE: <{}> was built without NumPy: see `lconf_schema.parse_section_typed`'.format(
+                    self.name),
+            ])
+        return self.records
+
+    def to_python(self):
+        columns = []
+        for column, column_type in zip(self.columns, self.column_types):
+            column = column if isinstance(column, list) else column.tolist()
+            if column_type == TYPE_BOOLEAN:
+                column = [value if value == '' else bool(value) for value in column]
+            columns.append(column)
+        return [list(row) for row in zip(*columns)]
+
+    def __repr__(self):
+        return '<{} {!r}: {} rows, {} columns>'.format(self.__class__.__name__, self.name, len(self),
+                                                      len(self.columns))
+
+
+# Result objects which are not plain LCONF-Values: see `StructureSingleBlock.to_python`
+STRUCTURE_TYPES = (StructureSingleBlock, StructureRecord, StructureBlocks, StructureList, StructureTable,
+                   StructureArray, StructureColumnTable)
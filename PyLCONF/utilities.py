@@ -1,72 +1,141 @@
+# Error codes: `code` of Err and SectionErr
+#   LCONF-Section lines (`line_engine`)
+ERR_TRAILING_SPACE = 'TRAILING_SPACE'
+ERR_INDENTATION_JUMP = 'INDENTATION_JUMP'
+ERR_INDENTATION_MULTIPLE = 'INDENTATION_MULTIPLE'
+ERR_WRONG_LINE = 'WRONG_LINE'
+ERR_KEY_VALUE_SEPARATOR = 'KEY_VALUE_SEPARATOR'
+ERR_IDENTIFIER_SPACE = 'IDENTIFIER_SPACE'
+ERR_IDENTIFIER_KEY_VALUE_SEPARATOR = 'IDENTIFIER_KEY_VALUE_SEPARATOR'
+ERR_TABLE_IDENTIFIER = 'TABLE_IDENTIFIER'
+ERR_LIST_ITEM = 'LIST_ITEM'
+ERR_TABLE_ROW = 'TABLE_ROW'
+ERR_TABLE_COLUMNS = 'TABLE_COLUMNS'
+ERR_BLOCKS_ITEM = 'BLOCKS_ITEM'
+ERR_NAMED_BLOCKS_ITEM = 'NAMED_BLOCKS_ITEM'
+ERR_UNNAMED_BLOCKS_ITEM = 'UNNAMED_BLOCKS_ITEM'
+#   LCONF-Sections
+ERR_SECTION_EXTRACT = 'SECTION_EXTRACT'
+ERR_SECTION_START_LINE = 'SECTION_START_LINE'
+ERR_SECTION_END_LINE = 'SECTION_END_LINE'
+ERR_SECTION_FORMAT = 'SECTION_FORMAT'
+#   LCONF-Schema
+ERR_SCHEMA = 'SCHEMA'
+ERR_SCHEMA_VALUE_TYPE = 'SCHEMA_VALUE_TYPE'
+ERR_SCHEMA_MISSING_KEY = 'SCHEMA_MISSING_KEY'
+ERR_SCHEMA_NOT_EMPTY = 'SCHEMA_NOT_EMPTY'
+ERR_SCHEMA_UNKNOWN_KEY = 'SCHEMA_UNKNOWN_KEY'
+ERR_SCHEMA_DUPLICATE_KEY = 'SCHEMA_DUPLICATE_KEY'
+ERR_SCHEMA_ITEM_TYPE = 'SCHEMA_ITEM_TYPE'
+ERR_SCHEMA_COLUMNS = 'SCHEMA_COLUMNS'
+ERR_SCHEMA_KEY_VALUE_SEPARATOR = 'SCHEMA_KEY_VALUE_SEPARATOR'
+#   Other
+ERR_GENERAL = 'GENERAL'
+
+
 class Err(Exception):
-    """ Prints Project Error.
+    """ Project Error: the message is only formatted by `str()`.
 
     * `error_origin`: (str) to specify from where the error comes.
-    * `info_list`   : (list) list of strings to print as message: each list item starts at a new line.
+    * `info_list`   : (list) list of strings of the message: each list item starts at a new line.
+    * `code`        : (str) one of the `ERR_*` error codes: default ERR_GENERAL
     """
 
-    def __init__(self, error_origin, info_list):
+    def __init__(self, error_origin, info_list, code=ERR_GENERAL):
         Exception.__init__(self, error_origin, info_list)
-        self.__error_origin = error_origin
-        self.__info_list = '\n'.join(info_list)
-        self.__txt = '''
+        self.error_origin = error_origin
+        self.info_list = info_list
+        self.code = code
+
+    def __reduce__(self):
+        return self.__class__, (self.error_origin, self.info_list, self.code)
+
+    @property
+    def message(self):
+        """ The `info_list` in one line.
+        """
+        return ' '.join([info.strip() for info in self.info_list if info.strip()])
+
+    def __str__(self):
+        return '''
 
         ========================================================================
         PyLCONF-ERROR: generated in <{}>
+        Code: <{}>
 
 
         {}
 
         ========================================================================
 
-        '''.format(self.__error_origin, self.__info_list)
-        print(self.__txt)
+        '''.format(self.error_origin, self.code, '\n'.join(self.info_list))
 
 
-class SectionErr(Exception):
-    """ Prints Project Section Error.
+class SectionErr(Err):
+    """ Project Section Error: the message is only formatted by `str()`.
 
     * `error_origin`: (str) to specify from where the error comes.
     * `section_format`: (str) the format of the section.
     * `section_name`: (str) the name of the section.
-    * `section_line`: (str) the line of the section.
-    * `info_list`   : (list) list of strings to print as message: each list item starts at a new line.
+    * `section_line`: (str or UTF-8 bytes) the line of the section: available decoded as `line`
+    * `info_list`   : (list) list of strings of the message: each list item starts at a new line.
+    * `code`        : (str) one of the `ERR_*` error codes: default ERR_GENERAL
+    * `line_number` : (int or None) the number of the line: 1 is the LCONF-Section-Start-Line
+    * `column`      : (int or None) the column (starting at 1) of the error in the line
     """
 
-    def __init__(self, error_origin, section_format, section_name, section_line, info_list):
-        Exception.__init__(self, error_origin, info_list)
-        self.__error_origin = error_origin
-        self.__section_format = section_format
-        self.__section_name = section_name
-        self.__section_line = section_line
-        self.__info_list = '\n'.join(info_list)
-        self.__txt = '''
+    def __init__(self, error_origin, section_format, section_name, section_line, info_list, code=ERR_GENERAL,
+                 line_number=None, column=None):
+        Err.__init__(self, error_origin, info_list, code)
+        self.section_format = section_format
+        self.section_name = section_name
+        self.section_line = section_line
+        self.line_number = line_number
+        self.column = column
+
+    def __reduce__(self):
+        return self.__class__, (self.error_origin, self.section_format, self.section_name, self.section_line,
+                                self.info_list, self.code, self.line_number, self.column)
+
+    @property
+    def line(self):
+        """ The line of the section as `str`.
+        """
+        if isinstance(self.section_line, bytes):
+            return self.section_line.decode('utf-8', 'replace')
+        return self.section_line
+
+    def __str__(self):
+        return '''
 
         ========================================================================
         PyLCONF-ERROR: generated in <{}>
+        Code: <{}>
 
         LCONF-Section-Format: <{}>
         LCONF-Section-Name:   <{}>
 
         {}
 
-        LCONF-Section-Line:
+        LCONF-Section-Line: number: <{}> column: <{}>
 
             <{}>
 
         ========================================================================
 
-        '''.format(self.__error_origin, self.__section_format, self.__section_name, self.__info_list, self.__section_line)
-        print(self.__txt)
+        '''.format(self.error_origin, self.code, self.section_format, self.section_name, '\n'.join(self.info_list),
+                   self.line_number, self.column, self.line)
 
 
 class MethodDeactivatedErr(Exception):
-    """ Prints an own raised Deactivated Error.
+    """ Own raised Deactivated Error.
     """
 
     def __init__(self):
         Exception.__init__(self, 'Method is deactivated.')
-        self.__txt = '''
+
+    def __str__(self):
+        return '''
 
         ========================================================================
         LCONF-MethodDeactivated ERROR:
@@ -77,4 +146,3 @@ class MethodDeactivatedErr(Exception):
         ========================================================================
 
         '''
-        print(self.__txt)
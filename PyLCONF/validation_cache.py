@@ -0,0 +1,225 @@
+"""
+### PyLCONF.validation_cache
+
+#### Overview
+
+`ValidationCache`: A persistent on-disk cache of valid LCONF-Sections: used by `pylconf-validate` and
+`pylconfsd-validate` with `--cache-dir`.
+
+A LCONF-Section is known to be valid if the key of its UTF-8 bytes is in the cache. The key is a hash of the
+LCONF-Section bytes, the PyLCONF version, the kind of the validation and the hash of a LCONF-Schema (if any): a new
+PyLCONF version or another LCONF-Schema never reuses old entries. Only valid LCONF-Sections are stored: not valid ones
+are always validated again to report their current errors.
+
+For each LCONF-File the `st_mtime_ns`, `st_size` and the keys of its LCONF-Sections are stored after all its
+LCONF-Sections were valid: if these did not change and all keys are still cached the file is not read at all.
+
+The cache is one SQLite database (`validation_cache.sqlite` in `cache_dir`) in WAL mode: concurrent runs and worker
+processes use their own connections, each file is written in one short transaction. The number of cached
+LCONF-Sections is bounded: `evict` removes the least recently used ones.
+"""
+from hashlib import blake2b
+from os import (
+    makedirs,
+    stat as os_stat,
+)
+from os.path import join as path_join
+import sqlite3
+from time import time
+
+from PyLCONF import __version__
+
+
+CACHE_FILE_NAME = 'validation_cache.sqlite'
+# Increased if the layout of the database changes: an old database is emptied
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_ENTRIES = 100000
+# Seconds to wait for the lock of a concurrent writer
+LOCK_TIMEOUT = 60.0
+
+# Validation kinds: part of the key
+VALIDATE_FAST = 'fast'
+VALIDATE_SCHEMA = 'schema'
+
+KEY_SIZE = 16
+# SQLite host parameters per `IN (...)` query
+QUERY_CHUNK_SIZE = 500
+
+
+class ValidationCache(object):
+    """ A persistent on-disk cache of valid LCONF-Sections.
+
+    `ValidationCache(cache_dir, max_entries=DEFAULT_MAX_ENTRIES)`
+
+    * `cache_dir`: (str) directory of the cache: created if it does not exist
+    * `max_entries`: (int) maximum number of cached LCONF-Sections kept by `evict`
+
+    * `hits`, `misses`: (int) number of LCONF-Sections found / not found in the cache
+    * `unchanged_files`: (int) number of files which were not read because they did not change
+    * `saved_seconds`: (float) the sum of the validation times of the hits when they were validated
+    """
+    __slots__ = ('cache_dir', 'max_entries', 'hits', 'misses', 'unchanged_files', 'saved_seconds', '_connection',
+                 '_version_digest')
+
+    def __init__(self, cache_dir, max_entries=DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.unchanged_files = 0
+        self.saved_seconds = 0.0
+        self._version_digest = __version__.encode('utf-8') + b'\x00'
+
+        makedirs(cache_dir, exist_ok=True)
+        self._connection = connection = sqlite3.connect(path_join(cache_dir, CACHE_FILE_NAME), timeout=LOCK_TIMEOUT,
+                                                        isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        with self._write():
+            if connection.execute('PRAGMA user_version').fetchone()[0] != CACHE_FORMAT_VERSION:
+                connection.execute('DROP TABLE IF EXISTS sections')
+                connection.execute('DROP TABLE IF EXISTS files')
+                connection.execute('PRAGMA user_version = {:d}'.format(CACHE_FORMAT_VERSION))
+            connection.execute('CREATE TABLE IF NOT EXISTS sections '
+                               '(key BLOB PRIMARY KEY, seconds REAL, last_used REAL) WITHOUT ROWID')
+            connection.execute('CREATE INDEX IF NOT EXISTS sections_last_used ON sections (last_used)')
+            connection.execute('CREATE TABLE IF NOT EXISTS files '
+                               '(path TEXT PRIMARY KEY, kind TEXT, mtime_ns INTEGER, size INTEGER, keys BLOB, '
+                               'names TEXT)')
+
+    def _write(self):
+        """ Returns a context manager for one write transaction: waits for concurrent writers.
+        """
+        return _WriteTransaction(self._connection)
+
+    def section_key(self, section_bytes, validation_kind, schema_digest=b''):
+        """ Returns the key (bytes) of one LCONF-Section.
+
+        * `section_bytes`: (bytes, bytearray, mmap slice or memoryview) the UTF-8 bytes of the LCONF-Section
+        * `validation_kind`: (str) e.g. `VALIDATE_FAST`
+        * `schema_digest`: (bytes) hash of the LCONF-Schema the LCONF-Section is validated with (`LconfSchema.digest`): empty
+            for none
+        """
+        hash_obj = blake2b(self._version_digest, digest_size=KEY_SIZE)
+        hash_obj.update(validation_kind.encode('utf-8'))
+        hash_obj.update(b'\x00')
+        hash_obj.update(schema_digest)
+        hash_obj.update(b'\x00')
+        hash_obj.update(section_bytes)
+        return hash_obj.digest()
+
+    def unchanged_file_sections(self, path, validation_kind):
+        """ Returns the LCONF-Section-Names of a not changed LCONF-File whose LCONF-Sections are all cached or None.
+
+        Counts a hit for each LCONF-Section: the file does not need to be read.
+        """
+        try:
+            stat_result = os_stat(path)
+        except OSError:
+            return None
+        row = self._connection.execute('SELECT mtime_ns, size, keys, names FROM files WHERE path = ? AND kind = ?',
+                                       (path, validation_kind)).fetchone()
+        if row is None or row[0] != stat_result.st_mtime_ns or row[1] != stat_result.st_size:
+            return None
+        keys = [row[2][idx:idx + KEY_SIZE] for idx in range(0, len(row[2]), KEY_SIZE)]
+        seconds = self._cached_seconds(keys)
+        if seconds is None:
+            return None
+        with self._write():
+            self._touch(keys)
+        self.hits += len(keys)
+        self.unchanged_files += 1
+        self.saved_seconds += seconds
+        return row[3].split('\n') if keys else []
+
+    def _cached_seconds(self, keys):
+        """ Returns the sum of the stored validation times if all `keys` are cached else None.
+        """
+        # NOTE: a LCONF-File may contain the same LCONF-Section more than once
+        keys = list(set(keys))
+        total_seconds = 0.0
+        found = 0
+        for idx in range(0, len(keys), QUERY_CHUNK_SIZE):
+            chunk = keys[idx:idx + QUERY_CHUNK_SIZE]
+            count, seconds = self._connection.execute(
+                'SELECT COUNT(*), TOTAL(seconds) FROM sections WHERE key IN ({})'.format(','.join('?' * len(chunk))),
+                chunk).fetchone()
+            found += count
+            total_seconds += seconds
+        if found != len(keys):
+            return None
+        return total_seconds
+
+    def is_valid(self, key):
+        """ Returns True if the LCONF-Section of `key` is cached as valid: counts a hit or a miss.
+
+        The last use time of a hit is updated with the next `store_file`.
+        """
+        row = self._connection.execute('SELECT seconds FROM sections WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return False
+        self.hits += 1
+        self.saved_seconds += row[0]
+        return True
+
+    def store_file(self, path, validation_kind, stat_result, section_names, keys, new_valid):
+        """ Stores the results of one LCONF-File in one transaction.
+
+        * `stat_result`: `os.stat` result of the file taken before it was read: None to not store the file
+        * `section_names`, `keys`: of all its LCONF-Sections
+        * `new_valid`: list of (key, seconds) of the LCONF-Sections which were validated without error
+        """
+        with self._write():
+            now = time()
+            self._connection.executemany('INSERT OR REPLACE INTO sections (key, seconds, last_used) VALUES (?, ?, ?)',
+                                         [(key, seconds, now) for key, seconds in new_valid])
+            self._touch(keys, now)
+            if stat_result is None:
+                self._connection.execute('DELETE FROM files WHERE path = ? AND kind = ?', (path, validation_kind))
+            else:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO files (path, kind, mtime_ns, size, keys, names) VALUES (?, ?, ?, ?, ?, ?)',
+                    (path, validation_kind, stat_result.st_mtime_ns, stat_result.st_size, b''.join(keys),
+                     '\n'.join(section_names)))
+
+    def _touch(self, keys, now=None):
+        if now is None:
+            now = time()
+        self._connection.executemany('UPDATE sections SET last_used = ? WHERE key = ?', [(now, key) for key in keys])
+
+    def evict(self):
+        """ Removes the least recently used LCONF-Sections above `max_entries`.
+
+        **Returns:** (int) the number of removed LCONF-Sections
+        """
+        with self._write():
+            count = self._connection.execute('SELECT COUNT(*) FROM sections').fetchone()[0]
+            if count <= self.max_entries:
+                return 0
+            self._connection.execute(
+                'DELETE FROM sections WHERE key IN (SELECT key FROM sections ORDER BY last_used LIMIT ?)',
+                (count - self.max_entries,))
+        return count - self.max_entries
+
+    def close(self):
+        self._connection.close()
+
+    def __repr__(self):
+        return '<{} {!r}: {} hits, {} misses>'.format(self.__class__.__name__, self.cache_dir, self.hits, self.misses)
+
+
+class _WriteTransaction(object):
+    """ One `BEGIN IMMEDIATE` transaction: committed on success else rolled back.
+    """
+    __slots__ = ('_connection',)
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __enter__(self):
+        self._connection.execute('BEGIN IMMEDIATE')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._connection.execute('COMMIT' if exc_type is None else 'ROLLBACK')
+        return False
@@ -7,13 +7,94 @@ This module is used by the PyLCONF validation script: `pylconf-validate`
 
 ```bash
 pylconf-validate path-to-first.lconf path-to-second.lconf
+pylconf-validate --jobs 8 --format jsonl configs/*.lconf
+pylconf-validate --all path-to-first.lconf
+pylconf-validate --cache-dir .lconf_cache configs/*.lconf
+pylconf-validate --stats path-to-slow.lconf
 ```
+
+Each LCONF-Section is validated like `validate_one_section_fast`: one result per LCONF-Section (or per file if the
+file can not be read or its LCONF-Sections can not be extracted). With `--all` all errors of a LCONF-Section are
+reported from one pass: one result per error. With `--jobs N` the files are validated by a pool
+of N processes: results are written as soon as a file is done, not in the order of the arguments. Each file is one
+task: only with more than JOBS_FILES_PER_WORKER files per process several files are sent per task (see
+`jobs_chunk_size`), their results are then written together.
+
+`--format jsonl` writes one JSON object per line:
+
+```json
+{"file": "a.lconf", "section": "Example1", "status": "ok", "seconds": 0.0012}
+{"file": "b.lconf", "section": null, "status": "error", "seconds": 0.0001, "error": "...", "code": "SECTION_EXTRACT"}
+{"file": "c.lconf", "section": "Example2", "status": "error", "seconds": 0.0003, "error": "...",
+ "code": "TRAILING_SPACE", "line_number": 7}
+```
+
+`code` is the `utilities.ERR_*` error code: `line_number` (the line number in the file) is only written for errors
+of one LCONF-Section line.
+
+With `--cache-dir` valid LCONF-Sections are cached on disk (see `validation_cache.ValidationCache`): unchanged
+LCONF-Sections are not validated again and unchanged files are not read. Their results have `"cached": true` and the
+hit / miss counts are written to stderr.
+
+With `--stats [N]` each LCONF-Section is validated with an active `profiling.ValidationProfile`: the phase breakdown,
+the lines per line kind and the N (default: 10) heaviest LCONF-Sections are written to stderr after the results.
+Profiled validation is slower than the normal one: see `profiling`.
+
+Exit code: 0 if all LCONF-Sections are valid else 1.
 """
 import argparse
 from argparse import RawDescriptionHelpFormatter
-from sys import exit as sys_exit
+from functools import partial
+from json import dumps as json_dumps
+from multiprocessing import Pool
+import sqlite3
+from os import (
+    cpu_count,
+    stat as os_stat,
+)
+from sys import (
+    exit as sys_exit,
+    stderr as sys_stderr,
+    stdout as sys_stdout,
+)
+from time import perf_counter
+
+from PyLCONF.lconf_section import (
+    extract_sections,
+    section_bytes_from_span,
+    validate_one_section_fast,
+)
+from PyLCONF import profiling
+from PyLCONF.profiling import (
+    DEFAULT_REPORT_SECTIONS,
+    ValidationProfile,
+)
+from PyLCONF.utilities import (
+    ERR_GENERAL,
+    Err,
+)
+from PyLCONF.validation_cache import (
+    DEFAULT_MAX_ENTRIES,
+    VALIDATE_FAST,
+    ValidationCache,
+)
+
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+
+# `jobs_chunk_size`: up to this number of files per worker process each file is one task
+JOBS_FILES_PER_WORKER = 64
+# `jobs_chunk_size`: the most files sent to a worker process per task
+JOBS_MAX_CHUNK_SIZE = 8
+
 
-from PyLCONF.lconf_section import validate_sections_from_file
+def jobs_chunk_size(files_count, jobs):
+    """ Returns the number of files sent to a worker process per task: 1 (results per file as they finish) unless there
+    are more than JOBS_FILES_PER_WORKER files per worker process: then up to JOBS_MAX_CHUNK_SIZE to lower the
+    inter-process overhead of many small files.
+    """
+    return max(1, min(JOBS_MAX_CHUNK_SIZE, files_count // (jobs * JOBS_FILES_PER_WORKER)))
 
 
 def parse_commandline():
@@ -22,6 +103,10 @@ def parse_commandline():
        formatter_class=RawDescriptionHelpFormatter,
        epilog='''EXAMPLES:
     pylconf-validate path-to-first.lconf path-to-second.lconf
+    pylconf-validate --jobs 8 --format jsonl path-to-first.lconf path-to-second.lconf
+    pylconf-validate --all path-to-first.lconf
+    pylconf-validate --cache-dir .lconf_cache path-to-first.lconf path-to-second.lconf
+    pylconf-validate --stats path-to-slow.lconf
     '''
     )
 
@@ -31,22 +116,260 @@ def parse_commandline():
        default=[],
        help='List of files to be validates',
     )
+    main_parser.add_argument(
+       '-j', '--jobs',
+       type=int,
+       default=1,
+       help='Number of worker processes: 0 uses one per CPU (default: 1: no worker processes)',
+    )
+    main_parser.add_argument(
+       '-f', '--format',
+       choices=('text', 'jsonl'),
+       default='text',
+       help='Output format (default: text)',
+    )
+    main_parser.add_argument(
+       '-a', '--all',
+       action='store_true',
+       help='Report all errors of each LCONF-Section instead of only the first one',
+    )
+    main_parser.add_argument(
+       '--cache-dir',
+       default=None,
+       help='Directory of the validation cache: unchanged LCONF-Sections are not validated again (default: no cache)',
+    )
+    main_parser.add_argument(
+       '--cache-size',
+       type=int,
+       default=DEFAULT_MAX_ENTRIES,
+       help='Maximum number of LCONF-Sections kept in the validation cache (default: {})'.format(DEFAULT_MAX_ENTRIES),
+    )
+    main_parser.add_argument(
+       '--stats',
+       type=int,
+       nargs='?',
+       const=DEFAULT_REPORT_SECTIONS,
+       default=None,
+       metavar='N',
+       help='Profile the validation: write the phase breakdown and the N heaviest LCONF-Sections to stderr '
+            '(default N: {})'.format(DEFAULT_REPORT_SECTIONS),
+    )
 
     args = main_parser.parse_args()
     if not args.in_files:
         main_parser.print_help()
         sys_exit()
+    if args.jobs < 0:
+        main_parser.error('--jobs must be 0 or a positive number')
+    if args.stats is not None and args.stats < 1:
+        main_parser.error('--stats must be a positive number')
 
     return args
 
 
+def _set_error(result, err):
+    """ Sets the message of one raised error in one line, its code and line number in `result`.
+    """
+    result['status'] = STATUS_ERROR
+    if isinstance(err, Err):
+        result['error'] = err.message
+        result['code'] = err.code
+        if getattr(err, 'line_number', None) is not None:
+            result['line_number'] = err.line_number
+    else:
+        result['error'] = '{}: {}'.format(err.__class__.__name__, err)
+        result['code'] = ERR_GENERAL
+    return result
+
+
+def validate_file_results(path_to_lconf_file, collect_all=False, cache=None):
+    """
+    #### validator.validate_file_results
+
+    Validates all LCONF-Sections of one LCONF-File: never raises.
+
+    `validate_file_results(path_to_lconf_file, collect_all=False, cache=None)`
+
+    **Parameters:**
+
+    * `path_to_lconf_file`: (str) path to a LCONF-File
+    * `collect_all`: (bool) if True one result per error: all errors of a LCONF-Section are found in one pass: see
+        `lconf_section.validate_one_section_fast`
+    * `cache`: (ValidationCache) optional: cached LCONF-Sections are not validated, new valid ones are stored
+
+    **Returns:** (list) of result dicts with the keys `file`, `section`, `status`, `seconds` and for errors `error`,
+        `code` and optional `line_number`: for LCONF-Sections found in the `cache` `cached` (True)
+    """
+    if cache is not None:
+        section_names = cache.unchanged_file_sections(path_to_lconf_file, VALIDATE_FAST)
+        if section_names is not None:
+            return [
+                {'file': path_to_lconf_file, 'section': section_name, 'status': STATUS_OK, 'seconds': 0.0,
+                 'cached': True}
+                for section_name in section_names
+            ]
+
+    results = []
+    start_time = perf_counter()
+    profile = profiling.active_profile
+    try:
+        stat_result = os_stat(path_to_lconf_file)
+        with open(path_to_lconf_file, 'rb') as file_obj:
+            buffer = file_obj.read()
+        if profile is not None:
+            profile.start_file(path_to_lconf_file, len(buffer))
+            extract_start_time = perf_counter()
+        section_spans = extract_sections(buffer, as_spans=True)
+        if profile is not None:
+            profile.add_extract(perf_counter() - extract_start_time)
+    except Exception as err:
+        return [_set_error({
+            'file': path_to_lconf_file,
+            'section': None,
+            'seconds': perf_counter() - start_time,
+        }, err)]
+
+    # cache: the keys of all LCONF-Sections and (key, seconds) of the new valid ones
+    keys = []
+    new_valid = []
+    is_valid = True
+    # Line number of the LCONF-Section-Start-Line: the newlines are counted once from span to span
+    line_number = 1
+    count_from_idx = 0
+    for section_span in section_spans:
+        line_number += buffer.count(b'\n', count_from_idx, section_span[0])
+        count_from_idx = section_span[0]
+        start_time = perf_counter()
+        result = {'file': path_to_lconf_file, 'section': section_span[2], 'status': STATUS_OK}
+        section_bytes = section_bytes_from_span(buffer, section_span)
+        if cache is not None:
+            key = cache.section_key(section_bytes, VALIDATE_FAST)
+            keys.append(key)
+            if cache.is_valid(key):
+                result['seconds'] = perf_counter() - start_time
+                result['cached'] = True
+                results.append(result)
+                continue
+        try:
+            errors = validate_one_section_fast(section_bytes, None, collect_all, line_number)
+        except Exception as err:
+            errors = [err]
+        result['seconds'] = perf_counter() - start_time
+        if errors is True or not errors:
+            results.append(result)
+            if cache is not None:
+                new_valid.append((key, result['seconds']))
+        else:
+            is_valid = False
+            results.extend(_set_error(dict(result), err) for err in errors)
+
+    if cache is not None:
+        cache.store_file(path_to_lconf_file, VALIDATE_FAST, stat_result if is_valid else None,
+                         [section_span[2] for section_span in section_spans], keys, new_valid)
+    return results
+
+
+# Worker processes: one ValidationCache per process
+_cache = None
+
+
+def _validate_file_task(path_to_lconf_file, collect_all, cache_dir, cache_size, stats):
+    """ Helper for `main`: returns the results of one file, the cache counts `(hits, misses, unchanged_files,
+    saved_seconds)` of it and if `stats` its `ValidationProfile` else None.
+    """
+    if not stats:
+        return _validate_file_cached(path_to_lconf_file, collect_all, cache_dir, cache_size) + (None,)
+    with ValidationProfile() as profile:
+        results, cache_counts = _validate_file_cached(path_to_lconf_file, collect_all, cache_dir, cache_size)
+    return results, cache_counts, profile
+
+
+def _validate_file_cached(path_to_lconf_file, collect_all, cache_dir, cache_size):
+    """ Helper for `_validate_file_task`: returns the results of one file and the cache counts of it.
+    """
+    global _cache
+    if cache_dir is None:
+        return validate_file_results(path_to_lconf_file, collect_all), (0, 0, 0, 0.0)
+    if _cache is None:
+        _cache = ValidationCache(cache_dir, cache_size)
+    before = (_cache.hits, _cache.misses, _cache.unchanged_files, _cache.saved_seconds)
+    try:
+        results = validate_file_results(path_to_lconf_file, collect_all, _cache)
+    except sqlite3.Error as err:
+        # The cache could not be read or written: validate without it
+        sys_stderr.write('pylconf-validate: cache error: {}: {}\n'.format(path_to_lconf_file, err))
+        results = validate_file_results(path_to_lconf_file, collect_all)
+    return results, (_cache.hits - before[0], _cache.misses - before[1], _cache.unchanged_files - before[2],
+                     _cache.saved_seconds - before[3])
+
+
+def _write_text(results, out):
+    for result in results:
+        if result['status'] == STATUS_OK:
+            out.write('{}: <{}>: OK ({})\n'.format(
+                result['file'], result['section'],
+                'cached' if result.get('cached') else '{:.4f} s'.format(result['seconds'])))
+        elif result['section'] is None:
+            out.write('{}: ERROR: {}\n'.format(result['file'], result['error']))
+        else:
+            out.write('{}: <{}>: ERROR: {}{}\n'.format(
+                result['file'], result['section'],
+                'line {}: '.format(result['line_number']) if 'line_number' in result else '', result['error']))
+
+
+def _write_jsonl(results, out):
+    for result in results:
+        out.write(json_dumps(result))
+        out.write('\n')
+
+
 def main():
     args = parse_commandline()
+    write_results = _write_jsonl if args.format == 'jsonl' else _write_text
+
+    validate_task = partial(_validate_file_task, collect_all=args.all, cache_dir=args.cache_dir,
+                            cache_size=args.cache_size, stats=args.stats is not None)
+    profile = ValidationProfile() if args.stats is not None else None
+
+    jobs = args.jobs or cpu_count() or 1
+    is_valid = True
+    # hits, misses, unchanged_files, saved_seconds
+    cache_counts = [0, 0, 0, 0.0]
+    if jobs == 1:
+        results_per_file = map(validate_task, args.in_files)
+        pool = None
+    else:
+        jobs = min(jobs, len(args.in_files))
+        pool = Pool(jobs)
+        results_per_file = pool.imap_unordered(validate_task, args.in_files,
+                                               jobs_chunk_size(len(args.in_files), jobs))
+    try:
+        for results, file_cache_counts, file_profile in results_per_file:
+            write_results(results, sys_stdout)
+            sys_stdout.flush()
+            if any(result['status'] != STATUS_OK for result in results):
+                is_valid = False
+            for idx, count in enumerate(file_cache_counts):
+                cache_counts[idx] += count
+            if file_profile is not None:
+                profile.merge(file_profile)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
 
-    for path_to_lconf_file in args.in_files:
-        validate_sections_from_file(path_to_lconf_file)
+    if args.cache_dir is not None:
+        cache = ValidationCache(args.cache_dir, args.cache_size)
+        evicted = cache.evict()
+        cache.close()
+        sys_stderr.write('pylconf-validate: cache: {} hits, {} misses, {} unchanged files, {} evicted: saved {:.4f} s '
+                         'of validation\n'.format(cache_counts[0], cache_counts[1], cache_counts[2], evicted,
+                                                  cache_counts[3]))
+    if profile is not None:
+        sys_stderr.write(profile.format_report(args.stats))
+    return 0 if is_valid else 1
 
 
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
 if __name__ == '__main__':
-    main()
+    sys_exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF benchmark corpus generator
+
+```bash
+python3 benchmarks/corpus.py -o corpus.lconf
+python3 benchmarks/corpus.py --sections 100 --depth 3 --fanout 4 --indentation 2 -o corpus.lconf
+```
+
+Generates a synthetic LCONF-File and the matching LCONF-Schema-File (`corpus.lconfsd`: one `STRICT`
+LCONF-Schema-Section per LCONF-Section of the same name). The structure is fixed by the knobs, the LCONF-Values are
+random (`--seed`).
+
+Each STRUCTURE_SINGLE_BLOCK (and the root of each LCONF-Section) contains:
+
+* `--pairs` LCONF-Key-Value-Pairs: the LCONF-Value-Types rotate `TYPE_STRING`, `TYPE_INTEGER`, `TYPE_FLOAT`,
+    `TYPE_BOOLEAN`
+* a STRUCTURE_LIST of `--list-length` integers and a Compact_STRUCTURE_LIST of the same integers
+* a STRUCTURE_TABLE of `--table-rows` rows and `--table-columns` columns
+* while the nesting level is below `--depth`: a STRUCTURE_SINGLE_BLOCK, a STRUCTURE_NAMED_BLOCKS and a
+    STRUCTURE_UNNAMED_BLOCKS each with `--fanout` blocks: all of the same content one level deeper
+
+Before each item a LCONF-Section-Comment-Line is written with the probability `--comment-density`.
+
+`build_corpus` returns the same data as plain Python objects (dict, list, str, int, float, bool): used by
+`run_benchmarks.py` to compare with `json` and `tomllib`.
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from os.path import splitext
+from random import Random
+from sys import (
+    exit as sys_exit,
+    stdout as sys_stdout,
+)
+
+
+DEFAULT_SECTIONS = 20
+DEFAULT_DEPTH = 2
+DEFAULT_PAIRS = 10
+DEFAULT_LIST_LENGTH = 20
+DEFAULT_TABLE_ROWS = 20
+DEFAULT_TABLE_COLUMNS = 4
+DEFAULT_FANOUT = 3
+DEFAULT_COMMENT_DENSITY = 0.1
+DEFAULT_INDENTATION = 4
+DEFAULT_SEED = 1
+
+PAIR_TYPES = ('TYPE_STRING', 'TYPE_INTEGER', 'TYPE_FLOAT', 'TYPE_BOOLEAN')
+WORDS = ('alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'iota', 'kappa', 'lambda', 'mu')
+
+
+class CorpusOptions(object):
+    """ The knobs of one generated corpus.
+
+    `CorpusOptions(sections=DEFAULT_SECTIONS, depth=DEFAULT_DEPTH, pairs=DEFAULT_PAIRS, list_length=DEFAULT_LIST_LENGTH,
+        table_rows=DEFAULT_TABLE_ROWS, table_columns=DEFAULT_TABLE_COLUMNS, fanout=DEFAULT_FANOUT,
+        comment_density=DEFAULT_COMMENT_DENSITY, indentation=DEFAULT_INDENTATION, seed=DEFAULT_SEED)`
+    """
+    __slots__ = ('sections', 'depth', 'pairs', 'list_length', 'table_rows', 'table_columns', 'fanout',
+                 'comment_density', 'indentation', 'seed')
+
+    def __init__(self, sections=DEFAULT_SECTIONS, depth=DEFAULT_DEPTH, pairs=DEFAULT_PAIRS,
+                 list_length=DEFAULT_LIST_LENGTH, table_rows=DEFAULT_TABLE_ROWS, table_columns=DEFAULT_TABLE_COLUMNS,
+                 fanout=DEFAULT_FANOUT, comment_density=DEFAULT_COMMENT_DENSITY, indentation=DEFAULT_INDENTATION,
+                 seed=DEFAULT_SEED):
+        if not 2 <= indentation <= 8:
+            raise ValueError('indentation must be 2 to 8: got {}'.format(indentation))
+        self.sections = sections
+        self.depth = depth
+        self.pairs = pairs
+        self.list_length = list_length
+        self.table_rows = table_rows
+        self.table_columns = table_columns
+        self.fanout = fanout
+        self.comment_density = comment_density
+        self.indentation = indentation
+        self.seed = seed
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _Generator(object):
+    """ Helper for `build_corpus`: writes the lines of the LCONF-Sections and builds their Python data.
+    """
+    __slots__ = ('options', 'random', 'lines')
+
+    def __init__(self, options):
+        self.options = options
+        self.random = Random(options.seed)
+        self.lines = []
+
+    def _comment(self, indent):
+        if self.options.comment_density and self.random.random() < self.options.comment_density:
+            self.lines.append('{}# {}'.format(indent, self.random.choice(WORDS)))
+
+    def _value(self, value_type):
+        if value_type == 'TYPE_STRING':
+            return ' '.join(self.random.choice(WORDS) for _ in range(self.random.randint(1, 4)))
+        elif value_type == 'TYPE_INTEGER':
+            return self.random.randint(-100000, 100000)
+        elif value_type == 'TYPE_FLOAT':
+            return round(self.random.uniform(-1000.0, 1000.0), 3)
+        return self.random.random() < 0.5
+
+    def block(self, level, indent_level):
+        """ Writes the items of one STRUCTURE_SINGLE_BLOCK of nesting `level` indented by `indent_level`: returns its
+        data (dict).
+        """
+        options = self.options
+        indent = ' ' * (options.indentation * indent_level)
+        item_indent = ' ' * (options.indentation * (indent_level + 1))
+        lines = self.lines
+        data = {}
+
+        for idx in range(options.pairs):
+            self._comment(indent)
+            key = 'key_{}'.format(idx)
+            data[key] = value = self._value(PAIR_TYPES[idx % len(PAIR_TYPES)])
+            lines.append('{}{} :: {}'.format(indent, key, lconf_value(value)))
+
+        self._comment(indent)
+        # NOTE: a STRUCTURE_LIST value must not start with a STRUCTURE_LIST_IDENTIFIER: no negative numbers
+        data['numbers'] = numbers = [abs(self._value('TYPE_INTEGER')) for _ in range(options.list_length)]
+        lines.append('{}- numbers'.format(indent))
+        lines.extend('{}{}'.format(item_indent, number) for number in numbers)
+        self._comment(indent)
+        data['compact_numbers'] = list(numbers)
+        if numbers:
+            lines.append('{}- compact_numbers :: {}'.format(indent, ','.join(str(number) for number in numbers)))
+        else:
+            lines.append('{}- compact_numbers'.format(indent))
+
+        self._comment(indent)
+        column_types = [PAIR_TYPES[(idx + 1) % len(PAIR_TYPES)] for idx in range(options.table_columns)]
+        rows = [[self._value(column_type) for column_type in column_types] for _ in range(options.table_rows)]
+        data['table'] = {'columns': ['column_{}'.format(idx) for idx in range(options.table_columns)], 'rows': rows}
+        lines.append('{}| table'.format(indent))
+        lines.extend('{}|{}|'.format(item_indent, '|'.join(lconf_value(value) for value in row)) for row in rows)
+
+        if level < options.depth:
+            self._comment(indent)
+            lines.append('{}. block'.format(indent))
+            data['block'] = self.block(level + 1, indent_level + 1)
+
+            self._comment(indent)
+            lines.append('{}* named_blocks'.format(indent))
+            data['named_blocks'] = named_blocks = {}
+            for idx in range(options.fanout):
+                lines.append('{}. block_{}'.format(item_indent, idx))
+                named_blocks['block_{}'.format(idx)] = self.block(level + 1, indent_level + 2)
+
+            self._comment(indent)
+            lines.append('{}* unnamed_blocks'.format(indent))
+            data['unnamed_blocks'] = unnamed_blocks = []
+            for _ in range(options.fanout):
+                lines.append('{}.'.format(item_indent))
+                unnamed_blocks.append(self.block(level + 1, indent_level + 2))
+        return data
+
+
+def lconf_value(value):
+    """ Returns the LCONF text of one generated LCONF-Value.
+    """
+    if value is True:
+        return 'true'
+    elif value is False:
+        return 'false'
+    return str(value)
+
+
+def section_name(idx):
+    return 'Section {}'.format(idx)
+
+
+def build_corpus(options):
+    """
+    #### corpus.build_corpus
+
+    Generates the LCONF-File text of `options`.
+
+    `build_corpus(options)`
+
+    **Returns:** (tuple) `(lconf_text, data)`: `data` is a dict LCONF-Section-Name: the data of the LCONF-Section
+    """
+    generator = _Generator(options)
+    data = {}
+    for idx in range(options.sections):
+        generator.lines.append('___SECTION :: {} :: LCONF :: {}'.format(options.indentation, section_name(idx)))
+        data[section_name(idx)] = generator.block(0, 0)
+        generator.lines.append('___END')
+        generator.lines.append('')
+    return '\n'.join(generator.lines), data
+
+
+def _schema_block(options, level, indent_level, lines):
+    """ Helper for `build_schema`: the LCONF-Schema items of one STRUCTURE_SINGLE_BLOCK generated at `level`.
+    """
+    indent = ' ' * (options.indentation * indent_level)
+    item_indent = ' ' * (options.indentation * (indent_level + 1))
+    for idx in range(options.pairs):
+        lines.append('{}key_{} :: REQUIRED | {}'.format(indent, idx, PAIR_TYPES[idx % len(PAIR_TYPES)]))
+    for key in ('numbers', 'compact_numbers'):
+        lines.append('{}. {} | STRUCTURE_LIST'.format(indent, key))
+        lines.append('{}ITEM :: OPTIONAL | TYPE_INTEGER'.format(item_indent))
+    if options.table_columns:
+        lines.append('{}. table | STRUCTURE_TABLE'.format(indent))
+        for idx in range(options.table_columns):
+            lines.append('{}column_{} :: OPTIONAL | {}'.format(item_indent, idx,
+                                                               PAIR_TYPES[(idx + 1) % len(PAIR_TYPES)]))
+    if level < options.depth:
+        for key, structure_type in (('block', 'STRUCTURE_SINGLE_BLOCK'), ('named_blocks', 'STRUCTURE_NAMED_BLOCKS'),
+                                    ('unnamed_blocks', 'STRUCTURE_UNNAMED_BLOCKS')):
+            lines.append('{}. {} | {}'.format(indent, key, structure_type))
+            # The items of a repeated block are one level deeper in the LCONF-Section: not in the LCONF-Schema
+            _schema_block(options, level + 1, indent_level + 1, lines)
+
+
+def build_schema(options):
+    """
+    #### corpus.build_schema
+
+    Generates the LCONF-Schema-File text of `options`: one `STRICT` LCONF-Schema-Section per LCONF-Section.
+
+    `build_schema(options)`
+
+    **Returns:** (str) the LCONF-Schema-File text
+    """
+    lines = []
+    for idx in range(options.sections):
+        lines.append('___SECTION :: {} :: STRICT :: {}'.format(options.indentation, section_name(idx)))
+        _schema_block(options, 0, 0, lines)
+        lines.append('___END')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def add_corpus_arguments(parser):
+    """ Adds the knobs of `CorpusOptions` to an `argparse.ArgumentParser`.
+    """
+    parser.add_argument('--sections', type=int, default=DEFAULT_SECTIONS, help='Number of LCONF-Sections')
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH,
+                        help='Nesting depth of STRUCTURE_SINGLE_BLOCKs and repeated blocks')
+    parser.add_argument('--pairs', type=int, default=DEFAULT_PAIRS, help='LCONF-Key-Value-Pairs per block')
+    parser.add_argument('--list-length', type=int, default=DEFAULT_LIST_LENGTH, help='Items per STRUCTURE_LIST')
+    parser.add_argument('--table-rows', type=int, default=DEFAULT_TABLE_ROWS, help='Rows per STRUCTURE_TABLE')
+    parser.add_argument('--table-columns', type=int, default=DEFAULT_TABLE_COLUMNS,
+                        help='Columns per STRUCTURE_TABLE')
+    parser.add_argument('--fanout', type=int, default=DEFAULT_FANOUT,
+                        help='Blocks per STRUCTURE_NAMED_BLOCKS / STRUCTURE_UNNAMED_BLOCKS')
+    parser.add_argument('--comment-density', type=float, default=DEFAULT_COMMENT_DENSITY,
+                        help='Probability of a comment line before each item')
+    parser.add_argument('--indentation', type=int, default=DEFAULT_INDENTATION, choices=range(2, 9),
+                        help='LCONF-Indentation-Per-Level: 2 to 8')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Seed of the random LCONF-Values')
+
+
+def corpus_options_from_args(args):
+    return CorpusOptions(args.sections, args.depth, args.pairs, args.list_length, args.table_rows,
+                         args.table_columns, args.fanout, args.comment_density, args.indentation, args.seed)
+
+
+def main():
+    main_parser = argparse.ArgumentParser(
+       description='Generate a synthetic LCONF-File and its LCONF-Schema-File',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    python3 benchmarks/corpus.py -o corpus.lconf
+    python3 benchmarks/corpus.py --sections 100 --depth 3 --fanout 4 --indentation 2 -o corpus.lconf
+    '''
+    )
+    add_corpus_arguments(main_parser)
+    main_parser.add_argument('-o', '--output', required=True,
+                             help='LCONF-File: the LCONF-Schema-File is written next to it with the extension .lconfsd')
+    args = main_parser.parse_args()
+    options = corpus_options_from_args(args)
+
+    lconf_text, _ = build_corpus(options)
+    schema_path = splitext(args.output)[0] + '.lconfsd'
+    with open(args.output, 'w', encoding='utf-8') as file_obj:
+        file_obj.write(lconf_text)
+    with open(schema_path, 'w', encoding='utf-8') as file_obj:
+        file_obj.write(build_schema(options))
+    sys_stdout.write('{}: {} bytes, {} lines: {}\n'.format(args.output, len(lconf_text.encode('utf-8')),
+                                                           lconf_text.count('\n') + 1, schema_path))
+    return 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF benchmark harness
+
+```bash
+python3 benchmarks/run_benchmarks.py
+python3 benchmarks/run_benchmarks.py --sections 100 --depth 3 --output results.json
+python3 benchmarks/run_benchmarks.py --lconf path-to.lconf --schema path-to.lconfsd
+python3 benchmarks/run_benchmarks.py --pure-python --output pure.json
+python3 benchmarks/run_benchmarks.py --compare old.json new.json
+```
+
+Measures each function separately on a corpus generated by `corpus.py` (same knobs) or on given files: the best time of
+`--repeat` runs over all LCONF-Sections, reported as MB/s and lines/s of the input. The peak memory is measured in one
+extra run with `tracemalloc`: the peak of the memory allocated by the function (the input is not counted). Like
+`timeit` the cyclic garbage collector is disabled while timing.
+
+* `extract_sections`: the whole LCONF-File (UTF-8 `bytes`, `as_spans=True`)
+* `section_splitlines`, `prepare_section_lines`, `section_line_table`, `validate_one_section_fast`: each LCONF-Section
+    (UTF-8 `bytes`)
+* `validate_one_section_schema`: each LCONF-Schema-Section of the LCONF-Schema-File (UTF-8 `bytes`)
+* `parse_section`: each LCONF-Section: compared with `json.loads` and `tomllib.loads` of the same data (generated
+    corpus only)
+
+The compiled `PyLCONF._speedups` functions are used if the extension is built: `--pure-python` measures the
+pure-Python code. The results are written as JSON with `--output` (with the PyLCONF and Python versions, whether the
+speedups were used and the corpus): `--compare OLD NEW` prints the ratios of two such files.
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from datetime import datetime
+import gc
+from json import (
+    dump as json_dump,
+    dumps as json_dumps,
+    load as json_load,
+    loads as json_loads,
+)
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+)
+from platform import (
+    platform,
+    python_implementation,
+    python_version,
+)
+from sys import (
+    exit as sys_exit,
+    path as sys_path,
+    stdout as sys_stdout,
+)
+from time import perf_counter
+import tracemalloc
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+BENCHMARKS_PATH = path_dirname(path_abspath(__file__))
+sys_path.insert(0, path_dirname(BENCHMARKS_PATH))
+sys_path.insert(0, BENCHMARKS_PATH)
+
+from PyLCONF import (  # noqa: E402
+    __version__,
+    lconf_section,
+    line_table,
+)
+from corpus import (  # noqa: E402
+    add_corpus_arguments,
+    build_corpus,
+    build_schema,
+    corpus_options_from_args,
+)
+
+
+DEFAULT_REPEAT = 5
+RESULTS_FORMAT_VERSION = 1
+
+
+def parse_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Benchmark the PyLCONF LCONF-Section functions',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    python3 benchmarks/run_benchmarks.py
+    python3 benchmarks/run_benchmarks.py --sections 100 --depth 3 --output results.json
+    python3 benchmarks/run_benchmarks.py --lconf path-to.lconf --schema path-to.lconfsd
+    python3 benchmarks/run_benchmarks.py --compare old.json new.json
+    '''
+    )
+    add_corpus_arguments(main_parser)
+    main_parser.add_argument('--lconf', default=None, help='LCONF-File to use instead of a generated corpus')
+    main_parser.add_argument('--schema', default=None, help='LCONF-Schema-File used with --lconf')
+    main_parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                             help='Runs per function: the best is reported (default: {})'.format(DEFAULT_REPEAT))
+    main_parser.add_argument('--pure-python', action='store_true',
+                             help='Do not use the compiled `PyLCONF._speedups` functions')
+    main_parser.add_argument('-o', '--output', default=None, help='Write the results as JSON to this file')
+    main_parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), default=None,
+                             help='Compare two JSON result files: nothing is measured')
+
+    args = main_parser.parse_args()
+    if args.repeat < 1:
+        main_parser.error('--repeat must be at least 1')
+    return args
+
+
+def use_pure_python():
+    """ Switches `lconf_section` and `line_table` to the pure-Python functions: see `lconf_section` Compiled Speedups.
+    """
+    line_table.scan_lines = line_table.py_scan_lines
+    lconf_section.check_section_text = None
+    lconf_section.section_splitlines = lconf_section.py_section_splitlines
+    lconf_section.prepare_section_lines = lconf_section.py_prepare_section_lines
+
+
+def best_seconds(func, repeat):
+    """ Returns the best time of `repeat` calls of `func`: like `timeit` without the cyclic garbage collector.
+    """
+    times = []
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start_time = perf_counter()
+            func()
+            times.append(perf_counter() - start_time)
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+    return min(times)
+
+
+def peak_memory(func):
+    """ Returns the peak of the memory allocated by one call of `func` in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base_size = tracemalloc.get_traced_memory()[0]
+        func()
+        return tracemalloc.get_traced_memory()[1] - base_size
+    finally:
+        tracemalloc.stop()
+
+
+def measure(func, size_bytes, line_count, repeat):
+    """ Returns the result dict of one benchmark: `line_count` None for input that is not LCONF.
+    """
+    seconds = best_seconds(func, repeat)
+    return {
+        'seconds': seconds,
+        'bytes': size_bytes,
+        'mb_per_s': size_bytes / seconds / 1e6,
+        'lines_per_s': line_count / seconds if line_count is not None else None,
+        'peak_memory_mb': peak_memory(func) / 1e6,
+    }
+
+
+def toml_value(value):
+    """ Returns the TOML text of one value of the corpus data: nested structures as inline tables and arrays.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    elif isinstance(value, (int, float)):
+        return repr(value)
+    elif isinstance(value, str):
+        return json_dumps(value)
+    elif isinstance(value, dict):
+        return '{{{}}}'.format(', '.join('{} = {}'.format(json_dumps(key), toml_value(item))
+                                         for key, item in value.items()))
+    return '[{}]'.format(', '.join(toml_value(item) for item in value))
+
+
+def toml_text(data):
+    """ Returns the TOML document of the corpus data: one table per LCONF-Section.
+    """
+    lines = []
+    for section_name, section_data in data.items():
+        lines.append('[{}]'.format(json_dumps(section_name)))
+        lines.extend('{} = {}'.format(key, toml_value(value)) for key, value in section_data.items())
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def run_benchmarks(lconf_bytes, schema_bytes, data, repeat):
+    """
+    #### run_benchmarks.run_benchmarks
+
+    Measures all benchmarks on one corpus.
+
+    `run_benchmarks(lconf_bytes, schema_bytes, data, repeat)`
+
+    **Parameters:**
+
+    * `lconf_bytes`: (bytes) the LCONF-File
+    * `schema_bytes`: (bytes) the LCONF-Schema-File or None
+    * `data`: the corpus data as plain Python objects (see `corpus.build_corpus`) or None: for `json` / `tomllib`
+    * `repeat`: (int) runs per benchmark
+
+    **Returns:** (dict) benchmark name: result dict with `seconds`, `bytes`, `mb_per_s`, `lines_per_s` and
+        `peak_memory_mb`
+    """
+    extract_sections = lconf_section.extract_sections
+    section_bytes_from_span = lconf_section.section_bytes_from_span
+    section_splitlines = lconf_section.section_splitlines
+    prepare_section_lines = lconf_section.prepare_section_lines
+    section_line_table = lconf_section.section_line_table
+    validate_one_section_fast = lconf_section.validate_one_section_fast
+    validate_one_section_schema = lconf_section.validate_one_section_schema
+    parse_section = lconf_section.parse_section
+
+    sections = [section_bytes_from_span(lconf_bytes, section_span)
+                for section_span in extract_sections(lconf_bytes, as_spans=True)]
+    split_sections = [section_splitlines(section_bytes) for section_bytes in sections]
+    size_bytes = len(lconf_bytes)
+    sections_bytes = sum(len(section_bytes) for section_bytes in sections)
+    line_count = lconf_bytes.count(b'\n') + 1
+    sections_line_count = sum(len(split_section[0]) for split_section in split_sections)
+
+    results = {
+        'extract_sections': measure(lambda: extract_sections(lconf_bytes, as_spans=True), size_bytes, line_count,
+                                    repeat),
+        'section_splitlines': measure(lambda: [section_splitlines(section_bytes) for section_bytes in sections],
+                                      sections_bytes, sections_line_count, repeat),
+        'prepare_section_lines': measure(lambda: [prepare_section_lines(*split_section)
+                                                  for split_section in split_sections],
+                                         sections_bytes, sections_line_count, repeat),
+        'section_line_table': measure(lambda: [section_line_table(section_bytes) for section_bytes in sections],
+                                      sections_bytes, sections_line_count, repeat),
+        'validate_one_section_fast': measure(lambda: [validate_one_section_fast(section_bytes)
+                                                      for section_bytes in sections],
+                                             sections_bytes, sections_line_count, repeat),
+    }
+    if schema_bytes is not None:
+        schema_sections = [section_bytes_from_span(schema_bytes, section_span)
+                           for section_span in extract_sections(schema_bytes, as_spans=True)]
+        results['validate_one_section_schema'] = measure(
+            lambda: [validate_one_section_schema(section_bytes) for section_bytes in schema_sections],
+            sum(len(section_bytes) for section_bytes in schema_sections),
+            sum(section_bytes.count(b'\n') + 1 for section_bytes in schema_sections), repeat)
+
+    results['parse_section'] = measure(lambda: [parse_section(section_bytes) for section_bytes in sections],
+                                       sections_bytes, sections_line_count, repeat)
+    if data is not None:
+        json_text = json_dumps(data, indent=1)
+        results['json.loads'] = measure(lambda: json_loads(json_text), len(json_text.encode('utf-8')), None, repeat)
+        if tomllib is not None:
+            toml_document = toml_text(data)
+            results['tomllib.loads'] = measure(lambda: tomllib.loads(toml_document),
+                                               len(toml_document.encode('utf-8')), None, repeat)
+    return results
+
+
+def write_results(results, out):
+    out.write('{:<30} {:>10} {:>10} {:>14} {:>10}\n'.format('benchmark', 'seconds', 'MB/s', 'lines/s', 'peak MB'))
+    for name, result in results.items():
+        out.write('{:<30} {:>10.4f} {:>10.2f} {:>14} {:>10.2f}\n'.format(
+            name, result['seconds'], result['mb_per_s'],
+            '{:.0f}'.format(result['lines_per_s']) if result['lines_per_s'] is not None else '-',
+            result['peak_memory_mb']))
+
+
+def compare_results(old_path, new_path, out):
+    """ Writes the MB/s and peak memory of two JSON result files and their ratios (new / old).
+    """
+    with open(old_path, 'r', encoding='utf-8') as file_obj:
+        old = json_load(file_obj)
+    with open(new_path, 'r', encoding='utf-8') as file_obj:
+        new = json_load(file_obj)
+    for label, run in (('old', old), ('new', new)):
+        out.write('{}: PyLCONF {} Python {} speedups: {}\n'.format(label, run['pylconf_version'],
+                                                                  run['python_version'], run['speedups']))
+    if old['corpus'] != new['corpus']:
+        out.write('WARNING: the corpus differs\n')
+    out.write('{:<30} {:>10} {:>10} {:>8} {:>10} {:>10} {:>8}\n'.format(
+        'benchmark', 'old MB/s', 'new MB/s', 'ratio', 'old peak', 'new peak', 'ratio'))
+    for name, new_result in new['results'].items():
+        old_result = old['results'].get(name)
+        if old_result is None:
+            continue
+        out.write('{:<30} {:>10.2f} {:>10.2f} {:>8.2f} {:>10.2f} {:>10.2f} {:>8.2f}\n'.format(
+            name, old_result['mb_per_s'], new_result['mb_per_s'], new_result['mb_per_s'] / old_result['mb_per_s'],
+            old_result['peak_memory_mb'], new_result['peak_memory_mb'],
+            new_result['peak_memory_mb'] / old_result['peak_memory_mb'] if old_result['peak_memory_mb'] else 0.0))
+
+
+def main():
+    args = parse_commandline()
+    if args.compare is not None:
+        compare_results(args.compare[0], args.compare[1], sys_stdout)
+        return 0
+
+    if args.pure_python:
+        use_pure_python()
+    if args.lconf is not None:
+        with open(args.lconf, 'rb') as file_obj:
+            lconf_bytes = file_obj.read()
+        schema_bytes = None
+        if args.schema is not None:
+            with open(args.schema, 'rb') as file_obj:
+                schema_bytes = file_obj.read()
+        data = None
+        corpus = {'lconf': args.lconf, 'schema': args.schema, 'bytes': len(lconf_bytes)}
+    else:
+        options = corpus_options_from_args(args)
+        lconf_text, data = build_corpus(options)
+        lconf_bytes = lconf_text.encode('utf-8')
+        schema_bytes = build_schema(options).encode('utf-8')
+        corpus = dict(options.as_dict(), bytes=len(lconf_bytes))
+
+    results = run_benchmarks(lconf_bytes, schema_bytes, data, args.repeat)
+    write_results(results, sys_stdout)
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as file_obj:
+            json_dump({
+                'format_version': RESULTS_FORMAT_VERSION,
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'pylconf_version': __version__,
+                'python_version': '{} {}'.format(python_implementation(), python_version()),
+                'platform': platform(),
+                'speedups': lconf_section.check_section_text is not None,
+                'repeat': args.repeat,
+                'corpus': corpus,
+                'results': results,
+            }, file_obj, indent=2)
+            file_obj.write('\n')
+    return 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())
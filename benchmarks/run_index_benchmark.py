@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF section index benchmark
+
+```bash
+python3 benchmarks/run_index_benchmark.py
+python3 benchmarks/run_index_benchmark.py --copies 100
+```
+
+Writes a LCONF-File generated by `corpus.py` (same knobs) to a temporary directory: with `--copies N` the corpus is
+repeated N times (the LCONF-Sections of each copy get other names) to get a large file fast. Measures:
+
+* `build_index`: scans the LCONF-File and writes its index file
+* `open_index`: the index file is fresh: reads its header and checks the fingerprint
+* `load_section: first / last LCONF-Section`: `lconf_loader.load_section` with a fresh index file
+* `without index: last LCONF-Section`: `extract_sections` over a `mmap` of the LCONF-File and `parse_section` of the
+    last LCONF-Section: what `load_section` saves
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from mmap import (
+    mmap,
+    ACCESS_READ as MMAP_ACCESS_READ,
+)
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+    getsize as path_getsize,
+    join as path_join,
+)
+from sys import (
+    exit as sys_exit,
+    path as sys_path,
+    stdout as sys_stdout,
+)
+from tempfile import TemporaryDirectory
+
+BENCHMARKS_PATH = path_dirname(path_abspath(__file__))
+sys_path.insert(0, path_dirname(BENCHMARKS_PATH))
+sys_path.insert(0, BENCHMARKS_PATH)
+
+from PyLCONF.lconf_loader import load_section  # noqa: E402
+from PyLCONF.lconf_section import (  # noqa: E402
+    extract_sections,
+    parse_section,
+)
+from PyLCONF.section_index import (  # noqa: E402
+    build_index,
+    open_index,
+)
+from corpus import (  # noqa: E402
+    add_corpus_arguments,
+    build_corpus,
+    corpus_options_from_args,
+    section_name,
+)
+from run_benchmarks import best_seconds  # noqa: E402
+
+
+DEFAULT_REPEAT = 5
+
+
+def parse_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Benchmark the PyLCONF section index',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    python3 benchmarks/run_index_benchmark.py
+    python3 benchmarks/run_index_benchmark.py --copies 100
+    '''
+    )
+    add_corpus_arguments(main_parser)
+    main_parser.add_argument('--copies', type=int, default=1, help='Number of copies of the corpus (default: 1)')
+    main_parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                             help='Runs per benchmark: the best is reported (default: {})'.format(DEFAULT_REPEAT))
+    args = main_parser.parse_args()
+    if args.repeat < 1 or args.copies < 1:
+        main_parser.error('--repeat and --copies must be at least 1')
+    return args
+
+
+def copy_section_name(copy_idx, section_idx):
+    return 'Copy {} {}'.format(copy_idx, section_name(section_idx))
+
+
+def write_copies(path, lconf_text, copies):
+    """ Writes `copies` copies of `lconf_text`: the LCONF-Section-Names get the prefix `Copy <number> `.
+    """
+    with open(path, 'w', encoding='utf-8') as file_obj:
+        for copy_idx in range(copies):
+            if copy_idx:
+                file_obj.write('\n')
+            file_obj.write(lconf_text.replace(' :: LCONF :: ', ' :: LCONF :: Copy {} '.format(copy_idx)))
+
+
+def parse_without_index(path, name):
+    with open(path, 'rb') as file_obj, mmap(file_obj.fileno(), 0, access=MMAP_ACCESS_READ) as buffer:
+        for section_span in extract_sections(buffer, as_spans=True):
+            if section_span[2] == name:
+                return parse_section(section_span, buffer)
+    raise KeyError(name)
+
+
+def main():
+    args = parse_commandline()
+    options = corpus_options_from_args(args)
+    lconf_text, _ = build_corpus(options)
+    first_name = copy_section_name(0, 0)
+    last_name = copy_section_name(args.copies - 1, options.sections - 1)
+
+    with TemporaryDirectory() as tmp_dir:
+        path = path_join(tmp_dir, 'corpus.lconf')
+        write_copies(path, lconf_text, args.copies)
+        size_bytes = path_getsize(path)
+        if load_section(path, last_name).to_python() != parse_without_index(path, last_name).to_python():
+            sys_stdout.write('ERROR: load_section and parse_section differ: <{}>\n'.format(last_name))
+            return 1
+        results = [
+            ('build_index', best_seconds(lambda: build_index(path), args.repeat)),
+            ('open_index', best_seconds(lambda: open_index(path), args.repeat)),
+            ('load_section: first LCONF-Section', best_seconds(lambda: load_section(path, first_name), args.repeat)),
+            ('load_section: last LCONF-Section', best_seconds(lambda: load_section(path, last_name), args.repeat)),
+            ('without index: last LCONF-Section', best_seconds(lambda: parse_without_index(path, last_name),
+                                                               args.repeat)),
+        ]
+
+    sys_stdout.write('corpus: {} bytes, {} LCONF-Sections\n'.format(size_bytes, options.sections * args.copies))
+    sys_stdout.write('{:<45} {:>10}\n'.format('benchmark', 'ms'))
+    for name, seconds in results:
+        sys_stdout.write('{:<45} {:>10.3f}\n'.format(name, seconds * 1000))
+    return 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())
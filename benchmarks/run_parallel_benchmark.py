@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF parallel validation benchmark
+
+```bash
+python3 benchmarks/run_parallel_benchmark.py
+python3 benchmarks/run_parallel_benchmark.py --sections 400 --workers 1 2 4 8
+```
+
+Writes a LCONF-File generated by `corpus.py` (same knobs) to a temporary directory and measures
+`lconf_section.validate_file(path, workers=N)` for each `--workers` number: the best of `--repeat` runs, including
+the start of the worker processes. The speedup is the time with one worker divided by the time with N workers.
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from os import cpu_count
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+    join as path_join,
+)
+from sys import (
+    exit as sys_exit,
+    path as sys_path,
+    stdout as sys_stdout,
+)
+from tempfile import TemporaryDirectory
+
+BENCHMARKS_PATH = path_dirname(path_abspath(__file__))
+sys_path.insert(0, path_dirname(BENCHMARKS_PATH))
+sys_path.insert(0, BENCHMARKS_PATH)
+
+from PyLCONF.lconf_section import validate_file  # noqa: E402
+from corpus import (  # noqa: E402
+    add_corpus_arguments,
+    build_corpus,
+    corpus_options_from_args,
+)
+from run_benchmarks import best_seconds  # noqa: E402
+
+
+DEFAULT_REPEAT = 3
+DEFAULT_WORKERS = (1, 2, 4)
+
+
+def parse_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Benchmark lconf_section.validate_file with worker processes',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    python3 benchmarks/run_parallel_benchmark.py
+    python3 benchmarks/run_parallel_benchmark.py --sections 400 --workers 1 2 4 8
+    '''
+    )
+    add_corpus_arguments(main_parser)
+    main_parser.add_argument('-w', '--workers', type=int, nargs='+', default=list(DEFAULT_WORKERS),
+                             help='Worker numbers to measure (default: {})'.format(
+                                 ' '.join(str(workers) for workers in DEFAULT_WORKERS)))
+    main_parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                             help='Runs per benchmark: the best is reported (default: {})'.format(DEFAULT_REPEAT))
+    args = main_parser.parse_args()
+    if args.repeat < 1:
+        main_parser.error('--repeat must be at least 1')
+    if min(args.workers) < 1:
+        main_parser.error('--workers must be at least 1')
+    return args
+
+
+def main():
+    args = parse_commandline()
+    options = corpus_options_from_args(args)
+    lconf_text, _ = build_corpus(options)
+    with TemporaryDirectory() as tmp_dir:
+        path = path_join(tmp_dir, 'corpus.lconf')
+        with open(path, 'w', encoding='utf-8') as file_obj:
+            file_obj.write(lconf_text)
+        results = [(workers, best_seconds(lambda: validate_file(path, workers), args.repeat))
+                   for workers in [1] + [workers for workers in args.workers if workers != 1]]
+
+    sys_stdout.write('{}: {} bytes, {} LCONF-Sections, {} CPUs\n'.format(
+        'corpus', len(lconf_text.encode('utf-8')), options.sections, cpu_count()))
+    sys_stdout.write('{:<10} {:>10} {:>10}\n'.format('workers', 'ms', 'speedup'))
+    for workers, seconds in results:
+        sys_stdout.write('{:<10} {:>10.1f} {:>10.2f}\n'.format(workers, seconds * 1000, results[0][1] / seconds))
+    return 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())
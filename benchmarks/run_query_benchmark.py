@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF key path query benchmark
+
+```bash
+python3 benchmarks/run_query_benchmark.py
+python3 benchmarks/run_query_benchmark.py --sections 400
+```
+
+Generates a LCONF-File with `corpus.py` (same knobs) and measures how long it takes to get one LCONF-Value by its key
+path: in the first and in the last LCONF-Section. The key path is `<LCONF-Section-Name>/named_blocks/block_<fanout
+- 1>/table/<rows - 1>/0`: the first cell of the last row of the STRUCTURE_TABLE in the last STRUCTURE_NAMED_BLOCKS item.
+Without `named_blocks` (`--depth 0` or `--fanout 0`) the last row of the STRUCTURE_TABLE of the root is used.
+
+* `lconf_query.query`: on the UTF-8 `bytes` of the LCONF-File and on a `mmap` of it
+* `LazySection`: extracts the LCONF-Section spans, creates the LazySection and looks the value up
+* `parse_section`: extracts the LCONF-Section spans, parses the LCONF-Section and looks the value up
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from mmap import (
+    mmap,
+    ACCESS_READ as MMAP_ACCESS_READ,
+)
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+    join as path_join,
+)
+from sys import (
+    exit as sys_exit,
+    path as sys_path,
+    stdout as sys_stdout,
+)
+from tempfile import TemporaryDirectory
+
+BENCHMARKS_PATH = path_dirname(path_abspath(__file__))
+sys_path.insert(0, path_dirname(BENCHMARKS_PATH))
+sys_path.insert(0, BENCHMARKS_PATH)
+
+from PyLCONF.lazy_section import LazySection  # noqa: E402
+from PyLCONF.lconf_query import (  # noqa: E402
+    query,
+    split_key_path,
+)
+from PyLCONF.lconf_section import (  # noqa: E402
+    extract_sections,
+    parse_section,
+)
+from corpus import (  # noqa: E402
+    add_corpus_arguments,
+    build_corpus,
+    corpus_options_from_args,
+    section_name,
+)
+from run_benchmarks import best_seconds  # noqa: E402
+
+
+DEFAULT_REPEAT = 5
+
+
+def parse_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Benchmark PyLCONF key path queries',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    python3 benchmarks/run_query_benchmark.py
+    python3 benchmarks/run_query_benchmark.py --sections 400
+    '''
+    )
+    add_corpus_arguments(main_parser)
+    main_parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                             help='Runs per benchmark: the best is reported (default: {})'.format(DEFAULT_REPEAT))
+    args = main_parser.parse_args()
+    if args.repeat < 1:
+        main_parser.error('--repeat must be at least 1')
+    return args
+
+
+def key_path(options, section_idx):
+    """ Returns the key path of the benchmarked LCONF-Value in the LCONF-Section number `section_idx`.
+    """
+    last_row = str(options.table_rows - 1)
+    if options.depth and options.fanout:
+        return '/'.join([section_name(section_idx), 'named_blocks', 'block_{}'.format(options.fanout - 1), 'table',
+                         last_row, '0'])
+    return '/'.join([section_name(section_idx), 'table', last_row, '0'])
+
+
+def lookup(section_obj, key_parts):
+    """ Returns the LCONF-Value of the key path in a parsed LCONF-Section.
+    """
+    value = section_obj
+    for part in key_parts[1:]:
+        if hasattr(value, 'get_block'):
+            value = value.get_block(part)
+        elif part.isdigit():
+            value = value[int(part)]
+        else:
+            value = value[part]
+    return value
+
+
+def section_span(lconf_bytes, name):
+    return next(span for span in extract_sections(lconf_bytes, as_spans=True) if span[2] == name)
+
+
+def main():
+    args = parse_commandline()
+    options = corpus_options_from_args(args)
+    lconf_text, _ = build_corpus(options)
+    lconf_bytes = lconf_text.encode('utf-8')
+
+    results = []
+    with TemporaryDirectory() as tmp_dir:
+        path = path_join(tmp_dir, 'corpus.lconf')
+        with open(path, 'wb') as file_obj:
+            file_obj.write(lconf_bytes)
+        with open(path, 'rb') as file_obj, mmap(file_obj.fileno(), 0, access=MMAP_ACCESS_READ) as lconf_mmap:
+            for position, section_idx in (('first', 0), ('last', options.sections - 1)):
+                path_to_value = key_path(options, section_idx)
+                key_parts = split_key_path(path_to_value)
+                expected = query(lconf_bytes, path_to_value)
+                if lookup(parse_section(section_span(lconf_bytes, key_parts[0]), lconf_bytes), key_parts) != expected:
+                    sys_stdout.write('ERROR: query and parse_section differ: <{}>\n'.format(path_to_value))
+                    return 1
+                benchmarks = [
+                    ('query (bytes)', lambda: query(lconf_bytes, path_to_value)),
+                    ('query (mmap)', lambda: query(lconf_mmap, path_to_value)),
+                    ('LazySection', lambda: lookup(LazySection(section_span(lconf_bytes, key_parts[0]), lconf_bytes),
+                                                   key_parts)),
+                    ('parse_section', lambda: lookup(parse_section(section_span(lconf_bytes, key_parts[0]),
+                                                                   lconf_bytes), key_parts)),
+                ]
+                for name, func in benchmarks:
+                    results.append(('{}: {} LCONF-Section'.format(name, position), best_seconds(func, args.repeat)))
+
+    sys_stdout.write('corpus: {} bytes, {} LCONF-Sections: {}\n'.format(len(lconf_bytes), options.sections,
+                                                                        key_path(options, options.sections - 1)))
+    sys_stdout.write('{:<45} {:>10}\n'.format('benchmark', 'ms'))
+    for name, seconds in results:
+        sys_stdout.write('{:<45} {:>10.3f}\n'.format(name, seconds * 1000))
+    return 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF record class benchmark
+
+```bash
+python3 benchmarks/run_record_benchmark.py
+python3 benchmarks/run_record_benchmark.py --blocks 100000
+```
+
+Generates one LCONF-Section with one STRUCTURE_UNNAMED_BLOCKS of `--blocks` items and its STRICT LCONF-Schema. Each
+block has the same 6 LCONF-Key-Value-Pairs: one unique string, two strings out of a few repeated ones, a
+`TYPE_INTEGER`, a `TYPE_FLOAT` and a `TYPE_BOOLEAN`. Measures the time of `parse_section_typed` and the memory of the
+result per block: `sys.getsizeof` of all objects reachable from the result (`gc.get_referents`), objects shared
+between blocks (e.g. the LCONF-Key-Names) are counted once. `tracemalloc` makes the parse too slow for 1M blocks.
+
+* `StructureSingleBlock`: `parse_section_typed`
+* `StructureRecord`: `parse_section_typed(.., use_records=True)`: one generated record class, pooled string values
+* `dict`: `parse_section_typed` and `to_python`: one dict per block, the parsed LCONF-Section is dropped
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from gc import get_referents
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+)
+from sys import (
+    exit as sys_exit,
+    getsizeof,
+    path as sys_path,
+    stdout as sys_stdout,
+)
+from time import perf_counter
+
+sys_path.insert(0, path_dirname(path_dirname(path_abspath(__file__))))
+
+from PyLCONF.lconf_schema import (  # noqa: E402
+    compile_schema,
+    parse_section_typed,
+)
+
+
+DEFAULT_BLOCKS = 1000000
+# Number of blocks compared between StructureRecord and StructureSingleBlock before the benchmark
+CHECK_BLOCKS = 1000
+CITIES = ('Berlin', 'London', 'Madrid', 'Paris', 'Rome', 'Vienna', 'Warsaw', 'Zurich')
+ROLES = ('admin', 'developer', 'guest')
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Records
+. users | STRUCTURE_UNNAMED_BLOCKS | REQUIRED
+    user_name :: REQUIRED | TYPE_STRING
+    city :: REQUIRED | TYPE_STRING
+    role :: REQUIRED | TYPE_STRING
+    age :: REQUIRED | TYPE_INTEGER
+    score :: OPTIONAL | TYPE_FLOAT
+    is_active :: OPTIONAL | TYPE_BOOLEAN
+___END'''
+
+
+def parse_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Benchmark the memory of PyLCONF record classes',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    python3 benchmarks/run_record_benchmark.py
+    python3 benchmarks/run_record_benchmark.py --blocks 100000
+    '''
+    )
+    main_parser.add_argument('--blocks', type=int, default=DEFAULT_BLOCKS,
+                             help='Number of STRUCTURE_UNNAMED_BLOCKS items (default: {})'.format(DEFAULT_BLOCKS))
+    args = main_parser.parse_args()
+    if args.blocks < 1:
+        main_parser.error('--blocks must be at least 1')
+    return args
+
+
+def build_section(blocks):
+    """ Returns the LCONF-Section text with `blocks` STRUCTURE_UNNAMED_BLOCKS items.
+    """
+    lines = ['___SECTION :: 4 :: LCONF :: Records', '* users']
+    for idx in range(blocks):
+        lines.extend((
+            '    .',
+            '        user_name :: user_{}'.format(idx),
+            '        city :: {}'.format(CITIES[idx % len(CITIES)]),
+            '        role :: {}'.format(ROLES[idx % len(ROLES)]),
+            '        age :: {}'.format(18 + idx % 60),
+            '        score :: {}'.format(idx % 1000 / 10),
+            '        is_active :: {}'.format('true' if idx % 2 else 'false'),
+        ))
+    lines.append('___END')
+    return '\n'.join(lines)
+
+
+def deep_size(obj):
+    """ Returns the `sys.getsizeof` sum of `obj` and all objects reachable from it: each object once. Classes are not
+    counted.
+    """
+    seen_ids = set()
+    size_bytes = 0
+    pending = [obj]
+    while pending:
+        next_pending = []
+        for item in pending:
+            if id(item) in seen_ids or isinstance(item, type):
+                continue
+            seen_ids.add(id(item))
+            size_bytes += getsizeof(item)
+            next_pending.append(item)
+        pending = get_referents(*next_pending)
+    return size_bytes
+
+
+def measure(func):
+    """ Returns `(seconds, bytes)`: the time of `func` and the memory of its result.
+    """
+    start_time = perf_counter()
+    result = func()
+    seconds = perf_counter() - start_time
+    return seconds, deep_size(result)
+
+
+def main():
+    args = parse_commandline()
+    schema = compile_schema(SCHEMA_TEXT)
+    check_text = build_section(min(args.blocks, CHECK_BLOCKS))
+    if parse_section_typed(check_text, schema, use_records=True).to_python() != \
+            parse_section_typed(check_text, schema).to_python():
+        sys_stdout.write('ERROR: StructureRecord and StructureSingleBlock results differ\n')
+        return 1
+    section_text = build_section(args.blocks)
+
+    results = [
+        ('StructureSingleBlock', measure(lambda: parse_section_typed(section_text, schema))),
+        ('StructureRecord', measure(lambda: parse_section_typed(section_text, schema, use_records=True))),
+        ('dict', measure(lambda: parse_section_typed(section_text, schema).to_python())),
+    ]
+
+    sys_stdout.write('corpus: {} bytes, {} blocks\n'.format(len(section_text), args.blocks))
+    sys_stdout.write('{:<25} {:>10} {:>16}\n'.format('blocks', 'parse s', 'bytes per block'))
+    for name, (seconds, size_bytes) in results:
+        sys_stdout.write('{:<25} {:>10.3f} {:>16.1f}\n'.format(name, seconds, size_bytes / args.blocks))
+    return 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())
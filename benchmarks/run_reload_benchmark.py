@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF ConfigStore reload benchmark
+
+```bash
+python3 benchmarks/run_reload_benchmark.py
+python3 benchmarks/run_reload_benchmark.py --sections 400 --schema
+```
+
+Writes a LCONF-File generated by `corpus.py` (same knobs) to a temporary directory and measures the reload latency of
+a `config_store.ConfigStore` when one LCONF-Section in the middle of the file changed: the value of its first
+`TYPE_INTEGER` LCONF-Key-Value-Pair alternates between two numbers. Writing the file is not timed.
+
+* `lconf_loader.load`: the whole file: what a reload costs without the store
+* `reload: one LCONF-Section changed`: `ConfigStore.reload([path])` reads, hashes and extracts the file and parses one
+    LCONF-Section
+* `reload: file not changed`: `ConfigStore.reload` of a file with the same `os.stat`: no read
+* `reload: read, nothing changed`: `ConfigStore.reload([path])` of a file with the same content
+* `watcher: write to callback`: from the end of the write to the change callback in the watcher thread: inotify if
+    available (includes `config_store.SETTLE_SECONDS`) else polling every 0.01 s
+
+With `--schema` the LCONF-Sections are parsed with their generated LCONF-Schema (`parse_section_typed`).
+"""
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+    join as path_join,
+)
+from sys import (
+    exit as sys_exit,
+    path as sys_path,
+    stdout as sys_stdout,
+)
+from tempfile import TemporaryDirectory
+from threading import Event
+from time import perf_counter
+
+BENCHMARKS_PATH = path_dirname(path_abspath(__file__))
+sys_path.insert(0, path_dirname(BENCHMARKS_PATH))
+sys_path.insert(0, BENCHMARKS_PATH)
+
+from PyLCONF.config_store import ConfigStore  # noqa: E402
+from PyLCONF.lconf_loader import load  # noqa: E402
+from PyLCONF.lconf_schema import compile_schema  # noqa: E402
+from PyLCONF.lconf_section import extract_sections  # noqa: E402
+from corpus import (  # noqa: E402
+    add_corpus_arguments,
+    build_corpus,
+    build_schema,
+    corpus_options_from_args,
+    section_name,
+)
+from run_benchmarks import best_seconds  # noqa: E402
+
+
+DEFAULT_REPEAT = 5
+# Seconds to wait for the watcher thread
+WATCHER_TIMEOUT = 10.0
+
+
+def parse_commandline():
+    main_parser = argparse.ArgumentParser(
+       description='Benchmark the reload latency of the PyLCONF ConfigStore',
+       formatter_class=RawDescriptionHelpFormatter,
+       epilog='''EXAMPLES:
+    python3 benchmarks/run_reload_benchmark.py
+    python3 benchmarks/run_reload_benchmark.py --sections 400 --schema
+    '''
+    )
+    add_corpus_arguments(main_parser)
+    main_parser.add_argument('--schema', action='store_true', help='Parse with the generated LCONF-Schema')
+    main_parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                             help='Runs per benchmark: the best is reported (default: {})'.format(DEFAULT_REPEAT))
+    args = main_parser.parse_args()
+    if args.repeat < 1:
+        main_parser.error('--repeat must be at least 1')
+    return args
+
+
+def changed_texts(lconf_text, options):
+    """ Returns two variants of `lconf_text` which differ only in one LCONF-Value of the middle LCONF-Section.
+    """
+    section_start = lconf_text.index('___SECTION :: {} :: LCONF :: {}\n'.format(options.indentation,
+                                                                               section_name(options.sections // 2)))
+    # `key_1` is the first TYPE_INTEGER LCONF-Key-Value-Pair of the root
+    value_start = lconf_text.index('\nkey_1 :: ', section_start) + len('\nkey_1 :: ')
+    value_end = lconf_text.index('\n', value_start)
+    return [lconf_text[:value_start] + value + lconf_text[value_end:] for value in ('111', '222')]
+
+
+def main():
+    args = parse_commandline()
+    options = corpus_options_from_args(args)
+    lconf_text, _ = build_corpus(options)
+    texts = changed_texts(lconf_text, options)
+    lconf_schema_obj = None
+    if args.schema:
+        schema_bytes = build_schema(options).encode('utf-8')
+        lconf_schema_obj = {}
+        for section_span in extract_sections(schema_bytes, as_spans=True):
+            schema_obj = compile_schema(section_span, schema_bytes)
+            lconf_schema_obj[schema_obj.name] = schema_obj
+
+    with TemporaryDirectory() as tmp_dir:
+        path = path_join(tmp_dir, 'corpus.lconf')
+        text_idx = [0]
+
+        def write_next():
+            text_idx[0] ^= 1
+            with open(path, 'w', encoding='utf-8') as file_obj:
+                file_obj.write(texts[text_idx[0]])
+
+        write_next()
+        store = ConfigStore(path, lconf_schema_obj, poll_interval=0.01)
+        results = [('lconf_loader.load', best_seconds(lambda: load(path, lconf_schema_obj), args.repeat))]
+
+        seconds = []
+        for _ in range(args.repeat):
+            write_next()
+            start_time = perf_counter()
+            store.reload([path])
+            seconds.append(perf_counter() - start_time)
+        results.append(('reload: one LCONF-Section changed', min(seconds)))
+        results.append(('reload: file not changed', best_seconds(store.reload, args.repeat)))
+        results.append(('reload: read, nothing changed', best_seconds(lambda: store.reload([path]), args.repeat)))
+
+        changed = Event()
+        store.add_change_callback(lambda old_snapshot, new_snapshot, changed_names: changed.set())
+        with store:
+            seconds = []
+            for _ in range(args.repeat):
+                changed.clear()
+                write_next()
+                start_time = perf_counter()
+                if not changed.wait(WATCHER_TIMEOUT):
+                    sys_stdout.write('ERROR: the watcher thread did not reload the file\n')
+                    return 1
+                seconds.append(perf_counter() - start_time)
+            watcher_name = 'watcher: write to callback ({})'.format('inotify' if store.uses_inotify else 'polling')
+        results.append((watcher_name, min(seconds)))
+
+    sys_stdout.write('{}: {} bytes, {} LCONF-Sections{}\n'.format(
+        'corpus', len(lconf_text.encode('utf-8')), options.sections, ', with LCONF-Schema' if args.schema else ''))
+    sys_stdout.write('{:<45} {:>10}\n'.format('benchmark', 'ms'))
+    for name, seconds in results:
+        sys_stdout.write('{:<45} {:>10.3f}\n'.format(name, seconds * 1000))
+    return 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())
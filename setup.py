@@ -314,6 +314,7 @@ ext_modules = []
 cython_include_path = []  # include for cimport, different from compile include: see: CreateCythonCommand.cythonize
 # Cython extension names
 cython_extension_name_sources = {
+    'PyLCONF._speedups': ['PyLCONF/cython/_speedups.pyx'],
     # 'PyLCONF.constants': ['PyLCONF/cython/constants.pyx'],
     # 'PyLCONF.lconf_classes': ['PyLCONF/cython/lconf_classes.pyx'],
     # 'PyLCONF.structure_classes': ['PyLCONF/cython/structure_classes.pyx'],
@@ -355,7 +356,7 @@ setuptools_setup(
     author_email='https://github.com/peter1000',
     url='http://lconf-data-serialization-format.github.io/PyLCONF/',
     license='MIT (Expat)',
-    packages=setuptools_find_packages(),
+    packages=setuptools_find_packages(exclude=['tests', 'tests.*']),
     include_package_data=True,
     install_requires=read_requires('requirements.txt'),
     use_2to3=False,
@@ -376,5 +377,8 @@ setuptools_setup(
     scripts=[
         'bin/pylconf-validate',
         'bin/pylconfsd-validate',
+        'bin/pylconf-compile',
+        'bin/pylconf-decompile',
+        'bin/pylconf-index',
     ],
 )
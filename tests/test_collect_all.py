@@ -0,0 +1,121 @@
+"""
+#### PyLCONF collect_all validation tests
+
+```bash
+make tests
+```
+
+With `collect_all=True` the validators must return all errors of a LCONF-Section with their line numbers in one pass:
+the lines indented more than a wrong line are skipped and validation resynchronizes at the next line with the same or
+a lower indentation. A valid LCONF-Section returns an empty list.
+"""
+from os import unlink
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from PyLCONF.lconf_schema import compile_schema
+from PyLCONF.lconf_section import (
+    validate_one_section_complet,
+    validate_one_section_fast,
+    validate_sections_from_file,
+)
+from PyLCONF.utilities import (
+    ERR_IDENTIFIER_SPACE,
+    ERR_INDENTATION_MULTIPLE,
+    ERR_KEY_VALUE_SEPARATOR,
+    ERR_SCHEMA_MISSING_KEY,
+    ERR_SCHEMA_UNKNOWN_KEY,
+    ERR_SECTION_START_LINE,
+    ERR_TRAILING_SPACE,
+    Err,
+    SectionErr,
+)
+
+
+VALID_SECTION_TEXT = '''___SECTION :: 4 :: LCONF :: Valid
+key :: value
+- list
+    item
+. block
+    inner :: x
+___END'''
+
+# Errors in the lines 2, 4 (its nested lines 5 and 6 are skipped), 7 and 9
+WRONG_SECTION_TEXT = '\n'.join([
+    '___SECTION :: 4 :: LCONF :: Wrong',
+    'key  :: value',
+    'ok :: 1',
+    '.block',
+    '    inner :: x',
+    '        deeper ::: y',
+    'other :: value ',
+    '. block',
+    '   inner :: x',
+    'last :: 2',
+    '___END',
+])
+
+WRONG_ERRORS = [
+    (ERR_KEY_VALUE_SEPARATOR, 2),
+    (ERR_IDENTIFIER_SPACE, 4),
+    (ERR_TRAILING_SPACE, 7),
+    (ERR_INDENTATION_MULTIPLE, 9),
+]
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Wrong
+key :: REQUIRED | TYPE_STRING
+ok :: REQUIRED | TYPE_INTEGER
+last :: REQUIRED | TYPE_INTEGER
+___END'''
+
+
+def error_codes(errors):
+    """ Returns the `(code, line_number)` of the `errors`.
+    """
+    return [(err.code, err.line_number) for err in errors]
+
+
+class CollectAllTest(TestCase):
+
+    def test_valid_section(self):
+        self.assertIs(validate_one_section_fast(VALID_SECTION_TEXT), True)
+        self.assertEqual(validate_one_section_fast(VALID_SECTION_TEXT, collect_all=True), [])
+        self.assertEqual(validate_one_section_fast(VALID_SECTION_TEXT.encode('utf-8'), collect_all=True), [])
+
+    def test_all_errors(self):
+        for section_text in (WRONG_SECTION_TEXT, WRONG_SECTION_TEXT.encode('utf-8')):
+            errors = validate_one_section_fast(section_text, collect_all=True)
+            self.assertTrue(all(isinstance(err, SectionErr) for err in errors))
+            self.assertEqual(error_codes(errors), WRONG_ERRORS)
+
+    def test_first_error_is_raised(self):
+        with self.assertRaises(SectionErr) as context:
+            validate_one_section_fast(WRONG_SECTION_TEXT)
+        self.assertEqual(error_codes([context.exception]), WRONG_ERRORS[:1])
+
+    def test_first_line_number(self):
+        errors = validate_one_section_fast(WRONG_SECTION_TEXT, collect_all=True, first_line_number=11)
+        self.assertEqual(error_codes(errors), [(code, line_number + 10) for code, line_number in WRONG_ERRORS])
+
+    def test_file_line_numbers(self):
+        with NamedTemporaryFile('wb', suffix='.lconf', delete=False) as file_obj:
+            file_obj.write('\n'.join(['text', VALID_SECTION_TEXT, 'text', '', WRONG_SECTION_TEXT]).encode('utf-8'))
+        try:
+            errors = validate_sections_from_file(file_obj.name, collect_all=True)
+        finally:
+            unlink(file_obj.name)
+        self.assertEqual(error_codes(errors), [(code, line_number + 10) for code, line_number in WRONG_ERRORS])
+
+    def test_schema_validation(self):
+        # `block` is not in the LCONF-Schema and `key` is missing: its line is wrong
+        errors = validate_one_section_complet(WRONG_SECTION_TEXT, compile_schema(SCHEMA_TEXT), collect_all=True)
+        self.assertEqual(error_codes(errors), WRONG_ERRORS[:3] + [(ERR_SCHEMA_UNKNOWN_KEY, 8)] + WRONG_ERRORS[3:] + [
+            (ERR_SCHEMA_MISSING_KEY, 1),
+        ])
+
+    def test_wrong_section_start_line(self):
+        section_text = WRONG_SECTION_TEXT.replace(':: 4 ::', ':: 9 ::', 1)
+        errors = validate_one_section_fast(section_text, collect_all=True)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], Err)
+        self.assertEqual(errors[0].code, ERR_SECTION_START_LINE)
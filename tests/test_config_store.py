@@ -0,0 +1,167 @@
+"""
+#### PyLCONF config store tests
+
+```bash
+make tests
+```
+
+`config_store.ConfigStore.reload` must replace the snapshot with the changed LCONF-Sections of the changed LCONF-Files
+and keep the objects of the unchanged LCONF-Sections. A reload with a not valid or missing LCONF-File must raise its
+error and keep the current snapshot: no change of the other LCONF-Files read in that reload may be lost.
+"""
+from os import (
+    stat as os_stat,
+    unlink,
+    utime,
+)
+from os.path import join as path_join
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Event
+from unittest import TestCase
+
+from PyLCONF.config_store import (
+    ConfigSnapshot,
+    ConfigStore,
+)
+from PyLCONF.lconf_schema import compile_schema
+from PyLCONF.utilities import (
+    Err,
+    SectionErr,
+)
+
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Server
+port :: REQUIRED | TYPE_INTEGER
+___END'''
+
+
+def section_text(section_name, value):
+    return '___SECTION :: 4 :: LCONF :: {}\nport :: {}\n___END\n'.format(section_name, value)
+
+
+class ConfigStoreCase(TestCase):
+    """ Two LCONF-Files `a` and `b` in a new directory and their ConfigStore.
+    """
+
+    def setUp(self):
+        self.dir_path = mkdtemp()
+        self.path_a = path_join(self.dir_path, 'a.lconf')
+        self.path_b = path_join(self.dir_path, 'b.lconf')
+        self.write_file(self.path_a, section_text('Server', 80) + section_text('Client', 1))
+        self.write_file(self.path_b, section_text('Backup', 90))
+        self.store = ConfigStore([self.path_a, self.path_b], {'Server': compile_schema(SCHEMA_TEXT)})
+
+    def tearDown(self):
+        self.store.stop()
+        rmtree(self.dir_path)
+
+    def write_file(self, path, text):
+        """ Writes the file: its `st_mtime_ns` is always changed.
+        """
+        try:
+            old_mtime_ns = os_stat(path).st_mtime_ns
+        except OSError:
+            old_mtime_ns = 0
+        with open(path, 'w', encoding='utf-8') as file_obj:
+            file_obj.write(text)
+        mtime_ns = max(os_stat(path).st_mtime_ns, old_mtime_ns + 1000)
+        utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class ConfigStoreTest(ConfigStoreCase):
+
+    def test_snapshot(self):
+        snapshot = self.store.snapshot
+        self.assertIsInstance(snapshot, ConfigSnapshot)
+        self.assertEqual(snapshot.version, 1)
+        self.assertEqual(snapshot.keys(), ['Server', 'Client', 'Backup'])
+        self.assertEqual(snapshot['Server'].to_python(), {'port': 80})
+        self.assertEqual(snapshot['Client'].to_python(), {'port': '1'})
+        self.assertEqual([section_obj.name for section_obj in snapshot.files[self.path_b]], ['Backup'])
+        with self.assertRaises(AttributeError):
+            snapshot.version = 2
+
+    def test_reload(self):
+        changes = []
+        self.store.add_change_callback(lambda old, new, names: changes.append((old.version, new.version, names)))
+        self.assertIsNone(self.store.reload())
+        old_snapshot = self.store.snapshot
+        self.write_file(self.path_a, section_text('Server', 81) + section_text('Client', 1) + section_text('New', 2))
+        new_snapshot = self.store.reload()
+        self.assertIs(self.store.snapshot, new_snapshot)
+        self.assertEqual(new_snapshot.version, 2)
+        self.assertEqual(new_snapshot['Server'].to_python(), {'port': 81})
+        self.assertIs(new_snapshot['Client'], old_snapshot['Client'])
+        self.assertIs(new_snapshot['Backup'], old_snapshot['Backup'])
+        self.assertEqual(old_snapshot['Server'].to_python(), {'port': 80})
+        self.assertEqual(changes, [(1, 2, frozenset(['Server', 'New']))])
+        # Read again but not changed
+        self.assertIsNone(self.store.reload([self.path_a]))
+
+    def test_removed_section(self):
+        changes = []
+        self.store.add_change_callback(lambda old, new, names: changes.append(names))
+        self.write_file(self.path_a, section_text('Server', 80))
+        self.assertNotIn('Client', self.store.reload())
+        self.assertEqual(changes, [frozenset(['Client'])])
+
+    def test_watcher_thread(self):
+        changed = Event()
+        store = ConfigStore([self.path_a], poll_interval=0.01, use_inotify=False)
+        store.add_change_callback(lambda old, new, names: changed.set())
+        with store:
+            self.assertTrue(store.is_watching)
+            self.write_file(self.path_a, section_text('Server', 82))
+            self.assertTrue(changed.wait(5))
+        self.assertFalse(store.is_watching)
+        self.assertEqual(store.snapshot['Server'].to_python(), {'port': '82'})
+
+
+class ConfigStoreErrorTest(ConfigStoreCase):
+
+    def test_rollback(self):
+        old_snapshot = self.store.snapshot
+        self.write_file(self.path_a, section_text('Server', 'x'))
+        with self.assertRaises(SectionErr):
+            self.store.reload()
+        self.assertIs(self.store.snapshot, old_snapshot)
+        self.write_file(self.path_a, '___SECTION :: 4 :: LCONF :: Server\n')
+        with self.assertRaises(Err):
+            self.store.reload()
+        unlink(self.path_a)
+        with self.assertRaises(OSError):
+            self.store.reload()
+        self.assertIs(self.store.snapshot, old_snapshot)
+        self.assertEqual(self.store.version, 1)
+
+    def test_no_change_lost_after_an_error(self):
+        # A valid change of `a` and a not valid one of `b` in one reload: `a` must be read again after `b` is fixed
+        #   even if only `b` is named
+        self.write_file(self.path_a, section_text('Server', 81) + section_text('Client', 1))
+        self.write_file(self.path_b, section_text('Backup', 90) + '___SECTION :: 9 :: LCONF :: Wrong\n___END\n')
+        with self.assertRaises(Err):
+            self.store.reload()
+        self.assertEqual(self.store.snapshot['Server'].to_python(), {'port': 80})
+        self.write_file(self.path_b, section_text('Backup', 91))
+        new_snapshot = self.store.reload([self.path_b])
+        self.assertEqual(new_snapshot['Server'].to_python(), {'port': 81})
+        self.assertEqual(new_snapshot['Backup'].to_python(), {'port': '91'})
+        self.assertIsNone(self.store.reload())
+
+    def test_error_callback(self):
+        errors = []
+        changed = Event()
+        store = ConfigStore([self.path_a], {'Server': compile_schema(SCHEMA_TEXT)}, poll_interval=0.01,
+                            use_inotify=False)
+        store.add_error_callback(lambda err: (errors.append(err), changed.set()))
+        with store:
+            self.write_file(self.path_a, section_text('Server', 'x'))
+            self.assertTrue(changed.wait(5))
+        self.assertIsInstance(errors[0], SectionErr)
+        self.assertEqual(store.version, 1)
+
+    def test_not_valid_file_at_creation(self):
+        self.write_file(self.path_b, section_text('Server', 'x'))
+        with self.assertRaises(SectionErr):
+            ConfigStore([self.path_b], {'Server': compile_schema(SCHEMA_TEXT)})
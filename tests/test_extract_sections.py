@@ -0,0 +1,107 @@
+"""
+#### PyLCONF LCONF-Section extraction tests
+
+```bash
+make tests
+```
+
+`lconf_section.extract_sections` (text and byte spans of `bytes` and `mmap` sources) and `iter_sections` must find
+the same LCONF-Sections as the text extraction: the span of a LCONF-Section decodes to its text. Sources with a
+missing or a nested LCONF-Section-Start-Line or LCONF-Section-End-Line must raise an `Err` in the span extraction and
+in `iter_sections`.
+"""
+from io import StringIO
+from mmap import (
+    mmap,
+    ACCESS_READ as MMAP_ACCESS_READ,
+)
+from os import unlink
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from PyLCONF.constants import (
+    LCONF_FORMAT_LCONF,
+    LCONF_FORMAT_SCHEMA_STRICT,
+)
+from PyLCONF.lconf_section import (
+    extract_sections,
+    iter_sections,
+    section_bytes_from_span,
+    section_text_from_span,
+)
+from PyLCONF.utilities import Err
+
+
+SOURCE = '''Additional text ä
+
+___SECTION :: 4 :: LCONF :: First ä
+key :: value ü
+___END
+
+Additional text between
+
+___SECTION :: 2 :: STRICT :: Second
+- list
+  item
+___END
+Additional text after'''
+
+SECTION_TEXTS = [
+    '___SECTION :: 4 :: LCONF :: First ä\nkey :: value ü\n___END',
+    '___SECTION :: 2 :: STRICT :: Second\n- list\n  item\n___END',
+]
+
+WRONG_SOURCES = [
+    'no LCONF-Section',
+    '___SECTION :: 4 :: LCONF :: Open\nkey :: value\n',
+    '___SECTION :: 4 :: LCONF :: Outer\n___SECTION :: 4 :: LCONF :: Inner\n___END\n___END',
+    '___SECTION :: 4 :: LCONF :: First\n___END\n___SECTION :: 4 :: LCONF :: Open\n',
+]
+
+
+class ExtractSectionsTest(TestCase):
+
+    def test_text(self):
+        self.assertEqual(extract_sections(SOURCE), SECTION_TEXTS)
+
+    def test_spans(self):
+        buffer = SOURCE.encode('utf-8')
+        section_spans = extract_sections(buffer, as_spans=True)
+        self.assertEqual([section_span[2:] for section_span in section_spans],
+                         [('First ä', LCONF_FORMAT_LCONF), ('Second', LCONF_FORMAT_SCHEMA_STRICT)])
+        self.assertEqual([section_text_from_span(buffer, section_span) for section_span in section_spans],
+                         SECTION_TEXTS)
+        self.assertEqual([section_bytes_from_span(buffer, section_span) for section_span in section_spans],
+                         [section_text.encode('utf-8') for section_text in SECTION_TEXTS])
+
+    def test_mmap_spans(self):
+        with NamedTemporaryFile('wb', suffix='.lconf', delete=False) as file_obj:
+            file_obj.write(SOURCE.encode('utf-8'))
+        try:
+            with open(file_obj.name, 'rb') as read_obj, \
+                    mmap(read_obj.fileno(), 0, access=MMAP_ACCESS_READ) as buffer:
+                section_spans = extract_sections(buffer, as_spans=True)
+                self.assertEqual([section_text_from_span(buffer, section_span) for section_span in section_spans],
+                                 SECTION_TEXTS)
+        finally:
+            unlink(file_obj.name)
+
+    def test_crlf_spans(self):
+        buffer = SOURCE.replace('\n', '\r\n').encode('utf-8')
+        self.assertEqual([section_span[2] for section_span in extract_sections(buffer, as_spans=True)],
+                         ['First ä', 'Second'])
+
+    def test_iter_sections(self):
+        for chunk_size in (1, 7, 64, 1 << 16):
+            self.assertEqual(list(iter_sections(StringIO(SOURCE), chunk_size)), SECTION_TEXTS)
+
+    def test_wrong_sources(self):
+        for source in WRONG_SOURCES:
+            with self.assertRaises(Err):
+                extract_sections(source.encode('utf-8'), as_spans=True)
+            with self.assertRaises(Err):
+                list(iter_sections(StringIO(source), 8))
+
+    def test_wrong_section_start_line(self):
+        with self.assertRaises(Err):
+            extract_sections(b'___SECTION :: 9 :: LCONF :: Wrong\n___END', as_spans=True)
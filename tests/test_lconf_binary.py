@@ -0,0 +1,161 @@
+"""
+#### PyLCONF compiled binary LCONF tests
+
+```bash
+make tests
+```
+
+`lconf_binary.dumps` / `loads` and `dump` / `load` must return the same LCONF-Sections: with the same Python types and
+structures in their order, for `lconf_section.parse_section` and `lconf_schema.parse_section_typed` results. Emitting
+a loaded LCONF-Section must give the emitted text of the parsed one. Not representable values and truncated or corrupt
+data must raise an `Err`.
+"""
+from array import array
+from io import BytesIO
+from os import unlink
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from PyLCONF.lconf_binary import (
+    FILE_EXTENSION,
+    FORMAT_VERSION,
+    MAGIC,
+    dump,
+    dumps,
+    load,
+    loads,
+)
+from PyLCONF.lconf_emitter import dumps as emit_dumps
+from PyLCONF.lconf_schema import (
+    compile_schema,
+    parse_section_typed,
+)
+from PyLCONF.lconf_section import parse_section
+from PyLCONF.structure_classes import (
+    StructureArray,
+    StructureColumnTable,
+)
+from PyLCONF.utilities import Err
+
+
+SCHEMA_TEXT = '''___SECTION :: 2 :: STRICT :: Binary
+name :: REQUIRED | TYPE_STRING
+count :: OPTIONAL | TYPE_INTEGER
+ratio :: OPTIONAL | TYPE_FLOAT
+enabled :: OPTIONAL | TYPE_BOOLEAN
+. ids | STRUCTURE_LIST
+  ITEM :: OPTIONAL | TYPE_INTEGER
+. words | STRUCTURE_LIST
+  ITEM :: OPTIONAL | TYPE_STRING
+. rows | STRUCTURE_TABLE
+  x :: OPTIONAL | TYPE_INTEGER
+  label :: OPTIONAL | TYPE_STRING
+  on :: OPTIONAL | TYPE_BOOLEAN
+. hosts | STRUCTURE_NAMED_BLOCKS
+  port :: OPTIONAL | TYPE_INTEGER
+. items | STRUCTURE_UNNAMED_BLOCKS
+  value :: OPTIONAL | TYPE_STRING
+___END'''
+
+SECTION_TEXT = '''___SECTION :: 2 :: LCONF :: Binary
+name :: ä name
+count :: -9223372036854775808
+ratio :: 0.1
+enabled :: false
+- ids :: 1,-2,3
+- words
+  first
+  second word
+| rows
+  |1|a||
+  ||b|true|
+* hosts
+  . alpha
+    port :: 80
+  . beta
+* items
+  .
+    value :: x
+  .
+    value ::
+___END'''
+
+
+class LconfBinaryTest(TestCase):
+
+    def setUp(self):
+        self.schema = compile_schema(SCHEMA_TEXT)
+
+    def assert_same_sections(self, section_objs, loaded_objs):
+        self.assertEqual(len(section_objs), len(loaded_objs))
+        for section_obj, loaded_obj in zip(section_objs, loaded_objs):
+            self.assertEqual((loaded_obj.name, loaded_obj.section_format, loaded_obj.section_indentation_number),
+                             (section_obj.name, section_obj.section_format, section_obj.section_indentation_number))
+            self.assertEqual(loaded_obj.to_python(), section_obj.to_python())
+            self.assertEqual(emit_dumps(loaded_obj), emit_dumps(section_obj))
+
+    def test_parsed_sections(self):
+        section_objs = [parse_section(SECTION_TEXT), parse_section(SECTION_TEXT.replace('Binary', 'Other'))]
+        data = dumps(section_objs)
+        self.assertTrue(data.startswith(MAGIC + bytes([FORMAT_VERSION])))
+        self.assert_same_sections(section_objs, loads(data))
+        self.assert_same_sections(section_objs[:1], loads(dumps(section_objs[0])))
+
+    def test_typed_sections(self):
+        for use_numpy in (False, True):
+            section_obj = parse_section_typed(SECTION_TEXT, self.schema, use_numpy=use_numpy)
+            loaded_obj = loads(dumps(section_obj), use_numpy)[0]
+            self.assert_same_sections([section_obj], [loaded_obj])
+        self.assertIsInstance(loaded_obj['ids'], StructureArray)
+        self.assertIsInstance(loaded_obj['rows'], StructureColumnTable)
+        self.assertIs(loaded_obj['enabled'], False)
+        self.assertEqual(loaded_obj['count'], -9223372036854775808)
+
+    def test_native_blocks(self):
+        section_obj = loads(dumps(parse_section_typed(SECTION_TEXT, self.schema, use_numpy=False)), False)[0]
+        self.assertEqual(section_obj['ids'].values, array('q', [1, -2, 3]))
+        self.assertEqual(section_obj['rows'].column('x'), [1, ''])
+
+    def test_file(self):
+        section_objs = [parse_section_typed(SECTION_TEXT, self.schema)]
+        with NamedTemporaryFile('wb', suffix=FILE_EXTENSION, delete=False) as file_obj:
+            dump(section_objs, file_obj)
+        try:
+            self.assert_same_sections(section_objs, load(file_obj.name))
+        finally:
+            unlink(file_obj.name)
+        buffer = BytesIO()
+        dump(section_objs, buffer)
+        self.assertEqual(buffer.getvalue(), dumps(section_objs))
+
+    def test_empty(self):
+        self.assertEqual(loads(dumps([])), [])
+
+
+class LconfBinaryErrorTest(TestCase):
+
+    def test_not_representable(self):
+        section_obj = parse_section(SECTION_TEXT)
+        section_obj.set_item_value(0, 'line1\nline2')
+        with self.assertRaises(Err):
+            dumps(section_obj)
+        section_obj.set_item_value(0, 1 << 64)
+        with self.assertRaises(Err):
+            dumps(section_obj)
+        section_obj.set_item_value(0, object())
+        with self.assertRaises(Err):
+            dumps(section_obj)
+
+    def test_corrupt_data(self):
+        data = dumps(parse_section(SECTION_TEXT))
+        for wrong_data in (
+            b'',
+            data[:5],
+            b'NOTLCF' + data[6:],
+            MAGIC + bytes([FORMAT_VERSION + 1]) + data[7:],
+            data[:-1],
+            data[:len(data) // 2],
+            data + b'\x00',
+        ):
+            with self.assertRaises(Err):
+                loads(wrong_data)
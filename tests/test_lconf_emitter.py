@@ -0,0 +1,160 @@
+"""
+#### PyLCONF emitter tests
+
+```bash
+make tests
+```
+
+Emits Python objects and parsed LCONF-Sections with `lconf_emitter.dumps` and parses the result again: the parsed
+LCONF-Section must be the emitted one. LCONF-Key-Names and LCONF-Values which LCONF can not represent and wrong
+options must raise an `Err`.
+"""
+from array import array
+from io import StringIO
+from unittest import TestCase
+
+from PyLCONF.lconf_emitter import (
+    EMIT_BUFFER_PARTS,
+    dump,
+    dumps,
+)
+from PyLCONF.lconf_schema import (
+    compile_schema,
+    parse_section_typed,
+)
+from PyLCONF.lconf_section import (
+    extract_sections,
+    parse_section,
+    validate_one_section_fast,
+)
+from PyLCONF.utilities import Err
+
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Typed
+name :: REQUIRED | TYPE_STRING
+count :: REQUIRED | TYPE_INTEGER
+. numbers | STRUCTURE_LIST
+    ITEM :: OPTIONAL | TYPE_FLOAT
+. points | STRUCTURE_TABLE
+    x :: OPTIONAL | TYPE_INTEGER
+    is_set :: OPTIONAL | TYPE_BOOLEAN
+___END'''
+
+SECTION_TEXT = '''___SECTION :: 4 :: LCONF :: Typed
+name :: x y
+count :: 7
+- numbers :: 1.5,2.0,-3.25
+| points
+    |1|true|
+    ||false|
+    |3||
+___END'''
+
+
+def round_trip(section_name, block, indentation=4):
+    """ Returns the parsed LCONF-Section of `dumps({section_name: block})` as Python objects.
+    """
+    section_texts = extract_sections(dumps({section_name: block}, indentation))
+    return parse_section(section_texts[0]).to_python()
+
+
+class EmitterRoundTripTest(TestCase):
+
+    def test_plain_objects(self):
+        block = {
+            'key': 'value with :: separator',
+            'empty': '',
+            'number': 12,
+            'flag': True,
+            'spaces': 'a  b\tc',
+            'words': ['first item', 'second: item'],
+            'numbers': [1, 2.5, -3],
+            'signed': ['-1', '2', ' 3', '#4'],
+            'table': [('a', '', ' spaced cell '), ('1', '2', '3')],
+            'block': {'inner': 'x', 'list': ['y']},
+            'blocks': [{'a': '1'}, {'a': '2'}],
+        }
+        self.assertEqual(round_trip('Plain', block), {
+            'key': 'value with :: separator',
+            'empty': '',
+            'number': '12',
+            'flag': 'true',
+            'spaces': 'a  b\tc',
+            'words': ['first item', 'second: item'],
+            'numbers': ['1', '2.5', '-3'],
+            'signed': ['-1', '2', ' 3', '#4'],
+            'table': [['a', '', ' spaced cell '], ['1', '2', '3']],
+            'block': {'inner': 'x', 'list': ['y']},
+            'blocks': [{'a': '1'}, {'a': '2'}],
+        })
+
+    def test_all_indentation_numbers(self):
+        for indentation in range(2, 9):
+            self.assertEqual(round_trip('Indent', {'block': {'inner': {'key': 'v'}}}, indentation),
+                             {'block': {'inner': {'key': 'v'}}})
+
+    def test_parsed_section(self):
+        section_obj = parse_section(SECTION_TEXT)
+        emitted_text = dumps(section_obj)
+        validate_one_section_fast(emitted_text.rstrip('\n'))
+        self.assertEqual(parse_section(emitted_text.rstrip('\n')).to_python(), section_obj.to_python())
+
+    def test_typed_section(self):
+        schema = compile_schema(SCHEMA_TEXT)
+        section_obj = parse_section_typed(SECTION_TEXT, schema)
+        emitted_text = dumps(section_obj)
+        self.assertEqual(parse_section_typed(emitted_text.rstrip('\n'), schema).to_python(), section_obj.to_python())
+
+    def test_large_list_is_written_in_chunks(self):
+        writes = []
+        fileobj = StringIO()
+        fileobj.write = writes.append
+        values = array('q', range(EMIT_BUFFER_PARTS * 3))
+        dump({'Large': {'values': values}}, fileobj)
+        self.assertGreater(len(writes), 3)
+        emitted = parse_section(extract_sections(''.join(writes))[0]).to_python()
+        self.assertEqual(emitted['values'], [str(value) for value in values])
+
+
+class EmitterErrorTest(TestCase):
+
+    def assert_not_representable(self, block):
+        with self.assertRaises(Err):
+            dumps({'Wrong': block})
+
+    def test_wrong_indentation(self):
+        for indentation in (0, 1, 9, 10, '4', True):
+            with self.assertRaises(Err):
+                dumps({'S': {'key': 'value'}}, indentation)
+
+    def test_wrong_comments_option(self):
+        with self.assertRaises(Err):
+            dumps({'S': {'key': 'value'}}, comments='Some')
+
+    def test_values(self):
+        for value in ('x ', ' x', 'line1\nline2', 'line1\rline2', 'a\u2028b'):
+            self.assert_not_representable({'key': value})
+
+    def test_keys(self):
+        for key in ('', 'k :: j', 'k::j', 'k ', ' k', '-k', '|k', '.k', '*k', '#k', 'k\nj'):
+            self.assert_not_representable({key: 'v'})
+        for key in ('', 'k :: j', 'k ', ' k'):
+            self.assert_not_representable({key: {'inner': 'v'}})
+        self.assert_not_representable({'table|': [('a', 'b')]})
+
+    def test_list_items(self):
+        for items in ([''], ['ok', 'a\nb'], ['ok', 'a :: b'], [' x', 'ok'], ['ok', 'x '], ['-1', 'a,b']):
+            self.assert_not_representable({'list': items})
+
+    def test_table_cells(self):
+        for cell in ('a|b', 'a::b', 'a\nb'):
+            self.assert_not_representable({'table': [('ok', cell)]})
+
+    def test_table_rows(self):
+        for rows in ([()], [('a', 'b'), ('c',)], [('a',), ('b', 'c')]):
+            self.assert_not_representable({'table': rows})
+
+    def test_section_names(self):
+        for section_name in ('', ' S', 'S ', 'S\nT'):
+            with self.assertRaises(Err):
+                dumps({section_name: {'key': 'value'}})
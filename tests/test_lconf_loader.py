@@ -0,0 +1,128 @@
+"""
+#### PyLCONF loader cache tests
+
+```bash
+make tests
+```
+
+`lconf_loader.load` with a `cache_dir` must return the same LCONF-Sections as without: a second `load` of the same
+LCONF-File with the same LCONF-Schema reads the cache file instead of parsing. A fingerprint mismatch (changed
+LCONF-File, other LCONF-Schema or options) and a corrupt cache file must parse the LCONF-File again and replace the
+cache file. A not valid LCONF-File must raise its error and write no cache file.
+"""
+from os import (
+    listdir,
+    unlink,
+)
+from os.path import join as path_join
+from shutil import rmtree
+from tempfile import (
+    NamedTemporaryFile,
+    mkdtemp,
+)
+from unittest import TestCase
+from unittest.mock import patch
+
+from PyLCONF import lconf_loader
+from PyLCONF.lconf_loader import (
+    CACHE_FILE_EXTENSION,
+    CACHE_MAGIC,
+    load,
+)
+from PyLCONF.lconf_schema import compile_schema
+from PyLCONF.utilities import SectionErr
+
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Cached
+port :: REQUIRED | TYPE_INTEGER
+. ids | STRUCTURE_LIST
+    ITEM :: OPTIONAL | TYPE_INTEGER
+___END'''
+
+FILE_TEXT = '''Additional text
+___SECTION :: 4 :: LCONF :: Cached
+port :: 80
+- ids :: 1,2,3
+___END
+___SECTION :: 4 :: LCONF :: Plain
+key :: value
+___END
+'''
+
+
+class LoaderCacheTest(TestCase):
+
+    def setUp(self):
+        self.cache_dir = mkdtemp()
+        with NamedTemporaryFile('wb', suffix='.lconf', delete=False) as file_obj:
+            file_obj.write(FILE_TEXT.encode('utf-8'))
+        self.path = file_obj.name
+        self.schemas = {'Cached': compile_schema(SCHEMA_TEXT)}
+        self.parse_count = 0
+
+    def tearDown(self):
+        unlink(self.path)
+        rmtree(self.cache_dir)
+
+    def counted_load(self, schemas, **kwargs):
+        """ Returns `load(self.path, schemas, self.cache_dir)` as Python objects: counts the parses.
+        """
+        parse_sections = lconf_loader._parse_sections
+
+        def counted_parse_sections(*args):
+            self.parse_count += 1
+            return parse_sections(*args)
+
+        with patch.object(lconf_loader, '_parse_sections', counted_parse_sections):
+            return [section_obj.to_python() for section_obj in load(self.path, schemas, self.cache_dir, **kwargs)]
+
+    def write_file(self, text):
+        with open(self.path, 'wb') as file_obj:
+            file_obj.write(text.encode('utf-8'))
+
+    def cache_path(self):
+        cache_file_names = listdir(self.cache_dir)
+        self.assertEqual(len(cache_file_names), 1)
+        self.assertTrue(cache_file_names[0].endswith(CACHE_FILE_EXTENSION))
+        return path_join(self.cache_dir, cache_file_names[0])
+
+    def test_cache_hit(self):
+        expected = [section_obj.to_python() for section_obj in load(self.path, self.schemas)]
+        self.assertEqual(expected, [{'port': 80, 'ids': [1, 2, 3]}, {'key': 'value'}])
+        self.assertEqual(self.counted_load(self.schemas), expected)
+        self.assertEqual(self.counted_load(self.schemas), expected)
+        self.assertEqual(self.parse_count, 1)
+        with open(self.cache_path(), 'rb') as file_obj:
+            self.assertEqual(file_obj.read(len(CACHE_MAGIC)), CACHE_MAGIC)
+
+    def test_fingerprint_mismatch(self):
+        self.counted_load(self.schemas)
+        self.write_file(FILE_TEXT.replace('port :: 80', 'port :: 81'))
+        self.assertEqual(self.counted_load(self.schemas)[0]['port'], 81)
+        self.assertEqual(self.parse_count, 2)
+        self.assertEqual(self.counted_load(None)[0]['port'], '81')
+        self.assertEqual(self.counted_load(self.schemas, use_records=True)[0]['port'], 81)
+        flexible_schemas = {'Cached': compile_schema(SCHEMA_TEXT.replace('STRICT', 'FLEXIBLE'))}
+        self.assertEqual(self.counted_load(flexible_schemas)[0]['port'], 81)
+        self.assertEqual(self.parse_count, 5)
+        self.counted_load(flexible_schemas)
+        self.assertEqual(self.parse_count, 5)
+
+    def test_corrupt_cache_file(self):
+        expected = self.counted_load(self.schemas)
+        cache_path = self.cache_path()
+        with open(cache_path, 'rb') as file_obj:
+            cache_bytes = file_obj.read()
+        for wrong_bytes in (b'', cache_bytes[:-10], b'X' + cache_bytes[1:]):
+            with open(cache_path, 'wb') as file_obj:
+                file_obj.write(wrong_bytes)
+            self.assertEqual(self.counted_load(self.schemas), expected)
+        self.assertEqual(self.parse_count, 4)
+        with open(cache_path, 'rb') as file_obj:
+            self.assertEqual(file_obj.read(), cache_bytes)
+
+    def test_not_valid_file(self):
+        self.write_file(FILE_TEXT.replace('port :: 80', 'port :: x'))
+        with self.assertRaises(SectionErr):
+            load(self.path, self.schemas, self.cache_dir)
+        self.assertEqual(listdir(self.cache_dir), [])
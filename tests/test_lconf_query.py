@@ -0,0 +1,119 @@
+"""
+#### PyLCONF key-path query tests
+
+```bash
+make tests
+```
+
+`lconf_query.query` must return for each key path of a LCONF-Section the same item as `lconf_section.parse_section`:
+for `str` and UTF-8 `bytes` sources. Missing LCONF-Sections and names must raise a KeyError, indexes out of range an
+IndexError and a missing LCONF-Section-End-Line or a wrong line of the target item an `Err`.
+"""
+from unittest import TestCase
+
+from PyLCONF.lconf_query import (
+    query,
+    split_key_path,
+)
+from PyLCONF.lconf_section import parse_section
+from PyLCONF.utilities import (
+    Err,
+    SectionErr,
+)
+
+
+SECTION_TEXT = '''___SECTION :: 4 :: LCONF :: Query ä
+key :: value ü
+empty ::
+- compact :: a,b,c
+- list
+    first item
+
+    # comment
+    second item
+| table
+    |1|2|
+    |3||
+. block
+    inner :: x
+    . nested
+        deep :: y
+* named
+    . one
+        value :: 1
+    . two
+        - values :: 2,3
+* unnamed
+    .
+        value :: 4
+    .
+        value :: 5
+last :: end
+___END'''
+
+SOURCE = 'Additional text\n___SECTION :: 4 :: LCONF :: Other\nkey :: other\n___END\n' + SECTION_TEXT + '\ntext\n'
+
+
+def iter_key_paths(key_path, value):
+    """ Yields `(key_path, value)` of all items below `value` (a `to_python` result) and the item itself.
+    """
+    yield key_path, value
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from iter_key_paths(key_path + [key], item)
+    elif isinstance(value, list):
+        for idx, item in enumerate(value):
+            yield from iter_key_paths(key_path + [idx], item)
+
+
+def to_python(result):
+    if isinstance(result, tuple):
+        return list(result)
+    return result if isinstance(result, str) else result.to_python()
+
+
+class QueryTest(TestCase):
+
+    def test_all_key_paths(self):
+        section_obj = parse_section(SECTION_TEXT).to_python()
+        key_paths = list(iter_key_paths(['Query ä'], section_obj))
+        self.assertGreater(len(key_paths), 30)
+        for source in (SOURCE, SOURCE.encode('utf-8'), memoryview(SOURCE.encode('utf-8'))):
+            for key_path, value in key_paths:
+                self.assertEqual(to_python(query(source, key_path)), value, key_path)
+
+    def test_str_key_paths(self):
+        self.assertEqual(split_key_path('Query ä/table/1/0'), ['Query ä', 'table', '1', '0'])
+        self.assertEqual(split_key_path(('a/b', 2)), ['a/b', '2'])
+        self.assertEqual(query(SOURCE, 'Query ä/named/two/values/1'), '3')
+        self.assertEqual(query(SOURCE, 'Query ä/unnamed/1/value'), '5')
+        self.assertEqual(query(SOURCE, 'Other/key'), 'other')
+
+    def test_skipped_items_are_not_validated(self):
+        source = SECTION_TEXT.replace('inner :: x', 'inner  ::  wrong ')
+        self.assertEqual(query(source, 'Query ä/last'), 'end')
+
+
+class QueryErrorTest(TestCase):
+
+    def test_missing(self):
+        for key_path in ('Missing', 'Query ä/missing', 'Query ä/block/missing', 'Query ä/named/three',
+                         'Query ä/list/x', 'Query ä/key/0', 'Query ä/block/inner/x'):
+            with self.assertRaises(KeyError):
+                query(SOURCE, key_path)
+
+    def test_index_out_of_range(self):
+        for key_path in ('Query ä/list/2', 'Query ä/table/2', 'Query ä/unnamed/2', 'Query ä/compact/3',
+                         'Query ä/table/0/2'):
+            with self.assertRaises(IndexError):
+                query(SOURCE, key_path)
+
+    def test_missing_section_end(self):
+        source = SECTION_TEXT[:-len('\n___END')]
+        for key_path in ('Query ä', 'Query ä/last', 'Query ä/missing'):
+            with self.assertRaises(Err):
+                query(source, key_path)
+
+    def test_wrong_target_item(self):
+        with self.assertRaises(SectionErr):
+            query(SECTION_TEXT.replace('inner :: x', 'inner  :: x'), 'Query ä/block')
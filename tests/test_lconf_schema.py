@@ -0,0 +1,161 @@
+"""
+#### PyLCONF compiled LCONF-Schema tests
+
+```bash
+make tests
+```
+
+`lconf_schema.compile_schema` compiles a LCONF-Schema-Section into an immutable `LconfSchema`: LCONF-Sections which
+match it must validate with `lconf_section.validate_one_section_complet` and the other ones must raise a `SectionErr`
+with their `ERR_SCHEMA_*` code and line number. Wrong LCONF-Schema-Sections must raise an `Err`.
+"""
+from os import unlink
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from PyLCONF.lconf_schema import (
+    LconfSchema,
+    SCHEMA_LIST,
+    SCHEMA_NAMED_BLOCKS,
+    SCHEMA_PAIR,
+    SCHEMA_TABLE,
+    compile_schema,
+    validate_schemas_from_file,
+)
+from PyLCONF.lconf_section import validate_one_section_complet
+from PyLCONF.utilities import (
+    ERR_SCHEMA,
+    ERR_SCHEMA_COLUMNS,
+    ERR_SCHEMA_DUPLICATE_KEY,
+    ERR_SCHEMA_ITEM_TYPE,
+    ERR_SCHEMA_KEY_VALUE_SEPARATOR,
+    ERR_SCHEMA_MISSING_KEY,
+    ERR_SCHEMA_NOT_EMPTY,
+    ERR_SCHEMA_UNKNOWN_KEY,
+    ERR_SCHEMA_VALUE_TYPE,
+    ERR_SECTION_FORMAT,
+    Err,
+    SectionErr,
+)
+
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Server
+host :: REQUIRED_NOT_EMPTY | TYPE_STRING
+port :: REQUIRED | TYPE_INTEGER
+debug :: OPTIONAL | TYPE_BOOLEAN
+. ratios | STRUCTURE_LIST
+    ITEM :: OPTIONAL | TYPE_FLOAT
+. users | STRUCTURE_TABLE
+    name :: OPTIONAL | TYPE_STRING
+    uid :: OPTIONAL | TYPE_INTEGER
+. routes | STRUCTURE_NAMED_BLOCKS
+    path :: REQUIRED | TYPE_STRING
+    weight :: OPTIONAL | TYPE_NUMBER
+___END'''
+
+SECTION_TEXT = '''___SECTION :: 4 :: LCONF :: Server
+host :: example.org
+port :: 8080
+- ratios :: 0.5,1,2.5
+| users
+    |root|0|
+    |guest||
+* routes
+    . home
+        path :: /
+        weight :: 1.5
+    . api
+        path :: /api
+___END'''
+
+
+def section(*lines):
+    """ Returns a LCONF-Section text of the Server LCONF-Schema with the `lines`.
+    """
+    return '\n'.join(('___SECTION :: 4 :: LCONF :: Server',) + lines + ('___END',))
+
+
+class CompileSchemaTest(TestCase):
+
+    def test_compile(self):
+        schema = compile_schema(SCHEMA_TEXT)
+        self.assertIsInstance(schema, LconfSchema)
+        self.assertEqual((schema.name, schema.section_format), ('Server', 'STRICT'))
+        self.assertEqual(schema.root.keys, ('host', 'port', 'debug', 'ratios', 'users', 'routes'))
+        self.assertEqual([schema.root.items[key].schema_kind for key in ('port', 'ratios', 'users', 'routes')],
+                         [SCHEMA_PAIR, SCHEMA_LIST, SCHEMA_TABLE, SCHEMA_NAMED_BLOCKS])
+        self.assertEqual([column.key for column in schema.root.items['users'].child], ['name', 'uid'])
+        self.assertEqual(schema.digest, compile_schema(SCHEMA_TEXT.encode('utf-8')).digest)
+        self.assertNotEqual(schema.digest, compile_schema(SCHEMA_TEXT.replace('TYPE_NUMBER', 'TYPE_FLOAT')).digest)
+
+    def test_immutable(self):
+        schema = compile_schema(SCHEMA_TEXT)
+        with self.assertRaises(AttributeError):
+            schema.name = 'Other'
+        with self.assertRaises(TypeError):
+            schema.root.items['host'] = None
+
+    def test_validate_schemas_from_file(self):
+        with NamedTemporaryFile('w', encoding='utf-8', suffix='.lconfsd', delete=False) as file_obj:
+            file_obj.write('text\n{}\ntext\n{}\n'.format(SCHEMA_TEXT, SCHEMA_TEXT.replace('Server', 'Other')))
+        try:
+            self.assertTrue(validate_schemas_from_file(file_obj.name))
+        finally:
+            unlink(file_obj.name)
+
+    def test_wrong_schemas(self):
+        for schema_text in (
+            SCHEMA_TEXT.replace('REQUIRED | TYPE_INTEGER', 'NEEDED | TYPE_INTEGER'),
+            SCHEMA_TEXT.replace('TYPE_BOOLEAN', 'TYPE_COLOR'),
+            SCHEMA_TEXT.replace('OPTIONAL | TYPE_FLOAT', 'TYPE_FLOAT'),
+            SCHEMA_TEXT.replace('    ITEM ::', '    VALUE ::'),
+            SCHEMA_TEXT.replace('STRUCTURE_NAMED_BLOCKS', 'STRUCTURE_BLOCKS'),
+            SCHEMA_TEXT.replace('debug ::', 'port ::'),
+            '___SECTION :: 4 :: STRICT :: T\n. t | STRUCTURE_TABLE\n___END',
+        ):
+            with self.assertRaises(Err) as context:
+                compile_schema(schema_text)
+            self.assertEqual(context.exception.code, ERR_SCHEMA)
+        with self.assertRaises(Err) as context:
+            compile_schema(SECTION_TEXT)
+        self.assertEqual(context.exception.code, ERR_SECTION_FORMAT)
+
+
+class ValidateSectionCompletTest(TestCase):
+
+    def setUp(self):
+        self.schema = compile_schema(SCHEMA_TEXT)
+
+    def assert_schema_err(self, section_text, code, line_number):
+        for text in (section_text, section_text.encode('utf-8')):
+            with self.assertRaises(SectionErr) as context:
+                validate_one_section_complet(text, self.schema)
+            self.assertEqual((context.exception.code, context.exception.line_number), (code, line_number))
+
+    def test_valid_sections(self):
+        self.assertIs(validate_one_section_complet(SECTION_TEXT, self.schema), True)
+        self.assertIs(validate_one_section_complet(SECTION_TEXT.encode('utf-8'), self.schema), True)
+        self.assertIs(validate_one_section_complet(section('host :: h', 'port ::'), self.schema), True)
+
+    def test_flexible_schema(self):
+        schema = compile_schema(SCHEMA_TEXT.replace('STRICT', 'FLEXIBLE'))
+        self.assertIs(validate_one_section_complet(section('host :: h', 'port :: 1', 'other :: x'), schema), True)
+
+    def test_key_errors(self):
+        self.assert_schema_err(section('host :: h', 'port :: 1', 'other :: x'), ERR_SCHEMA_UNKNOWN_KEY, 4)
+        self.assert_schema_err(section('host :: h', 'port :: 1', 'port :: 2'), ERR_SCHEMA_DUPLICATE_KEY, 4)
+        self.assert_schema_err(section('host :: h'), ERR_SCHEMA_MISSING_KEY, 1)
+        self.assert_schema_err(section('host ::', 'port :: 1'), ERR_SCHEMA_NOT_EMPTY, 2)
+
+    def test_value_errors(self):
+        for line in ('port :: 1_000', 'port :: 80.0', 'port :: 9223372036854775808'):
+            self.assert_schema_err(section('host :: h', line), ERR_SCHEMA_VALUE_TYPE, 3)
+        self.assert_schema_err(section('host :: h', 'port :: 1', 'debug :: yes'), ERR_SCHEMA_VALUE_TYPE, 4)
+        self.assert_schema_err(section('host :: h', 'port :: 1', '- ratios :: 1,x'), ERR_SCHEMA_VALUE_TYPE, 4)
+
+    def test_structure_errors(self):
+        self.assert_schema_err(section('host :: h', 'port :: 1', '| users', '    |a|1|2|'), ERR_SCHEMA_COLUMNS, 5)
+        self.assert_schema_err(section('host :: h', 'port :: 1', '. routes', '    path :: /'), ERR_SCHEMA_ITEM_TYPE, 4)
+
+    def test_second_key_value_separator(self):
+        self.assert_schema_err(section('host :: a :: b', 'port :: 1'), ERR_SCHEMA_KEY_VALUE_SEPARATOR, 2)
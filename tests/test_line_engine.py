@@ -0,0 +1,133 @@
+"""
+#### PyLCONF line engine tests
+
+```bash
+make tests
+```
+
+`line_engine.iter_section_lines` must yield the same line kinds for `str` and UTF-8 `bytes` LCONF-Sections and
+`lconf_section.parse_section` must return their values. The LCONF_KEY_VALUE_SEPARATOR rule of the module docstring is
+pinned: the first `::` of a line is the separator. Wrong lines must raise a `SectionErr` with their `ERR_*` code and
+line number.
+"""
+from unittest import TestCase
+
+from PyLCONF.lconf_section import (
+    parse_section,
+    section_line_table,
+    validate_one_section_fast,
+)
+from PyLCONF.line_engine import (
+    LINE_BLOCKS,
+    LINE_COMPACT_LIST,
+    LINE_LIST,
+    LINE_LIST_VALUE,
+    LINE_NAMED_BLOCK,
+    LINE_PAIR,
+    LINE_SINGLE_BLOCK,
+    LINE_TABLE,
+    LINE_TABLE_ROW,
+    iter_section_lines,
+)
+from PyLCONF.utilities import (
+    ERR_IDENTIFIER_KEY_VALUE_SEPARATOR,
+    ERR_INDENTATION_JUMP,
+    ERR_KEY_VALUE_SEPARATOR,
+    ERR_TRAILING_SPACE,
+    SectionErr,
+)
+
+
+SECTION_TEXT = '''___SECTION :: 4 :: LCONF :: Lines ä
+# comment
+key :: value ü
+empty ::
+- compact :: a,b
+- list
+    item 1
+
+| table
+    |1|2|
+. block
+    inner :: x
+* blocks
+    . first
+        name :: 1
+___END'''
+
+LINE_KINDS = [
+    LINE_PAIR, LINE_PAIR, LINE_COMPACT_LIST, LINE_LIST, LINE_LIST_VALUE, LINE_TABLE, LINE_TABLE_ROW,
+    LINE_SINGLE_BLOCK, LINE_PAIR, LINE_BLOCKS, LINE_NAMED_BLOCK, LINE_PAIR,
+]
+
+SECTION_OBJ = {
+    'key': 'value ü',
+    'empty': '',
+    'compact': ['a', 'b'],
+    'list': ['item 1'],
+    'table': [['1', '2']],
+    'block': {'inner': 'x'},
+    'blocks': {'first': {'name': '1'}},
+}
+
+
+def section(*lines):
+    """ Returns a LCONF-Section text with the `lines`.
+    """
+    return '\n'.join(('___SECTION :: 4 :: LCONF :: S',) + lines + ('___END',))
+
+
+def line_kinds(section_text):
+    """ Returns the `(line_kind, line_number)` of the lines of `section_text`.
+    """
+    line_table, section_indentation_number, section_format, section_name = section_line_table(section_text)
+    return [
+        (line_kind, line_number) for line_kind, _, _, _, _, _, line_number in
+        iter_section_lines(line_table, section_indentation_number, section_format, section_name, 'test')
+    ]
+
+
+class LineEngineTest(TestCase):
+
+    def test_line_kinds(self):
+        expected = list(zip(LINE_KINDS, [3, 4, 5, 6, 7, 9, 10, 11, 12, 13, 14, 15]))
+        self.assertEqual(line_kinds(SECTION_TEXT), expected)
+        self.assertEqual(line_kinds(SECTION_TEXT.encode('utf-8')), expected)
+
+    def test_parse_section(self):
+        self.assertEqual(parse_section(SECTION_TEXT).to_python(), SECTION_OBJ)
+        self.assertEqual(parse_section(SECTION_TEXT.encode('utf-8')).to_python(), SECTION_OBJ)
+
+    def test_separator_in_values(self):
+        for line, expected in (
+            ('key :: a  :: x', {'key': 'a  :: x'}),
+            ('key :: ::  x', {'key': '::  x'}),
+            ('key :: a::b', {'key': 'a::b'}),
+            ('- list :: a,b  ::c', {'list': ['a', 'b  ::c']}),
+        ):
+            section_text = section(line)
+            self.assertTrue(validate_one_section_fast(section_text))
+            self.assertTrue(validate_one_section_fast(section_text.encode('utf-8')))
+            self.assertEqual(parse_section(section_text).to_python(), expected)
+
+
+class LineEngineErrorTest(TestCase):
+
+    def assert_section_err(self, section_text, code, line_number):
+        for text in (section_text, section_text.encode('utf-8')):
+            with self.assertRaises(SectionErr) as context:
+                validate_one_section_fast(text)
+            self.assertEqual((context.exception.code, context.exception.line_number), (code, line_number))
+            with self.assertRaises(SectionErr):
+                parse_section(text)
+
+    def test_separator_in_keys(self):
+        for line in ('a::b :: v', 'a:: b :: v', 'key ::b', 'key  :: v', 'key ::  v', 'key:: v'):
+            self.assert_section_err(section('ok :: 1', line), ERR_KEY_VALUE_SEPARATOR, 3)
+
+    def test_separator_in_identifier_lines(self):
+        self.assert_section_err(section('. block :: x'), ERR_IDENTIFIER_KEY_VALUE_SEPARATOR, 2)
+
+    def test_wrong_lines(self):
+        self.assert_section_err(section('key :: v '), ERR_TRAILING_SPACE, 2)
+        self.assert_section_err(section('. block', '        key :: v'), ERR_INDENTATION_JUMP, 3)
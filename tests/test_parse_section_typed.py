@@ -0,0 +1,193 @@
+"""
+#### PyLCONF typed parse tests
+
+```bash
+make tests
+```
+
+`lconf_schema.parse_section_typed` must convert the LCONF-Values of a LCONF-Section to the LCONF-Value-Types of its
+LCONF-Schema: typed STRUCTURE_LISTs are `StructureArray`s, STRUCTURE_TABLEs `StructureColumnTable`s and with
+`use_records` the blocks of a STRICT LCONF-Schema are records. The values must equal the converted values of
+`lconf_section.parse_section`. Wrong LCONF-Values must raise a `SectionErr` with their line number.
+"""
+from array import array
+from pickle import (
+    dumps as pickle_dumps,
+    loads as pickle_loads,
+)
+from unittest import TestCase
+
+from PyLCONF.lconf_schema import (
+    compile_schema,
+    parse_section_typed,
+)
+from PyLCONF.lconf_section import (
+    extract_sections,
+    parse_section,
+)
+from PyLCONF.structure_classes import (
+    RECORD_CLASSES_CACHE_SIZE,
+    StructureArray,
+    StructureColumnTable,
+    StructureRecord,
+    StructureSingleBlock,
+    record_class,
+)
+from PyLCONF.utilities import (
+    ERR_SCHEMA_COLUMNS,
+    ERR_SCHEMA_VALUE_TYPE,
+    ERR_SECTION_FORMAT,
+    Err,
+    SectionErr,
+)
+
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Measurements
+station :: REQUIRED | TYPE_STRING
+code :: OPTIONAL | TYPE_DIGITS
+count :: REQUIRED | TYPE_INTEGER
+scale :: OPTIONAL | TYPE_NUMBER
+. samples | STRUCTURE_LIST
+    ITEM :: OPTIONAL | TYPE_FLOAT
+. flags | STRUCTURE_LIST
+    ITEM :: OPTIONAL | TYPE_BOOLEAN
+. ids | STRUCTURE_LIST
+    ITEM :: OPTIONAL | TYPE_INTEGER
+. readings | STRUCTURE_TABLE
+    hour :: OPTIONAL | TYPE_INTEGER
+    value :: OPTIONAL | TYPE_FLOAT
+    valid :: OPTIONAL | TYPE_BOOLEAN
+. sensors | STRUCTURE_UNNAMED_BLOCKS
+    kind :: REQUIRED | TYPE_STRING
+    offset :: OPTIONAL | TYPE_FLOAT
+___END'''
+
+SECTION_TEXT = '''___SECTION :: 4 :: LCONF :: Measurements
+station :: north ä
+code :: 0042
+count :: -7
+scale :: 2.5
+- samples :: 1.5,-2,3e2
+- flags
+    true
+    false
+- ids :: 1,2,3
+| readings
+    |0|1.5|true|
+    |1||false|
+    |2|-3.25||
+* sensors
+    .
+        kind :: wind
+        offset :: 0.5
+    .
+        kind :: rain
+___END'''
+
+SECTION_OBJ = {
+    'station': 'north ä',
+    'code': '0042',
+    'count': -7,
+    'scale': 2.5,
+    'samples': [1.5, -2.0, 300.0],
+    'flags': [True, False],
+    'ids': [1, 2, 3],
+    'readings': [[0, 1.5, True], [1, '', False], [2, -3.25, '']],
+    'sensors': [{'kind': 'wind', 'offset': 0.5}, {'kind': 'rain'}],
+}
+
+
+def section(*lines):
+    """ Returns a LCONF-Section text of the Measurements LCONF-Schema with the `lines`.
+    """
+    return '\n'.join(('___SECTION :: 4 :: LCONF :: Measurements', 'station :: s', 'count :: 1') + lines +
+                     ('___END',))
+
+
+class ParseSectionTypedTest(TestCase):
+
+    def setUp(self):
+        self.schema = compile_schema(SCHEMA_TEXT)
+
+    def test_to_python(self):
+        for section_text in (SECTION_TEXT, SECTION_TEXT.encode('utf-8')):
+            for use_numpy in (False, True):
+                for use_records in (False, True):
+                    section_obj = parse_section_typed(section_text, self.schema, use_numpy=use_numpy,
+                                                      use_records=use_records)
+                    self.assertEqual(section_obj.to_python(), SECTION_OBJ)
+
+    def test_same_values_as_parse_section(self):
+        plain = parse_section(SECTION_TEXT).to_python()
+        typed = parse_section_typed(SECTION_TEXT, self.schema, use_numpy=False).to_python()
+        self.assertEqual(plain.keys(), typed.keys())
+        self.assertEqual([float(value) for value in plain['samples']], typed['samples'])
+        self.assertEqual([int(value) for value in plain['ids']], typed['ids'])
+        self.assertEqual(plain['station'], typed['station'])
+
+    def test_span(self):
+        buffer = ('text\n' + SECTION_TEXT + '\n').encode('utf-8')
+        section_span = extract_sections(buffer, as_spans=True)[0]
+        self.assertEqual(parse_section_typed(section_span, self.schema, buffer).to_python(), SECTION_OBJ)
+
+    def test_typed_structures(self):
+        section_obj = parse_section_typed(SECTION_TEXT, self.schema, use_numpy=False)
+        self.assertIsInstance(section_obj['samples'], StructureArray)
+        self.assertEqual(section_obj['samples'].values, array('d', [1.5, -2.0, 300.0]))
+        self.assertEqual(section_obj['ids'].values, array('q', [1, 2, 3]))
+        readings = section_obj['readings']
+        self.assertIsInstance(readings, StructureColumnTable)
+        self.assertEqual(readings.column('hour'), array('q', [0, 1, 2]))
+        self.assertEqual(readings.column('value'), [1.5, '', -3.25])
+        self.assertEqual(readings.column_sum('value'), -1.75)
+        self.assertEqual(readings.row(1), (1, '', False))
+
+    def test_records(self):
+        section_obj = parse_section_typed(SECTION_TEXT, self.schema, use_numpy=False, use_records=True)
+        first, second = section_obj['sensors']
+        self.assertIsInstance(first, StructureRecord)
+        self.assertIs(first.__class__, second.__class__)
+        self.assertEqual((first.kind, first.offset, first['offset']), ('wind', 0.5, 0.5))
+        self.assertNotIn('offset', second)
+        self.assertEqual(pickle_loads(pickle_dumps(first)).to_python(), first.to_python())
+        flexible_schema = compile_schema(SCHEMA_TEXT.replace('STRICT', 'FLEXIBLE'))
+        section_obj = parse_section_typed(SECTION_TEXT, flexible_schema, use_numpy=False, use_records=True)
+        self.assertIsInstance(section_obj['sensors'][0], StructureSingleBlock)
+
+    def test_record_class_cache(self):
+        section_obj = parse_section_typed(SECTION_TEXT, self.schema, use_numpy=False, use_records=True)
+        first = section_obj['sensors'][0]
+        self.assertEqual(record_class.cache_info().maxsize, RECORD_CLASSES_CACHE_SIZE)
+        for idx in range(RECORD_CLASSES_CACHE_SIZE + 1):
+            record_class(('key {}'.format(idx),))
+        self.assertEqual(record_class.cache_info().currsize, RECORD_CLASSES_CACHE_SIZE)
+        self.assertIsNot(record_class(first._keys), first.__class__)
+        # Records of a dropped class keep working
+        self.assertEqual(first.kind, 'wind')
+        self.assertEqual(pickle_loads(pickle_dumps(first)).to_python(), first.to_python())
+
+
+class ParseSectionTypedErrorTest(TestCase):
+
+    def setUp(self):
+        self.schema = compile_schema(SCHEMA_TEXT)
+
+    def assert_section_err(self, section_text, code, line_number):
+        for use_numpy in (False, True):
+            with self.assertRaises(SectionErr) as context:
+                parse_section_typed(section_text, self.schema, use_numpy=use_numpy)
+            self.assertEqual((context.exception.code, context.exception.line_number), (code, line_number))
+
+    def test_wrong_values(self):
+        for line in ('code :: 4a', 'code :: \uff14\uff12', 'scale :: 1_0', 'scale :: 1e', '- ids :: 1,1_000',
+                     '- ids :: 1,9223372036854775808', '- samples :: 1.5, 2', '- flags :: true,yes'):
+            self.assert_section_err(section(line), ERR_SCHEMA_VALUE_TYPE, 4)
+
+    def test_wrong_table_rows(self):
+        self.assert_section_err(section('| readings', '    |0|1.5|'), ERR_SCHEMA_COLUMNS, 5)
+        self.assert_section_err(section('| readings', '    |0|x|true|'), ERR_SCHEMA_VALUE_TYPE, 5)
+
+    def test_wrong_section_format(self):
+        with self.assertRaises(Err) as context:
+            parse_section_typed(SCHEMA_TEXT, self.schema)
+        self.assertEqual(context.exception.code, ERR_SECTION_FORMAT)
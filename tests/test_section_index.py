@@ -0,0 +1,154 @@
+"""
+#### PyLCONF section index tests
+
+```bash
+make tests
+```
+
+`lconf_loader.load_section` must return the same LCONF-Section as `lconf_loader.load` using the sidecar index file of
+`section_index`: it is built on the first call and rebuilt if the LCONF-File changed, also if the change kept the
+fingerprint of the LCONF-File. A missing LCONF-Section must raise a KeyError and a truncated index file an `Err`.
+"""
+from os import (
+    stat as os_stat,
+    utime,
+)
+from os.path import (
+    isfile as path_isfile,
+    join as path_join,
+)
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from PyLCONF.indexer import iter_lconf_files
+from PyLCONF.lconf_loader import (
+    load,
+    load_section,
+)
+from PyLCONF.lconf_schema import compile_schema
+from PyLCONF.section_index import (
+    FINGERPRINT_SAMPLE_SIZE,
+    INDEX_HEADER,
+    build_index,
+    index_path,
+    open_index,
+)
+from PyLCONF.utilities import Err
+
+
+SCHEMA_TEXT = '''___SECTION :: 4 :: STRICT :: Section 1
+value :: REQUIRED | TYPE_INTEGER
+___END'''
+
+
+def file_text(section_count, value_prefix=''):
+    """ Returns a LCONF-File text with `section_count` LCONF-Sections: `Section 0`, `Section 1` ..
+    """
+    return 'Additional text\n' + ''.join([
+        '___SECTION :: 4 :: LCONF :: Section {0}\nvalue :: {1}{0}\n___END\ntext ä\n'.format(idx, value_prefix)
+        for idx in range(section_count)
+    ])
+
+
+class SectionIndexTest(TestCase):
+
+    def setUp(self):
+        self.dir_path = mkdtemp()
+        self.path = path_join(self.dir_path, 'bundle.lconf')
+        self.write_file(file_text(50))
+
+    def tearDown(self):
+        rmtree(self.dir_path)
+
+    def write_file(self, text):
+        with open(self.path, 'wb') as file_obj:
+            file_obj.write(text.encode('utf-8'))
+
+    def test_find(self):
+        section_index = build_index(self.path)
+        self.assertEqual(section_index.path_to_index_file, self.path + '.idx')
+        self.assertEqual(index_path(self.path), self.path + '.idx')
+        self.assertEqual(len(section_index), 50)
+        with open(self.path, 'rb') as file_obj:
+            buffer = file_obj.read()
+        for idx in range(50):
+            start, end, section_name, section_format, _ = section_index.find('Section {}'.format(idx))
+            self.assertEqual((section_name, section_format), ('Section {}'.format(idx), 'LCONF'))
+            self.assertTrue(buffer[start:end].startswith(b'___SECTION :: 4 :: LCONF :: Section '))
+            self.assertTrue(buffer[start:end].endswith(b'___END'))
+        self.assertIsNone(section_index.find('Section 50'))
+
+    def test_load_section(self):
+        section_objs = load(self.path)
+        self.assertFalse(path_isfile(index_path(self.path)))
+        for section_obj in section_objs:
+            self.assertEqual(load_section(self.path, section_obj.name).to_python(), section_obj.to_python())
+        self.assertTrue(path_isfile(index_path(self.path)))
+        schemas = {'Section 1': compile_schema(SCHEMA_TEXT)}
+        self.assertEqual(load_section(self.path, 'Section 1', schemas).to_python(), {'value': 1})
+        self.assertEqual(load_section(self.path, 'Section 2', schemas).to_python(), {'value': '2'})
+
+    def test_first_section_of_a_name(self):
+        self.write_file(file_text(2) + file_text(2, 'second '))
+        self.assertEqual(load_section(self.path, 'Section 1').to_python(), {'value': '1'})
+
+    def test_long_section_name(self):
+        section_name = 'ä' * 40000
+        self.write_file(file_text(1) + '___SECTION :: 4 :: LCONF :: {}\nkey :: v\n___END\n'.format(section_name))
+        self.assertEqual(load_section(self.path, section_name).name, section_name)
+        self.assertEqual(open_index(self.path).find(section_name)[2], section_name)
+
+    def test_changed_file(self):
+        load_section(self.path, 'Section 1')
+        self.write_file(file_text(60, 'changed '))
+        self.assertEqual(load_section(self.path, 'Section 55').to_python(), {'value': 'changed 55'})
+        self.assertEqual(len(open_index(self.path)), 60)
+
+    def test_change_with_the_same_fingerprint(self):
+        # A change between the fingerprint samples with the same size and modification time
+        padding = 'x' * FINGERPRINT_SAMPLE_SIZE
+        text = padding + file_text(3, 'a') + padding
+        self.write_file(text)
+        self.assertEqual(load_section(self.path, 'Section 1').to_python(), {'value': 'a1'})
+        stat_result = os_stat(self.path)
+        self.write_file(text.replace('value :: a', 'value :: b'))
+        utime(self.path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+        self.assertEqual(load_section(self.path, 'Section 1').to_python(), {'value': 'b1'})
+
+    def test_iter_lconf_files(self):
+        other_path = path_join(self.dir_path, 'other.lconfsd')
+        with open(other_path, 'w') as file_obj:
+            file_obj.write(SCHEMA_TEXT)
+        self.assertEqual(list(iter_lconf_files([self.dir_path])), [self.path])
+        self.assertEqual(list(iter_lconf_files([self.dir_path, other_path], ('.lconf', '.lconfsd'))),
+                         [self.path, other_path, other_path])
+
+
+class SectionIndexErrorTest(TestCase):
+
+    def setUp(self):
+        self.dir_path = mkdtemp()
+        self.path = path_join(self.dir_path, 'bundle.lconf')
+        with open(self.path, 'w', encoding='utf-8') as file_obj:
+            file_obj.write(file_text(3))
+
+    def tearDown(self):
+        rmtree(self.dir_path)
+
+    def test_missing_section(self):
+        with self.assertRaises(KeyError):
+            load_section(self.path, 'Section 3')
+
+    def test_truncated_index_file(self):
+        build_index(self.path)
+        with open(index_path(self.path), 'r+b') as file_obj:
+            file_obj.truncate(INDEX_HEADER.size + 20)
+        with self.assertRaises(Err):
+            load_section(self.path, 'Section 1')
+
+    def test_not_valid_file(self):
+        with open(self.path, 'a') as file_obj:
+            file_obj.write('___SECTION :: 4 :: LCONF :: Open\n')
+        with self.assertRaises(Err):
+            load_section(self.path, 'Section 1')
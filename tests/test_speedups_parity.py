@@ -0,0 +1,243 @@
+"""
+#### PyLCONF compiled speedups parity tests
+
+```bash
+make build_ext
+make tests
+```
+
+Runs the compiled functions of `PyLCONF._speedups` and the pure-Python ones of `PyLCONF.lconf_section` on the same
+corpus and compares them: the LCONF-Sections of `lconf-examples/test.lconf` and a generated corpus of one
+LCONF-Section with all structures and many variants of it with one wrong line each. Each LCONF-Section is checked as
+`str` and as UTF-8 `bytes` with LF, CRLF and CR line ends.
+
+Compared: the results or the errors (class, code, message, line number, column) of `section_splitlines`,
+`prepare_section_lines` and `line_table.scan_lines` and of `validate_one_section_fast` (raised and with `collect_all`):
+the compiled `check_section_text` must return True exactly for the LCONF-Sections the pure-Python validator finds no
+error in.
+
+The tests are skipped if the extension is not built. `tools/speedups_parity.py` runs the same comparison on any
+LCONF-Files.
+"""
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+    join as path_join,
+)
+from unittest import TestCase
+
+from PyLCONF import lconf_section
+from PyLCONF.line_table import py_scan_lines
+from PyLCONF.lconf_section import extract_sections
+from PyLCONF.utilities import Err
+
+try:
+    from PyLCONF import _speedups
+except ImportError:
+    _speedups = None
+
+
+ROOT_PATH = path_dirname(path_dirname(path_abspath(__file__)))
+EXAMPLE_PATHS = [path_join(ROOT_PATH, 'lconf-examples', 'test.lconf')]
+
+BASE_SECTION_LINES = [
+    '___SECTION :: 4 :: LCONF :: Parity',
+    '# Comment',
+    'key1 :: value1',
+    'empty ::',
+    'key2 :: a value :: with separator',
+    '',
+    '- list1',
+    '    item1',
+    '    item2 ä',
+    '- compact :: 1,2,3',
+    '| table',
+    '    |a|b|c|',
+    '    |1|2|3|',
+    '. block',
+    '    inner :: 1',
+    '    - inner_list',
+    '        x',
+    '    . nested',
+    '        deep :: 2',
+    '* named',
+    '    . first',
+    '        k :: v',
+    '    . second',
+    '* unnamed',
+    '    .',
+    '        k :: v',
+    '    .',
+    '        # Comment',
+    '        k :: w',
+    'last :: 日本',
+    '___END',
+]
+
+# One wrong (or changed) line: applied to each line between the first and the last one
+LINE_MUTATIONS = (
+    lambda line: line + ' ',
+    lambda line: ' ' + line,
+    lambda line: '    ' + line,
+    lambda line: '        ' + line,
+    lambda line: line.lstrip(),
+    lambda line: '\t' + line,
+    lambda line: '　' + line,
+    lambda line: '\t',
+    lambda line: '    ',
+    lambda line: line.replace(' :: ', '::'),
+    lambda line: line.replace(' :: ', ' ::  '),
+    lambda line: line.replace(' :: ', '  :: '),
+    lambda line: line + ' :: x',
+    lambda line: line + '::',
+    lambda line: line.replace('|', '', 1),
+    lambda line: line + '|',
+    lambda line: line.replace('. ', '.', 1),
+    lambda line: line.replace('- ', '-  ', 1),
+    lambda line: line[:-1] if len(line.strip()) > 1 else line,
+    lambda line: '.',
+    lambda line: '. x',
+    lambda line: '#' + line,
+    lambda line: '',
+)
+
+SECTION_MUTATIONS = (
+    lambda lines: lines[:-1],
+    lambda lines: lines[:-1] + ['___END '],
+    lambda lines: lines[:-1] + ['___END', ''],
+    lambda lines: ['___SECTION :: 9 :: LCONF :: Parity'] + lines[1:],
+    lambda lines: ['___SECTION :: 4 :: LCONF ::  Parity'] + lines[1:],
+    lambda lines: ['___SECTION :: 2 :: LCONF :: Parity'] + lines[1:],
+    lambda lines: [lines[0], lines[-1]],
+    lambda lines: lines[:1],
+)
+
+LINE_ENDS = ('\n', '\r\n', '\r')
+
+
+def file_texts(paths):
+    """ Returns a list of (description, section_text): the LCONF-Sections of the LCONF-Files.
+    """
+    texts = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as file_obj:
+            for idx, section_text in enumerate(extract_sections(file_obj.read())):
+                texts.append(('{}: section {}'.format(path, idx), section_text))
+    return texts
+
+
+def variant_texts():
+    """ Returns a list of (description, section_text): the generated LCONF-Section and its variants with one wrong
+    line each.
+    """
+    texts = [('base', '\n'.join(BASE_SECTION_LINES))]
+    for line_idx in range(1, len(BASE_SECTION_LINES) - 1):
+        for mutation_idx, mutation in enumerate(LINE_MUTATIONS):
+            lines = list(BASE_SECTION_LINES)
+            lines[line_idx] = mutation(lines[line_idx])
+            texts.append(('line {} mutation {}'.format(line_idx, mutation_idx), '\n'.join(lines)))
+    for mutation_idx, mutation in enumerate(SECTION_MUTATIONS):
+        texts.append(('section mutation {}'.format(mutation_idx), '\n'.join(mutation(list(BASE_SECTION_LINES)))))
+    return texts
+
+
+def iter_corpus(texts):
+    """ Yields (description, section_text) for each of the `texts`: `str` and UTF-8 `bytes` with LF, CRLF and CR line
+    ends, with and without a final line end.
+    """
+    for description, text in texts:
+        for line_end in LINE_ENDS:
+            section_text = text.replace('\n', line_end)
+            for final_line_end in ('', line_end):
+                name = '{} ({!r}{})'.format(description, line_end, ' end' if final_line_end else '')
+                yield name + ' str', section_text + final_line_end
+                yield name + ' bytes', (section_text + final_line_end).encode('utf-8')
+
+
+def outcome(func, *args):
+    """ Returns the result of `func(*args)` or the parts of its error which must be equal.
+    """
+    try:
+        return 'result', func(*args)
+    except Err as err:
+        return ('error', err.__class__.__name__, err.code, err.message, getattr(err, 'line_number', None),
+                getattr(err, 'column', None))
+    except Exception as err:
+        return 'error', err.__class__.__name__, str(err)
+
+
+def errors_outcome(errors):
+    if errors[0] != 'result' or errors[1] is True:
+        return errors
+    return [outcome(_raise, err) for err in errors[1]]
+
+
+def _raise(err):
+    raise err
+
+
+def validate_pure_python(section_text, collect_all):
+    """ `lconf_section.validate_one_section_fast` without the compiled check.
+    """
+    check_section_text = lconf_section.check_section_text
+    lconf_section.check_section_text = None
+    try:
+        return lconf_section.validate_one_section_fast(section_text, None, collect_all)
+    finally:
+        lconf_section.check_section_text = check_section_text
+
+
+def compare(section_text):
+    """ Returns the names of the differing functions for one LCONF-Section.
+    """
+    differences = []
+    compiled = outcome(_speedups.section_splitlines, section_text)
+    if compiled != outcome(lconf_section.py_section_splitlines, section_text):
+        differences.append('section_splitlines')
+    if compiled[0] == 'result':
+        args = compiled[1]
+        if outcome(_speedups.prepare_section_lines, *args) != outcome(lconf_section.py_prepare_section_lines, *args):
+            differences.append('prepare_section_lines')
+    if outcome(_speedups.scan_lines, section_text) != outcome(py_scan_lines, section_text):
+        differences.append('scan_lines')
+
+    for collect_all in (False, True):
+        pure_python = errors_outcome(outcome(validate_pure_python, section_text, collect_all))
+        if errors_outcome(outcome(lconf_section.validate_one_section_fast, section_text, None, collect_all)) != \
+                pure_python:
+            differences.append('validate_one_section_fast(collect_all={})'.format(collect_all))
+    is_valid = pure_python == []
+    if _speedups.check_section_text(section_text) != is_valid:
+        differences.append('check_section_text')
+    return differences
+
+
+
+def differing_sections(texts):
+    """ Returns a list of `description: differing functions` for all LCONF-Sections of `iter_corpus(texts)` with a
+    difference.
+    """
+    return ['{}: {}'.format(description, ', '.join(differences))
+            for description, differences in ((description, compare(section_text))
+                                             for description, section_text in iter_corpus(texts))
+            if differences]
+
+
+class SpeedupsParityTest(TestCase):
+
+    def setUp(self):
+        if _speedups is None:
+            self.skipTest('The compiled extension `PyLCONF._speedups` is not built: run `make build_ext`')
+
+    def test_example_sections(self):
+        self.assertEqual(differing_sections(file_texts(EXAMPLE_PATHS)), [])
+
+    def test_generated_section_variants(self):
+        texts = variant_texts()
+        self.assertGreater(len(texts), len(BASE_SECTION_LINES) * len(LINE_MUTATIONS) // 2)
+        self.assertEqual(differing_sections(texts), [])
+
+    def test_valid_and_invalid_sections_are_covered(self):
+        is_valid = [_speedups.check_section_text(section_text) for _, section_text in iter_corpus(variant_texts())]
+        self.assertTrue(any(is_valid))
+        self.assertFalse(all(is_valid))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+#### PyLCONF compiled speedups parity check
+
+```bash
+make build_ext
+python3 tools/speedups_parity.py
+python3 tools/speedups_parity.py path-to-first.lconf path-to-second.lconf
+```
+
+Runs the comparison of `tests/test_speedups_parity.py` on the LCONF-Sections of the given files (default:
+`lconf-examples/test.lconf`) and the generated LCONF-Section variants and reports every difference.
+
+Exit code: 0 if there was no difference else 1 (2 if the extension is not built).
+"""
+from os.path import (
+    abspath as path_abspath,
+    dirname as path_dirname,
+)
+from sys import (
+    argv as sys_argv,
+    exit as sys_exit,
+    path as sys_path,
+    stdout as sys_stdout,
+)
+
+sys_path.insert(0, path_dirname(path_dirname(path_abspath(__file__))))
+
+from tests.test_speedups_parity import (  # noqa: E402
+    EXAMPLE_PATHS,
+    _speedups,
+    compare,
+    file_texts,
+    iter_corpus,
+    variant_texts,
+)
+
+
+def main():
+    if _speedups is None:
+        sys_stdout.write('The compiled extension `PyLCONF._speedups` is not built: run `make build_ext`\n')
+        return 2
+    count = 0
+    count_valid = 0
+    count_differences = 0
+    for description, section_text in iter_corpus(file_texts(sys_argv[1:] or EXAMPLE_PATHS) + variant_texts()):
+        count += 1
+        count_valid += _speedups.check_section_text(section_text)
+        differences = compare(section_text)
+        if differences:
+            count_differences += 1
+            sys_stdout.write('DIFFERENCE: {}: {}\n'.format(description, ', '.join(differences)))
+    sys_stdout.write('{} LCONF-Sections ({} valid): {} with differences\n'.format(count, count_valid,
+                                                                                count_differences))
+    return 1 if count_differences else 0
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+    sys_exit(main())